@@ -2,18 +2,32 @@
 # Logging is not configured here on purpose, see https://github.com/deepset-ai/haystack/issues/2485
 
 from importlib import metadata
+from typing import TYPE_CHECKING
 
 __version__: str = str(metadata.version("farm-haystack"))
 
 
 import haystack.silenceable_tqdm  # Needs to be imported first to wrap TQDM for all following modules
-from haystack.schema import Document, Answer, Label, MultiLabel, Span, EvaluationResult, TableCell
-from haystack.nodes.base import BaseComponent
-from haystack.pipelines.base import Pipeline
 from haystack.environment import set_pytorch_secure_model_loading
+from haystack.lazy_imports import lazy_attributes
 from haystack.mmh3 import hash128
 
 
+# The schema, nodes and pipelines are imported when they're first accessed, so that `import haystack` stays fast
+_LAZY_ATTRIBUTES = {
+    "haystack.schema": ["Document", "Answer", "Label", "MultiLabel", "Span", "EvaluationResult", "TableCell"],
+    "haystack.nodes.base": ["BaseComponent"],
+    "haystack.pipelines.base": ["Pipeline"],
+}
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from haystack.schema import Document, Answer, Label, MultiLabel, Span, EvaluationResult, TableCell
+    from haystack.nodes.base import BaseComponent
+    from haystack.pipelines.base import Pipeline
+
+
 # Enables torch's secure model loading through setting an env var.
 # Does not use torch.
 set_pytorch_secure_model_loading()
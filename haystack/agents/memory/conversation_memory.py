@@ -1,24 +1,51 @@
+import bisect
 import collections
-from typing import OrderedDict, List, Optional, Any, Dict
+import logging
+from typing import OrderedDict, List, Optional, Any, Dict, Callable, TYPE_CHECKING
 
 from haystack.agents.memory import Memory
 
+if TYPE_CHECKING:
+    from haystack.nodes import PromptNode
+
+
+logger = logging.getLogger(__name__)
+
 
 class ConversationMemory(Memory):
     """
     A memory class that stores conversation history.
+
+    Each conversation snippet is rendered once, when it's saved, and appended to the cached transcript, so loading the
+    conversation history doesn't get slower as the conversation grows. With `max_tokens`, only the most recent snippets
+    that fit into the token budget are loaded.
     """
 
-    def __init__(self, input_key: str = "input", output_key: str = "output"):
+    def __init__(
+        self,
+        input_key: str = "input",
+        output_key: str = "output",
+        max_tokens: Optional[int] = None,
+        prompt_node: Optional["PromptNode"] = None,
+    ):
         """
         Initialize ConversationMemory with input and output keys.
 
         :param input_key: The key to use for storing user input.
         :param output_key: The key to use for storing model output.
+        :param max_tokens: Optional maximum number of tokens of the loaded conversation history. The oldest snippets are
+            left out until the history fits. A single snippet longer than `max_tokens` isn't loaded.
+        :param prompt_node: Optional PromptNode whose model's tokenizer is used to count the tokens for `max_tokens`.
+            Without it, whitespace-separated words are counted.
         """
+        if max_tokens is not None and max_tokens < 1:
+            raise ValueError(f"max_tokens must be at least 1, got {max_tokens}.")
         self.list: List[OrderedDict] = []
         self.input_key = input_key
         self.output_key = output_key
+        self.max_tokens = max_tokens
+        self.count_tokens: Callable[[str], int] = _token_counter(prompt_node if max_tokens is not None else None)
+        self._clear_cache()
 
     def load(self, keys: Optional[List[str]] = None, **kwargs) -> str:
         """
@@ -29,18 +56,18 @@ class ConversationMemory(Memory):
             - window_size: integer specifying the number of most recent conversation snippets to load.
         :return: A formatted string containing the conversation history.
         """
-        chat_transcript = ""
+        self._update_cache()
         window_size = kwargs.get("window_size", None)
 
+        start = 0
         if window_size is not None:
-            chat_list = self.list[-window_size:]  # pylint: disable=invalid-unary-operand-type
-        else:
-            chat_list = self.list
-
-        for chat_snippet in chat_list:
-            chat_transcript += f"Human: {chat_snippet['Human']}\n"
-            chat_transcript += f"AI: {chat_snippet['AI']}\n"
-        return chat_transcript
+            # The first snippet of self.list[-window_size:]
+            start = range(len(self.list))[-window_size:].start  # pylint: disable=invalid-unary-operand-type
+        if self.max_tokens is not None:
+            # The first snippet from which on the tokens of the remaining snippets fit into max_tokens
+            min_tokens = self._token_offsets[-1] - self.max_tokens
+            start = max(start, bisect.bisect_left(self._token_offsets, min_tokens))
+        return self._transcript[self._char_offsets[start] :]
 
     def save(self, data: Dict[str, Any]) -> None:
         """
@@ -52,9 +79,69 @@ class ConversationMemory(Memory):
         chat_snippet["Human"] = data[self.input_key]
         chat_snippet["AI"] = data[self.output_key]
         self.list.append(chat_snippet)
+        self._update_cache()
 
     def clear(self) -> None:
         """
         Clear the conversation history.
         """
         self.list = []
+        self._clear_cache()
+
+    @staticmethod
+    def render_snippet(chat_snippet: OrderedDict) -> str:
+        """
+        Format a conversation snippet as it appears in the conversation history.
+
+        :param chat_snippet: The conversation snippet to format.
+        """
+        return f"Human: {chat_snippet['Human']}\nAI: {chat_snippet['AI']}\n"
+
+    def _clear_cache(self) -> None:
+        self._transcript = ""
+        # The offsets of the snippets in the transcript, with the end of the transcript as the last offset
+        self._char_offsets: List[int] = [0]
+        # The number of tokens before each snippet, with the total number of tokens as the last offset
+        self._token_offsets: List[int] = [0]
+
+    def _update_cache(self) -> None:
+        """
+        Render the snippets that aren't in the cached transcript yet and append them to it.
+        """
+        num_cached = len(self._char_offsets) - 1
+        if num_cached > len(self.list):
+            # The list was shortened without calling clear()
+            self._clear_cache()
+            num_cached = 0
+        for chat_snippet in self.list[num_cached:]:
+            rendered = self.render_snippet(chat_snippet)
+            self._transcript += rendered
+            self._char_offsets.append(len(self._transcript))
+            self._token_offsets.append(self._token_offsets[-1] + self.count_tokens(rendered))
+
+
+def _token_counter(prompt_node: Optional["PromptNode"]) -> Callable[[str], int]:
+    """
+    Return a function counting the tokens of a text with the tokenizer of the PromptNode's model. Local Hugging Face
+    models, OpenAI models, and models that use the `DefaultPromptHandler` expose their tokenizer. For other models, or
+    without a PromptNode, whitespace-separated words are counted.
+    """
+    if prompt_node is not None:
+        prompt_model = getattr(prompt_node, "prompt_model", None)
+        invocation_layer = getattr(prompt_model, "model_invocation_layer", None)
+        candidates = [
+            getattr(invocation_layer, "_tokenizer", None),
+            getattr(getattr(invocation_layer, "prompt_handler", None), "tokenizer", None),
+            getattr(getattr(invocation_layer, "pipe", None), "tokenizer", None),
+        ]
+        tokenizer = next((candidate for candidate in candidates if candidate is not None), None)
+        if tokenizer is not None:
+            if hasattr(tokenizer, "add_special_tokens"):
+                # A Hugging Face tokenizer, which adds special tokens by default
+                return lambda text: len(tokenizer.encode(text, add_special_tokens=False))
+            return lambda text: len(tokenizer.encode(text))
+        logger.warning(
+            "Can't find the tokenizer of the model %s. Counting words instead of tokens.",
+            getattr(prompt_model, "model_name_or_path", None),
+        )
+    return lambda text: len(text.split())
@@ -1,9 +1,15 @@
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor, wait
 from typing import Optional, Union, Dict, Any, List
 
 from haystack.agents.memory import ConversationMemory
 from haystack.nodes import PromptTemplate, PromptNode
 
 
+logger = logging.getLogger(__name__)
+
+
 class ConversationSummaryMemory(ConversationMemory):
     """
     A memory class that stores conversation history and periodically generates summaries.
@@ -16,6 +22,8 @@ class ConversationSummaryMemory(ConversationMemory):
         input_key: str = "input",
         output_key: str = "output",
         summary_frequency: int = 3,
+        summarize_in_background: bool = False,
+        max_tokens: Optional[int] = None,
     ):
         """
         Initialize ConversationSummaryMemory with a PromptNode, optional prompt_template,
@@ -26,8 +34,12 @@ class ConversationSummaryMemory(ConversationMemory):
         :param input_key: input key, default is "input".
         :param output_key: output key, default is "output".
         :param summary_frequency: integer specifying how often to generate a summary (default is 3).
+        :param summarize_in_background: If True, `save()` returns right away and summaries are generated in a
+            background thread. Until a summary is ready, `load()` returns the snippets it summarizes instead.
+        :param max_tokens: Optional maximum number of tokens of the snippets that haven't been summarized yet that
+            `load()` returns, counted with the tokenizer of the model of `prompt_node`.
         """
-        super().__init__(input_key, output_key)
+        super().__init__(input_key, output_key, max_tokens=max_tokens, prompt_node=prompt_node)
         self.save_count = 0
         self.prompt_node = prompt_node
 
@@ -39,6 +51,14 @@ class ConversationSummaryMemory(ConversationMemory):
         self.template = prompt_node.get_prompt_template(template)
         self.summary_frequency = summary_frequency
         self.summary = ""
+        self.summarize_in_background = summarize_in_background
+        # The number of saved snippets that the summary covers
+        self._summarized_count = 0
+        # Incremented by clear(), so that summaries of the cleared conversation are discarded
+        self._generation = 0
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending_summaries: List[Future] = []
 
     def load(self, keys: Optional[List[str]] = None, **kwargs) -> str:
         """
@@ -49,11 +69,12 @@ class ConversationSummaryMemory(ConversationMemory):
             - window_size: integer specifying the number of most recent conversation snippets to load.
         :return: A formatted string containing the conversation history with the latest summary.
         """
-        if self.has_unsummarized_snippets():
-            unsummarized = self.load_recent_snippets(window_size=self.unsummarized_snippets())
-            return f"{self.summary}\n{unsummarized}"
+        with self._lock:
+            summary, unsummarized = self.summary, self.unsummarized_snippets()
+        if unsummarized:
+            return f"{summary}\n{self.load_recent_snippets(window_size=unsummarized)}"
         else:
-            return self.summary
+            return summary
 
     def load_recent_snippets(self, window_size: int = 1) -> str:
         """
@@ -66,13 +87,11 @@ class ConversationSummaryMemory(ConversationMemory):
 
     def summarize(self) -> str:
         """
-        Generate a summary of the conversation history and clear the history.
+        Generate a summary of the most recent `summary_frequency` conversation snippets.
 
         :return: A string containing the generated summary.
         """
-        most_recent_chat_snippets = self.load_recent_snippets(window_size=self.summary_frequency)
-        pn_response = self.prompt_node.prompt(self.template, chat_transcript=most_recent_chat_snippets)
-        return pn_response[0]
+        return self._summarize(self._recent_transcript(self.summary_frequency))
 
     def needs_summary(self) -> bool:
         """
@@ -87,7 +106,7 @@ class ConversationSummaryMemory(ConversationMemory):
         Returns how many conversation snippets have not been summarized.
         :return: The number of conversation snippets that have not been summarized.
         """
-        return self.save_count % self.summary_frequency
+        return self.save_count - self._summarized_count
 
     def has_unsummarized_snippets(self) -> bool:
         """
@@ -106,12 +125,70 @@ class ConversationSummaryMemory(ConversationMemory):
         super().save(data)
         self.save_count += 1
         if self.needs_summary():
-            self.summary += self.summarize()
+            if self.summarize_in_background:
+                self._submit_summary()
+            else:
+                self.summary += self.summarize()
+                self._summarized_count = self.save_count
+
+    def wait_for_summaries(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until the summaries generated in the background are added to the summary.
+
+        :param timeout: The maximum number of seconds to wait. If None, wait until all summaries are done.
+        :return: True if all summaries are done, False if the timeout expired first.
+        """
+        _, not_done = wait(self._pending_summaries, timeout=timeout)
+        self._pending_summaries = list(not_done)
+        return not not_done
 
     def clear(self) -> None:
         """
         Clear the conversation history and the summary.
         """
-        super().clear()
-        self.save_count = 0
-        self.summary = ""
+        with self._lock:
+            self._generation += 1
+            super().clear()
+            self.save_count = 0
+            self.summary = ""
+            self._summarized_count = 0
+        self._pending_summaries = []
+
+    def _recent_transcript(self, num_snippets: int) -> str:
+        return "".join(self.render_snippet(chat_snippet) for chat_snippet in self.list[-num_snippets:])
+
+    def _summarize(self, chat_transcript: str) -> str:
+        pn_response = self.prompt_node.prompt(self.template, chat_transcript=chat_transcript)
+        return pn_response[0]
+
+    def _submit_summary(self) -> None:
+        """
+        Summarize the snippets saved so far in a background thread. Summaries are generated one at a time, in the order
+        they're submitted, so they're added to the summary in the order of the conversation.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix=self.__class__.__name__)
+        self._pending_summaries = [future for future in self._pending_summaries if not future.done()]
+        self._pending_summaries.append(
+            self._executor.submit(self._add_summary, summarized_count=self.save_count, generation=self._generation)
+        )
+
+    def _add_summary(self, summarized_count: int, generation: int) -> None:
+        """
+        Summarize the snippets that the summary doesn't cover yet, up to the `summarized_count`-th snippet, and add the
+        result to the summary. If a previous summary failed, its snippets are included.
+        """
+        with self._lock:
+            if generation != self._generation:
+                return
+            chat_snippets = self.list[self._summarized_count : summarized_count]
+        chat_transcript = "".join(self.render_snippet(chat_snippet) for chat_snippet in chat_snippets)
+        try:
+            summary = self._summarize(chat_transcript)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Couldn't summarize the conversation. The snippets will be part of the next summary.")
+            return
+        with self._lock:
+            if generation == self._generation:
+                self.summary += summary
+                self._summarized_count = summarized_count
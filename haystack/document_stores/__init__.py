@@ -1,15 +1,41 @@
-from haystack.document_stores.base import BaseDocumentStore, KeywordDocumentStore
+# The document stores are imported when they're first accessed, so that using one doesn't import the clients of all of them
+from typing import TYPE_CHECKING
 
-from haystack.document_stores.memory import InMemoryDocumentStore
-from haystack.document_stores.deepsetcloud import DeepsetCloudDocumentStore
-from haystack.document_stores.utils import eval_data_from_json, eval_data_from_jsonl, squad_json_to_jsonl
+from haystack.lazy_imports import lazy_attributes
 
-from haystack.document_stores.es_converter import elasticsearch_index_to_document_store
-from haystack.document_stores.es_converter import open_search_index_to_document_store
 
-from haystack.document_stores.elasticsearch import ElasticsearchDocumentStore
-from haystack.document_stores.opensearch import OpenSearchDocumentStore
-from haystack.document_stores.sql import SQLDocumentStore
-from haystack.document_stores.faiss import FAISSDocumentStore
-from haystack.document_stores.pinecone import PineconeDocumentStore
-from haystack.document_stores.weaviate import WeaviateDocumentStore
+_LAZY_ATTRIBUTES = {
+    "haystack.document_stores.base": ["BaseDocumentStore", "KeywordDocumentStore"],
+    "haystack.document_stores.memory": ["InMemoryDocumentStore"],
+    "haystack.document_stores.deepsetcloud": ["DeepsetCloudDocumentStore"],
+    "haystack.document_stores.utils": ["eval_data_from_json", "eval_data_from_jsonl", "squad_json_to_jsonl"],
+    "haystack.document_stores.es_converter": [
+        "elasticsearch_index_to_document_store",
+        "open_search_index_to_document_store",
+    ],
+    "haystack.document_stores.elasticsearch": ["ElasticsearchDocumentStore"],
+    "haystack.document_stores.opensearch": ["OpenSearchDocumentStore"],
+    "haystack.document_stores.sql": ["SQLDocumentStore"],
+    "haystack.document_stores.faiss": ["FAISSDocumentStore"],
+    "haystack.document_stores.pinecone": ["PineconeDocumentStore"],
+    "haystack.document_stores.weaviate": ["WeaviateDocumentStore"],
+}
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from haystack.document_stores.base import BaseDocumentStore, KeywordDocumentStore
+
+    from haystack.document_stores.memory import InMemoryDocumentStore
+    from haystack.document_stores.deepsetcloud import DeepsetCloudDocumentStore
+    from haystack.document_stores.utils import eval_data_from_json, eval_data_from_jsonl, squad_json_to_jsonl
+
+    from haystack.document_stores.es_converter import elasticsearch_index_to_document_store
+    from haystack.document_stores.es_converter import open_search_index_to_document_store
+
+    from haystack.document_stores.elasticsearch import ElasticsearchDocumentStore
+    from haystack.document_stores.opensearch import OpenSearchDocumentStore
+    from haystack.document_stores.sql import SQLDocumentStore
+    from haystack.document_stores.faiss import FAISSDocumentStore
+    from haystack.document_stores.pinecone import PineconeDocumentStore
+    from haystack.document_stores.weaviate import WeaviateDocumentStore
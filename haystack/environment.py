@@ -6,13 +6,6 @@ import sys
 from typing import Any, Dict, Optional
 
 from haystack import __version__
-from haystack.lazy_imports import LazyImport
-
-with LazyImport(message="Run 'pip install farm-haystack[inference]'") as torch_import:
-    import torch
-
-with LazyImport() as transformers_import:
-    import transformers
 
 
 # Any remote API (OpenAI, Cohere etc.)
@@ -98,14 +91,17 @@ def collect_static_system_specs() -> Dict[str, Any]:
         "python.version": platform.python_version(),  # FIXME verify
         "hardware.cpus": os.cpu_count(),  # FIXME verify
     }
+    # torch and transformers are imported here, as this module is imported by `import haystack`
     try:
-        transformers_import.check()
+        import transformers
+
         specs["libraries.transformers"] = transformers.__version__
     except ImportError:
         specs["libraries.transformers"] = False
 
     try:
-        torch_import.check()
+        import torch
+
         has_mps = (
             hasattr(torch.backends, "mps")
             and torch.backends.mps.is_available()
@@ -0,0 +1,117 @@
+# Shared by Haystack 1.x and the preview package, so it must not import from either of them
+import logging
+from typing import Any, Dict, Type
+
+from haystack.lazy_imports import LazyImport
+
+with LazyImport(message="Run 'pip install transformers[torch]'") as torch_import:
+    import torch
+
+logger = logging.getLogger(__name__)
+
+INFERENCE_PRECISIONS = ("fp32", "bf16", "dynamic-int8")
+
+
+def validate_inference_precision(inference_precision: str):
+    """
+    Raises a ValueError if `inference_precision` is not one of the supported precisions.
+    """
+    if inference_precision not in INFERENCE_PRECISIONS:
+        raise ValueError(
+            f"Invalid inference_precision '{inference_precision}'. Use one of {', '.join(INFERENCE_PRECISIONS)}."
+        )
+
+
+def apply_inference_precision(model: "torch.nn.Module", inference_precision: str = "fp32") -> "torch.nn.Module":
+    """
+    Prepares a model to run inference with reduced precision, trading a little accuracy for speed on CPUs.
+
+    - `"fp32"`: The model is returned unchanged.
+    - `"bf16"`: The forward pass runs under `torch.autocast` with bfloat16. Floating point outputs are cast back to
+      float32, so that callers can keep converting them to numpy. The model's class is replaced by a subclass that
+      overrides `forward`, so copies of the model, like the replicas of `torch.nn.DataParallel`, run with bfloat16 too.
+    - `"dynamic-int8"`: The weights of the linear layers are quantized to int8, and their inputs are quantized on the
+      fly. Only supported for models on the CPU; models on other devices are returned unchanged.
+
+    :param model: The model to prepare. It's modified in place.
+    :param inference_precision: One of `"fp32"`, `"bf16"`, or `"dynamic-int8"`.
+    :return: The prepared model.
+    """
+    validate_inference_precision(inference_precision)
+    if inference_precision == "fp32":
+        return model
+
+    torch_import.check()
+    device_type = _device_type(model)
+    if inference_precision == "dynamic-int8":
+        if device_type != "cpu":
+            logger.warning(
+                "inference_precision='dynamic-int8' is only supported on CPU, but the model is on %s. "
+                "Running inference in full precision.",
+                device_type,
+            )
+            return model
+        return torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+
+    model.__class__ = _bfloat16_autocast_class(model.__class__)
+    return model
+
+
+class _Bfloat16Autocast:
+    """
+    Mixin running the forward pass of a `torch.nn.Module` under `torch.autocast` with bfloat16.
+    """
+
+    def forward(self, *args, **kwargs):
+        with torch.autocast(device_type=_device_type(self), dtype=torch.bfloat16):  # type: ignore [arg-type]
+            outputs = super().forward(*args, **kwargs)  # type: ignore [misc]
+        return _to_float32(outputs)
+
+    def __reduce_ex__(self, protocol):
+        # The subclasses are created at runtime and can't be pickled by reference, so the model is pickled with its
+        # original class and gets its subclass back when it's loaded
+        _, model_class = self.__class__.__bases__
+        return _new_bfloat16_autocast_model, (model_class,), self.__getstate__()
+
+
+def _new_bfloat16_autocast_model(model_class: Type) -> "torch.nn.Module":
+    subclass = _bfloat16_autocast_class(model_class)
+    return subclass.__new__(subclass)
+
+
+_BFLOAT16_AUTOCAST_CLASSES: Dict[Type, Type] = {}
+
+
+def _bfloat16_autocast_class(model_class: Type) -> Type:
+    """
+    Returns the subclass of `model_class` that runs its forward pass with bfloat16, creating it only once per class.
+    """
+    if issubclass(model_class, _Bfloat16Autocast):
+        return model_class
+    if model_class not in _BFLOAT16_AUTOCAST_CLASSES:
+        _BFLOAT16_AUTOCAST_CLASSES[model_class] = type(
+            model_class.__name__,
+            (_Bfloat16Autocast, model_class),
+            {"__module__": model_class.__module__, "__qualname__": model_class.__qualname__},
+        )
+    return _BFLOAT16_AUTOCAST_CLASSES[model_class]
+
+
+def _device_type(model: "torch.nn.Module") -> str:
+    parameter = next(model.parameters(), None)
+    return parameter.device.type if parameter is not None else "cpu"
+
+
+def _to_float32(outputs: Any) -> Any:
+    if isinstance(outputs, torch.Tensor):
+        return outputs.float() if outputs.dtype == torch.bfloat16 else outputs
+    if isinstance(outputs, dict):
+        # Updated in place to keep the type of outputs like transformers' ModelOutput
+        for key, value in outputs.items():
+            outputs[key] = _to_float32(value)
+        return outputs
+    if isinstance(outputs, list):
+        return [_to_float32(item) for item in outputs]
+    if isinstance(outputs, tuple):
+        return tuple(_to_float32(item) for item in outputs)
+    return outputs
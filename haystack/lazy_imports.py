@@ -1,5 +1,6 @@
-from typing import Optional, Type
+from typing import Any, Callable, Dict, List, Optional, Tuple, Type
 from types import TracebackType
+import importlib
 from lazy_imports.try_import import _DeferredImportExceptionContextManager
 
 
@@ -42,3 +43,42 @@ class LazyImport(_DeferredImportExceptionContextManager):
             self._deferred = (exc_value, message)
             return True
         return None
+
+
+def lazy_attributes(
+    package: str, attributes: Dict[str, List[str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]], List[str]]:
+    """
+    Creates the module level `__getattr__()` and `__dir__()` functions (PEP 562) and the `__all__` list of a package
+    that imports the names it exports only when they're first accessed, so that importing the package doesn't import
+    all of its modules and their dependencies. `from package import *` imports all of these names.
+
+    Submodules of the package that aren't imported yet are imported on access too, like `haystack.nodes.prompt`.
+
+    :param package: The name of the package, usually `__name__`.
+    :param attributes: The modules to import from, with the names each of them exports.
+    :return: The `__getattr__()` and `__dir__()` functions and the `__all__` list of the package.
+    """
+    attribute_modules = {name: module for module, names in attributes.items() for name in names}
+
+    def __getattr__(name: str) -> Any:
+        module = importlib.import_module(package)
+        if name in attribute_modules:
+            value = getattr(importlib.import_module(attribute_modules[name]), name)
+        elif name.startswith("__"):
+            raise AttributeError(f"module '{package}' has no attribute '{name}'")
+        else:
+            try:
+                value = importlib.import_module(f"{package}.{name}")
+            except ModuleNotFoundError as e:
+                if e.name != f"{package}.{name}":
+                    raise
+                raise AttributeError(f"module '{package}' has no attribute '{name}'") from None
+        # Accessing the name again doesn't call __getattr__()
+        setattr(module, name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(importlib.import_module(package))) | set(attribute_modules))
+
+    return __getattr__, __dir__, list(attribute_modules)
@@ -4,17 +4,23 @@ import hashlib
 import json
 import logging
 import random
+import shutil
+from contextlib import nullcontext
+from functools import partial
 from itertools import groupby
 from pathlib import Path
 import numpy as np
 from tqdm import tqdm
 import torch
+from torch import multiprocessing as mp
 from torch.utils.data import ConcatDataset, Dataset
 from torch.utils.data.distributed import DistributedSampler
 from torch.utils.data.sampler import RandomSampler, SequentialSampler
 
 from haystack.modeling.data_handler.dataloader import NamedDataLoader
+from haystack.modeling.data_handler.dataset import MemmapTensorDataset, write_dataset_shard
 from haystack.modeling.data_handler.processor import Processor, SquadProcessor
+from haystack.modeling.utils import calc_chunksize, log_ascii_workers
 from haystack.utils.experiment_tracking import Tracker as tracker
 from haystack.modeling.visual import TRACTOR_SMALL
 
@@ -53,18 +59,16 @@ class DataSilo:
         :param max_multiprocessing_chunksize: max possible value for chunksize as calculated by `calc_chunksize()`
             in `haystack.basics.utils`. For certain cases like lm_finetuning, a smaller value can be set, as the default chunksize
             values are rather large that might cause memory issues.
-        :param max_processes: the maximum number of processes to spawn in the multiprocessing.Pool used in DataSilo.
-                              It can be set to 1 to disable the use of multiprocessing or make debugging easier.
-                              .. deprecated:: 1.9
-                                    Multiprocessing has been removed in 1.9. This parameter will be ignored.
+        :param max_processes: the maximum number of processes to spawn in the multiprocessing.Pool used in DataSilo
+                              to convert the dicts into datasets in parallel.
+                              It can be set to 1 (or 0) to disable the use of multiprocessing or make debugging easier.
         :multiprocessing_strategy: Set the multiprocessing sharing strategy, this can be one of file_descriptor/file_system depending on your OS.
                                    If your system has low limits for the number of open file descriptors, and you can’t raise them,
                                    you should use the file_system strategy.
-                                   .. deprecated:: 1.9
-                                        Multiprocessing has been removed in 1.9. This parameter will be ignored.
         :param caching: save the processed datasets on disk to save time/compute if the same train data is used to run
                         multiple experiments. Each cache has a checksum based on the train_filename of the Processor
-                        and the batch size.
+                        and the batch size. The datasets are streamed to disk in shards while they are being processed
+                        and are memory-mapped when loaded from the cache, so they don't need to fit into RAM.
         :param cache_path: root dir for storing the datasets' cache.
         """
         self.distributed = distributed
@@ -83,6 +87,15 @@ class DataSilo:
         else:
             self.eval_batch_size = eval_batch_size
 
+        if multiprocessing_strategy:
+            if multiprocessing_strategy in mp.get_all_sharing_strategies():
+                mp.set_sharing_strategy(multiprocessing_strategy)
+            else:
+                logger.warning(
+                    "%s is unavailable. Falling back to the default multiprocessing sharing strategy of your OS.",
+                    multiprocessing_strategy,
+                )
+
         if len(self.processor.tasks) == 0:
             raise Exception(
                 "No task initialized. Try initializing the processor with a metric and a label list. "
@@ -94,7 +107,7 @@ class DataSilo:
             checksum = self._get_checksum()
             dataset_path = self.cache_path / checksum
 
-            if dataset_path.exists():
+            if self._is_cache_complete(dataset_path):
                 self._load_dataset_from_cache(dataset_path)
                 loaded_from_cache = True
 
@@ -103,7 +116,28 @@ class DataSilo:
             # later or load from dicts instead of file
             self._load_data()
 
-    def _get_dataset(self, filename: Optional[Union[str, Path]], dicts: Optional[List[Dict]] = None):
+    @staticmethod
+    def _dataset_from_chunk(
+        indexed_chunk: Tuple[int, List[Dict]], processor: Processor, shard_dir: Optional[Path] = None
+    ) -> Tuple[Optional[Dataset], Optional[List[str]], set]:
+        """
+        Converts one chunk of dicts into a dataset. This is a static method so that it can be sent to the worker
+        processes of the multiprocessing.Pool.
+
+        If `shard_dir` is set, the dataset is written to disk as a shard and a memory-mapped view on it is returned
+        instead, so that neither the worker nor the main process have to keep the chunk in memory.
+        """
+        chunk_idx, chunk = indexed_chunk
+        dataset, tensor_names, problematic_sample_ids = processor.dataset_from_dicts(
+            dicts=chunk, indices=list(range(len(chunk)))  # TODO remove indices
+        )
+        if dataset and shard_dir:
+            dataset = write_dataset_shard(dataset, tensor_names, shard_dir / f"{chunk_idx:05d}")
+        return dataset, tensor_names, problematic_sample_ids
+
+    def _get_dataset(
+        self, filename: Optional[Union[str, Path]], dicts: Optional[List[Dict]] = None, shard_dir: Optional[Path] = None
+    ):
         if not filename and not dicts:
             raise ValueError("You must either supply `filename` or `dicts`")
 
@@ -119,16 +153,32 @@ class DataSilo:
                 random.shuffle(dicts)
 
         num_dicts = len(dicts)
+        if self.max_processes > 1:
+            chunksize, num_processes = calc_chunksize(
+                num_dicts, max_chunksize=self.max_multiprocessing_chunksize, max_processes=self.max_processes
+            )
+        else:
+            chunksize, num_processes = self.max_multiprocessing_chunksize, 1
+        chunks = [dicts[i : i + chunksize] for i in range(0, num_dicts, chunksize)]
+        num_processes = min(num_processes, len(chunks))
+
         datasets = []
         problematic_ids_all = set()
-        batch_size = self.max_multiprocessing_chunksize
-        for i in tqdm(range(0, num_dicts, batch_size), desc="Preprocessing dataset", unit=" Dicts"):
-            processing_batch = dicts[i : i + batch_size]
-            dataset, tensor_names, problematic_sample_ids = self.processor.dataset_from_dicts(
-                dicts=processing_batch, indices=list(range(len(processing_batch)))  # TODO remove indices
-            )
-            datasets.append(dataset)
-            problematic_ids_all.update(problematic_sample_ids)
+        tensor_names = None
+        dataset_from_chunk = partial(self._dataset_from_chunk, processor=self.processor, shard_dir=shard_dir)
+        with mp.Pool(processes=num_processes) if num_processes > 1 else nullcontext() as pool:
+            if pool:
+                log_ascii_workers(num_processes, logger)
+                results = pool.imap(dataset_from_chunk, enumerate(chunks))
+            else:
+                results = map(dataset_from_chunk, enumerate(chunks))
+            with tqdm(total=num_dicts, desc="Preprocessing dataset", unit=" Dicts") as pbar:
+                for chunk, (dataset, chunk_tensor_names, problematic_sample_ids) in zip(chunks, results):
+                    datasets.append(dataset)
+                    if dataset:
+                        tensor_names = chunk_tensor_names
+                    problematic_ids_all.update(problematic_sample_ids)
+                    pbar.update(len(chunk))
 
         self.processor.log_problematic(problematic_ids_all)
         datasets = [d for d in datasets if d]
@@ -153,18 +203,26 @@ class DataSilo:
         """
 
         logger.info("\nLoading data into the data silo ... %s", TRACTOR_SMALL)
+        if self.caching:
+            # Start from a clean cache dir to not mix up new shards with the ones of an interrupted previous run
+            shutil.rmtree(self.cache_path / self._get_checksum(), ignore_errors=True)
+
         # train data
         logger.info("LOADING TRAIN DATA")
         logger.info("==================")
         if train_dicts:
             # either from supplied dicts
             logger.info("Loading train set from supplied dicts ")
-            self.data["train"], self.tensor_names = self._get_dataset(filename=None, dicts=train_dicts)
+            self.data["train"], self.tensor_names = self._get_dataset(
+                filename=None, dicts=train_dicts, shard_dir=self._get_shard_dir("train")
+            )
         elif self.processor.train_filename:
             # or from a file (default)
             train_file = self.processor.data_dir / self.processor.train_filename
             logger.info("Loading train set from: %s ", train_file)
-            self.data["train"], self.tensor_names = self._get_dataset(train_file)
+            self.data["train"], self.tensor_names = self._get_dataset(
+                train_file, shard_dir=self._get_shard_dir("train")
+            )
         else:
             logger.info("No train set is being loaded")
             self.data["train"] = None
@@ -176,12 +234,14 @@ class DataSilo:
         if dev_dicts:
             # either from supplied dicts
             logger.info("Loading train set from supplied dicts ")
-            self.data["dev"], self.tensor_names = self._get_dataset(filename=None, dicts=dev_dicts)
+            self.data["dev"], self.tensor_names = self._get_dataset(
+                filename=None, dicts=dev_dicts, shard_dir=self._get_shard_dir("dev")
+            )
         elif self.processor.dev_filename:
             # or from file (default)
             dev_file = self.processor.data_dir / self.processor.dev_filename
             logger.info("Loading dev set from: %s", dev_file)
-            self.data["dev"], _ = self._get_dataset(dev_file)
+            self.data["dev"], _ = self._get_dataset(dev_file, shard_dir=self._get_shard_dir("dev"))
         elif self.processor.dev_split > 0.0:
             # or split it apart from train set
             logger.info("Loading dev set as a slice of train set")
@@ -197,15 +257,19 @@ class DataSilo:
         if test_dicts:
             # either from supplied dicts
             logger.info("Loading train set from supplied dicts ")
-            self.data["test"], self.tensor_names = self._get_dataset(filename=None, dicts=test_dicts)
+            self.data["test"], self.tensor_names = self._get_dataset(
+                filename=None, dicts=test_dicts, shard_dir=self._get_shard_dir("test")
+            )
         elif self.processor.test_filename:
             # or from file (default)
             test_file = self.processor.data_dir / self.processor.test_filename
             logger.info("Loading test set from: %s", test_file)
             if self.tensor_names:
-                self.data["test"], _ = self._get_dataset(test_file)
+                self.data["test"], _ = self._get_dataset(test_file, shard_dir=self._get_shard_dir("test"))
             else:
-                self.data["test"], self.tensor_names = self._get_dataset(test_file)
+                self.data["test"], self.tensor_names = self._get_dataset(
+                    test_file, shard_dir=self._get_shard_dir("test")
+                )
         else:
             logger.info("No test set is being loaded")
             self.data["test"] = None
@@ -219,26 +283,50 @@ class DataSilo:
 
         self._initialize_data_loaders()
 
+    @staticmethod
+    def _is_cache_complete(cache_dir: Path) -> bool:
+        """
+        Check if a cache has been fully written. The tensor names are saved last, so a cache without them comes from
+        an interrupted run.
+        """
+        # "tensor_names" is the file name used by caches that were saved with torch.save
+        return (cache_dir / "tensor_names.json").exists() or (cache_dir / "tensor_names").exists()
+
+    def _get_shard_dir(self, dataset_name: str) -> Optional[Path]:
+        """
+        Returns the directory the shards of a dataset are streamed to while it's processed, or None if caching is off.
+        """
+        if not self.caching:
+            return None
+        return self.cache_path / self._get_checksum() / "shards" / dataset_name
+
     def _load_dataset_from_cache(self, cache_dir: Path):
         """
         Load serialized dataset from a cache.
         """
         logger.info("Loading datasets from cache at %s", cache_dir)
-        self.data["train"] = torch.load(cache_dir / "train_dataset")
-
-        dev_dataset_path = cache_dir / "dev_dataset"
-        if dev_dataset_path.exists():
-            self.data["dev"] = torch.load(dev_dataset_path)
+        if (cache_dir / "tensor_names.json").exists():
+            for dataset_name in ["train", "dev", "test"]:
+                self.data[dataset_name] = self._load_shards_from_cache(cache_dir, dataset_name)
+            with open(cache_dir / "tensor_names.json") as f:
+                self.tensor_names = json.load(f)
         else:
-            self.data["dev"] = None
+            # caches written by older versions hold the whole pickled datasets
+            self.data["train"] = torch.load(cache_dir / "train_dataset")
 
-        test_dataset_path = cache_dir / "test_dataset"
-        if test_dataset_path.exists():
-            self.data["test"] = torch.load(test_dataset_path)
-        else:
-            self.data["test"] = None
+            dev_dataset_path = cache_dir / "dev_dataset"
+            if dev_dataset_path.exists():
+                self.data["dev"] = torch.load(dev_dataset_path)
+            else:
+                self.data["dev"] = None
+
+            test_dataset_path = cache_dir / "test_dataset"
+            if test_dataset_path.exists():
+                self.data["test"] = torch.load(test_dataset_path)
+            else:
+                self.data["test"] = None
 
-        self.tensor_names = torch.load(cache_dir / "tensor_names")
+            self.tensor_names = torch.load(cache_dir / "tensor_names")
 
         # derive stats and meta data
         self._calculate_statistics()
@@ -261,24 +349,45 @@ class DataSilo:
         checksum = get_dict_checksum(payload_dict)
         return checksum
 
+    @staticmethod
+    def _load_shards_from_cache(cache_dir: Path, dataset_name: str) -> Optional[ConcatDataset]:
+        """
+        Memory-map the shards of a cached dataset. Returns None if the dataset hasn't been cached.
+        """
+        shard_list_path = cache_dir / f"{dataset_name}_dataset.json"
+        if not shard_list_path.exists():
+            return None
+        with open(shard_list_path) as f:
+            shard_names = json.load(f)
+        return ConcatDataset([MemmapTensorDataset(cache_dir / "shards" / name) for name in shard_names])
+
     def _save_dataset_to_cache(self):
         """
         Serialize and save dataset to a cache.
+
+        Every dataset is stored as a list of shards in `<cache_dir>/shards`. Shards that were already streamed to the
+        cache while processing the data are only referenced, everything else is written now.
         """
         checksum = self._get_checksum()
 
         cache_dir = self.cache_path / checksum
-        cache_dir.mkdir(parents=True, exist_ok=True)
-
-        torch.save(self.data["train"], cache_dir / "train_dataset")
-
-        if self.data["dev"]:
-            torch.save(self.data["dev"], cache_dir / "dev_dataset")
-
-        if self.data["test"]:
-            torch.save(self.data["test"], cache_dir / "test_dataset")
-
-        torch.save(self.tensor_names, cache_dir / "tensor_names")
+        shards_root = (cache_dir / "shards").resolve()
+        shards_root.mkdir(parents=True, exist_ok=True)
+
+        for dataset_name in ["train", "dev", "test"]:
+            dataset = self.data[dataset_name]
+            if not dataset:
+                continue
+            shard_names = []
+            for idx, shard in enumerate(dataset.datasets if isinstance(dataset, ConcatDataset) else [dataset]):
+                if not isinstance(shard, MemmapTensorDataset) or shard.shard_dir.resolve().parent.parent != shards_root:
+                    shard = write_dataset_shard(shard, self.tensor_names, shards_root / dataset_name / f"{idx:05d}")
+                shard_names.append(str(shard.shard_dir.resolve().relative_to(shards_root)))
+            with open(cache_dir / f"{dataset_name}_dataset.json", "w") as f:
+                json.dump(shard_names, f)
+
+        with open(cache_dir / "tensor_names.json", "w") as f:
+            json.dump(self.tensor_names, f)
         logger.info("Cached the datasets at %s", cache_dir)
 
     def _initialize_data_loaders(self):
@@ -801,7 +910,11 @@ class DistillationDataSilo(DataSilo):
     def _teacher_output_names(self) -> List[str]:
         return ["teacher_output_" + str(i) for i in range(self.output_len)]
 
-    def _get_dataset(self, filename: Optional[Union[str, Path]], dicts: Optional[List[Dict]] = None):
+    def _get_dataset(
+        self, filename: Optional[Union[str, Path]], dicts: Optional[List[Dict]] = None, shard_dir: Optional[Path] = None
+    ):
+        # The teacher outputs are appended to the in-memory tensors, so the datasets can't be streamed to the cache.
+        # They are written to the cache in _save_dataset_to_cache() after the forward pass.
         concat_datasets, tensor_names = super()._get_dataset(filename, dicts)
 
         batch = []
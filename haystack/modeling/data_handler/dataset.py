@@ -1,10 +1,12 @@
+import json
 import logging
 import numbers
+from pathlib import Path
 from typing import Optional, List
 
 import numpy as np
 import torch
-from torch.utils.data import ConcatDataset, TensorDataset
+from torch.utils.data import ConcatDataset, Dataset, TensorDataset
 from transformers import BatchEncoding
 
 from haystack.modeling.utils import flatten_list
@@ -101,3 +103,61 @@ class ConcatTensorDataset(ConcatDataset):
             return tuple(map(torch.stack, zip(*rows)))
         else:
             return super(ConcatTensorDataset, self).__getitem__(idx)
+
+
+class MemmapTensorDataset(Dataset):
+    """
+    A TensorDataset whose tensors live on disk as `.npy` files and are memory-mapped instead of loaded into RAM.
+
+    Only the rows that are accessed get copied into memory, so a dataset written with `write_dataset_shard()` can be
+    larger than the available RAM and opening it takes constant time. Indexing works like in a TensorDataset:
+    integers return one sample, slices and index arrays return a tuple of stacked tensors.
+
+    :param shard_dir: The directory the shard has been written to by `write_dataset_shard()`.
+    """
+
+    def __init__(self, shard_dir: Path):
+        self.shard_dir = Path(shard_dir)
+        with open(self.shard_dir / "tensor_names.json") as f:
+            self.tensor_names = json.load(f)
+        self.arrays = self._open_arrays()
+
+    def _open_arrays(self) -> List[np.ndarray]:
+        return [np.load(self.shard_dir / f"{name}.npy", mmap_mode="r") for name in self.tensor_names]
+
+    def __len__(self):
+        return self.arrays[0].shape[0]
+
+    def __getitem__(self, idx):
+        # np.array() copies the accessed rows out of the read-only memory map
+        return tuple(torch.from_numpy(np.array(array[idx])) for array in self.arrays)
+
+    def __getstate__(self):
+        # Pickling a memory map copies the whole file, e.g. when the dataset is sent to DataLoader workers.
+        # Only send the location and re-open the files on the other side.
+        state = self.__dict__.copy()
+        del state["arrays"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.arrays = self._open_arrays()
+
+
+def write_dataset_shard(dataset: Dataset, tensor_names: List[str], shard_dir: Path) -> MemmapTensorDataset:
+    """
+    Writes a dataset to disk as one `.npy` file per tensor and returns a memory-mapped view on it.
+
+    :param dataset: A TensorDataset (or any dataset that returns all of its tensors for `dataset[:]`).
+    :param tensor_names: The names of the tensors in the dataset, in order.
+    :param shard_dir: The directory to write the shard to. It will be created if it doesn't exist.
+    :return: A MemmapTensorDataset reading from `shard_dir`.
+    """
+    shard_dir = Path(shard_dir)
+    shard_dir.mkdir(parents=True, exist_ok=True)
+    for name, tensor in zip(tensor_names, dataset[:]):  # type: ignore [index]
+        np.save(shard_dir / f"{name}.npy", tensor.numpy())
+    # Written last, so that a shard that has been interrupted while writing can't be opened
+    with open(shard_dir / "tensor_names.json", "w") as f:
+        json.dump(tensor_names, f)
+    return MemmapTensorDataset(shard_dir)
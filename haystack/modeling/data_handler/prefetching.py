@@ -0,0 +1,126 @@
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, TypeVar
+
+import queue
+import threading
+import time
+from collections import defaultdict
+
+
+T = TypeVar("T")
+
+# Default number of model batches to preprocess at a time, so that the model doesn't wait for the next chunk
+PREPROCESSING_CHUNK_BATCHES = 4
+
+_DONE = object()
+
+
+class StageTimings:
+    """
+    Sums up the seconds spent in each stage of an inference run, like preprocessing or the forward pass.
+    Can be updated from several threads.
+    """
+
+    def __init__(self):
+        self._seconds: Dict[str, float] = defaultdict(float)
+        self._lock = threading.Lock()
+
+    def add(self, stage: str, seconds: float):
+        with self._lock:
+            self._seconds[stage] += seconds
+
+    def measure(self, stage: str) -> "_StageTimer":
+        """
+        Returns a context manager that adds the time spent in it to `stage`.
+        """
+        return _StageTimer(self, stage)
+
+    def to_dict(self) -> Dict[str, float]:
+        with self._lock:
+            return dict(self._seconds)
+
+    def __repr__(self) -> str:
+        return ", ".join(f"{stage}: {seconds:.3f}s" for stage, seconds in self.to_dict().items())
+
+
+class _StageTimer:
+    def __init__(self, timings: StageTimings, stage: str):
+        self.timings = timings
+        self.stage = stage
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *args):
+        self.timings.add(self.stage, time.perf_counter() - self.start)
+
+
+def prefetch_chunks(
+    items: Sequence[Any],
+    featurize: Callable[[List[Any], List[int]], T],
+    chunk_size: Optional[int] = None,
+    max_prefetched_chunks: int = 1,
+    timings: Optional[StageTimings] = None,
+) -> Iterator[T]:
+    """
+    Splits `items` into chunks and featurizes them in a background thread, so that the next chunks are tokenized and
+    turned into tensors while the caller runs the model on the current one. At most `max_prefetched_chunks` featurized
+    chunks wait for the caller at any time, which bounds the memory used.
+
+    :param items: The items to featurize, for example the dicts passed to `Processor.dataset_from_dicts()`.
+    :param featurize: Called with the items of each chunk and their indices in `items`.
+    :param chunk_size: The number of items per chunk. If `None`, all items are featurized at once in the calling thread.
+    :param max_prefetched_chunks: The maximum number of featurized chunks that are not consumed yet.
+    :param timings: If given, the time spent featurizing is added to its `"preprocessing"` stage, and the time the
+                    caller waited for a chunk to its `"waiting_for_preprocessing"` stage.
+    :return: The featurized chunks, in order.
+    """
+    timings = timings or StageTimings()
+    if chunk_size is None or chunk_size >= len(items):
+        with timings.measure("preprocessing"):
+            featurized = featurize(list(items), list(range(len(items))))
+        yield featurized
+        return
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+
+    featurized_chunks: "queue.Queue[Any]" = queue.Queue(maxsize=max(max_prefetched_chunks, 1))
+    stop = threading.Event()
+
+    def put(item: Any) -> bool:
+        # Wait for free space, but give up if the consumer stopped iterating
+        while not stop.is_set():
+            try:
+                featurized_chunks.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce():
+        try:
+            for start in range(0, len(items), chunk_size):
+                indices = list(range(start, min(start + chunk_size, len(items))))
+                with timings.measure("preprocessing"):  # type: ignore[union-attr]
+                    featurized = featurize([items[i] for i in indices], indices)
+                if not put(featurized):
+                    return
+            put(_DONE)
+        except Exception as e:  # pylint: disable=broad-except
+            put(e)
+
+    producer = threading.Thread(target=produce, name="prefetch_chunks", daemon=True)
+    producer.start()
+    try:
+        while True:
+            with timings.measure("waiting_for_preprocessing"):
+                featurized = featurized_chunks.get()
+            if featurized is _DONE:
+                return
+            if isinstance(featurized, Exception):
+                raise featurized
+            yield featurized
+    finally:
+        stop.set()
+        producer.join()
@@ -21,6 +21,7 @@ from transformers import PreTrainedTokenizer, AutoTokenizer
 
 from haystack.errors import HaystackError
 from haystack.modeling.model.feature_extraction import (
+    DocumentTokenizationCache,
     tokenize_batch_question_answering,
     tokenize_with_metadata,
     truncate_sequences,
@@ -381,6 +382,7 @@ class SquadProcessor(Processor):
         max_query_length: int = 64,
         proxies: Optional[dict] = None,
         max_answers: Optional[int] = None,
+        tokenization_cache_size: int = 0,
         **kwargs,
     ):
         """
@@ -405,6 +407,9 @@ class SquadProcessor(Processor):
         :param max_answers: Number of answers to be converted. QA sets can contain multi-way annotations, which are converted to arrays of max_answer length.
                             Adjusts to maximum number of answers in the first processed datasets if not set.
                             Truncates or pads to max_answer length if set.
+        :param tokenization_cache_size: Number of tokenized documents to cache across calls, so that documents that
+                                        recur across queries are only tokenized and split into passages once.
+                                        Set to 0 (default) to disable the cache.
         :param kwargs: placeholder for passing generic parameters
         """
         self.ph_output_type = "per_token_squad"
@@ -426,6 +431,9 @@ class SquadProcessor(Processor):
         self.doc_stride = doc_stride
         self.max_query_length = max_query_length
         self.max_answers = max_answers
+        self.tokenization_cache = (
+            DocumentTokenizationCache(max_size=tokenization_cache_size) if tokenization_cache_size > 0 else None
+        )
         super(SquadProcessor, self).__init__(
             tokenizer=tokenizer,
             max_seq_len=max_seq_len,
@@ -465,7 +473,7 @@ class SquadProcessor(Processor):
         pre_baskets = [self.convert_qa_input_dict(x) for x in dicts]  # TODO move to input object conversion
 
         # Tokenize documents and questions
-        baskets = tokenize_batch_question_answering(pre_baskets, self.tokenizer, indices)
+        baskets = tokenize_batch_question_answering(pre_baskets, self.tokenizer, indices, cache=self.tokenization_cache)
 
         # Split documents into smaller passages to fit max_seq_len
         baskets = self._split_docs_into_passages(baskets)
@@ -568,17 +576,23 @@ class SquadProcessor(Processor):
 
             # passage_spans is a list of dictionaries where each defines the start and end of each passage
             # on both token and character level
-            try:
-                passage_spans = get_passage_offsets(
-                    basket.raw["document_offsets"], self.doc_stride, passage_len_t, basket.raw["document_text"]
-                )
-            except Exception as e:
-                logger.warning(
-                    "Could not divide document into passages. Document: %s\nWith error: %s",
-                    basket.raw["document_text"][:200],
-                    e,
-                )
-                passage_spans = []
+            # The passages only depend on the document and their length, so they're shared by all the questions of
+            # the same length about the document, and across calls if the document is cached
+            passage_spans_key = (self.doc_stride, passage_len_t)
+            passage_spans = basket.raw["document_passage_spans"].get(passage_spans_key)
+            if passage_spans is None:
+                try:
+                    passage_spans = get_passage_offsets(
+                        basket.raw["document_offsets"], self.doc_stride, passage_len_t, basket.raw["document_text"]
+                    )
+                except Exception as e:
+                    logger.warning(
+                        "Could not divide document into passages. Document: %s\nWith error: %s",
+                        basket.raw["document_text"][:200],
+                        e,
+                    )
+                    passage_spans = []
+                basket.raw["document_passage_spans"][passage_spans_key] = passage_spans
 
             for passage_span in passage_spans:
                 # Unpack each variable in the dictionary. The "_t" and "_c" indicate
@@ -1,5 +1,6 @@
 import contextlib
 import logging
+import math
 import os
 from typing import Any, Dict, List, Optional, Set, Union
 
@@ -10,6 +11,7 @@ from tqdm import tqdm
 
 from haystack.modeling.data_handler.dataloader import NamedDataLoader
 from haystack.modeling.data_handler.inputs import QAInput
+from haystack.modeling.data_handler.prefetching import StageTimings, prefetch_chunks
 from haystack.modeling.data_handler.processor import InferenceProcessor, Processor
 from haystack.modeling.data_handler.samples import SampleBasket
 from haystack.modeling.model.adaptive_model import AdaptiveModel, BaseAdaptiveModel
@@ -39,6 +41,7 @@ class Inferencer:
         num_processes: Optional[int] = None,
         disable_tqdm: bool = False,
         devices: Optional[List[Union[str, torch.device]]] = None,
+        preprocessing_chunk_size: Optional[int] = None,
     ):
         """
         Initializes Inferencer from an AdaptiveModel and a Processor instance.
@@ -70,6 +73,10 @@ class Inferencer:
                         A list containing torch device objects and/or strings is supported (For example
                         [torch.device('cuda:0'), "mps", "cuda:1"]). When specifying `use_gpu=False` the devices
                         parameter is not used and a single cpu device is used for inference.
+        :param preprocessing_chunk_size: Number of input dicts to preprocess (tokenize, put into tensors, etc.) at a
+                                         time. The next chunk is preprocessed in a background thread while the model
+                                         runs on the current one. If `None` (default), all dicts are preprocessed at
+                                         once before running the model.
         :return: An instance of the Inferencer.
 
         """
@@ -89,7 +96,10 @@ class Inferencer:
         self.language = self.model.get_language()
         self.task_type = task_type
         self.disable_tqdm = disable_tqdm
+        self.preprocessing_chunk_size = preprocessing_chunk_size
         self.problematic_sample_ids: Set[List[int]] = set()  # type ignore
+        # Seconds spent in each stage of the last inference run, e.g. "preprocessing" and "model"
+        self.last_inference_timings: Dict[str, float] = {}
 
         if task_type == "embeddings":
             if not extraction_layer or not extraction_strategy:
@@ -132,6 +142,7 @@ class Inferencer:
         use_auth_token: Optional[Union[bool, str]] = None,
         devices: Optional[List[Union[str, torch.device]]] = None,
         max_query_length: int = 64,
+        preprocessing_chunk_size: Optional[int] = None,
         **kwargs,
     ):
         """
@@ -181,6 +192,10 @@ class Inferencer:
                                Additional information can be found here
                                https://huggingface.co/transformers/main_classes/model.html#transformers.PreTrainedModel.from_pretrained
         :param max_query_length: Only QA: Maximum length of the question in number of tokens.
+        :param preprocessing_chunk_size: Number of input dicts to preprocess (tokenize, put into tensors, etc.) at a
+                                         time. The next chunk is preprocessed in a background thread while the model
+                                         runs on the current one. If `None` (default), all dicts are preprocessed at
+                                         once before running the model.
         :return: An instance of the Inferencer.
         """
         if tokenizer_args is None:
@@ -258,6 +273,7 @@ class Inferencer:
             extraction_layer=extraction_layer,
             num_processes=num_processes,
             disable_tqdm=disable_tqdm,
+            preprocessing_chunk_size=preprocessing_chunk_size,
             devices=devices,
         )
 
@@ -326,17 +342,42 @@ class Inferencer:
         :param aggregate_preds: whether to aggregate predictions across different samples (e.g. for QA on long texts)
         :return: list of predictions
         """
-        indices = list(range(len(dicts)))
-        dataset, tensor_names, problematic_ids, baskets = self.processor.dataset_from_dicts(
-            dicts, indices=indices, return_baskets=True
-        )
-        self.problematic_sample_ids = problematic_ids
+        timings = StageTimings()
+        self.problematic_sample_ids = set()
 
-        # TODO change format of formatted_preds in QA (list of dicts)
-        if aggregate_preds:
-            preds_all = self._get_predictions_and_aggregate(dataset, tensor_names, baskets)
-        else:
-            preds_all = self._get_predictions(dataset, tensor_names, baskets)
+        def featurize(chunk: List[Dict], indices: List[int]):
+            return self.processor.dataset_from_dicts(chunk, indices=indices, return_baskets=True)
+
+        # With a preprocessing_chunk_size, the next chunk is preprocessed while the model runs on the current one.
+        # The chunks contain whole dicts, so that the predictions of a dict can be aggregated within its chunk.
+        chunked = self.preprocessing_chunk_size is not None and self.preprocessing_chunk_size < len(dicts)
+        preds_all = []
+        with contextlib.closing(
+            prefetch_chunks(dicts, featurize, chunk_size=self.preprocessing_chunk_size, timings=timings)
+        ) as chunks:
+            # A single progress bar for all chunks instead of one per chunk
+            num_chunks = math.ceil(len(dicts) / self.preprocessing_chunk_size) if chunked else 1  # type: ignore [operator]
+            for dataset, tensor_names, problematic_ids, baskets in tqdm(
+                chunks,
+                total=num_chunks,
+                desc="Inferencing Samples",
+                unit=" Chunks",
+                disable=self.disable_tqdm or not chunked,
+            ):
+                self.problematic_sample_ids.update(problematic_ids)
+
+                # TODO change format of formatted_preds in QA (list of dicts)
+                if aggregate_preds:
+                    preds_all += self._get_predictions_and_aggregate(
+                        dataset, tensor_names, baskets, timings=timings, disable_tqdm=chunked or self.disable_tqdm
+                    )
+                else:
+                    preds_all += self._get_predictions(
+                        dataset, tensor_names, baskets, timings=timings, disable_tqdm=chunked or self.disable_tqdm
+                    )
+
+        self.last_inference_timings = timings.to_dict()
+        logger.debug("Inference of %s dicts took %s", len(dicts), timings)
 
         if return_json:
             # TODO this try catch should be removed when all tasks return prediction objects
@@ -345,7 +386,14 @@ class Inferencer:
 
         return preds_all
 
-    def _get_predictions(self, dataset: Dataset, tensor_names: List, baskets):
+    def _get_predictions(
+        self,
+        dataset: Dataset,
+        tensor_names: List,
+        baskets,
+        timings: Optional[StageTimings] = None,
+        disable_tqdm: Optional[bool] = None,
+    ) -> List:
         """
         Feed a preprocessed dataset to the model and get the actual predictions (forward pass + formatting).
 
@@ -354,30 +402,41 @@ class Inferencer:
         :param baskets: For each item in the dataset, we need additional information to create formatted preds.
                         Baskets contain all relevant infos for that.
                         Example: QA - input string to convert the predicted answer from indices back to string space
+        :param timings: If given, the time spent in the model and in formatting the predictions is added to it.
+        :param disable_tqdm: Whether to disable the progress bar. Defaults to the `disable_tqdm` of the Inferencer.
         :return: list of predictions
         """
+        timings = timings or StageTimings()
+        disable_tqdm = self.disable_tqdm if disable_tqdm is None else disable_tqdm
         samples = [s for b in baskets for s in b.samples]
 
         data_loader = NamedDataLoader(
             dataset=dataset, sampler=SequentialSampler(dataset), batch_size=self.batch_size, tensor_names=tensor_names  # type: ignore [arg-type]
         )  # type ignore
         preds_all = []
-        for i, batch in enumerate(
-            tqdm(data_loader, desc="Inferencing Samples", unit=" Batches", disable=self.disable_tqdm)
-        ):
+        for i, batch in enumerate(tqdm(data_loader, desc="Inferencing Samples", unit=" Batches", disable=disable_tqdm)):
             batch = {key: batch[key].to(self.devices[0]) for key in batch}
             batch_samples = samples[i * self.batch_size : (i + 1) * self.batch_size]
 
             # get logits
             with torch.inference_mode():
-                logits = self.model.forward(**batch)
-                preds = self.model.formatted_preds(
-                    logits=logits, samples=batch_samples, padding_mask=batch.get("padding_mask", None)
-                )
+                with timings.measure("model"):
+                    logits = self.model.forward(**batch)
+                with timings.measure("postprocessing"):
+                    preds = self.model.formatted_preds(
+                        logits=logits, samples=batch_samples, padding_mask=batch.get("padding_mask", None)
+                    )
                 preds_all += preds
         return preds_all
 
-    def _get_predictions_and_aggregate(self, dataset: Dataset, tensor_names: List, baskets: List[SampleBasket]):
+    def _get_predictions_and_aggregate(
+        self,
+        dataset: Dataset,
+        tensor_names: List,
+        baskets: List[SampleBasket],
+        timings: Optional[StageTimings] = None,
+        disable_tqdm: Optional[bool] = None,
+    ) -> List:
         """
         Feed a preprocessed dataset to the model and get the actual predictions (forward pass + logits_to_preds + formatted_preds).
 
@@ -390,8 +449,12 @@ class Inferencer:
         :param baskets: For each item in the dataset, we need additional information to create formatted preds.
                         Baskets contain all relevant infos for that.
                         Example: QA - input string to convert the predicted answer from indices back to string space
+        :param timings: If given, the time spent in the model and in aggregating the predictions is added to it.
+        :param disable_tqdm: Whether to disable the progress bar. Defaults to the `disable_tqdm` of the Inferencer.
         :return: list of predictions
         """
+        timings = timings or StageTimings()
+        disable_tqdm = self.disable_tqdm if disable_tqdm is None else disable_tqdm
         data_loader = NamedDataLoader(
             dataset=dataset, sampler=SequentialSampler(dataset), batch_size=self.batch_size, tensor_names=tensor_names  # type: ignore [arg-type]
         )  # type ignore
@@ -399,11 +462,11 @@ class Inferencer:
         # TODO so that preds of the right shape are passed in to formatted_preds
         unaggregated_preds_all = []
 
-        for batch in tqdm(data_loader, desc="Inferencing Samples", unit=" Batches", disable=self.disable_tqdm):
+        for batch in tqdm(data_loader, desc="Inferencing Samples", unit=" Batches", disable=disable_tqdm):
             batch = {key: batch[key].to(self.devices[0]) for key in batch}
 
             # get logits
-            with torch.inference_mode():
+            with torch.inference_mode(), timings.measure("model"):
                 # Aggregation works on preds, not logits. We want as much processing happening in one batch + on GPU
                 # So we transform logits to preds here as well
                 logits = self.model.forward(
@@ -426,11 +489,12 @@ class Inferencer:
 
         # can assume that we have only complete docs i.e. all the samples of one doc are in the current chunk
         logits = [None]
-        preds_all = self.model.formatted_preds(
-            logits=logits,  # For QA we collected preds per batch and do not want to pass logits
-            preds=unaggregated_preds_all,
-            baskets=baskets,
-        )  # type ignore
+        with timings.measure("postprocessing"):
+            preds_all = self.model.formatted_preds(
+                logits=logits,  # For QA we collected preds per batch and do not want to pass logits
+                preds=unaggregated_preds_all,
+                baskets=baskets,
+            )  # type ignore
         return preds_all
 
     def extract_vectors(
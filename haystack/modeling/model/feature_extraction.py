@@ -19,6 +19,8 @@ import re
 import os
 import json
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 
 import numpy as np
@@ -141,20 +143,68 @@ class FeatureExtractor:
         return self.feature_extractor(**params)
 
 
+class DocumentTokenizationCache:
+    """
+    LRU cache of tokenized documents for question answering, keyed by the document text. Documents that recur across
+    queries, like the top documents of a retriever, are tokenized only once, and the passage windows they are split
+    into are computed only once per combination of `doc_stride` and passage length.
+
+    A cache belongs to a single tokenizer. Its entries must not be modified. When pickled, for example to be sent to
+    other processes, the cache is emptied.
+    """
+
+    def __init__(self, max_size: int = 1000):
+        """
+        :param max_size: The maximum number of documents to keep. The least recently used ones are evicted first.
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be at least 1, got {max_size}.")
+        self.max_size = max_size
+        self._entries: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, document_text: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            entry = self._entries.get(document_text)
+            if entry is not None:
+                self._entries.move_to_end(document_text)
+            return entry
+
+    def put(self, document_text: str, entry: Dict[str, Any]):
+        with self._lock:
+            self._entries[document_text] = entry
+            self._entries.move_to_end(document_text)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __getstate__(self):
+        return {"max_size": self.max_size}
+
+    def __setstate__(self, state):
+        self.__init__(max_size=state["max_size"])  # type: ignore [misc]
+
+
 def tokenize_batch_question_answering(
-    pre_baskets: List[Dict[str, Any]], tokenizer: PreTrainedTokenizer, indices: List[Any]
+    pre_baskets: List[Dict[str, Any]],
+    tokenizer: PreTrainedTokenizer,
+    indices: List[Any],
+    cache: Optional[DocumentTokenizationCache] = None,
 ) -> List[SampleBasket]:
     """
     Tokenizes text data for question answering tasks. Tokenization means splitting words into subwords, depending on the
     tokenizer's vocabulary.
 
-    - We first tokenize all documents in batch mode. (When using FastTokenizers Rust multithreading can be enabled by TODO add how to enable rust mt)
-    - Then we tokenize each question individually
+    - We first tokenize all distinct documents that are not cached yet in batch mode. (When using FastTokenizers Rust multithreading can be enabled by TODO add how to enable rust mt)
+    - Then we tokenize each distinct question individually
     - We construct dicts with question and corresponding document text + tokens + offsets + ids
 
     :param pre_baskets: input dicts with QA info #TODO change to input objects
     :param tokenizer: tokenizer to be used
     :param indices: indices used during multiprocessing so that IDs assigned to our baskets are unique
+    :param cache: cache of tokenized documents to reuse across calls. It must have been filled with the same tokenizer.
     :return: baskets, list containing question and corresponding document information
     """
     if not len(indices) == len(pre_baskets):
@@ -166,62 +216,95 @@ def tokenize_batch_question_answering(
             "Please load Tokenizers with 'use_fast=True' option."
         )
 
-    baskets = []
-    # # Tokenize texts in batch mode
-    texts = [d["context"] for d in pre_baskets]
-    tokenized_docs_batch = tokenizer(
-        text=texts,
-        return_offsets_mapping=True,
-        return_special_tokens_mask=True,
-        add_special_tokens=False,
-        verbose=False,
-    )
-
-    # Extract relevant data
-    tokenids_batch = tokenized_docs_batch["input_ids"]
-    offsets_batch = []
-    for o in tokenized_docs_batch["offset_mapping"]:
-        offsets_batch.append(np.asarray([x[0] for x in o], dtype=np.int32))
-    start_of_words_batch = []
-    for e in tokenized_docs_batch.encodings:
-        start_of_words_batch.append(_get_start_of_word_QA(e.word_ids))
+    # Documents that appear several times in the batch or in the cache are tokenized only once
+    documents: Dict[str, Dict[str, Any]] = {}
+    for d in pre_baskets:
+        if d["context"] not in documents:
+            cached = cache.get(d["context"]) if cache is not None else None
+            if cached is not None:
+                documents[d["context"]] = cached
+    texts = list({d["context"]: None for d in pre_baskets if d["context"] not in documents})
+    for text, tokenized_document in zip(texts, _tokenize_documents_question_answering(texts, tokenizer)):
+        documents[text] = tokenized_document
+        if cache is not None:
+            cache.put(text, tokenized_document)
 
+    baskets = []
+    tokenized_questions: Dict[str, Dict[str, Any]] = {}
     for i_doc, d in enumerate(pre_baskets):
         document_text = d["context"]
+        document = documents[document_text]
         # # Tokenize questions one by one
         for i_q, q in enumerate(d["qas"]):
             question_text = q["question"]
-            tokenized_q = tokenizer(
-                question_text, return_offsets_mapping=True, return_special_tokens_mask=True, add_special_tokens=False
-            )
-
-            # Extract relevant data
-            question_tokenids = tokenized_q["input_ids"]
-            question_offsets = [x[0] for x in tokenized_q["offset_mapping"]]
-            question_sow = _get_start_of_word_QA(tokenized_q.encodings[0].word_ids)
+            if question_text not in tokenized_questions:
+                tokenized_q = tokenizer(
+                    question_text,
+                    return_offsets_mapping=True,
+                    return_special_tokens_mask=True,
+                    add_special_tokens=False,
+                )
+                # Extract relevant data
+                tokenized_questions[question_text] = {
+                    "question_tokens": tokenized_q["input_ids"],
+                    "question_offsets": [x[0] for x in tokenized_q["offset_mapping"]],
+                    "question_start_of_word": _get_start_of_word_QA(tokenized_q.encodings[0].word_ids),
+                    "question_tokens_strings": tokenized_q.encodings[0].tokens,
+                }
+            question = tokenized_questions[question_text]
 
             external_id = q["id"]
             # The internal_id depends on unique ids created for each process before forking
             internal_id = f"{indices[i_doc]}-{i_q}"
+            # The baskets of a document share its tokens, so they must not be modified
             raw = {
                 "document_text": document_text,
-                "document_tokens": tokenids_batch[i_doc],
-                "document_offsets": offsets_batch[i_doc],
-                "document_start_of_word": start_of_words_batch[i_doc],
+                "document_tokens": document["document_tokens"],
+                "document_offsets": document["document_offsets"],
+                "document_start_of_word": document["document_start_of_word"],
+                "document_passage_spans": document["document_passage_spans"],
                 "question_text": question_text,
-                "question_tokens": question_tokenids,
-                "question_offsets": question_offsets,
-                "question_start_of_word": question_sow,
+                "question_tokens": question["question_tokens"],
+                "question_offsets": question["question_offsets"],
+                "question_start_of_word": question["question_start_of_word"],
                 "answers": q["answers"],
             }
             # TODO add only during debug mode (need to create debug mode)
-            raw["document_tokens_strings"] = tokenized_docs_batch.encodings[i_doc].tokens
-            raw["question_tokens_strings"] = tokenized_q.encodings[0].tokens
+            raw["document_tokens_strings"] = document["document_tokens_strings"]
+            raw["question_tokens_strings"] = question["question_tokens_strings"]
 
             baskets.append(SampleBasket(raw=raw, id_internal=internal_id, id_external=external_id, samples=None))
     return baskets
 
 
+def _tokenize_documents_question_answering(texts: List[str], tokenizer: PreTrainedTokenizer) -> List[Dict[str, Any]]:
+    """
+    Tokenizes the documents in batch mode and extracts the data the question answering baskets need from them.
+    """
+    if not texts:
+        return []
+    tokenized_docs_batch = tokenizer(
+        text=texts,
+        return_offsets_mapping=True,
+        return_special_tokens_mask=True,
+        add_special_tokens=False,
+        verbose=False,
+    )
+    return [
+        {
+            "document_tokens": tokenids,
+            "document_offsets": np.asarray([x[0] for x in offsets], dtype=np.int32),
+            "document_start_of_word": _get_start_of_word_QA(encoding.word_ids),
+            "document_tokens_strings": encoding.tokens,
+            # Filled by the processor with the passages of the document for each doc_stride and passage length
+            "document_passage_spans": {},
+        }
+        for tokenids, offsets, encoding in zip(
+            tokenized_docs_batch["input_ids"], tokenized_docs_batch["offset_mapping"], tokenized_docs_batch.encodings
+        )
+    ]
+
+
 def _get_start_of_word_QA(word_ids):
     return [1] + list(np.ediff1d(np.asarray(word_ids, dtype=np.int32)))
 
@@ -442,77 +442,133 @@ class QuestionAnsweringHead(PredictionHead):
         (i.e. special tokens, question tokens, passage_tokens)
         """
 
-        # Will be populated with the top-n predictions of each sample in the batch
-        # shape = batch_size x ~top_n
-        # Note that ~top_n = n   if no_answer is     within the top_n predictions
-        #           ~top_n = n+1 if no_answer is not within the top_n predictions
-        all_top_n = []
-
         # logits is of shape [batch_size, max_seq_len, 2]. The final dimension corresponds to [start, end]
         start_logits, end_logits = logits.split(1, dim=-1)
         start_logits = start_logits.squeeze(-1)
         end_logits = end_logits.squeeze(-1)
 
-        # Calculate a few useful variables
-        batch_size = start_logits.size()[0]
-        max_seq_len = start_logits.shape[1]  # target dim
+        start_end_matrix = self._get_start_end_matrix(start_logits, end_logits, span_mask, max_answer_length)
+
+        # Returns the top-n predictions of each sample in the batch
+        # shape = batch_size x ~top_n
+        # Note that ~top_n = n   if no_answer is     within the top_n predictions
+        #           ~top_n = n+1 if no_answer is not within the top_n predictions
+        return self.get_top_candidates_batch(start_end_matrix, start_logits, end_logits)
 
-        # get scores for all combinations of start and end logits => candidate answers
-        start_matrix = start_logits.unsqueeze(2).expand(-1, -1, max_seq_len)
-        end_matrix = end_logits.unsqueeze(1).expand(-1, max_seq_len, -1)
-        start_end_matrix = start_matrix + end_matrix
+    def _get_start_end_matrix(
+        self, start_logits: torch.Tensor, end_logits: torch.Tensor, span_mask: torch.Tensor, max_answer_length: int
+    ) -> torch.Tensor:
+        """
+        Returns the scores of all combinations of start and end logits, i.e. of all candidate answers, as a tensor of
+        shape (batch_size, max_seq_len, max_seq_len). Invalid candidates get low scores that tell why they are invalid.
+        """
+        max_seq_len = start_logits.shape[1]
+        start_end_matrix = start_logits.unsqueeze(2) + end_logits.unsqueeze(1)
 
+        positions = torch.arange(max_seq_len, device=start_end_matrix.device)
+        span_length = positions.unsqueeze(0) - positions.unsqueeze(1)
         # disqualify answers where end < start
-        # (set the lower triangular matrix to low value, excluding diagonal)
-        indices = torch.tril_indices(max_seq_len, max_seq_len, offset=-1, device=start_end_matrix.device)
-        start_end_matrix[:, indices[0][:], indices[1][:]] = -888
-
+        start_end_matrix.masked_fill_(span_length < 0, -888)
         # disqualify answers where answer span is greater than max_answer_length
-        # (set the upper triangular matrix to low value, excluding diagonal)
-        indices_long_span = torch.triu_indices(
-            max_seq_len, max_seq_len, offset=max_answer_length, device=start_end_matrix.device
-        )
-        start_end_matrix[:, indices_long_span[0][:], indices_long_span[1][:]] = -777
-
+        start_end_matrix.masked_fill_(span_length >= max_answer_length, -777)
         # disqualify answers where start=0, but end != 0
         start_end_matrix[:, 0, 1:] = -666
 
-        # Turn 1d span_mask vectors into 2d span_mask along 2 different axes
         # span mask has:
         #   0 for every position that is never a valid start or end index (question tokens, mid and end special tokens, padding)
         #   1 everywhere else
-        span_mask_start = span_mask.unsqueeze(2).expand(-1, -1, max_seq_len)
-        span_mask_end = span_mask.unsqueeze(1).expand(-1, max_seq_len, -1)
-        span_mask_2d = span_mask_start + span_mask_end
         # disqualify spans where either start or end is on an invalid token
-        invalid_indices = torch.nonzero((span_mask_2d != 2), as_tuple=True)
-        start_end_matrix[invalid_indices[0][:], invalid_indices[1][:], invalid_indices[2][:]] = -999
-
-        # Sort the candidate answers by their score. Sorting happens on the flattened matrix.
-        # flat_sorted_indices.shape: (batch_size, max_seq_len^2, 1)
-        flat_scores = start_end_matrix.view(batch_size, -1)
-        flat_sorted_indices_2d = flat_scores.sort(descending=True)[1]
-        flat_sorted_indices = flat_sorted_indices_2d.unsqueeze(2)
-
-        # The returned indices are then converted back to the original dimensionality of the matrix.
-        # sorted_candidates.shape : (batch_size, max_seq_len^2, 2)
-        start_indices = torch.div(flat_sorted_indices, max_seq_len, rounding_mode="trunc")
-        end_indices = flat_sorted_indices % max_seq_len
-        sorted_candidates = torch.cat((start_indices, end_indices), dim=2)
-
-        # Get the n_best candidate answers for each sample
-        sorted_candidates = sorted_candidates.cpu().numpy()
-        start_end_matrix = start_end_matrix.cpu().numpy()
+        valid_positions = span_mask == 1
+        valid_spans = valid_positions.unsqueeze(2) & valid_positions.unsqueeze(1)
+        start_end_matrix.masked_fill_(~valid_spans, -999)
+        return start_end_matrix
+
+    def get_top_candidates_batch(
+        self, start_end_matrix: torch.Tensor, start_logits: torch.Tensor, end_logits: torch.Tensor
+    ) -> List[List[QACandidate]]:
+        """
+        Returns the top candidate answers of each sample in the batch as lists of QACandidate objects, like
+        `get_top_candidates` does for a single sample. The candidates of all samples are selected together with tensor
+        operations, without sorting all the candidates.
+
+        :param start_end_matrix: The summed start and end logits of each sample, with invalid spans disqualified,
+                                 of shape (batch_size, max_seq_len, max_seq_len).
+        :param start_logits: The start logits of each sample, of shape (batch_size, max_seq_len).
+        :param end_logits: The end logits of each sample, of shape (batch_size, max_seq_len).
+        """
+        batch_size, max_seq_len, _ = start_end_matrix.shape
+        flat_scores = start_end_matrix.reshape(batch_size, -1).clone()
+        # Ignore no_answer scores which are added at the end of each sample's candidates
+        flat_scores[:, 0] = -float("inf")
+        n_best = min(self.n_best_per_sample, flat_scores.shape[1] - 1)
+
+        if self.duplicate_filtering > -1:
+            # Greedily take the best candidate of each sample and disqualify the ones that start or end close to it
+            positions = torch.arange(max_seq_len, device=flat_scores.device)
+            scores = flat_scores.view(batch_size, max_seq_len, max_seq_len)
+            best_indices = []
+            found = []
+            for _ in range(n_best):
+                best_scores, best_flat_indices = scores.reshape(batch_size, -1).max(dim=1)
+                best_indices.append(best_flat_indices)
+                found.append(best_scores > -float("inf"))
+                best_starts = torch.div(best_flat_indices, max_seq_len, rounding_mode="trunc")
+                best_ends = best_flat_indices % max_seq_len
+                close_starts = (positions.unsqueeze(0) - best_starts.unsqueeze(1)).abs() <= self.duplicate_filtering
+                close_ends = (positions.unsqueeze(0) - best_ends.unsqueeze(1)).abs() <= self.duplicate_filtering
+                scores.masked_fill_(close_starts.unsqueeze(2) | close_ends.unsqueeze(1), -float("inf"))
+            top_flat_indices = torch.stack(best_indices, dim=1)
+            top_found = torch.stack(found, dim=1)
+        else:
+            top_flat_indices = flat_scores.topk(n_best, dim=1)[1]
+            top_found = torch.ones_like(top_flat_indices, dtype=torch.bool)
+
+        top_starts = torch.div(top_flat_indices, max_seq_len, rounding_mode="trunc").cpu().numpy()
+        top_ends = (top_flat_indices % max_seq_len).cpu().numpy()
+        top_scores = start_end_matrix.reshape(batch_size, -1).gather(1, top_flat_indices).cpu().numpy()
+        top_found = top_found.cpu().numpy()
+        no_answer_scores = start_end_matrix[:, 0, 0].cpu().numpy()
+        start_softmax = torch.softmax(start_logits, dim=-1).cpu().numpy()
+        end_softmax = torch.softmax(end_logits, dim=-1).cpu().numpy()
+
+        all_top_n = []
         for sample_idx in range(batch_size):
-            sample_top_n = self.get_top_candidates(
-                sorted_candidates[sample_idx],
-                start_end_matrix[sample_idx],
-                sample_idx,
-                start_matrix=start_matrix[sample_idx],
-                end_matrix=end_matrix[sample_idx],
+            top_candidates = []
+            for start_idx, end_idx, score, found in zip(
+                top_starts[sample_idx], top_ends[sample_idx], top_scores[sample_idx], top_found[sample_idx]
+            ):
+                if not found:
+                    break
+                confidence = (
+                    (start_softmax[sample_idx, start_idx] + end_softmax[sample_idx, end_idx]) / 2
+                    if score > -500
+                    else np.exp(score / 10)  # disqualify answers according to scores in _get_start_end_matrix()
+                )
+                top_candidates.append(
+                    QACandidate(
+                        offset_answer_start=start_idx,
+                        offset_answer_end=end_idx,
+                        score=score,
+                        answer_type="span",
+                        offset_unit="token",
+                        aggregation_level="passage",
+                        passage_id=str(sample_idx),
+                        confidence=confidence,
+                    )
+                )
+            top_candidates.append(
+                QACandidate(
+                    offset_answer_start=0,
+                    offset_answer_end=0,
+                    score=no_answer_scores[sample_idx],
+                    answer_type="no_answer",
+                    offset_unit="token",
+                    aggregation_level="passage",
+                    passage_id=None,
+                    confidence=(start_softmax[sample_idx, 0] + end_softmax[sample_idx, 0]) / 2,
+                )
             )
-            all_top_n.append(sample_top_n)
-
+            all_top_n.append(top_candidates)
         return all_top_n
 
     def get_top_candidates(self, sorted_candidates, start_end_matrix, sample_idx: int, start_matrix, end_matrix):
@@ -520,6 +576,7 @@ class QuestionAnsweringHead(PredictionHead):
         Returns top candidate answers as a list of Span objects. Operates on a matrix of summed start and end logits.
         This matrix corresponds to a single sample (includes special tokens, question tokens, passage tokens).
         This method always returns a list of len n_best + 1 (it is comprised of the n_best positive answers along with the one no_answer)
+        Use `get_top_candidates_batch` to get the top candidates of all samples in a batch at once.
         """
         # Initialize some variables
         top_candidates: List[QACandidate] = []
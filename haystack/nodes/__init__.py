@@ -1,63 +1,142 @@
-from haystack.nodes.base import BaseComponent
-
-from haystack.nodes.answer_generator import BaseGenerator, OpenAIAnswerGenerator
-from haystack.nodes.document_classifier import BaseDocumentClassifier, TransformersDocumentClassifier
-from haystack.nodes.extractor import EntityExtractor, simplify_ner_for_qa
-from haystack.nodes.file_classifier import FileTypeClassifier
-from haystack.nodes.file_converter import (
-    BaseConverter,
-    DocxToTextConverter,
-    ImageToTextConverter,
-    MarkdownConverter,
-    PDFToTextConverter,
-    TikaConverter,
-    TikaXHTMLParser,
-    TextConverter,
-    AzureConverter,
-    ParsrConverter,
-    CsvTextConverter,
-    JsonConverter,
-)
-from haystack.nodes.image_to_text import TransformersImageToText
-from haystack.nodes.label_generator import PseudoLabelGenerator
-from haystack.nodes.other import Docs2Answers, JoinDocuments, RouteDocuments, JoinAnswers, DocumentMerger, Shaper
-from haystack.nodes.preprocessor import BasePreProcessor, PreProcessor
-from haystack.nodes.prompt import PromptNode, PromptTemplate, PromptModel, BaseOutputParser, AnswerParser
-from haystack.nodes.prompt.invocation_layer import PromptModelInvocationLayer
-from haystack.nodes.query_classifier import TransformersQueryClassifier
-from haystack.nodes.question_generator import QuestionGenerator
-from haystack.nodes.ranker import (
-    BaseRanker,
-    SentenceTransformersRanker,
-    CohereRanker,
-    LostInTheMiddleRanker,
-    DiversityRanker,
-    RecentnessRanker,
-)
-from haystack.nodes.reader import BaseReader, FARMReader, TransformersReader, TableReader, RCIReader
-from haystack.nodes.retriever import (
-    BaseRetriever,
-    DenseRetriever,
-    DensePassageRetriever,
-    EmbeddingRetriever,
-    BM25Retriever,
-    FilterRetriever,
-    MultihopEmbeddingRetriever,
-    TfidfRetriever,
-    TableTextRetriever,
-    MultiModalRetriever,
-    LinkContentFetcher,
-    WebRetriever,
-)
-
-from haystack.nodes.sampler import BaseSampler, TopPSampler
-from haystack.nodes.search_engine import WebSearch
-from haystack.nodes.summarizer import BaseSummarizer, TransformersSummarizer
-from haystack.nodes.translator import BaseTranslator, TransformersTranslator
-from haystack.nodes.doc_language_classifier import (
-    LangdetectDocumentLanguageClassifier,
-    TransformersDocumentLanguageClassifier,
-)
-
-from haystack.nodes.audio import WhisperTranscriber, WhisperModel
-from haystack.nodes.connector.crawler import Crawler
+# The nodes are imported when they're first accessed, so that importing one node doesn't import all of them
+from typing import TYPE_CHECKING
+
+from haystack.lazy_imports import lazy_attributes
+
+
+_LAZY_ATTRIBUTES = {
+    "haystack.nodes.base": ["BaseComponent"],
+    "haystack.nodes.answer_generator": ["BaseGenerator", "OpenAIAnswerGenerator"],
+    "haystack.nodes.document_classifier": ["BaseDocumentClassifier", "TransformersDocumentClassifier"],
+    "haystack.nodes.extractor": ["EntityExtractor", "simplify_ner_for_qa"],
+    "haystack.nodes.file_classifier": ["FileTypeClassifier"],
+    "haystack.nodes.file_converter": [
+        "BaseConverter",
+        "DocxToTextConverter",
+        "ImageToTextConverter",
+        "MarkdownConverter",
+        "PDFToTextConverter",
+        "TikaConverter",
+        "TikaXHTMLParser",
+        "TextConverter",
+        "AzureConverter",
+        "ParsrConverter",
+        "CsvTextConverter",
+        "JsonConverter",
+    ],
+    "haystack.nodes.image_to_text": ["TransformersImageToText"],
+    "haystack.nodes.label_generator": ["PseudoLabelGenerator"],
+    "haystack.nodes.other": [
+        "Docs2Answers",
+        "JoinDocuments",
+        "RouteDocuments",
+        "JoinAnswers",
+        "DocumentMerger",
+        "Shaper",
+    ],
+    "haystack.nodes.preprocessor": ["BasePreProcessor", "PreProcessor"],
+    "haystack.nodes.prompt": ["PromptNode", "PromptTemplate", "PromptModel", "BaseOutputParser", "AnswerParser"],
+    "haystack.nodes.prompt.invocation_layer": ["PromptModelInvocationLayer"],
+    "haystack.nodes.query_classifier": ["TransformersQueryClassifier"],
+    "haystack.nodes.question_generator": ["QuestionGenerator"],
+    "haystack.nodes.ranker": [
+        "BaseRanker",
+        "SentenceTransformersRanker",
+        "CohereRanker",
+        "LostInTheMiddleRanker",
+        "DiversityRanker",
+        "RecentnessRanker",
+    ],
+    "haystack.nodes.reader": ["BaseReader", "FARMReader", "TransformersReader", "TableReader", "RCIReader"],
+    "haystack.nodes.retriever": [
+        "BaseRetriever",
+        "DenseRetriever",
+        "DensePassageRetriever",
+        "EmbeddingRetriever",
+        "BM25Retriever",
+        "FilterRetriever",
+        "MultihopEmbeddingRetriever",
+        "TfidfRetriever",
+        "TableTextRetriever",
+        "MultiModalRetriever",
+        "LinkContentFetcher",
+        "WebRetriever",
+    ],
+    "haystack.nodes.sampler": ["BaseSampler", "TopPSampler"],
+    "haystack.nodes.search_engine": ["WebSearch"],
+    "haystack.nodes.summarizer": ["BaseSummarizer", "TransformersSummarizer"],
+    "haystack.nodes.translator": ["BaseTranslator", "TransformersTranslator"],
+    "haystack.nodes.doc_language_classifier": [
+        "LangdetectDocumentLanguageClassifier",
+        "TransformersDocumentLanguageClassifier",
+    ],
+    "haystack.nodes.audio": ["WhisperTranscriber", "WhisperModel"],
+    "haystack.nodes.connector.crawler": ["Crawler"],
+}
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from haystack.nodes.base import BaseComponent
+
+    from haystack.nodes.answer_generator import BaseGenerator, OpenAIAnswerGenerator
+    from haystack.nodes.document_classifier import BaseDocumentClassifier, TransformersDocumentClassifier
+    from haystack.nodes.extractor import EntityExtractor, simplify_ner_for_qa
+    from haystack.nodes.file_classifier import FileTypeClassifier
+    from haystack.nodes.file_converter import (
+        BaseConverter,
+        DocxToTextConverter,
+        ImageToTextConverter,
+        MarkdownConverter,
+        PDFToTextConverter,
+        TikaConverter,
+        TikaXHTMLParser,
+        TextConverter,
+        AzureConverter,
+        ParsrConverter,
+        CsvTextConverter,
+        JsonConverter,
+    )
+    from haystack.nodes.image_to_text import TransformersImageToText
+    from haystack.nodes.label_generator import PseudoLabelGenerator
+    from haystack.nodes.other import Docs2Answers, JoinDocuments, RouteDocuments, JoinAnswers, DocumentMerger, Shaper
+    from haystack.nodes.preprocessor import BasePreProcessor, PreProcessor
+    from haystack.nodes.prompt import PromptNode, PromptTemplate, PromptModel, BaseOutputParser, AnswerParser
+    from haystack.nodes.prompt.invocation_layer import PromptModelInvocationLayer
+    from haystack.nodes.query_classifier import TransformersQueryClassifier
+    from haystack.nodes.question_generator import QuestionGenerator
+    from haystack.nodes.ranker import (
+        BaseRanker,
+        SentenceTransformersRanker,
+        CohereRanker,
+        LostInTheMiddleRanker,
+        DiversityRanker,
+        RecentnessRanker,
+    )
+    from haystack.nodes.reader import BaseReader, FARMReader, TransformersReader, TableReader, RCIReader
+    from haystack.nodes.retriever import (
+        BaseRetriever,
+        DenseRetriever,
+        DensePassageRetriever,
+        EmbeddingRetriever,
+        BM25Retriever,
+        FilterRetriever,
+        MultihopEmbeddingRetriever,
+        TfidfRetriever,
+        TableTextRetriever,
+        MultiModalRetriever,
+        LinkContentFetcher,
+        WebRetriever,
+    )
+
+    from haystack.nodes.sampler import BaseSampler, TopPSampler
+    from haystack.nodes.search_engine import WebSearch
+    from haystack.nodes.summarizer import BaseSummarizer, TransformersSummarizer
+    from haystack.nodes.translator import BaseTranslator, TransformersTranslator
+    from haystack.nodes.doc_language_classifier import (
+        LangdetectDocumentLanguageClassifier,
+        TransformersDocumentLanguageClassifier,
+    )
+
+    from haystack.nodes.audio import WhisperTranscriber, WhisperModel
+    from haystack.nodes.connector.crawler import Crawler
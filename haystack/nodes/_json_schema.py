@@ -1,10 +1,11 @@
 from typing import Any, Callable, Dict, List, Optional, Set, Tuple, Type, Union
 
 import os
-import sys
+import importlib
 import json
 import inspect
 import logging
+import weakref
 from pathlib import Path
 
 import pydantic.schema
@@ -36,6 +37,11 @@ SCHEMA_URL = "https://raw.githubusercontent.com/deepset-ai/haystack-json-schema/
 # else than enums and class constants: see Pipeline.load_from_config()
 ALLOW_ACCESSORY_CLASSES = False
 
+# The schemas of the node classes validated so far, see get_node_class_schema()
+_NODE_CLASS_SCHEMAS: "weakref.WeakKeyDictionary[Type[BaseComponent], Tuple[Dict[str, Any], Dict[str, Any]]]" = (
+    weakref.WeakKeyDictionary()
+)
+
 
 class Settings(BaseSettings):
     input_token: SecretStr
@@ -125,7 +131,8 @@ def find_subclasses_in_modules(importable_modules: List[str]):
     return [
         (module, class_)
         for module in importable_modules
-        for _, class_ in inspect.getmembers(sys.modules[module])
+        # Lazily imported packages import all of their members when listing them
+        for _, class_ in inspect.getmembers(importlib.import_module(module))
         if is_valid_component_class(class_)
     ]
 
@@ -396,6 +403,26 @@ def get_json_schema(filename: str, version: str, modules: Optional[List[str]] =
     return pipeline_schema
 
 
+def get_node_class_schema(node_class: Type[BaseComponent]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+    """
+    Like `create_schema_for_node_class()`, but checks that the class can be used in a pipeline first, and creates the
+    schema of each class only once per process. The returned schema must not be modified.
+
+    :returns: the schema for the node and all accessory classes,
+              and a dict with the reference to the node only.
+    """
+    if node_class not in _NODE_CLASS_SCHEMAS:
+        if not is_valid_component_class(node_class):
+            raise PipelineSchemaError(
+                f"Can't generate a valid schema for node of type '{node_class.__name__}'. "
+                "Possible causes: \n"
+                "   - it has abstract methods\n"
+                "   - its __init__() take something else than Python primitive types or other nodes as parameter.\n"
+            )
+        _NODE_CLASS_SCHEMAS[node_class] = create_schema_for_node_class(node_class)
+    return _NODE_CLASS_SCHEMAS[node_class]
+
+
 def inject_definition_in_schema(node_class: Type[BaseComponent], schema: Dict[str, Any]) -> Dict[str, Any]:
     """
     Given a node and a schema in dict form, injects the JSON schema for the new component
@@ -403,14 +430,7 @@ def inject_definition_in_schema(node_class: Type[BaseComponent], schema: Dict[st
 
     :returns: the updated schema
     """
-    if not is_valid_component_class(node_class):
-        raise PipelineSchemaError(
-            f"Can't generate a valid schema for node of type '{node_class.__name__}'. "
-            "Possible causes: \n"
-            "   - it has abstract methods\n"
-            "   - its __init__() take something else than Python primitive types or other nodes as parameter.\n"
-        )
-    schema_definition, node_ref = create_schema_for_node_class(node_class)
+    schema_definition, node_ref = get_node_class_schema(node_class)
     schema["definitions"].update(schema_definition)
     schema["properties"]["components"]["items"]["anyOf"].append(node_ref)
     logger.info("Added definition for %s", getattr(node_class, "__name__"))
@@ -421,6 +441,24 @@ def load_schema():
     """
     Generate the json schema if it doesn't exist and load it
     """
+    with open(get_schema_file_path(), "r") as schema_file:
+        return json.load(schema_file)
+
+
+def get_schema_key() -> Tuple[str, int, int]:
+    """
+    Identifies the current content of the main json schema file, generating it if it doesn't exist. The key changes
+    whenever the file is regenerated, so it can be used to cache anything derived from the schema.
+    """
+    schema_file_path = get_schema_file_path()
+    stat = schema_file_path.stat()
+    return str(schema_file_path), stat.st_mtime_ns, stat.st_size
+
+
+def get_schema_file_path() -> Path:
+    """
+    Returns the path of the main json schema file, generating it if it doesn't exist
+    """
     schema_file_path = JSON_SCHEMAS_PATH / "haystack-pipeline-main.schema.json"
     if not os.path.exists(schema_file_path):
         logger.info("Json schema not found, generating one at: %s", schema_file_path)
@@ -432,9 +470,7 @@ def load_schema():
                 schema_file_path.unlink()
             # This error is not recoverable
             raise e
-
-    with open(schema_file_path, "r") as schema_file:
-        return json.load(schema_file)
+    return schema_file_path
 
 
 def update_json_schema(destination_path: Path = JSON_SCHEMAS_PATH, main_only: bool = False):
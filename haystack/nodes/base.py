@@ -4,6 +4,7 @@ from typing import Any, Optional, Dict, List, Tuple, Union, Callable, Type
 from copy import deepcopy
 from abc import ABC, abstractmethod
 from functools import wraps
+import importlib
 import inspect
 import logging
 
@@ -14,6 +15,9 @@ from haystack.utils.reflection import args_to_kwargs
 
 logger = logging.getLogger(__name__)
 
+# Packages that import their components lazily. Component classes are only registered once they're imported.
+LAZY_COMPONENT_PACKAGES = ["haystack.nodes", "haystack.document_stores"]
+
 
 def exportable_to_yaml(init_func):
     """
@@ -117,6 +121,8 @@ class BaseComponent(ABC):
 
     @classmethod
     def get_subclass(cls, component_type: str) -> Type[BaseComponent]:
+        if component_type not in cls._subclasses.keys():
+            cls._import_component_class(component_type)
         if component_type not in cls._subclasses.keys():
             raise PipelineSchemaError(
                 f"Haystack component with the name '{component_type}' not found. "
@@ -127,6 +133,22 @@ class BaseComponent(ABC):
         subclass = cls._subclasses[component_type]
         return subclass
 
+    @staticmethod
+    def _import_component_class(component_type: str):
+        """
+        Imports the Haystack component class called `component_type`, so that it registers itself as a subclass.
+        Components exported by the lazily imported packages are imported on their own. For other classes, like the
+        ones that are only defined in a submodule, all components of these packages are imported.
+        """
+        packages = [importlib.import_module(package) for package in LAZY_COMPONENT_PACKAGES]
+        for package in packages:
+            if component_type in dir(package):
+                getattr(package, component_type)
+                return
+        for package in packages:
+            for name in dir(package):
+                getattr(package, name)
+
     @classmethod
     def _calculate_outgoing_edges(cls, component_params: Dict[str, Any]) -> int:
         """
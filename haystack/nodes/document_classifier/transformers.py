@@ -2,8 +2,6 @@ from typing import List, Optional, Union
 import logging
 import itertools
 
-from tqdm import tqdm
-
 from haystack.schema import Document
 from haystack.nodes.document_classifier.base import BaseDocumentClassifier
 from haystack.lazy_imports import LazyImport
@@ -12,6 +10,8 @@ with LazyImport(message="Run 'pip install farm-haystack[inference]'") as torch_a
     import torch
     from transformers import pipeline
     from haystack.modeling.utils import initialize_device_settings  # pylint: disable=ungrouped-imports
+    from haystack.utils.batching import count_tokens, run_in_batches
+    from haystack.utils.zero_shot import ZeroShotClassifier
 
 
 logger = logging.getLogger(__name__)
@@ -83,6 +83,7 @@ class TransformersDocumentClassifier(BaseDocumentClassifier):
         progress_bar: bool = True,
         use_auth_token: Optional[Union[str, bool]] = None,
         devices: Optional[List[Union[str, "torch.device"]]] = None,
+        max_tokens_per_batch: Optional[int] = None,
     ):
         """
         Load a text classification model from Transformers.
@@ -109,7 +110,8 @@ class TransformersDocumentClassifier(BaseDocumentClassifier):
         ["positive", "negative"] otherwise None. Given a LABEL, the sequence fed to the model is "<cls> sequence to
         classify <sep> This example is LABEL . <sep>" and the model predicts whether that sequence is a contradiction
         or an entailment.
-        :param batch_size: Number of Documents to be processed at a time.
+        :param batch_size: Number of Documents to be processed at a time. For the task 'zero-shot-classification', it's
+                           the number of (Document, label) pairs processed at a time.
         :param classification_field: Name of Document's meta field to be used for classification. If left unset, Document.content is used by default.
         :param progress_bar: Whether to show a progress bar while processing.
         :param use_auth_token: The API token used to download private models from Huggingface.
@@ -121,6 +123,10 @@ class TransformersDocumentClassifier(BaseDocumentClassifier):
                         A list containing torch device objects and/or strings is supported (For example
                         [torch.device('cuda:0'), "mps", "cuda:1"]). When specifying `use_gpu=False` the devices
                         parameter is not used and a single cpu device is used for inference.
+        :param max_tokens_per_batch: The maximum number of tokens in a batch, counting the padding. Documents are
+                                     grouped into batches of Documents with a similar length, so batches of short
+                                     Documents can hold more of them than `batch_size`. If `None`, only `batch_size`
+                                     limits the batches.
         """
         torch_and_transformers_import.check()
 
@@ -166,8 +172,11 @@ class TransformersDocumentClassifier(BaseDocumentClassifier):
         self.labels = labels
         self.task = task
         self.batch_size = batch_size
+        self.max_tokens_per_batch = max_tokens_per_batch
         self.classification_field = classification_field
         self.progress_bar = progress_bar
+        if task == "zero-shot-classification":
+            self.zero_shot_classifier = ZeroShotClassifier(self.model)
 
     def predict(self, documents: List[Document], batch_size: Optional[int] = None) -> List[Document]:
         """
@@ -185,17 +194,25 @@ class TransformersDocumentClassifier(BaseDocumentClassifier):
             doc.content if self.classification_field is None else doc.meta[self.classification_field]
             for doc in documents
         ]
-        batches = self.get_batches(texts, batch_size=batch_size)
-        predictions = []
-        pb = tqdm(total=len(texts), disable=not self.progress_bar, desc="Classifying documents")
-        for batch in batches:
-            if self.task == "zero-shot-classification":
-                batched_prediction = self.model(batch, candidate_labels=self.labels, truncation=True)
-            elif self.task == "text-classification":
-                batched_prediction = self.model(batch, top_k=self.top_k, truncation=True)
-            predictions.extend(batched_prediction)
-            pb.update(len(batch))
-        pb.close()
+        if self.task == "zero-shot-classification":
+            predictions = self.zero_shot_classifier(
+                texts,
+                labels=self.labels,
+                batch_size=batch_size,
+                max_tokens_per_batch=self.max_tokens_per_batch,
+                progress_bar=self.progress_bar,
+                desc="Classifying documents",
+            )
+        elif self.task == "text-classification":
+            predictions = run_in_batches(
+                texts,
+                lambda batch: self.model(batch, top_k=self.top_k, truncation=True, batch_size=len(batch)),
+                lengths=count_tokens(self.model.tokenizer, texts),
+                batch_size=batch_size,
+                max_tokens_per_batch=self.max_tokens_per_batch,
+                progress_bar=self.progress_bar,
+                desc="Classifying documents",
+            )
 
         for prediction, doc in zip(predictions, documents):
             if self.task == "zero-shot-classification":
@@ -1,7 +1,7 @@
 import logging
-from collections import defaultdict
-from math import inf
-from typing import List, Optional
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
 
 from haystack.nodes.other.join import JoinNode
 from haystack.schema import Document
@@ -19,6 +19,10 @@ class JoinDocuments(JoinNode):
     * merge: merge scores of documents from multiple nodes. Optionally, each input score can be given a different
              `weight` & a `top_k` limit can be set. This mode can also be used for "reranking" retrieved documents.
     * reciprocal_rank_fusion: combines the documents based on their rank in multiple nodes.
+
+    The scores are computed on arrays: every document gets a column, the scores of all input nodes are combined with
+    vectorized NumPy operations and only the `top_k_join` best documents are selected and sorted. In `run_batch`,
+    the documents of all queries are fused in one go.
     """
 
     outgoing_edges = 1
@@ -60,39 +64,7 @@ class JoinDocuments(JoinNode):
 
     def run_accumulated(self, inputs: List[dict], top_k_join: Optional[int] = None):  # type: ignore
         results = [inp["documents"] for inp in inputs]
-        document_map = {doc.id: doc for result in results for doc in result}
-
-        if self.join_mode == "concatenate":
-            scores_map = self._concatenate_results(results, document_map)
-        elif self.join_mode == "merge":
-            scores_map = self._calculate_comb_sum(results)
-        elif self.join_mode == "reciprocal_rank_fusion":
-            scores_map = self._calculate_rrf(results)
-        else:
-            raise ValueError(f"Invalid join_mode: {self.join_mode}")
-
-        # only sort the docs if that was requested
-        if self.sort_by_score:
-            sorted_docs = sorted(scores_map.items(), key=lambda d: d[1] if d[1] is not None else -inf, reverse=True)
-            if any(s is None for s in scores_map.values()):
-                logger.info(
-                    "The `JoinDocuments` node has received some documents with `score=None` - and was requested "
-                    "to sort the documents by score, so the `score=None` documents got sorted as if their "
-                    "score would be `-infinity`."
-                )
-        else:
-            sorted_docs = list(scores_map.items())
-
-        if not top_k_join:
-            top_k_join = self.top_k_join
-        if not top_k_join:
-            top_k_join = len(sorted_docs)
-
-        docs = []
-        for id, score in sorted_docs[:top_k_join]:
-            doc = document_map[id]
-            doc.score = score
-            docs.append(doc)
+        docs = self._join([results], top_k_join=top_k_join)[0]
 
         output = {"documents": docs, "labels": inputs[0].get("labels", None)}
 
@@ -104,59 +76,158 @@ class JoinDocuments(JoinNode):
             return self.run(inputs=inputs, top_k_join=top_k_join)
         # Join lists of document lists
         else:
-            output_docs = []
             incoming_edges = [inp["documents"] for inp in inputs]
-            for idx in range(len(incoming_edges[0])):
-                cur_docs_to_join = []
-                for edge in incoming_edges:
-                    cur_docs_to_join.append({"documents": edge[idx]})
-                cur, _ = self.run(inputs=cur_docs_to_join, top_k_join=top_k_join)
-                output_docs.append(cur["documents"])
+            results_per_query = [[edge[idx] for edge in incoming_edges] for idx in range(len(incoming_edges[0]))]
+            output_docs = self._join(results_per_query, top_k_join=top_k_join)
 
             output = {"documents": output_docs, "labels": inputs[0].get("labels", None)}
 
             return output, "output_1"
 
-    def _concatenate_results(self, results, document_map):
+    def _join(self, results_per_query: List[List[List[Document]]], top_k_join: Optional[int] = None):
+        """
+        Joins the results of the input nodes for a batch of queries.
+
+        Each distinct document of a query gets one column in a flat array that holds the columns of all queries one
+        after the other. The scores of all queries are computed at once and the best documents of each query are then
+        selected from its slice of the array.
+
+        :param results_per_query: For each query, the list of documents of every input node.
+        :param top_k_join: Limit documents to top_k based on the resulting scores of the join.
+        :return: For each query, the joined list of documents.
+        """
+        columns, input_ids, ranks, scores, documents, query_offsets = self._to_arrays(results_per_query)
+
+        if self.join_mode == "concatenate":
+            joined_scores = self._concatenate_scores(columns, scores, len(documents))
+        elif self.join_mode == "merge":
+            joined_scores = self._comb_sum_scores(columns, input_ids, scores, len(documents), results_per_query)
+        elif self.join_mode == "reciprocal_rank_fusion":
+            joined_scores = self._rrf_scores(columns, ranks, len(documents))
+        else:
+            raise ValueError(f"Invalid join_mode: {self.join_mode}")
+
+        if self.sort_by_score and np.isnan(joined_scores).any():
+            logger.info(
+                "The `JoinDocuments` node has received some documents with `score=None` - and was requested "
+                "to sort the documents by score, so the `score=None` documents got sorted as if their "
+                "score would be `-infinity`."
+            )
+
+        top_k_join = top_k_join or self.top_k_join
+        joined_docs = []
+        for start, end in zip(query_offsets[:-1], query_offsets[1:]):
+            query_scores = joined_scores[start:end]
+            if self.sort_by_score:
+                indices = self._top_k_indices(np.nan_to_num(query_scores, nan=-np.inf), top_k_join)
+            else:
+                indices = np.arange(len(query_scores))[:top_k_join]
+
+            docs = []
+            for idx, score in zip(indices.tolist(), query_scores[indices].tolist()):
+                doc = documents[start + idx]
+                doc.score = None if np.isnan(score) else score
+                docs.append(doc)
+            joined_docs.append(docs)
+
+        return joined_docs
+
+    @staticmethod
+    def _to_arrays(
+        results_per_query: List[List[List[Document]]],
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, List[Document], List[int]]:
+        """
+        Flattens the input documents into arrays with one entry per incoming document.
+
+        :return: The column of each document's id, the index of the input node it comes from, its rank in that input,
+                 its score (NaN for `None`), the document of each column and the offsets of the queries' columns.
+        """
+        columns: List[int] = []
+        input_ids: List[int] = []
+        ranks: List[int] = []
+        scores: List[float] = []
+        documents: List[Document] = []
+        query_offsets = [0]
+        for results in results_per_query:
+            id_to_column: Dict[str, int] = {}
+            for input_id, result in enumerate(results):
+                for rank, doc in enumerate(result):
+                    column = id_to_column.setdefault(doc.id, len(documents))
+                    if column == len(documents):
+                        documents.append(doc)
+                    else:
+                        # like a dict built from all documents, keep the last object seen for a document id
+                        documents[column] = doc
+                    columns.append(column)
+                    input_ids.append(input_id)
+                    ranks.append(rank)
+                    scores.append(np.nan if doc.score is None else doc.score)
+            query_offsets.append(len(documents))
+
+        return (
+            np.array(columns, dtype=np.int64),
+            np.array(input_ids, dtype=np.int64),
+            np.array(ranks, dtype=np.int64),
+            np.array(scores, dtype=np.float64),
+            documents,
+            query_offsets,
+        )
+
+    @staticmethod
+    def _concatenate_scores(columns: np.ndarray, scores: np.ndarray, num_columns: int) -> np.ndarray:
         """
         Concatenates multiple document result lists.
-        Return the documents with the higher score.
+        Return the highest score of each document, NaN if none of its duplicates has a score.
         """
-        list_id = list(document_map.keys())
-        scores_map = {}
-        for idx in list_id:
-            tmp = []
-            for result in results:
-                for doc in result:
-                    if doc.id == idx:
-                        tmp.append(doc)
-            item_best_score = max(tmp, key=lambda x: x.score if x.score is not None else -inf)
-            scores_map.update({idx: item_best_score.score})
-        return scores_map
-
-    def _calculate_comb_sum(self, results):
+        joined_scores = np.full(num_columns, -np.inf)
+        np.maximum.at(joined_scores, columns, np.nan_to_num(scores, nan=-np.inf))
+        has_score = np.bincount(columns, weights=~np.isnan(scores), minlength=num_columns) > 0
+        joined_scores[~has_score] = np.nan
+        return joined_scores
+
+    def _comb_sum_scores(
+        self,
+        columns: np.ndarray,
+        input_ids: np.ndarray,
+        scores: np.ndarray,
+        num_columns: int,
+        results_per_query: List[List[List[Document]]],
+    ) -> np.ndarray:
         """
         Calculates a combination sum by multiplying each score by its weight.
         """
-        scores_map = defaultdict(int)
-        weights = self.weights if self.weights else [1 / len(results)] * len(results)
-
-        for result, weight in zip(results, weights):
-            for doc in result:
-                scores_map[doc.id] += (doc.score if doc.score else 0) * weight
-
-        return scores_map
-
-    def _calculate_rrf(self, results):
+        num_inputs = max((len(results) for results in results_per_query), default=0)
+        if num_inputs == 0:
+            return np.zeros(num_columns)
+        weights = np.zeros(num_inputs)
+        node_weights = self.weights if self.weights else [1 / num_inputs] * num_inputs
+        # inputs without a weight don't add to the scores
+        weights[: len(node_weights)] = node_weights[:num_inputs]
+        weighted_scores = np.nan_to_num(scores, nan=0.0) * weights[input_ids]
+        return np.bincount(columns, weights=weighted_scores, minlength=num_columns)
+
+    @staticmethod
+    def _rrf_scores(columns: np.ndarray, ranks: np.ndarray, num_columns: int) -> np.ndarray:
         """
         Calculates the reciprocal rank fusion. The constant K is set to 61 (60 was suggested by the original paper,
         plus 1 as python lists are 0-based and the paper used 1-based ranking).
         """
         K = 61
 
-        scores_map = defaultdict(int)
-        for result in results:
-            for rank, doc in enumerate(result):
-                scores_map[doc.id] += 1 / (K + rank)
+        return np.bincount(columns, weights=1 / (K + ranks), minlength=num_columns)
 
-        return scores_map
+    @staticmethod
+    def _top_k_indices(scores: np.ndarray, top_k: Optional[int]) -> np.ndarray:
+        """
+        Returns the indices of the `top_k` highest scores, sorted by descending score. Documents with equal scores
+        keep their original order, exactly like a stable sort of all scores would.
+        Instead of sorting all scores, it partitions them around the k-th highest score and only sorts the top_k.
+        """
+        if not top_k or top_k >= len(scores):
+            return np.argsort(-scores, kind="stable")
+
+        kth_score = np.partition(scores, len(scores) - top_k)[len(scores) - top_k]
+        above = np.flatnonzero(scores > kth_score)
+        ties = np.flatnonzero(scores == kth_score)[: top_k - len(above)]
+        candidates = np.sort(np.concatenate([above, ties]))
+        return candidates[np.argsort(-scores[candidates], kind="stable")]
@@ -2,8 +2,6 @@ import logging
 from pathlib import Path
 from typing import Union, List, Optional, Dict, Any
 
-from tqdm import tqdm
-
 from haystack.nodes.query_classifier.base import BaseQueryClassifier
 from haystack.lazy_imports import LazyImport
 
@@ -15,7 +13,8 @@ with LazyImport(message="Run 'pip install farm-haystack[inference]'") as torch_a
     import torch
     from transformers import pipeline
     from haystack.modeling.utils import initialize_device_settings  # pylint: disable=ungrouped-imports
-    from haystack.utils.torch_utils import ListDataset
+    from haystack.utils.batching import count_tokens, run_in_batches
+    from haystack.utils.zero_shot import ZeroShotClassifier
 
 
 DEFAULT_LABELS = ["LABEL_1", "LABEL_0"]
@@ -78,6 +77,7 @@ class TransformersQueryClassifier(BaseQueryClassifier):
         progress_bar: bool = True,
         use_auth_token: Optional[Union[str, bool]] = None,
         devices: Optional[List[Union[str, "torch.device"]]] = None,
+        max_tokens_per_batch: Optional[int] = None,
     ):
         """
         :param model_name_or_path: Directory of a saved model or the name of a public model, for example 'shahrukhx01/bert-mini-finetune-question-detection'.
@@ -89,7 +89,8 @@ class TransformersQueryClassifier(BaseQueryClassifier):
         :param labels: If the task is 'text-classification' and an ordered list of labels is provided, the first label corresponds to output_1,
         the second label to output_2, and so on. The labels must match the model labels; only the order can differ.
         If the task is 'zero-shot-classification', these are the candidate labels.
-        :param batch_size: The number of queries to be processed at a time.
+        :param batch_size: The number of queries to be processed at a time. If the task is 'zero-shot-classification',
+                           it's the number of (query, label) pairs processed at a time.
         :param progress_bar: Whether to show a progress bar.
         :param use_auth_token: The API token used to download private models from Huggingface.
                                If this parameter is set to `True`, then the token generated when running
@@ -101,6 +102,10 @@ class TransformersQueryClassifier(BaseQueryClassifier):
                         A list containing torch device objects and/or strings is supported (For example
                         [torch.device('cuda:0'), "mps", "cuda:1"]). When specifying `use_gpu=False` the devices
                         parameter is not used and a single cpu device is used for inference.
+        :param max_tokens_per_batch: The maximum number of tokens in a batch, counting the padding. Queries are grouped
+                                     into batches of queries with a similar length, so batches of short queries can
+                                     hold more of them than `batch_size`. If `None`, only `batch_size` limits the
+                                     batches.
         """
         torch_and_transformers_import.check()
 
@@ -140,7 +145,10 @@ class TransformersQueryClassifier(BaseQueryClassifier):
             )
         self.task = task
         self.batch_size = batch_size
+        self.max_tokens_per_batch = max_tokens_per_batch
         self.progress_bar = progress_bar
+        if task == "zero-shot-classification":
+            self.zero_shot_classifier = ZeroShotClassifier(self.model)
 
     @classmethod
     def _calculate_outgoing_edges(cls, component_params: Dict[str, Any]) -> int:
@@ -154,7 +162,7 @@ class TransformersQueryClassifier(BaseQueryClassifier):
 
     def run(self, query: str):  # type: ignore
         if self.task == "zero-shot-classification":
-            prediction = self.model([query], candidate_labels=self.labels, truncation=True)
+            prediction = self.zero_shot_classifier([query], labels=self.labels, batch_size=self.batch_size)
             label = prediction[0]["labels"][0]
         elif self.task == "text-classification":
             prediction = self.model([query], truncation=True)
@@ -162,25 +170,27 @@ class TransformersQueryClassifier(BaseQueryClassifier):
         return {}, f"output_{self._get_edge_number_from_label(label)}"
 
     def run_batch(self, queries: List[str], batch_size: Optional[int] = None):  # type: ignore
-        # HF pb hack https://discuss.huggingface.co/t/progress-bar-for-hf-pipelines/20498/2
-        queries_dataset = ListDataset(queries)
         if batch_size is None:
             batch_size = self.batch_size
-        all_predictions = []
         if self.task == "zero-shot-classification":
-            for predictions in tqdm(
-                self.model(queries_dataset, candidate_labels=self.labels, truncation=True, batch_size=batch_size),
-                disable=not self.progress_bar,
+            all_predictions = self.zero_shot_classifier(
+                queries,
+                labels=self.labels,
+                batch_size=batch_size,
+                max_tokens_per_batch=self.max_tokens_per_batch,
+                progress_bar=self.progress_bar,
                 desc="Classifying queries",
-            ):
-                all_predictions.extend([predictions])
+            )
         elif self.task == "text-classification":
-            for predictions in tqdm(
-                self.model(queries_dataset, truncation=True, batch_size=batch_size),
-                disable=not self.progress_bar,
+            all_predictions = run_in_batches(
+                queries,
+                lambda batch: self.model(batch, truncation=True, batch_size=len(batch)),
+                lengths=count_tokens(self.model.tokenizer, queries),
+                batch_size=batch_size,
+                max_tokens_per_batch=self.max_tokens_per_batch,
+                progress_bar=self.progress_bar,
                 desc="Classifying queries",
-            ):
-                all_predictions.extend([predictions])
+            )
         results = {f"output_{self._get_edge_number_from_label(label)}": {"queries": []} for label in self.labels}  # type: ignore
         for query, prediction in zip(queries, all_predictions):
             if self.task == "zero-shot-classification":
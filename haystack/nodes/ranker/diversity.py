@@ -2,6 +2,8 @@ import logging
 from pathlib import Path
 from typing import List, Literal, Optional, Union
 
+import numpy as np
+
 from haystack.nodes.ranker.base import BaseRanker
 from haystack.schema import Document
 from haystack.lazy_imports import LazyImport
@@ -27,6 +29,7 @@ class DiversityRanker(BaseRanker):
         use_gpu: Optional[bool] = True,
         devices: Optional[List[Union[str, "torch.device"]]] = None,
         similarity: Literal["dot_product", "cosine"] = "dot_product",
+        use_document_embeddings: bool = False,
     ):
         """
         Initialize a DiversityRanker.
@@ -36,6 +39,10 @@ class DiversityRanker(BaseRanker):
         :param use_gpu: Whether to use GPU (if available). If no GPUs are available, it falls back on a CPU.
         :param devices: List of torch devices (for example, cuda:0, cpu, mps) to limit inference to specific devices.
         :param similarity: Whether to use dot product or cosine similarity. Can be set to "dot_product" (default) or "cosine".
+        :param use_document_embeddings: Whether to reuse the embeddings the Documents already have, for example from an
+                                        EmbeddingRetriever, instead of encoding their content again. Only enable this if
+                                        the embeddings were created with the same model as `model_name_or_path`.
+                                        Documents without an embedding of the model's dimension are still encoded.
         """
         torch_and_transformers_import.check()
         super().__init__()
@@ -43,6 +50,7 @@ class DiversityRanker(BaseRanker):
         self.devices, _ = initialize_device_settings(devices=devices, use_cuda=use_gpu, multi_gpu=True)
         self.model = SentenceTransformer(model_name_or_path, device=str(self.devices[0]))
         self.similarity = similarity
+        self.use_document_embeddings = use_document_embeddings
 
     def predict(self, query: str, documents: List[Document], top_k: Optional[int] = None) -> List[Document]:
         """
@@ -60,10 +68,12 @@ class DiversityRanker(BaseRanker):
             raise ValueError("No documents to choose from")
 
         top_k = top_k or self.top_k
-        diversity_sorted = self.greedy_diversity_order(query=query, documents=documents)
+        diversity_sorted = self.greedy_diversity_order(query=query, documents=documents, top_k=top_k)
         return diversity_sorted[:top_k]
 
-    def greedy_diversity_order(self, query: str, documents: List[Document]) -> List[Document]:
+    def greedy_diversity_order(
+        self, query: str, documents: List[Document], top_k: Optional[int] = None
+    ) -> List[Document]:
         """
         Orders the given list of documents to maximize diversity. The algorithm first calculates embeddings for
         each document and the query. It starts by selecting the document that is semantically closest to the query.
@@ -73,45 +83,102 @@ class DiversityRanker(BaseRanker):
 
         :param query: The search query.
         :param documents: The list of Document objects to be ranked.
+        :param top_k: Stop after selecting this many documents. By default, all documents are ordered.
 
         :return: A list of documents ordered to maximize diversity.
         """
+        return self._greedy_diversity_order_batch(queries=[query], documents=[documents], top_k=top_k)[0]
 
-        # Calculate embeddings
-        doc_embeddings: torch.Tensor = self.model.encode([d.content for d in documents], convert_to_tensor=True)
-        query_embedding: torch.Tensor = self.model.encode([query], convert_to_tensor=True)
+    def _embed_documents(self, documents: List[Document]) -> "torch.Tensor":
+        """
+        Calculates the embeddings of the documents. If `use_document_embeddings` is enabled, the existing embeddings
+        of the documents are reused and only the documents without one are encoded.
+        """
+        dim = self.model.get_sentence_embedding_dimension()
+        reusable = [
+            self.use_document_embeddings and dim is not None and doc.embedding is not None and len(doc.embedding) == dim
+            for doc in documents
+        ]
+        if not any(reusable):
+            return self.model.encode([doc.content for doc in documents], convert_to_tensor=True)
+
+        embeddings = torch.empty((len(documents), dim), device=self.model.device)
+        mask = torch.tensor(reusable, dtype=torch.bool, device=embeddings.device)
+        embeddings[mask] = torch.as_tensor(
+            np.stack([doc.embedding for doc, reuse in zip(documents, reusable) if reuse]),
+            dtype=embeddings.dtype,
+            device=embeddings.device,
+        )
+        if not all(reusable):
+            embeddings[~mask] = self.model.encode(
+                [doc.content for doc, reuse in zip(documents, reusable) if not reuse], convert_to_tensor=True
+            ).to(embeddings.dtype)
+        return embeddings
+
+    def _greedy_diversity_order_batch(
+        self, queries: List[str], documents: List[List[Document]], top_k: Optional[int] = None
+    ) -> List[List[Document]]:
+        """
+        Runs the greedy diversity ordering for a batch of queries at once. The document lists are padded to the same
+        length, so that every selection step is a single tensor operation for all queries.
+        """
+        num_docs = [len(docs) for docs in documents]
+        max_num_docs = max(num_docs)
+        batch_size = len(documents)
+
+        # Calculate embeddings for the documents of all queries at once and pad them to (batch, max_num_docs, dim)
+        flat_doc_embeddings = self._embed_documents([doc for docs in documents for doc in docs])
+        query_embeddings: torch.Tensor = self.model.encode(queries, convert_to_tensor=True).to(
+            flat_doc_embeddings.dtype
+        )
+        device = flat_doc_embeddings.device
+        doc_embeddings = flat_doc_embeddings.new_zeros((batch_size, max_num_docs, flat_doc_embeddings.shape[-1]))
+        padding = torch.ones((batch_size, max_num_docs), dtype=torch.bool, device=device)
+        offset = 0
+        for idx, n in enumerate(num_docs):
+            doc_embeddings[idx, :n] = flat_doc_embeddings[offset : offset + n]
+            padding[idx, :n] = False
+            offset += n
 
         if self.similarity == "dot_product":
-            doc_embeddings /= torch.norm(doc_embeddings, p=2, dim=-1).unsqueeze(-1)
-            query_embedding /= torch.norm(query_embedding, p=2, dim=-1).unsqueeze(-1)
+            doc_embeddings = torch.nn.functional.normalize(doc_embeddings, p=2, dim=-1)
+            query_embeddings = torch.nn.functional.normalize(query_embeddings, p=2, dim=-1)
 
-        n = len(documents)
-        selected: List[int] = []
+        rows = torch.arange(batch_size, device=device)
+        # Divided by n for numerical stability, n being the number of documents of each query
+        n = torch.tensor(num_docs, device=device, dtype=doc_embeddings.dtype).unsqueeze(-1)
+        num_selections = min(top_k or max_num_docs, max_num_docs)
 
         # Compute the similarity vector between the query and documents
-        query_doc_sim: torch.Tensor = query_embedding @ doc_embeddings.T
+        query_doc_sim = torch.einsum("bd,bnd->bn", query_embeddings, doc_embeddings)
+        query_doc_sim[padding] = -torch.inf
 
         # Start with the document with the highest similarity to the query
-        selected.append(int(torch.argmax(query_doc_sim).item()))
-
-        selected_sum = doc_embeddings[selected[0]] / n
+        selected_idx = torch.argmax(query_doc_sim, dim=-1)
+        selected = torch.zeros((batch_size, max_num_docs), dtype=torch.bool, device=device)
+        selected[rows, selected_idx] = True
+        order = [selected_idx]
+        selected_sum = doc_embeddings[rows, selected_idx] / n
 
-        while len(selected) < n:
+        for _ in range(1, num_selections):
             # Compute mean of dot products of all selected documents and all other documents
-            similarities = selected_sum @ doc_embeddings.T
-            # Mask documents that are already selected
-            similarities[selected] = torch.inf
+            similarities = torch.einsum("bd,bnd->bn", selected_sum, doc_embeddings)
+            # Mask documents that are already selected and padding
+            similarities[selected | padding] = torch.inf
             # Select the document with the lowest total similarity score
-            index_unselected = int(torch.argmin(similarities).item())
+            selected_idx = torch.argmin(similarities, dim=-1)
 
-            selected.append(index_unselected)
+            selected[rows, selected_idx] = True
+            order.append(selected_idx)
             # It's enough just to add to the selected vectors because dot product is distributive
-            # It's divided by n for numerical stability
-            selected_sum += doc_embeddings[index_unselected] / n
+            selected_sum += doc_embeddings[rows, selected_idx] / n
 
-        ranked_docs: List[Document] = [documents[i] for i in selected]
-
-        return ranked_docs
+        # Queries with fewer documents than selection steps have picked padding at the end, which is cut off here
+        order_per_query = torch.stack(order, dim=-1).tolist()
+        return [
+            [docs[i] for i in query_order[: min(len(docs), num_selections)]]
+            for docs, query_order in zip(documents, order_per_query)
+        ]
 
     def predict_batch(
         self,
@@ -146,8 +213,13 @@ class DiversityRanker(BaseRanker):
                 queries = queries * len(documents)
             if len(queries) != len(documents):
                 raise ValueError("Number of queries must be equal to number of provided Document lists.")
-
-            results = []
-            for query, cur_docs in zip(queries, documents):
-                results.append(self.predict(query=query, documents=cur_docs, top_k=top_k))  # type: ignore
-            return results
+            if any(query is None or len(query) == 0 for query in queries):
+                raise ValueError("Query is empty")
+            if any(cur_docs is None or len(cur_docs) == 0 for cur_docs in documents):
+                raise ValueError("No documents to choose from")
+
+            # All queries are ranked together with padded tensor operations
+            top_k = int(top_k or self.top_k or 0) or None
+            return self._greedy_diversity_order_batch(
+                queries=queries, documents=documents, top_k=top_k  # type: ignore [arg-type]
+            )
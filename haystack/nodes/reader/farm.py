@@ -16,7 +16,6 @@ from haystack.errors import HaystackError
 from haystack.schema import Document, Answer, Span
 from haystack.document_stores.base import BaseDocumentStore
 from haystack.nodes.reader.base import BaseReader
-from haystack.utils import get_batches_from_generator
 from haystack.utils.early_stopping import EarlyStopping
 from haystack.telemetry import send_event
 from haystack.lazy_imports import LazyImport
@@ -32,6 +31,7 @@ with LazyImport(message="Run 'pip install farm-haystack[inference]'") as torch_a
     from haystack.modeling.data_handler.dataloader import NamedDataLoader
     from haystack.modeling.data_handler.inputs import QAInput, Question
     from haystack.modeling.infer import QAInferencer
+    from haystack.modeling.model.feature_extraction import DocumentTokenizationCache
     from haystack.modeling.model.optimization import initialize_optimizer
     from haystack.modeling.model.predictions import QAPred, QACandidate
     from haystack.modeling.model.adaptive_model import AdaptiveModel
@@ -77,6 +77,7 @@ class FARMReader(BaseReader):
         use_auth_token: Optional[Union[str, bool]] = None,
         max_query_length: int = 64,
         preprocessing_batch_size: Optional[int] = None,
+        tokenization_cache_size: int = 0,
     ):
         """
         :param model_name_or_path: Directory of a saved model or the name of a public model e.g. 'bert-base-cased',
@@ -138,8 +139,14 @@ class FARMReader(BaseReader):
                                https://huggingface.co/transformers/main_classes/model.html#transformers.PreTrainedModel.from_pretrained
         :param max_query_length: Maximum length of the question in number of tokens.
         :param preprocessing_batch_size: Number of query-document pairs to be preprocessed (= tokenized, put into
-                                         tensors, etc.) at once. If `None` (default), all query-document pairs are
-                                         preprocessed at once.
+                                         tensors, etc.) at once. The next batch is preprocessed in a background thread
+                                         while the model runs on the current one, and the time spent in each stage is
+                                         available in `reader.inferencer.last_inference_timings`. If `None` (default),
+                                         all query-document pairs are preprocessed at once.
+        :param tokenization_cache_size: Number of tokenized documents to keep in memory across queries. Documents that
+                                        recur across queries, like the top results of a retriever, are then tokenized
+                                        and split into passages only once, and only the query is tokenized for each
+                                        query. Set to 0 (default) to disable the cache.
         """
         torch_and_transformers_import.check()
 
@@ -166,6 +173,8 @@ class FARMReader(BaseReader):
             devices=self.devices,  # type: ignore [arg-type]
             use_auth_token=use_auth_token,
             max_query_length=max_query_length,
+            # The next batch of query-document pairs is preprocessed while the model runs on the current one
+            preprocessing_chunk_size=preprocessing_batch_size,
         )
         self.inferencer.model.prediction_heads[0].context_window_size = context_window_size
         self.inferencer.model.prediction_heads[0].no_ans_boost = no_ans_boost
@@ -181,6 +190,8 @@ class FARMReader(BaseReader):
         self.confidence_threshold = confidence_threshold
         self.model_name_or_path = model_name_or_path  # Used in distillation, see DistillationDataSilo._get_checksum()
         self.preprocessing_batch_size = preprocessing_batch_size
+        if tokenization_cache_size > 0:
+            self.inferencer.processor.tokenization_cache = DocumentTokenizationCache(max_size=tokenization_cache_size)
 
     def _training_procedure(
         self,
@@ -857,12 +868,9 @@ class FARMReader(BaseReader):
         if batch_size is not None:
             self.inferencer.batch_size = batch_size
         # Make predictions on all document-query pairs
-        predictions = []
-        for input_batch in get_batches_from_generator(inputs, self.preprocessing_batch_size):
-            cur_predictions = self.inferencer.inference_from_objects(
-                objects=input_batch, return_json=False, multiprocessing_chunksize=10
-            )
-            predictions.extend(cur_predictions)
+        predictions = self.inferencer.inference_from_objects(
+            objects=inputs, return_json=False, multiprocessing_chunksize=10
+        )
 
         # Group predictions together
         grouped_predictions = []
@@ -926,12 +934,9 @@ class FARMReader(BaseReader):
 
         # get answers from QA model
         # TODO: Need fix in FARM's `to_dict` function of `QAInput` class
-        predictions = []
-        for input_batch in get_batches_from_generator(inputs, self.preprocessing_batch_size):
-            cur_predictions = self.inferencer.inference_from_objects(
-                objects=input_batch, return_json=False, multiprocessing_chunksize=1
-            )
-            predictions.extend(cur_predictions)
+        predictions = self.inferencer.inference_from_objects(
+            objects=inputs, return_json=False, multiprocessing_chunksize=1
+        )
         # Deduplicate same answers resulting from Document split overlap
         predictions = self._deduplicate_predictions(predictions, documents)
         # assemble answers from all the different documents & format them.
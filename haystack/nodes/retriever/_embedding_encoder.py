@@ -40,7 +40,9 @@ with LazyImport(message="Run 'pip install farm-haystack[inference]'") as torch_a
     from haystack.modeling.data_handler.dataloader import NamedDataLoader
     from haystack.modeling.data_handler.dataset import convert_features_to_dataset, flatten_rename
     from haystack.modeling.infer import Inferencer
+    from haystack.modeling.data_handler.prefetching import PREPROCESSING_CHUNK_BATCHES
     from haystack.nodes.retriever._losses import _TRAINING_LOSSES
+    from haystack.inference_precision import apply_inference_precision
 
 
 COHERE_TIMEOUT = float(os.environ.get(HAYSTACK_REMOTE_API_TIMEOUT_SEC, 30))
@@ -69,6 +71,10 @@ class _DefaultEmbeddingEncoder(_BaseEmbeddingEncoder):
             max_seq_len=retriever.max_seq_len,
             num_processes=0,
             use_auth_token=retriever.use_auth_token,
+            preprocessing_chunk_size=retriever.batch_size * PREPROCESSING_CHUNK_BATCHES,
+        )
+        self.embedding_model.model = apply_inference_precision(
+            self.embedding_model.model, retriever.inference_precision
         )
         torch_and_transformers_import.check()
         if retriever.document_store:
@@ -134,6 +140,7 @@ class _SentenceTransformersEmbeddingEncoder(_BaseEmbeddingEncoder):
         )
         self.batch_size = retriever.batch_size
         self.embedding_model.max_seq_length = retriever.max_seq_len
+        self.embedding_model = apply_inference_precision(self.embedding_model, retriever.inference_precision)
         self.show_progress_bar = retriever.progress_bar
         if retriever.document_store:
             self._check_docstore_similarity_function(
@@ -265,6 +272,7 @@ class _RetribertEmbeddingEncoder(_BaseEmbeddingEncoder):
         self.embedding_model = AutoModel.from_pretrained(
             retriever.embedding_model, use_auth_token=retriever.use_auth_token
         ).to(str(retriever.devices[0]))
+        self.embedding_model = apply_inference_precision(self.embedding_model, retriever.inference_precision)
 
     def embed_queries(self, queries: List[str]) -> np.ndarray:
         """
@@ -1,4 +1,5 @@
 # pylint: disable=ungrouped-imports
+import contextlib
 from abc import abstractmethod
 from typing import List, Dict, Union, Optional, Any, Literal
 
@@ -38,6 +39,8 @@ with LazyImport(message="Run 'pip install farm-haystack[inference]'") as torch_a
     from haystack.modeling.data_handler.processor import TextSimilarityProcessor, TableTextSimilarityProcessor
     from haystack.modeling.data_handler.data_silo import DataSilo
     from haystack.modeling.data_handler.dataloader import NamedDataLoader
+    from haystack.modeling.data_handler.prefetching import PREPROCESSING_CHUNK_BATCHES, StageTimings, prefetch_chunks
+    from haystack.inference_precision import apply_inference_precision
     from haystack.modeling.model.optimization import initialize_optimizer
     from haystack.modeling.training.base import Trainer
     from haystack.modeling.utils import initialize_device_settings  # pylint: disable=ungrouped-imports
@@ -103,6 +106,7 @@ class DensePassageRetriever(DenseRetriever):
         devices: Optional[List[Union[str, "torch.device"]]] = None,
         use_auth_token: Optional[Union[str, bool]] = None,
         scale_score: bool = True,
+        inference_precision: str = "fp32",
     ):
         """
         Init the Retriever incl. the two encoder models from a local or remote model checkpoint.
@@ -161,6 +165,10 @@ class DensePassageRetriever(DenseRetriever):
         :param scale_score: Whether to scale the similarity score to the unit interval (range of [0,1]).
                             If true (default) similarity scores (e.g. cosine or dot_product) which naturally have a different value range will be scaled to a range of [0,1], where 1 means extremely relevant.
                             Otherwise raw similarity scores (e.g. cosine or dot_product) will be used.
+        :param inference_precision: The precision to run the encoders in. Use `"fp32"` (default) for full precision,
+            `"bf16"` to run them with bfloat16 autocast, or `"dynamic-int8"` to quantize their linear layers to int8
+            (CPU only). Reduced precision trades a little accuracy for faster inference on CPUs, so only use it for
+            inference, not for training.
         """
         torch_and_transformers_import.check()
         super().__init__()
@@ -172,6 +180,8 @@ class DensePassageRetriever(DenseRetriever):
 
         self.document_store = document_store
         self.batch_size = batch_size
+        # Seconds spent in each stage of the last call to the model, e.g. "preprocessing" and "model"
+        self.last_inference_timings: Dict[str, float] = {}
         self.progress_bar = progress_bar
         self.top_k = top_k
         self.scale_score = scale_score
@@ -236,6 +246,7 @@ class DensePassageRetriever(DenseRetriever):
         )
 
         self.model.connect_heads_with_processor(self.processor.tasks, require_labels=False)
+        self.model = apply_inference_precision(self.model, inference_precision)
 
         if len(self.devices) > 1:
             self.model = DataParallel(self.model, device_ids=self.devices)  # type: ignore [assignment]
@@ -483,49 +494,52 @@ class DensePassageRetriever(DenseRetriever):
                     "external_id": '19930582'}, ...]
         :return: dictionary of embeddings for "passages" and "query"
         """
-        dataset, tensor_names, _, _ = self.processor.dataset_from_dicts(
-            dicts, indices=list(range(len(dicts))), return_baskets=True
-        )
-
-        data_loader = NamedDataLoader(
-            dataset=dataset, sampler=SequentialSampler(dataset), batch_size=self.batch_size, tensor_names=tensor_names
-        )
+        timings = StageTimings()
         query_embeddings_batched = []
         passage_embeddings_batched = []
         self.model.eval()
 
         # When running evaluations etc., we don't want a progress bar for every single query
-        if len(dataset) == 1:
+        if len(dicts) == 1:
             disable_tqdm = True
         else:
             disable_tqdm = not self.progress_bar
 
         with tqdm(
-            total=len(data_loader) * self.batch_size,
-            unit=" Docs",
-            desc="Create embeddings",
-            position=1,
-            leave=False,
-            disable=disable_tqdm,
-        ) as progress_bar:
-            for raw_batch in data_loader:
-                batch = {key: raw_batch[key].to(self.devices[0]) for key in raw_batch}
-
-                # get logits
-                with torch.inference_mode():
-                    query_embeddings, passage_embeddings = self.model.forward(
-                        query_input_ids=batch.get("query_input_ids", None),
-                        query_segment_ids=batch.get("query_segment_ids", None),
-                        query_attention_mask=batch.get("query_attention_mask", None),
-                        passage_input_ids=batch.get("passage_input_ids", None),
-                        passage_segment_ids=batch.get("passage_segment_ids", None),
-                        passage_attention_mask=batch.get("passage_attention_mask", None),
-                    )[0]
-                    if query_embeddings is not None:
-                        query_embeddings_batched.append(query_embeddings.cpu().numpy())
-                    if passage_embeddings is not None:
-                        passage_embeddings_batched.append(passage_embeddings.cpu().numpy())
-                progress_bar.update(self.batch_size)
+            total=len(dicts), unit=" Docs", desc="Create embeddings", position=1, leave=False, disable=disable_tqdm
+        ) as progress_bar, contextlib.closing(
+            prefetch_chunks(
+                dicts, self._featurize, chunk_size=self.batch_size * PREPROCESSING_CHUNK_BATCHES, timings=timings
+            )
+        ) as chunks:
+            for dataset, tensor_names in chunks:
+                data_loader = NamedDataLoader(
+                    dataset=dataset,
+                    sampler=SequentialSampler(dataset),
+                    batch_size=self.batch_size,
+                    tensor_names=tensor_names,
+                )
+                for raw_batch in data_loader:
+                    batch = {key: raw_batch[key].to(self.devices[0]) for key in raw_batch}
+
+                    # get logits
+                    with torch.inference_mode(), timings.measure("model"):
+                        query_embeddings, passage_embeddings = self.model.forward(
+                            query_input_ids=batch.get("query_input_ids", None),
+                            query_segment_ids=batch.get("query_segment_ids", None),
+                            query_attention_mask=batch.get("query_attention_mask", None),
+                            passage_input_ids=batch.get("passage_input_ids", None),
+                            passage_segment_ids=batch.get("passage_segment_ids", None),
+                            passage_attention_mask=batch.get("passage_attention_mask", None),
+                        )[0]
+                        if query_embeddings is not None:
+                            query_embeddings_batched.append(query_embeddings.cpu().numpy())
+                        if passage_embeddings is not None:
+                            passage_embeddings_batched.append(passage_embeddings.cpu().numpy())
+                    progress_bar.update(len(next(iter(raw_batch.values()))))
+
+        self.last_inference_timings = timings.to_dict()
+        logger.debug("Embedding %s dicts took %s", len(dicts), timings)
 
         all_embeddings: Dict[str, np.ndarray] = {}
         if passage_embeddings_batched:
@@ -534,6 +548,13 @@ class DensePassageRetriever(DenseRetriever):
             all_embeddings["query"] = np.concatenate(query_embeddings_batched)
         return all_embeddings
 
+    def _featurize(self, dicts: List[Dict[str, Any]], indices: List[int]):
+        """
+        Turns the dicts into a dataset for the model and returns it with the names of its tensors.
+        """
+        dataset, tensor_names, _, _ = self.processor.dataset_from_dicts(dicts, indices=indices, return_baskets=True)
+        return dataset, tensor_names
+
     def embed_queries(self, queries: List[str]) -> np.ndarray:
         """
         Create embeddings for a list of queries using the query encoder.
@@ -867,6 +888,8 @@ class TableTextRetriever(DenseRetriever):
 
         self.document_store = document_store
         self.batch_size = batch_size
+        # Seconds spent in each stage of the last call to the model, e.g. "preprocessing" and "model"
+        self.last_inference_timings: Dict[str, float] = {}
         self.progress_bar = progress_bar
         self.top_k = top_k
         self.embed_meta_fields = embed_meta_fields
@@ -1112,42 +1135,45 @@ class TableTextRetriever(DenseRetriever):
         :return: dictionary of embeddings for "passages" and "query"
         """
 
-        dataset, tensor_names, _, _ = self.processor.dataset_from_dicts(
-            dicts, indices=list(range(len(dicts))), return_baskets=True
-        )
-
-        data_loader = NamedDataLoader(
-            dataset=dataset, sampler=SequentialSampler(dataset), batch_size=self.batch_size, tensor_names=tensor_names
-        )
+        timings = StageTimings()
         query_embeddings_batched = []
         passage_embeddings_batched = []
         self.model.eval()
 
         # When running evaluations etc., we don't want a progress bar for every single query
-        if dataset and len(dataset) == 1:
+        if len(dicts) == 1:
             disable_tqdm = True
         else:
             disable_tqdm = not self.progress_bar
 
         with tqdm(
-            total=len(data_loader) * self.batch_size,
-            unit=" Docs",
-            desc="Create embeddings",
-            position=1,
-            leave=False,
-            disable=disable_tqdm,
-        ) as progress_bar:
-            for batch in data_loader:
-                batch = {key: batch[key].to(self.devices[0]) for key in batch}
-
-                # get logits
-                with torch.inference_mode():
-                    query_embeddings, passage_embeddings = self.model.forward(**batch)[0]
-                    if query_embeddings is not None:
-                        query_embeddings_batched.append(query_embeddings.cpu().numpy())
-                    if passage_embeddings is not None:
-                        passage_embeddings_batched.append(passage_embeddings.cpu().numpy())
-                progress_bar.update(self.batch_size)
+            total=len(dicts), unit=" Docs", desc="Create embeddings", position=1, leave=False, disable=disable_tqdm
+        ) as progress_bar, contextlib.closing(
+            prefetch_chunks(
+                dicts, self._featurize, chunk_size=self.batch_size * PREPROCESSING_CHUNK_BATCHES, timings=timings
+            )
+        ) as chunks:
+            for dataset, tensor_names in chunks:
+                data_loader = NamedDataLoader(
+                    dataset=dataset,
+                    sampler=SequentialSampler(dataset),
+                    batch_size=self.batch_size,
+                    tensor_names=tensor_names,
+                )
+                for raw_batch in data_loader:
+                    batch = {key: raw_batch[key].to(self.devices[0]) for key in raw_batch}
+
+                    # get logits
+                    with torch.inference_mode(), timings.measure("model"):
+                        query_embeddings, passage_embeddings = self.model.forward(**batch)[0]
+                        if query_embeddings is not None:
+                            query_embeddings_batched.append(query_embeddings.cpu().numpy())
+                        if passage_embeddings is not None:
+                            passage_embeddings_batched.append(passage_embeddings.cpu().numpy())
+                    progress_bar.update(len(next(iter(raw_batch.values()))))
+
+        self.last_inference_timings = timings.to_dict()
+        logger.debug("Embedding %s dicts took %s", len(dicts), timings)
 
         all_embeddings: Dict[str, np.ndarray] = {}
         if passage_embeddings_batched:
@@ -1156,6 +1182,13 @@ class TableTextRetriever(DenseRetriever):
             all_embeddings["query"] = np.concatenate(query_embeddings_batched)
         return all_embeddings
 
+    def _featurize(self, dicts: List[Dict[str, Any]], indices: List[int]):
+        """
+        Turns the dicts into a dataset for the model and returns it with the names of its tensors.
+        """
+        dataset, tensor_names, _, _ = self.processor.dataset_from_dicts(dicts, indices=indices, return_baskets=True)
+        return dataset, tensor_names
+
     def embed_queries(self, queries: List[str]) -> np.ndarray:
         """
         Create embeddings for a list of queries using the query encoder.
@@ -1466,6 +1499,7 @@ class EmbeddingRetriever(DenseRetriever):
         azure_deployment_name: Optional[str] = None,
         api_base: str = "https://api.openai.com/v1",
         openai_organization: Optional[str] = None,
+        inference_precision: str = "fp32",
     ):
         """
         :param document_store: An instance of DocumentStore from which to retrieve documents.
@@ -1530,6 +1564,10 @@ class EmbeddingRetriever(DenseRetriever):
         :param api_base: The OpenAI API base URL, defaults to `"https://api.openai.com/v1"`.
         :param openai_organization: The OpenAI-Organization ID, defaults to `None`. For more details, see OpenAI
         [documentation](https://platform.openai.com/docs/api-reference/requesting-organization).
+        :param inference_precision: The precision to run the embedding model in, for models running locally. Use
+            `"fp32"` (default) for full precision, `"bf16"` to run it with bfloat16 autocast, or `"dynamic-int8"` to
+            quantize its linear layers to int8 (CPU only). Reduced precision trades a little accuracy for faster
+            inference on CPUs.
         """
         torch_and_transformers_import.check()
 
@@ -1560,6 +1598,7 @@ class EmbeddingRetriever(DenseRetriever):
         self.azure_base_url = azure_base_url
         self.azure_deployment_name = azure_deployment_name
         self.openai_organization = openai_organization
+        self.inference_precision = inference_precision
         self.model_format = (
             self._infer_model_format(model_name_or_path=embedding_model, use_auth_token=use_auth_token)
             if model_format is None
@@ -1,12 +1,15 @@
+import asyncio
 import inspect
 import io
 import logging
+import threading
 from collections import defaultdict
 from datetime import datetime
 from http import HTTPStatus
-from typing import Optional, Dict, List, Union, Callable, Any, Tuple
+from typing import Optional, Dict, List, Union, Callable, Any, Tuple, Coroutine
 from urllib.parse import urlparse
 
+import httpx
 import requests
 from boilerpy3 import extractors
 from requests import Response
@@ -48,6 +51,86 @@ def pdf_content_handler(response: Response) -> Optional[str]:
     return text.encode("ascii", errors="ignore").decode()
 
 
+class _AsyncFetchEngine:
+    """
+    Runs the asynchronous requests of a LinkContentFetcher on an event loop in a background thread.
+
+    The event loop and its httpx.AsyncClient live until the engine is closed, so connections are pooled and kept alive
+    across calls. The number of concurrent requests is limited both overall and per host. `close()` closes the client
+    and stops the loop's thread. It's called when the engine is garbage collected, and the engine starts a new loop if
+    it's used again after being closed.
+    """
+
+    def __init__(self, max_connections: int, max_connections_per_host: int):
+        self.max_connections = max_connections
+        self.max_connections_per_host = max_connections_per_host
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[httpx.AsyncClient] = None
+        self._host_semaphores: Dict[str, asyncio.Semaphore] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    def run(self, coroutine: Coroutine) -> Any:
+        """
+        Runs a coroutine on the engine's event loop and blocks until it's done.
+        """
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(target=self._loop.run_forever, name="LinkContentFetcher", daemon=True)
+                self._thread.start()
+            loop = self._loop
+        return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+    def close(self) -> None:
+        """
+        Closes the httpx.AsyncClient and stops the event loop and its thread.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop, self._thread = None, None
+        if loop is None or thread is None:
+            return
+
+        async def close_client():
+            if self._client is not None:
+                await self._client.aclose()
+            self._client = None
+            self._host_semaphores = {}
+
+        if threading.current_thread() is thread:
+            # Called from within the loop, for example by the garbage collector, so it can't wait for the loop
+            loop.create_task(close_client()).add_done_callback(lambda _: loop.stop())
+            return
+        try:
+            asyncio.run_coroutine_threadsafe(close_client(), loop).result()
+        finally:
+            loop.call_soon_threadsafe(loop.stop)
+            thread.join()
+            loop.close()
+
+    def __del__(self):
+        try:
+            self.close()
+        except Exception as e:  # pylint: disable=broad-except
+            logger.debug("Couldn't close the LinkContentFetcher connections: %s", str(e))
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        # Must only be used from within the engine's event loop
+        if self._client is None:
+            limits = httpx.Limits(max_connections=self.max_connections, max_keepalive_connections=self.max_connections)
+            self._client = httpx.AsyncClient(limits=limits, follow_redirects=True)
+        return self._client
+
+    def host_semaphore(self, url: str) -> asyncio.Semaphore:
+        # Must only be used from within the engine's event loop
+        host = urlparse(url).netloc
+        if host not in self._host_semaphores:
+            self._host_semaphores[host] = asyncio.Semaphore(self.max_connections_per_host)
+        return self._host_semaphores[host]
+
+
 class LinkContentFetcher(BaseComponent):
     """
     LinkContentFetcher fetches content from a URL and converts it into a list of Document objects.
@@ -111,6 +194,16 @@ class LinkContentFetcher(BaseComponent):
         print(f"Research paper summary: {research_paper}")
         pipeline.run(research_paper)
         print("\n\n\n")
+    ```
+
+    To fetch many URLs at once, use `fetch_batch`. It sends the requests concurrently through a shared, keep-alive
+    connection pool, limits the number of parallel requests per host, and extracts the content of each page as soon
+    as it has been downloaded:
+
+    ```python
+    link_content_fetcher = LinkContentFetcher(max_connections_per_host=2, total_timeout=5)
+    docs_per_url = link_content_fetcher.fetch_batch(urls=["https://deepset.ai/", "https://haystack.deepset.ai/"])
+    ```
     """
 
     outgoing_edges = 1
@@ -131,6 +224,9 @@ class LinkContentFetcher(BaseComponent):
         raise_on_failure: Optional[bool] = False,
         user_agents: Optional[List[str]] = None,
         retry_attempts: Optional[int] = None,
+        max_connections: int = 100,
+        max_connections_per_host: int = 4,
+        total_timeout: Optional[float] = None,
     ):
         """
 
@@ -142,6 +238,11 @@ class LinkContentFetcher(BaseComponent):
                          Defaults to False.
         :param user_agents: A list of user agents to use when fetching content. Defaults to None.
         :param retry_attempts: The number of times to retry fetching content. Defaults to 2.
+        :param max_connections: The maximum number of concurrent connections `fetch_batch` opens. Defaults to 100.
+        :param max_connections_per_host: The maximum number of concurrent requests `fetch_batch` sends to a
+                         single host. Defaults to 4.
+        :param total_timeout: The time budget in seconds for one call of `fetch_batch`. URLs that couldn't be
+                         fetched within this time are returned without content. Defaults to None (no budget).
         """
         super().__init__()
         self.processor = processor
@@ -149,7 +250,11 @@ class LinkContentFetcher(BaseComponent):
         self.user_agents = user_agents or [LinkContentFetcher._USER_AGENT]
         self.current_user_agent_idx: int = 0
         self.retry_attempts = retry_attempts or 2
+        self.total_timeout = total_timeout
         self.handlers: Dict[str, Callable] = defaultdict(lambda: html_content_handler)
+        self._engine = _AsyncFetchEngine(
+            max_connections=max_connections, max_connections_per_host=max_connections_per_host
+        )
 
         # register default content handlers
         self._register_content_handler("text/html", html_content_handler)
@@ -161,6 +266,13 @@ class LinkContentFetcher(BaseComponent):
             for content_type, handler in content_handlers.items():
                 self._register_content_handler(content_type, handler)
 
+    def close(self) -> None:
+        """
+        Closes the connection pool and stops the background thread that `fetch_batch` uses. They're created again if
+        `fetch_batch` is called after closing. This also happens when the LinkContentFetcher is garbage collected.
+        """
+        self._engine.close()
+
     def fetch(self, url: str, timeout: Optional[int] = 3, doc_kwargs: Optional[dict] = None) -> List[Document]:
         """
         Fetches content from a URL and converts it into a list of Document objects. If no content is extracted,
@@ -174,13 +286,127 @@ class LinkContentFetcher(BaseComponent):
         if not self._is_valid_url(url):
             raise InvalidURL("Invalid or missing URL: {}".format(url))
 
+        response = self._get_response(url, timeout=timeout or 3)
+        return self._build_documents(url=url, response=response, doc_kwargs=doc_kwargs)
+
+    def fetch_batch(
+        self,
+        urls: List[str],
+        timeout: Optional[int] = 3,
+        doc_kwargs: Optional[List[Optional[dict]]] = None,
+        total_timeout: Optional[float] = None,
+        skip_failed_urls: bool = False,
+    ) -> List[List[Document]]:
+        """
+        Fetches content from many URLs concurrently and converts it into lists of Document objects.
+
+        The requests share one connection pool and are limited to `max_connections_per_host` parallel requests per
+        host. The content of a page is extracted in a worker thread as soon as it's downloaded, while the other pages
+        are still being fetched. If the `total_timeout` budget runs out, the URLs that are done are returned with
+        their content and all others are treated like failed requests.
+
+        :param urls: URLs to fetch content from.
+        :param timeout: Timeout in seconds for each request.
+        :param doc_kwargs: Optional kwargs to pass to the Document constructor, one dict per URL.
+        :param total_timeout: The time budget in seconds for fetching all URLs. Defaults to the `total_timeout` of
+                              the LinkContentFetcher.
+        :param skip_failed_urls: With `raise_on_failure`, a URL that fails raises its exception and the results of all
+                                 other URLs are lost. If True, each failure is logged and only the URL that failed is
+                                 returned without Documents.
+        :return: One list of Documents per URL, in the same order as `urls`.
+        """
+        for url in urls:
+            if not self._is_valid_url(url):
+                raise InvalidURL("Invalid or missing URL: {}".format(url))
+        if not urls:
+            return []
+
+        doc_kwargs = doc_kwargs or [None] * len(urls)
+        if len(doc_kwargs) != len(urls):
+            raise ValueError("The number of doc_kwargs must match the number of urls.")
+        total_timeout = total_timeout if total_timeout is not None else self.total_timeout
+        return self._engine.run(
+            self._afetch_batch(urls, timeout or 3, doc_kwargs, total_timeout, skip_failed_urls=skip_failed_urls)
+        )
+
+    async def _afetch_batch(
+        self,
+        urls: List[str],
+        timeout: int,
+        doc_kwargs: List[Optional[dict]],
+        total_timeout: Optional[float],
+        skip_failed_urls: bool = False,
+    ) -> List[List[Document]]:
+        tasks = [asyncio.ensure_future(self._afetch(url, timeout, kwargs)) for url, kwargs in zip(urls, doc_kwargs)]
+        done, pending = await asyncio.wait(tasks, timeout=total_timeout)
+        for task in pending:
+            task.cancel()
+        if pending:
+            logger.warning(
+                "Couldn't fetch %s of %s URLs within the time budget of %s seconds",
+                len(pending),
+                len(urls),
+                total_timeout,
+            )
+
+        results: List[List[Document]] = []
+        for url, kwargs, task in zip(urls, doc_kwargs, tasks):
+            if task in done and task.exception() is not None:
+                # only happens with raise_on_failure, all other errors are logged and skipped in _afetch
+                if not skip_failed_urls:
+                    raise task.exception()  # type: ignore [misc]
+                logger.debug("Error fetching documents from %s : %s", url, str(task.exception()))
+                results.append([])
+                continue
+            results.append(task.result() if task in done else self._build_documents(url, None, kwargs))
+        return results
+
+    async def _afetch(self, url: str, timeout: int, doc_kwargs: Optional[dict]) -> List[Document]:
+        response = await self._aget_response(url, timeout=timeout)
+        # Extracting the content is CPU-bound, so it runs in a thread to not hold up the downloads of the other URLs
+        return await asyncio.get_running_loop().run_in_executor(None, self._build_documents, url, response, doc_kwargs)
+
+    async def _aget_response(self, url: str, timeout: int) -> Optional[httpx.Response]:
+        """
+        Fetches content from a URL with the shared async client. Returns None if the request failed.
+        Like `_get_response`, it retries failed requests with exponential backoff and switches the User-Agent.
+        """
+        for attempt in range(self.retry_attempts):
+            headers = self._REQUEST_HEADERS.copy()
+            headers["User-Agent"] = self.user_agents[attempt % len(self.user_agents)]
+            try:
+                async with self._engine.host_semaphore(url):
+                    response = await self._engine.client.get(url, headers=headers, timeout=timeout)
+                response.raise_for_status()
+                return response
+            except httpx.HTTPError as e:
+                if attempt + 1 < self.retry_attempts:
+                    await asyncio.sleep(min(max(2**attempt, 2), 10))
+                    continue
+                if self.raise_on_failure:
+                    raise e
+                logger.warning("Couldn't retrieve content from %s", url)
+        return None
+
+    def _build_documents(
+        self, url: str, response: Optional[Union[requests.Response, httpx.Response]], doc_kwargs: Optional[dict] = None
+    ) -> List[Document]:
+        """
+        Extracts the content of a response and converts it into a list of Documents.
+
+        :param url: The URL the response comes from.
+        :param response: The response, or None if the request failed.
+        :param doc_kwargs: Optional kwargs to pass to the Document constructor.
+        :return: List of Document objects or an empty list if no content is extracted.
+        """
         doc_kwargs = doc_kwargs or {}
         extracted_doc: Dict[str, Union[str, dict]] = {
             "meta": {"url": url, "timestamp": int(datetime.utcnow().timestamp())}
         }
         extracted_doc.update(doc_kwargs)
-        response = self._get_response(url, timeout=timeout or 3)
-        has_content = response.status_code == HTTPStatus.OK and (response.text or response.content)
+        has_content = (
+            response is not None and response.status_code == HTTPStatus.OK and (response.text or response.content)
+        )
         fetched_documents = []
         if has_content:
             # if we get here, we have a valid response, let's try to extract content
@@ -244,7 +470,9 @@ class LinkContentFetcher(BaseComponent):
         """
         Takes a list of queries, where each query is expected to be a URL. For each query, the method
         fetches content from the specified URL and transforms it into a list of Document objects. The output is a list
-        of these document lists, where each individual list of Document objects corresponds to the content retrieved
+        of these document lists, where each individual list of Document objects corresponds to the content retrieved.
+        The URLs are fetched concurrently with `fetch_batch` and URLs that occur in several queries are fetched only
+        once.
 
         param queries: List of queries - URLs to fetch content from.
         param file_paths: Not used.
@@ -263,8 +491,10 @@ class LinkContentFetcher(BaseComponent):
             raise ValueError(
                 "LinkContentFetcher run_batch requires the `queries` parameter to be Union[str, List[str]]"
             )
+        unique_urls = list(dict.fromkeys(queries))
+        docs_per_url = dict(zip(unique_urls, self.fetch_batch(urls=unique_urls)))
         for query in queries:
-            results.append(self.fetch(url=query))
+            results.append(docs_per_url[query])
 
         return {"documents": results}, "output_1"
 
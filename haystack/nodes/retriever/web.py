@@ -1,9 +1,10 @@
+import copy
 import logging
-from concurrent.futures import ThreadPoolExecutor
+import time
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from multiprocessing import cpu_count
-from typing import Dict, Iterator, List, Optional, Literal, Union, Tuple, Any
+from typing import Dict, List, Optional, Literal, Union, Tuple, Any
 
 from haystack.schema import Document
 from haystack.document_stores.base import BaseDocumentStore
@@ -59,6 +60,7 @@ class WebRetriever(BaseRetriever):
         cache_index: Optional[str] = None,
         cache_headers: Optional[Dict[str, str]] = None,
         cache_time: int = 1 * 24 * 60 * 60,
+        cache_cleanup_interval: int = 60 * 60,
         allowed_domains: Optional[List[str]] = None,
         link_content_fetcher: Optional[LinkContentFetcher] = None,
     ):
@@ -74,9 +76,13 @@ class WebRetriever(BaseRetriever):
         :param cache_index: Index name to be used to cache search results.
         :param cache_headers: Headers to be used to cache search results.
         :param cache_time: Time in seconds to cache search results. Defaults to 24 hours.
+        :param cache_cleanup_interval: Minimum time in seconds between two deletions of expired documents from the
+        cache. Expired documents are never returned from the cache, so they only need to be deleted from time to time
+        to free up space. Defaults to 1 hour.
         :param allowed_domains: List of domains to restrict the search to. If not provided, the search is unrestricted.
         :param link_content_fetcher: LinkContentFetcher to be used to fetch the content from the links. If not provided,
-        the default LinkContentFetcher is used.
+        the default LinkContentFetcher is used. Its `max_connections_per_host` and `total_timeout` settings control how
+        the links of a query are fetched.
 
         """
         super().__init__()
@@ -95,6 +101,10 @@ class WebRetriever(BaseRetriever):
         self.top_k = top_k
         self.cache_headers = cache_headers
         self.cache_time = cache_time
+        self.cache_cleanup_interval = cache_cleanup_interval
+        self._last_cache_cleanup: Optional[float] = None
+        self._cache_hits = 0
+        self._cache_misses = 0
         self.preprocessor = (
             preprocessor or PreProcessor(progress_bar=False) if mode == "preprocessed_documents" else None
         )
@@ -108,6 +118,7 @@ class WebRetriever(BaseRetriever):
         cache_index: Optional[str] = None,
         cache_headers: Optional[Dict[str, str]] = None,
         cache_time: Optional[int] = None,
+        top_p: Optional[int] = None,
         **kwargs,
     ) -> List[Document]:
         """
@@ -124,28 +135,34 @@ class WebRetriever(BaseRetriever):
         :param query: The query string.
         :param top_k: The number of Documents to be returned by the retriever.
         :param preprocessor: The PreProcessor to be used to split documents into paragraphs.
-        :param cache_document_store: The DocumentStore to cache the documents to.
+        :param cache_document_store: The DocumentStore to cache the documents to. If None, the instance's default
+        DocumentStore is used.
         :param cache_index: The index name to save the documents to.
         :param cache_headers: The headers to save the documents to.
         :param cache_time: The time limit in seconds for the documents in the cache. If objects are older than this time,
         they will be deleted from the cache on the next retrieval.
+        :param top_p: The number of search results to retrieve the documents from. If None, the instance's
+        `top_search_results` is used.
         """
 
         # Initialize default parameters
         preprocessor = preprocessor or self.preprocessor
+        cache_document_store = cache_document_store or self.cache_document_store
         cache_index = cache_index or self.cache_index
         top_k = top_k or self.top_k
         cache_headers = cache_headers or self.cache_headers
         cache_time = cache_time or self.cache_time
 
-        search_results, _ = self.web_search.run(query=query)
+        search_results, _ = self.web_search.run(query=query, top_k=top_p)
         result_docs = search_results["documents"]
 
         if self.mode != "snippets":
             # for raw_documents and preprocessed_documents modes, we need to retrieve the links from the search results
             links: List[SearchResult] = self._prepare_links(result_docs)
 
-            links_found_in_cache, cached_docs = self._check_cache(links)
+            links_found_in_cache, cached_docs = self._check_cache(
+                links, cache_time=cache_time, cache_document_store=cache_document_store
+            )
             logger.debug("Found %d links in cache", len(links_found_in_cache))
 
             links_to_fetch = [link for link in links if link not in links_found_in_cache]
@@ -154,7 +171,11 @@ class WebRetriever(BaseRetriever):
 
             # Save result_docs to cache
             self._save_to_cache(
-                result_docs, cache_index=cache_index, cache_headers=cache_headers, cache_time=cache_time
+                result_docs,
+                cache_index=cache_index,
+                cache_headers=cache_headers,
+                cache_time=cache_time,
+                cache_document_store=cache_document_store,
             )
 
             # join cached_docs and result_docs
@@ -194,30 +215,21 @@ class WebRetriever(BaseRetriever):
         if not links:
             return []
 
-        def link_fetch(link: SearchResult) -> List[Document]:
-            """
-            Encapsulate the link fetching logic in a function to be used in a ThreadPoolExecutor.
-            """
-            docs: List[Document] = []
-            try:
-                docs = self.link_content_fetcher.fetch(
-                    url=link.url,
-                    doc_kwargs={
-                        "id_hash_keys": ["meta.url"],
-                        "search.score": link.score,
-                        "search.position": link.position,
-                        "snippet_text": link.snippet,
-                    },
-                )
-            except Exception as e:
-                # Log the exception for debugging
-                logger.debug("Error fetching documents from %s : %s", link.url, str(e))
-
-            return docs
-
-        thread_count = min(cpu_count() if len(links) > cpu_count() else len(links), 10)  # max 10 threads
-        with ThreadPoolExecutor(max_workers=thread_count) as executor:
-            fetched_pages: Iterator[List[Document]] = executor.map(link_fetch, links)
+        valid_links = [link for link in links if self.link_content_fetcher._is_valid_url(link.url)]
+        # links that fail are logged and skipped by fetch_batch, the other links of the batch are still returned
+        fetched_pages = self.link_content_fetcher.fetch_batch(
+            urls=[link.url for link in valid_links],
+            doc_kwargs=[
+                {
+                    "id_hash_keys": ["meta.url"],
+                    "search.score": link.score,
+                    "search.position": link.position,
+                    "snippet_text": link.snippet,
+                }
+                for link in valid_links
+            ],
+            skip_failed_urls=True,
+        )
 
         # Flatten list of lists to a single list
         extracted_docs = [doc for doc_list in fetched_pages for doc in doc_list]
@@ -227,27 +239,61 @@ class WebRetriever(BaseRetriever):
 
         return extracted_docs
 
-    def _check_cache(self, links: List[SearchResult]) -> Tuple[List[SearchResult], List[Document]]:
+    @property
+    def cache_stats(self) -> Dict[str, float]:
+        """
+        Hits and misses of the links looked up in the cache since this WebRetriever was created.
+        """
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+        }
+
+    def _check_cache(
+        self,
+        links: List[SearchResult],
+        cache_time: Optional[int] = None,
+        cache_document_store: Optional[BaseDocumentStore] = None,
+    ) -> Tuple[List[SearchResult], List[Document]]:
         """
-        Check the DocumentStore cache for documents.
+        Check the DocumentStore cache for documents. All links are looked up with a single query.
 
         :param links: List of SearchResult objects.
+        :param cache_time: Optional time to live in seconds for the documents in the cache. Older documents are
+        ignored, even if they haven't been deleted from the cache yet.
+        :param cache_document_store: Optional DocumentStore to look the links up in. If not provided, the instance's
+        cache DocumentStore is used.
         :return: Tuple of lists of SearchResult and Document objects that were found in the cache.
         """
-        if not links or not self.cache_document_store:
+        cache_document_store = cache_document_store or self.cache_document_store
+        if not links or not cache_document_store:
             return [], []
 
         cache_documents: List[Document] = []
         cached_links: List[SearchResult] = []
 
         valid_links = [link for link in links if link.url]
+        if not valid_links:
+            return [], []
+        cache_filter: FilterType = {"url": {"$in": [link.url for link in valid_links]}}
+        if cache_time is not None and cache_time > 0:
+            cache_filter["timestamp"] = {"$gte": int((datetime.utcnow() - timedelta(seconds=cache_time)).timestamp())}
+        documents = cache_document_store.get_all_documents(filters=cache_filter, return_embedding=False)
+
+        documents_by_url: Dict[str, List[Document]] = defaultdict(list)
+        for document in documents or []:
+            documents_by_url[document.meta.get("url")].append(document)
         for link in valid_links:
-            cache_filter: FilterType = {"url": link.url}
-            documents = self.cache_document_store.get_all_documents(filters=cache_filter, return_embedding=False)
-            if documents:
-                cache_documents.extend(documents)
+            if documents_by_url[link.url]:
+                cache_documents.extend(documents_by_url[link.url])
                 cached_links.append(link)
 
+        self._cache_hits += len(cached_links)
+        self._cache_misses += len(valid_links) - len(cached_links)
+        logger.debug("Cache hit rate: %.2f", self.cache_stats["hit_rate"])
+
         return cached_links, cache_documents
 
     def _save_to_cache(
@@ -256,24 +302,33 @@ class WebRetriever(BaseRetriever):
         cache_index: Optional[str] = None,
         cache_headers: Optional[Dict[str, str]] = None,
         cache_time: Optional[int] = None,
+        cache_document_store: Optional[BaseDocumentStore] = None,
     ) -> None:
         """
         Save the documents to the cache and potentially delete old expired documents from the cache.
+        Expired documents are deleted at most once every `cache_cleanup_interval` seconds, not on every write.
 
         :param documents: List of Document objects to be saved to the cache.
         :param cache_index: Optional index name to save the documents to.
         :param cache_headers: Optional headers made to use when saving the documents to the cache.
         :param cache_time: Optional time to live in seconds for the documents in the cache. If objects are older than
         this time, they will be deleted from the cache.
+        :param cache_document_store: Optional DocumentStore to save the documents to. If not provided, the instance's
+        cache DocumentStore is used.
         """
-        cache_document_store = self.cache_document_store
+        cache_document_store = cache_document_store or self.cache_document_store
 
         if cache_document_store is not None and documents:
             cache_document_store.write_documents(
                 documents=documents, index=cache_index, headers=cache_headers, duplicate_documents="overwrite"
             )
 
-        if cache_document_store and cache_time is not None and cache_time > 0:
+        cleanup_due = (
+            self._last_cache_cleanup is None
+            or time.monotonic() - self._last_cache_cleanup >= self.cache_cleanup_interval
+        )
+        if cache_document_store and cache_time is not None and cache_time > 0 and cleanup_due:
+            self._last_cache_cleanup = time.monotonic()
             cache_filter: FilterType = {
                 "timestamp": {"$lt": int((datetime.utcnow() - timedelta(seconds=cache_time)).timestamp())}
             }
@@ -291,15 +346,17 @@ class WebRetriever(BaseRetriever):
         cache_index: Optional[str] = None,
         cache_headers: Optional[Dict[str, str]] = None,
         cache_time: Optional[int] = None,
+        **kwargs,
     ) -> List[List[Document]]:
         """
-        Batch retrieval method that fetches documents for a list of queries. Each query is passed to the `retrieve`
-        method which fetches documents from the web in real-time or from a DocumentStore cache. The fetched documents
-        are then extended to a list of documents.
+        Batch retrieval method that fetches documents for a list of queries. The web search runs for each query,
+        then the links of all queries are fetched together, from the web in real-time or from a DocumentStore cache.
+        A link that is found for several queries is only fetched once. The documents of each query are the same, and
+        in the same order, as the ones `retrieve` returns for it.
 
         :param queries: List of query strings to retrieve documents for.
-        :param top_p: The number of documents to be returned by the retriever for each query. If None, the instance's
-        default value is used.
+        :param top_p: The number of search results to retrieve the documents from for each query. If None, the
+        instance's `top_search_results` is used.
         :param top_k: The maximum number of documents to be retrieved for each query. If None, the instance's default
         value is used.
         :param preprocessor: The PreProcessor to be used to split documents into paragraphs. If None, the instance's
@@ -312,16 +369,76 @@ class WebRetriever(BaseRetriever):
 
         :returns: A list of lists where each inner list represents the documents fetched for a particular query.
         """
-        documents = []
+        if self.mode == "snippets":
+            # snippets come with the search results, there is nothing to fetch
+            return [self.retrieve(query=q, top_k=top_k, top_p=top_p) for q in queries]
+
+        preprocessor = preprocessor or self.preprocessor
+        cache_document_store = cache_document_store or self.cache_document_store
+        cache_index = cache_index or self.cache_index
+        top_k = top_k or self.top_k
+        cache_headers = cache_headers or self.cache_headers
+        cache_time = cache_time or self.cache_time
+
+        links_per_query: List[List[SearchResult]] = []
         for q in queries:
-            documents.append(
-                self.retrieve(
-                    query=q,
-                    top_k=top_k,
-                    preprocessor=preprocessor,
-                    cache_document_store=cache_document_store,
-                    cache_index=cache_index,
-                )
-            )
+            search_results, _ = self.web_search.run(query=q, top_k=top_p)
+            links_per_query.append(self._prepare_links(search_results["documents"]))
+
+        # links found for several queries are looked up and fetched once, score and position are set per query
+        links_by_url: Dict[str, SearchResult] = {}
+        for links in links_per_query:
+            for link in links:
+                links_by_url.setdefault(link.url, link)
+        unique_links = list(links_by_url.values())
+        links_found_in_cache, cached_docs = self._check_cache(
+            unique_links, cache_time=cache_time, cache_document_store=cache_document_store
+        )
+        logger.debug("Found %d links in cache", len(links_found_in_cache))
+
+        links_to_fetch = [link for link in unique_links if link not in links_found_in_cache]
+        logger.debug("Fetching %d links for %d queries", len(links_to_fetch), len(queries))
+        fetched_docs = self._scrape_links(links_to_fetch)
+        self._save_to_cache(
+            fetched_docs,
+            cache_index=cache_index,
+            cache_headers=cache_headers,
+            cache_time=cache_time,
+            cache_document_store=cache_document_store,
+        )
+
+        cached_docs_by_url = self._group_by_url(cached_docs)
+        fetched_docs_by_url = self._group_by_url(fetched_docs)
+
+        documents = []
+        for links in links_per_query:
+            # like in `retrieve`, the cached documents come first, followed by the fetched ones sorted by score
+            result_docs = [doc for link in links for doc in cached_docs_by_url.get(link.url, [])]
+            fetched_query_docs = self._copy_for_links(links, fetched_docs_by_url)
+            result_docs += sorted(fetched_query_docs, key=lambda x: x.meta["search.score"], reverse=True)
+            if preprocessor:
+                result_docs = preprocessor.process(result_docs)
+            documents.append(result_docs[:top_k])
 
         return documents
+
+    @staticmethod
+    def _group_by_url(documents: List[Document]) -> Dict[str, List[Document]]:
+        docs_by_url: Dict[str, List[Document]] = defaultdict(list)
+        for doc in documents:
+            docs_by_url[doc.meta.get("url")].append(doc)
+        return docs_by_url
+
+    @staticmethod
+    def _copy_for_links(links: List[SearchResult], docs_by_url: Dict[str, List[Document]]) -> List[Document]:
+        """
+        Returns copies of the fetched documents of the links, with the search score and position of these links.
+        The documents are shared between queries, so they're copied instead of changed.
+        """
+        docs = []
+        for link in links:
+            for doc in docs_by_url.get(link.url, []):
+                doc_for_link = copy.copy(doc)
+                doc_for_link.meta = {**doc.meta, "search.score": link.score, "search.position": link.position}
+                docs.append(doc_for_link)
+        return docs
@@ -1,10 +1,8 @@
 import itertools
-from typing import List, Optional, Set, Union
+from typing import Dict, List, Optional, Set, Union
 
 import logging
 
-from tqdm import tqdm
-
 from haystack.schema import Document
 from haystack.nodes.summarizer.base import BaseSummarizer
 from haystack.lazy_imports import LazyImport
@@ -17,7 +15,7 @@ with LazyImport(message="Run 'pip install farm-haystack[inference]'") as torch_a
     import torch
     from transformers import pipeline
     from haystack.modeling.utils import initialize_device_settings  # pylint: disable=ungrouped-imports
-    from haystack.utils.torch_utils import ListDataset
+    from haystack.utils.batching import run_in_batches
 
 
 class TransformersSummarizer(BaseSummarizer):
@@ -68,6 +66,7 @@ class TransformersSummarizer(BaseSummarizer):
         progress_bar: bool = True,
         use_auth_token: Optional[Union[str, bool]] = None,
         devices: Optional[List[Union[str, "torch.device"]]] = None,
+        max_tokens_per_batch: Optional[int] = None,
     ):
         """
         Load a summarization model from transformers.
@@ -92,6 +91,10 @@ class TransformersSummarizer(BaseSummarizer):
                         A list containing torch device objects or strings is supported (for example
                         [torch.device('cuda:0'), "mps", "cuda:1"]). If you specify `use_gpu=False`, the devices
                         parameter is not used and a single CPU device is used for inference.
+        :param max_tokens_per_batch: The maximum number of input tokens in a batch, counting the padding. Documents are
+                                     grouped into batches of documents with a similar length, so batches of short
+                                     documents can hold more of them than `batch_size`. If `None`, only `batch_size`
+                                     limits the batches.
         """
         torch_and_transformers_import.check()
         super().__init__()
@@ -120,6 +123,7 @@ class TransformersSummarizer(BaseSummarizer):
         self.clean_up_tokenization_spaces = clean_up_tokenization_spaces
         self.print_log: Set[str] = set()
         self.batch_size = batch_size
+        self.max_tokens_per_batch = max_tokens_per_batch
         self.progress_bar = progress_bar
 
     def predict(self, documents: List[Document]) -> List[Document]:
@@ -137,29 +141,7 @@ class TransformersSummarizer(BaseSummarizer):
             raise ValueError("Summarizer needs at least one document to produce a summary.")
 
         contexts: List[str] = [doc.content for doc in documents]
-
-        encoded_input = self.summarizer.tokenizer(contexts, verbose=False)
-        for input_id in encoded_input["input_ids"]:
-            tokens_count: int = len(input_id)
-            if tokens_count > self.summarizer.tokenizer.model_max_length:
-                truncation_warning = (
-                    "One or more of your input document texts is longer than the specified "
-                    f"maximum sequence length for this summarizer model. "
-                    f"Generating summary from first {self.summarizer.tokenizer.model_max_length}"
-                    f" tokens."
-                )
-                if truncation_warning not in self.print_log:
-                    logger.warning(truncation_warning)
-                    self.print_log.add(truncation_warning)
-
-        summaries = self.summarizer(
-            contexts,
-            min_length=self.min_length,
-            max_length=self.max_length,
-            return_text=True,
-            clean_up_tokenization_spaces=self.clean_up_tokenization_spaces,
-            truncation=True,
-        )
+        summaries = self._summarize(contexts, batch_size=self.batch_size)
 
         result: List[Document] = []
 
@@ -203,37 +185,7 @@ class TransformersSummarizer(BaseSummarizer):
             number_of_docs = [len(context_group) for context_group in contexts]
             contexts = list(itertools.chain.from_iterable(contexts))
 
-        encoded_input = self.summarizer.tokenizer(contexts, verbose=False)
-        for input_id in encoded_input["input_ids"]:
-            tokens_count: int = len(input_id)
-            if tokens_count > self.summarizer.tokenizer.model_max_length:
-                truncation_warning = (
-                    "One or more of your input document texts is longer than the specified "
-                    f"maximum sequence length for this summarizer model. "
-                    f"Generating summary from first {self.summarizer.tokenizer.model_max_length}"
-                    f" tokens."
-                )
-                logger.warning(truncation_warning)
-                break
-
-        summaries = []
-        # HF pipeline progress bar hack, see https://discuss.huggingface.co/t/progress-bar-for-hf-pipelines/20498/2
-        summaries_dataset = ListDataset(contexts)
-        for summary_batch in tqdm(
-            self.summarizer(
-                summaries_dataset,
-                min_length=self.min_length,
-                max_length=self.max_length,
-                return_text=True,
-                clean_up_tokenization_spaces=self.clean_up_tokenization_spaces,
-                truncation=True,
-                batch_size=batch_size,
-            ),
-            disable=not self.progress_bar,
-            total=len(summaries_dataset),
-            desc="Summarizing",
-        ):
-            summaries.extend(summary_batch)
+        summaries = self._summarize(contexts, batch_size=batch_size)
 
         if is_doclist_flat:
             flat_result: List[Document] = []
@@ -262,3 +214,40 @@ class TransformersSummarizer(BaseSummarizer):
                     cur_summaries.append(document)
                 nested_result.append(cur_summaries)
             return nested_result
+
+    def _summarize(self, contexts: List[str], batch_size: Optional[int]) -> List[Dict[str, str]]:
+        """
+        Summarizes all contexts in one stream of batches of contexts with a similar length.
+        """
+        model_max_length = self.summarizer.tokenizer.model_max_length
+        tokens_counts = [
+            len(input_ids) for input_ids in self.summarizer.tokenizer(contexts, verbose=False)["input_ids"]
+        ]
+        if any(tokens_count > model_max_length for tokens_count in tokens_counts):
+            truncation_warning = (
+                "One or more of your input document texts is longer than the specified "
+                f"maximum sequence length for this summarizer model. "
+                f"Generating summary from first {model_max_length}"
+                f" tokens."
+            )
+            if truncation_warning not in self.print_log:
+                logger.warning(truncation_warning)
+                self.print_log.add(truncation_warning)
+
+        return run_in_batches(
+            contexts,
+            lambda batch: self.summarizer(
+                batch,
+                min_length=self.min_length,
+                max_length=self.max_length,
+                return_text=True,
+                clean_up_tokenization_spaces=self.clean_up_tokenization_spaces,
+                truncation=True,
+                batch_size=len(batch),
+            ),
+            lengths=[min(tokens_count, model_max_length) for tokens_count in tokens_counts],
+            batch_size=batch_size,
+            max_tokens_per_batch=self.max_tokens_per_batch,
+            progress_bar=self.progress_bar,
+            desc="Summarizing",
+        )
@@ -95,10 +95,10 @@ class BaseTranslator(BaseComponent):
         """
         translation_results = {}
         if queries:
-            translation_results["queries"] = self.translate_batch(queries=queries)
+            translation_results["queries"] = self.translate_batch(queries=queries, batch_size=batch_size)
         if documents:
-            translation_results["documents"] = self.translate_batch(documents=documents)
+            translation_results["documents"] = self.translate_batch(documents=documents, batch_size=batch_size)
         if answers:
-            translation_results["answers"] = self.translate_batch(documents=answers)
+            translation_results["answers"] = self.translate_batch(documents=answers, batch_size=batch_size)
 
         return translation_results, "output_1"
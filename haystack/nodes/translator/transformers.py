@@ -1,9 +1,8 @@
+import itertools
 import logging
 from copy import deepcopy
 from typing import Any, Dict, List, Optional, Union
 
-from tqdm import tqdm
-
 from haystack.errors import HaystackError
 from haystack.schema import Document, Answer
 from haystack.nodes.translator.base import BaseTranslator
@@ -17,6 +16,7 @@ with LazyImport(message="Run 'pip install farm-haystack[inference]'") as torch_a
     import torch
     from transformers import AutoModelForSeq2SeqLM, AutoTokenizer
     from haystack.modeling.utils import initialize_device_settings  # pylint: disable=ungrouped-imports
+    from haystack.utils.batching import count_tokens, run_in_batches
 
 
 class TransformersTranslator(BaseTranslator):
@@ -50,6 +50,8 @@ class TransformersTranslator(BaseTranslator):
         progress_bar: bool = True,
         use_auth_token: Optional[Union[str, bool]] = None,
         devices: Optional[List[Union[str, "torch.device"]]] = None,
+        batch_size: int = 16,
+        max_tokens_per_batch: Optional[int] = None,
     ):
         """Initialize the translator with a model that fits your targeted languages. While we support all seq2seq
         models from Hugging Face's model hub, we recommend using the OPUS models from Helsinki NLP. They provide plenty
@@ -81,6 +83,11 @@ class TransformersTranslator(BaseTranslator):
                         A list containing torch device objects and/or strings is supported (For example
                         [torch.device('cuda:0'), "mps", "cuda:1"]). When specifying `use_gpu=False` the devices
                         parameter is not used and a single cpu device is used for inference.
+        :param batch_size: The number of texts to translate at a time.
+        :param max_tokens_per_batch: The maximum number of input tokens in a batch, counting the padding. Texts are
+                                     grouped into batches of texts with a similar length, so batches of short texts
+                                     can hold more of them than `batch_size`. If `None`, only `batch_size` limits the
+                                     batches.
         """
         torch_and_transformers_import.check()
         super().__init__()
@@ -96,6 +103,8 @@ class TransformersTranslator(BaseTranslator):
         self.max_seq_len = max_seq_len
         self.clean_up_tokenization_spaces = clean_up_tokenization_spaces
         self.progress_bar = progress_bar
+        self.batch_size = batch_size
+        self.max_tokens_per_batch = max_tokens_per_batch
         tokenizer_name = tokenizer_name or model_name_or_path
         self.tokenizer = AutoTokenizer.from_pretrained(tokenizer_name, use_auth_token=use_auth_token)
         self.model = AutoModelForSeq2SeqLM.from_pretrained(model_name_or_path, use_auth_token=use_auth_token)
@@ -115,6 +124,17 @@ class TransformersTranslator(BaseTranslator):
         :param documents: The documents to translate
         :param dict_key: If you pass a dictionary in `documents`, you can specify here the field which shall be translated.
         """
+        return self._translate(results=results, query=query, documents=documents, dict_key=dict_key)
+
+    def _translate(
+        self,
+        results: Optional[List[Dict[str, Any]]] = None,
+        query: Optional[str] = None,
+        documents: Optional[Union[List[Document], List[Answer], List[str], List[Dict[str, Any]]]] = None,
+        dict_key: Optional[str] = None,
+        batch_size: Optional[int] = None,
+        progress_bar: bool = False,
+    ) -> Union[str, List[Document], List[Answer], List[str], List[Dict[str, Any]]]:
         queries_for_translator = None
         answers_for_translator = None
         if results is not None:
@@ -149,17 +169,14 @@ class TransformersTranslator(BaseTranslator):
         else:
             text_for_translator: List[str] = [query]  # type: ignore
 
-        batch = self.tokenizer(
-            text=text_for_translator,
-            return_tensors="pt",
-            max_length=self.max_seq_len,
-            padding="longest",
-            truncation=True,
-        ).to(self.devices[0])
-
-        generated_output = self.model.generate(**batch)
-        translated_texts = self.tokenizer.batch_decode(
-            generated_output, skip_special_tokens=True, clean_up_tokenization_spaces=self.clean_up_tokenization_spaces
+        translated_texts = run_in_batches(
+            text_for_translator,
+            self._generate,
+            lengths=count_tokens(self.tokenizer, text_for_translator, max_length=self.max_seq_len),
+            batch_size=batch_size or self.batch_size,
+            max_tokens_per_batch=self.max_tokens_per_batch,
+            progress_bar=progress_bar,
+            desc="Translating",
         )
 
         if queries_for_translator is not None and answers_for_translator is not None:
@@ -198,36 +215,54 @@ class TransformersTranslator(BaseTranslator):
 
         :param queries: Single query or list of queries.
         :param documents: List of documents or list of lists of documets.
-        :param batch_size: Not applicable.
+        :param batch_size: The number of texts to translate at a time. All queries, or all documents of all lists,
+                           are translated in one stream of batches.
         """
-        # TODO: This method currently just calls the translate method multiple times, so there is room for improvement.
-
         if queries and documents:
             raise AttributeError("Translator needs either query or documents but not both.")
 
         if not queries and not documents:
             raise AttributeError("Translator needs a query or documents to perform translation.")
 
-        translated = []
+        translated: List[Union[str, List[Document], List[Answer], List[str], List[Dict[str, Any]]]] = []
         # Translate queries
         if queries:
-            for query in tqdm(queries, disable=not self.progress_bar, desc="Translating"):
-                cur_translation = self.translate(query=query)
-                translated.append(cur_translation)
+            translated.extend(self._translate(documents=queries, batch_size=batch_size, progress_bar=self.progress_bar))
 
         # Translate docs / answers
         elif documents:
             # Single list of documents / answers
             if not isinstance(documents[0], list):
-                translated.append(self.translate(documents=documents))  # type: ignore
+                translated.append(
+                    self._translate(
+                        documents=documents, batch_size=batch_size, progress_bar=self.progress_bar  # type: ignore
+                    )
+                )
             # Multiple lists of document / answer lists
             else:
-                for cur_list in tqdm(documents, disable=not self.progress_bar, desc="Translating"):
+                for cur_list in documents:
                     if not isinstance(cur_list, list):
                         raise HaystackError(
                             f"cur_list was of type {type(cur_list)}, but expected a list of Documents / Answers."
                         )
-                    cur_translation = self.translate(documents=cur_list)
-                    translated.append(cur_translation)
+                flattened_documents = list(itertools.chain.from_iterable(documents))  # type: ignore
+                translated_documents = self._translate(
+                    documents=flattened_documents, batch_size=batch_size, progress_bar=self.progress_bar
+                )
+                # Group the translations by list again
+                start = 0
+                for cur_list in documents:
+                    translated.append(translated_documents[start : start + len(cur_list)])  # type: ignore
+                    start += len(cur_list)
 
         return translated
+
+    def _generate(self, texts: List[str]) -> List[str]:
+        batch = self.tokenizer(
+            text=texts, return_tensors="pt", max_length=self.max_seq_len, padding="longest", truncation=True
+        ).to(self.devices[0])
+
+        generated_output = self.model.generate(**batch)
+        return self.tokenizer.batch_decode(
+            generated_output, skip_special_tokens=True, clean_up_tokenization_spaces=self.clean_up_tokenization_spaces
+        )
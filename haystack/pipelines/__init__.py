@@ -1,17 +1,46 @@
-from haystack.pipelines.base import Pipeline, RootNode
-from haystack.pipelines.ray import RayPipeline
-from haystack.pipelines.standard_pipelines import (
-    BaseStandardPipeline,
-    DocumentSearchPipeline,
-    QuestionGenerationPipeline,
-    TranslationWrapperPipeline,
-    SearchSummarizationPipeline,
-    MostSimilarDocumentsPipeline,
-    QuestionAnswerGenerationPipeline,
-    RetrieverQuestionGenerationPipeline,
-    GenerativeQAPipeline,
-    ExtractiveQAPipeline,
-    FAQPipeline,
-    TextIndexingPipeline,
-    WebQAPipeline,
-)
+# The pipelines are imported when they're first accessed, so that importing Pipeline doesn't import Ray
+from typing import TYPE_CHECKING
+
+from haystack.lazy_imports import lazy_attributes
+
+
+_LAZY_ATTRIBUTES = {
+    "haystack.pipelines.base": ["Pipeline", "RootNode"],
+    "haystack.pipelines.ray": ["RayPipeline"],
+    "haystack.pipelines.standard_pipelines": [
+        "BaseStandardPipeline",
+        "DocumentSearchPipeline",
+        "QuestionGenerationPipeline",
+        "TranslationWrapperPipeline",
+        "SearchSummarizationPipeline",
+        "MostSimilarDocumentsPipeline",
+        "QuestionAnswerGenerationPipeline",
+        "RetrieverQuestionGenerationPipeline",
+        "GenerativeQAPipeline",
+        "ExtractiveQAPipeline",
+        "FAQPipeline",
+        "TextIndexingPipeline",
+        "WebQAPipeline",
+    ],
+}
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from haystack.pipelines.base import Pipeline, RootNode
+    from haystack.pipelines.ray import RayPipeline
+    from haystack.pipelines.standard_pipelines import (
+        BaseStandardPipeline,
+        DocumentSearchPipeline,
+        QuestionGenerationPipeline,
+        TranslationWrapperPipeline,
+        SearchSummarizationPipeline,
+        MostSimilarDocumentsPipeline,
+        QuestionAnswerGenerationPipeline,
+        RetrieverQuestionGenerationPipeline,
+        GenerativeQAPipeline,
+        ExtractiveQAPipeline,
+        FAQPipeline,
+        TextIndexingPipeline,
+        WebQAPipeline,
+    )
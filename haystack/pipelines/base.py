@@ -18,7 +18,6 @@ from pathlib import Path
 import yaml
 import numpy as np
 import pandas as pd
-import networkx as nx
 from pandas.core.frame import DataFrame
 from tqdm import tqdm
 from networkx import DiGraph
@@ -35,6 +34,7 @@ from haystack.pipelines.config import (
     _init_pipeline_graph,
     VALID_ROOT_NODES,
 )
+from haystack.pipelines.execution_plan import ExecutionPlan
 from haystack.pipelines.utils import generate_code, print_eval_report
 from haystack.utils.deepsetcloud import DeepsetCloud
 from haystack.schema import Answer, EvaluationResult, MultiLabel, Document, Span
@@ -72,6 +72,8 @@ class Pipeline:
 
     def __init__(self):
         self.graph = DiGraph()
+        self._execution_plan: Optional[ExecutionPlan] = None
+        self._config_hash_outdated = False
         self.config_hash = None
         self.last_config_hash = None
         self.runs = 0
@@ -85,6 +87,38 @@ class Pipeline:
             return None
         return list(self.graph.nodes)[0]  # List conversion is required, see networkx docs
 
+    @property
+    def config_hash(self) -> Optional[str]:
+        """
+        Used for telemetry. The hash of the pipeline config, see `update_config_hash()`. It's computed again when it's
+        first needed after the pipeline changed.
+        """
+        if self._config_hash_outdated:
+            self.update_config_hash()
+        return self._config_hash
+
+    @config_hash.setter
+    def config_hash(self, config_hash: Optional[str]):
+        self._config_hash = config_hash
+        self._config_hash_outdated = False
+
+    def _get_execution_plan(self) -> ExecutionPlan:
+        """
+        Returns the execution plan of the pipeline graph, compiling it if the graph changed since it was last compiled.
+        """
+        plan = self._execution_plan
+        if plan is None or plan.graph is not self.graph:
+            plan = ExecutionPlan(self.graph)
+            self._execution_plan = plan
+        return plan
+
+    def _invalidate_execution_plan(self):
+        """
+        Drops the execution plan and the config hash after the pipeline graph changed.
+        """
+        self._execution_plan = None
+        self._config_hash_outdated = True
+
     @property
     def components(self) -> Dict[str, BaseComponent]:
         """
@@ -428,7 +462,7 @@ class Pipeline:
             node={"name": name, "inputs": inputs},
             instance=component,
         )
-        self.update_config_hash()
+        self._invalidate_execution_plan()
 
     def update_config_hash(self):
         """
@@ -464,6 +498,7 @@ class Pipeline:
         :param component: The component object to be set at the node.
         """
         self.graph.nodes[name]["component"] = component
+        self._invalidate_execution_plan()
 
     def _run_node(self, node_id: str, node_input: Dict[str, Any]) -> Tuple[Dict, str]:
         return self.graph.nodes[node_id]["component"]._dispatch_run(**node_input)
@@ -522,7 +557,8 @@ class Pipeline:
         # validate the node names
         self._validate_node_names_in_params(params=params)
 
-        root_node = self.root_node
+        plan = self._get_execution_plan()
+        root_node = plan.root_node
         if not root_node:
             raise PipelineError("Cannot run a pipeline with no nodes.")
 
@@ -543,7 +579,7 @@ class Pipeline:
 
         i = 0  # the first item is popped off the queue unless it is a "join" node with unprocessed predecessors
         while queue:
-            node_id = list(queue.keys())[i]
+            node_id = next(itertools.islice(queue, i, None))
             node_input = queue[node_id]
             node_input["node_id"] = node_id
 
@@ -559,8 +595,8 @@ class Pipeline:
                     node_input["params"][node_id] = {}
                 node_input["params"][node_id]["debug"] = debug
 
-            predecessors = set(nx.ancestors(self.graph, node_id))
-            if predecessors.isdisjoint(set(queue.keys())):  # only execute if predecessor nodes are executed
+            # only execute if predecessor nodes are executed
+            if plan.ancestors[node_id].isdisjoint(queue):
                 try:
                     logger.debug("Running node '%s` with input: %s", node_id, node_input)
                     start = time()
@@ -581,11 +617,11 @@ class Pipeline:
                         current_node_output = {k: v for k, v in node_output.items() if not k.startswith("output_")}
                         current_docs = node_output.pop(stream_id)
                         current_node_output["documents"] = current_docs
-                        next_nodes = self.get_next_nodes(node_id, stream_id)
+                        next_nodes = plan.next_nodes(node_id, stream_id)
                         for n in next_nodes:
                             queue[n] = current_node_output
                 else:
-                    next_nodes = self.get_next_nodes(node_id, stream_id)
+                    next_nodes = plan.next_nodes(node_id, stream_id)
                     for n in next_nodes:  # add successor nodes with corresponding inputs to the queue
                         if queue.get(n):  # concatenate inputs if it's a join node
                             existing_input = queue[n]
@@ -660,7 +696,8 @@ class Pipeline:
         # validate the node names
         self._validate_node_names_in_params(params=params)
 
-        root_node = self.root_node
+        plan = self._get_execution_plan()
+        root_node = plan.root_node
         if not root_node:
             raise PipelineError("Cannot run a pipeline with no nodes.")
 
@@ -681,7 +718,7 @@ class Pipeline:
 
         i = 0  # the first item is popped off the queue unless it is a "join" node with unprocessed predecessors
         while queue:
-            node_id = list(queue.keys())[i]
+            node_id = next(itertools.islice(queue, i, None))
             node_input = queue[node_id]
             node_input["node_id"] = node_id
 
@@ -697,8 +734,8 @@ class Pipeline:
                     node_input["params"][node_id] = {}
                 node_input["params"][node_id]["debug"] = debug
 
-            predecessors = set(nx.ancestors(self.graph, node_id))
-            if predecessors.isdisjoint(set(queue.keys())):  # only execute if predecessor nodes are executed
+            # only execute if predecessor nodes are executed
+            if plan.ancestors[node_id].isdisjoint(queue):
                 try:
                     logger.debug("Running node '%s` with input: %s", node_id, node_input)
                     start = time()
@@ -719,11 +756,11 @@ class Pipeline:
                         current_node_output = {k: v for k, v in node_output.items() if not k.startswith("output_")}
                         current_docs = node_output.pop(stream_id)
                         current_node_output["documents"] = current_docs
-                        next_nodes = self.get_next_nodes(node_id, stream_id)
+                        next_nodes = plan.next_nodes(node_id, stream_id)
                         for n in next_nodes:
                             queue[n] = current_node_output
                 else:
-                    next_nodes = self.get_next_nodes(node_id, stream_id)
+                    next_nodes = plan.next_nodes(node_id, stream_id)
                     for n in next_nodes:  # add successor nodes with corresponding inputs to the queue
                         if queue.get(n):  # concatenate inputs if it's a join node
                             existing_input = queue[n]
@@ -831,7 +868,8 @@ class Pipeline:
         # Validate node names
         self._validate_node_names_in_params(params=params)
 
-        root_node = self.root_node
+        plan = self._get_execution_plan()
+        root_node = plan.root_node
         if not root_node:
             raise PipelineError("Cannot run a pipeline with no nodes.")
 
@@ -852,7 +890,7 @@ class Pipeline:
 
         i = 0  # the first item is popped off the queue unless it is a "join" node with unprocessed predecessors
         while queue:
-            node_id = list(queue.keys())[i]
+            node_id = next(itertools.islice(queue, i, None))
             node_input = queue[node_id]
             node_input["node_id"] = node_id
 
@@ -867,8 +905,8 @@ class Pipeline:
                     node_input["params"][node_id] = {}
                 node_input["params"][node_id]["debug"] = debug
 
-            predecessors = set(nx.ancestors(self.graph, node_id))
-            if predecessors.isdisjoint(set(queue.keys())):  # only execute if predecessor nodes are executed
+            # only execute if predecessor nodes are executed
+            if plan.ancestors[node_id].isdisjoint(queue):
                 try:
                     logger.debug("Running node '%s` with input: %s", node_id, node_input)
                     node_output, stream_id = self.graph.nodes[node_id]["component"]._dispatch_run_batch(**node_input)
@@ -886,11 +924,11 @@ class Pipeline:
                         current_node_output = {k: v for k, v in node_output.items() if not k.startswith("output_")}
                         current_docs = node_output.pop(stream_id)
                         current_node_output["documents"] = current_docs
-                        next_nodes = self.get_next_nodes(node_id, stream_id)
+                        next_nodes = plan.next_nodes(node_id, stream_id)
                         for n in next_nodes:
                             queue[n] = current_node_output
                 else:
-                    next_nodes = self.get_next_nodes(node_id, stream_id)
+                    next_nodes = plan.next_nodes(node_id, stream_id)
                     for n in next_nodes:
                         if queue.get(n):  # concatenate inputs if it's a join node
                             existing_input = queue[n]
@@ -2066,13 +2104,7 @@ class Pipeline:
         return pd.concat(partial_dfs, ignore_index=True).reset_index()
 
     def get_next_nodes(self, node_id: str, stream_id: str):
-        current_node_edges = self.graph.edges(node_id, data=True)
-        next_nodes = [
-            next_node
-            for _, next_node, data in current_node_edges
-            if not stream_id or data["label"] == stream_id or stream_id == "output_all"
-        ]
-        return next_nodes
+        return list(self._get_execution_plan().next_nodes(node_id, stream_id))
 
     def get_nodes_by_class(self, class_type) -> List[Any]:
         """
@@ -2433,15 +2465,13 @@ class Pipeline:
         """
         Validates the node names provided in the 'params' arg of run/run_batch method.
         """
-        if params and not all(node_id in self.graph.nodes for node_id in params.keys()):
+        if not params:
+            return
+        plan = self._get_execution_plan()
+        not_a_node = params.keys() - plan.node_names
+        if not_a_node:
             # Might be a non-targeted param. Verify that too
-            not_a_node = set(params.keys()) - set(self.graph.nodes)
-            # "debug" will be picked up by _dispatch_run, see its code
-            # "add_isolated_node_eval" is set by pipeline.eval / pipeline.eval_batch
-            valid_global_params = {"debug", "add_isolated_node_eval"}
-            for node_id in self.graph.nodes:
-                run_signature_args = self._get_run_node_signature(node_id)
-                valid_global_params |= set(run_signature_args)
+            valid_global_params = plan.valid_global_params(self._get_run_node_signature)
             invalid_keys = [key for key in not_a_node if key not in valid_global_params]
 
             if invalid_keys:
@@ -1,8 +1,10 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 import re
 import os
 import logging
+import threading
+from functools import lru_cache
 from pathlib import Path
 from copy import copy
 
@@ -13,7 +15,7 @@ from jsonschema.exceptions import ValidationError
 
 from haystack import __version__
 from haystack.nodes.base import BaseComponent, RootNode
-from haystack.nodes._json_schema import load_schema, inject_definition_in_schema
+from haystack.nodes._json_schema import load_schema, get_schema_key, get_node_class_schema
 from haystack.errors import PipelineError, PipelineConfigError, PipelineSchemaError
 
 
@@ -269,57 +271,104 @@ def validate_schema(pipeline_config: Dict, strict_version_check: bool = False, e
                 __version__,
             )
 
-    # Load the json schema, and create one if it doesn't exist yet
-    schema = load_schema()
+    # Load the compiled json schema, and create one if it doesn't exist yet
+    compiled_schema = get_compiled_schema(get_schema_key())
 
-    # Remove the version value from the schema to prevent validation errors on it - a version only have to be present.
-    del schema["properties"]["version"]["const"]
+    try:
+        compiled_schema.pipeline_validator.validate(instance=pipeline_config)
+    except ValidationError as validation:
+        # Format the error to make it as clear as possible
+        error_path = [
+            i for i in list(validation.relative_schema_path)[:-1] if repr(i) != "'items'" and repr(i) != "'properties'"
+        ]
+        error_location = "->".join(repr(index) for index in error_path)
+        if error_location:
+            error_location = f"The error is in {error_location}."
 
-    loaded_custom_nodes = []
-    while True:
-        try:
-            Draft7Validator(schema).validate(instance=pipeline_config)
-            break
+        raise PipelineConfigError(
+            f"Validation failed. {validation.message}. {error_location} " "See the stacktrace for more information."
+        ) from validation
 
+    # Each component is only validated against the schema of its own type
+    for component in pipeline_config["components"]:
+        try:
+            compiled_schema.get_component_validator(component["type"]).validate(instance=component)
         except ValidationError as validation:
-            # If the validation comes from an unknown node, try to find it and retry:
-            if list(validation.relative_schema_path) == ["properties", "components", "items", "anyOf"]:
-                if validation.instance["type"] not in loaded_custom_nodes:
-                    logger.info(
-                        "Missing definition for node of type %s. Looking into local classes...",
-                        validation.instance["type"],
-                    )
-                    missing_component_class = BaseComponent.get_subclass(validation.instance["type"])
-                    schema = inject_definition_in_schema(node_class=missing_component_class, schema=schema)
-                    loaded_custom_nodes.append(validation.instance["type"])
-                    continue
-
-                # A node with the given name was in the schema, but something else is wrong with it.
-                # Probably it references unknown classes in its init parameters.
-                raise PipelineSchemaError(
-                    f"Node of type {validation.instance['type']} found, but it failed validation. Possible causes:\n"
-                    " - The node is missing some mandatory parameter\n"
-                    " - Wrong indentation of some parameter in YAML\n"
-                    "See the stacktrace for more information."
-                ) from validation
-
-            # Format the error to make it as clear as possible
-            error_path = [
-                i
-                for i in list(validation.relative_schema_path)[:-1]
-                if repr(i) != "'items'" and repr(i) != "'properties'"
-            ]
-            error_location = "->".join(repr(index) for index in error_path)
-            if error_location:
-                error_location = f"The error is in {error_location}."
-
-            raise PipelineConfigError(
-                f"Validation failed. {validation.message}. {error_location} " "See the stacktrace for more information."
+            # Probably it references unknown classes in its init parameters.
+            raise PipelineSchemaError(
+                f"Node of type {component['type']} found, but it failed validation. Possible causes:\n"
+                " - The node is missing some mandatory parameter\n"
+                " - Wrong indentation of some parameter in YAML\n"
+                "See the stacktrace for more information."
             ) from validation
 
     logger.debug("The given configuration is valid according to the JSON schema.")
 
 
+class CompiledSchema:
+    """
+    The validators of a version of the pipeline json schema, built once and reused for all the pipelines loaded.
+
+    The pipeline validator checks the structure of the configuration. Instead of trying the schemas of all nodes for
+    each component, every component is then validated against the schema of its own type only. Nodes that are not
+    in the schema file, like custom nodes, get their schema from their class the first time they're validated.
+    """
+
+    def __init__(self, schema: Dict[str, Any]):
+        # Remove the version value from the schema to prevent validation errors on it - a version only have to be present.
+        del schema["properties"]["version"]["const"]
+
+        self.definitions: Dict[str, Any] = schema["definitions"]
+        self.node_types: Dict[str, str] = {}
+        for node_ref in schema["properties"]["components"]["items"]["anyOf"]:
+            definition_name = node_ref["$ref"].split("/")[-1]
+            self.node_types[self.definitions[definition_name]["properties"]["type"]["const"]] = definition_name
+
+        # The rest of each component, including its name, is checked by the validator of its type
+        schema["properties"]["components"]["items"] = {
+            "type": "object",
+            "properties": {"type": {"type": "string"}},
+            "required": ["type"],
+        }
+        self.pipeline_validator = Draft7Validator(schema)
+        self._component_validators: Dict[str, Tuple[Any, Draft7Validator]] = {}
+        self._lock = threading.Lock()
+
+    def get_component_validator(self, component_type: str) -> Draft7Validator:
+        """
+        Returns the validator for components of the given type.
+
+        :raise: `PipelineSchemaError` if no valid node class with this name exists.
+        """
+        if component_type in self.node_types:
+            node_class = None
+            definition_name = self.node_types[component_type]
+            definitions = self.definitions
+        else:
+            logger.info("Missing definition for node of type %s. Looking into local classes...", component_type)
+            # Custom classes can be redefined with the same name, so their validators are tied to the class
+            node_class = BaseComponent.get_subclass(component_type)
+            schema_definition, _ = get_node_class_schema(node_class)
+            definition_name = f"{component_type}Component"
+            definitions = {**self.definitions, **schema_definition}
+
+        with self._lock:
+            cached_class, validator = self._component_validators.get(component_type, (None, None))
+            if validator is None or cached_class is not node_class:
+                validator = Draft7Validator({"$ref": f"#/definitions/{definition_name}", "definitions": definitions})
+                self._component_validators[component_type] = (node_class, validator)
+        return validator
+
+
+@lru_cache(maxsize=8)
+def get_compiled_schema(schema_key: Tuple[str, int, int]) -> CompiledSchema:
+    """
+    Returns the compiled version of the pipeline json schema identified by `schema_key`, see `get_schema_key()`.
+    Each version of the schema is only loaded and compiled once per process.
+    """
+    return CompiledSchema(load_schema())
+
+
 def validate_pipeline_graph(pipeline_definition: Dict[str, Any], component_definitions: Dict[str, Any]):
     """
     Validates a pipeline's graph without loading the nodes.
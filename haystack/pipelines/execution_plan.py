@@ -0,0 +1,70 @@
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Set, Tuple
+
+import networkx as nx
+
+
+class ExecutionPlan:
+    """
+    The parts of a pipeline graph that `Pipeline.run()` and `Pipeline.run_batch()` look up for every node they execute:
+    the root node, the topological order of the nodes, the ancestors of each node, and the successors of each node
+    for each of its outgoing edges.
+
+    A plan describes the graph it was compiled from and isn't updated when that graph changes. Pipelines compile a new
+    plan after a node is added or replaced.
+    """
+
+    def __init__(self, graph: nx.DiGraph):
+        """
+        :param graph: The pipeline graph to compile. It must be a directed acyclic graph whose edges are labeled with
+                      the output they connect, like `"output_1"`.
+        """
+        self.graph = graph
+        self.root_node: Optional[str] = next(iter(graph.nodes), None)
+        self.node_names: FrozenSet[str] = frozenset(graph.nodes)
+        self.order: Tuple[str, ...] = tuple(nx.topological_sort(graph))
+
+        # Visiting the nodes in topological order, the ancestors of a node are its predecessors and their ancestors
+        self.ancestors: Dict[str, FrozenSet[str]] = {}
+        for node in self.order:
+            ancestors: Set[str] = set()
+            for predecessor in graph.predecessors(node):
+                ancestors.add(predecessor)
+                ancestors |= self.ancestors[predecessor]
+            self.ancestors[node] = frozenset(ancestors)
+
+        self.successors: Dict[str, Tuple[str, ...]] = {}
+        self.routes: Dict[str, Dict[str, Tuple[str, ...]]] = {}
+        for node in graph.nodes:
+            edges = list(graph.edges(node, data="label"))
+            self.successors[node] = tuple(successor for _, successor, _ in edges)
+            routes: Dict[str, Tuple[str, ...]] = {}
+            for _, successor, label in edges:
+                routes[label] = routes.get(label, ()) + (successor,)
+            self.routes[node] = routes
+
+        self._valid_global_params: Optional[FrozenSet[str]] = None
+
+    def next_nodes(self, node_id: str, stream_id: Optional[str]) -> Tuple[str, ...]:
+        """
+        Returns the nodes that receive the output a node sent to `stream_id`, in the order of the node's edges.
+        If the node didn't pick an output, or picked `"output_all"`, all of its successors receive it.
+        """
+        if not stream_id or stream_id == "output_all":
+            return self.successors[node_id]
+        return self.routes[node_id].get(stream_id, ())
+
+    def valid_global_params(self, get_run_node_signature: Callable[[str], Iterable[str]]) -> FrozenSet[str]:
+        """
+        Returns the names of the parameters that can be passed to all nodes at once in `params`. They're collected from
+        the signatures of the nodes' run methods the first time they're needed.
+
+        :param get_run_node_signature: Returns the names of the parameters of a node's run method.
+        """
+        if self._valid_global_params is None:
+            # "debug" will be picked up by _dispatch_run, see its code
+            # "add_isolated_node_eval" is set by pipeline.eval / pipeline.eval_batch
+            valid_global_params = {"debug", "add_isolated_node_eval"}
+            for node_id in self.graph.nodes:
+                valid_global_params |= set(get_run_node_signature(node_id))
+            self._valid_global_params = frozenset(valid_global_params)
+        return self._valid_global_params
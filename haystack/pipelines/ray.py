@@ -1,11 +1,11 @@
 from __future__ import annotations
 import inspect
+import itertools
 import logging
 from time import time
 from typing import Any, Dict, List, Optional, Tuple, Union
 from pathlib import Path
 
-import networkx as nx
 
 try:
     from ray import serve
@@ -251,6 +251,7 @@ class RayPipeline(Pipeline):
                        must be specified explicitly as "QueryClassifier.output_2".
         """
         self.graph.add_node(name, component=handle, inputs=inputs, outgoing_edges=outgoing_edges)
+        self._invalidate_execution_plan()
 
         if len(self.graph.nodes) == 2:  # first node added; connect with Root
             self.graph.add_edge(self.root_node, name, label="output_1")
@@ -328,7 +329,8 @@ class RayPipeline(Pipeline):
         # validate the node names
         self._validate_node_names_in_params(params=params)
 
-        root_node = self.root_node
+        plan = self._get_execution_plan()
+        root_node = plan.root_node
         if not root_node:
             raise PipelineError("Cannot run a pipeline with no nodes.")
 
@@ -349,7 +351,7 @@ class RayPipeline(Pipeline):
 
         i = 0  # the first item is popped off the queue unless it is a "join" node with unprocessed predecessors
         while queue:
-            node_id = list(queue.keys())[i]
+            node_id = next(itertools.islice(queue, i, None))
             node_input = queue[node_id]
             node_input["node_id"] = node_id
 
@@ -365,8 +367,8 @@ class RayPipeline(Pipeline):
                     node_input["params"][node_id] = {}
                 node_input["params"][node_id]["debug"] = debug
 
-            predecessors = set(nx.ancestors(self.graph, node_id))
-            if predecessors.isdisjoint(set(queue.keys())):  # only execute if predecessor nodes are executed
+            # only execute if predecessor nodes are executed
+            if plan.ancestors[node_id].isdisjoint(queue):
                 try:
                     logger.debug("Running node '%s` with input: %s", node_id, node_input)
                     start = time()
@@ -387,11 +389,11 @@ class RayPipeline(Pipeline):
                         current_node_output = {k: v for k, v in node_output.items() if not k.startswith("output_")}
                         current_docs = node_output.pop(stream_id)
                         current_node_output["documents"] = current_docs
-                        next_nodes = self.get_next_nodes(node_id, stream_id)
+                        next_nodes = plan.next_nodes(node_id, stream_id)
                         for n in next_nodes:
                             queue[n] = current_node_output
                 else:
-                    next_nodes = self.get_next_nodes(node_id, stream_id)
+                    next_nodes = plan.next_nodes(node_id, stream_id)
                     for n in next_nodes:  # add successor nodes with corresponding inputs to the queue
                         if queue.get(n):  # concatenate inputs if it's a join node
                             existing_input = queue[n]
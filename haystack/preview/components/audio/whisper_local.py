@@ -5,6 +5,7 @@ from pathlib import Path
 
 from haystack.preview import component, Document, default_to_dict, ComponentError
 from haystack.preview.lazy_imports import LazyImport
+from haystack.preview.utils import ModelKey, model_registry
 
 with LazyImport(
     "Run 'pip install transformers[torch]==4.34.1' to install torch and "
@@ -56,7 +57,12 @@ class LocalWhisperTranscriber:
         Loads the model.
         """
         if not self._model:
-            self._model = whisper.load_model(self.model_name, device=self.device)
+            # Transcribers with the same model share it, so it's loaded only once per process
+            self._model = model_registry.acquire(
+                owner=self,
+                key=ModelKey.from_kwargs("whisper", self.model_name, device=self.device),
+                loader=lambda: whisper.load_model(self.model_name, device=self.device),
+            )
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -138,3 +138,20 @@ class PromptBuilder:
                 raise ValueError(
                     "PromptBuilder was initialized with template_variables, but no ChatMessage(s) were provided."
                 )
+
+    def run_batch(self, messages: Optional[List[Optional[List[ChatMessage]]]] = None, **kwargs):
+        """
+        Build the prompts for a batch of inputs.
+
+        :param messages: (Optional) The list of `ChatMessage` instances of each batch item.
+        :param kwargs: Lists with the value of each template variable for each batch item.
+        """
+        if not messages and not any(kwargs.values()):
+            return {"prompt": []}
+        batch_size = len(messages) if messages else len(next(values for values in kwargs.values() if values))
+        messages = messages or [None] * batch_size
+        prompts = [
+            self.run(messages=messages[i], **{name: values[i] for name, values in kwargs.items()})["prompt"]
+            for i in range(batch_size)
+        ]
+        return {"prompt": prompts}
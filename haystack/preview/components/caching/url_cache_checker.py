@@ -1,7 +1,12 @@
+import logging
+from collections import defaultdict
 from typing import List, Dict, Any
 
 from haystack.preview import component, Document, default_from_dict, default_to_dict, DeserializationError
 from haystack.preview.document_stores import DocumentStore, document_store
+from haystack.preview.utils.filters import _document_fields
+
+logger = logging.getLogger(__name__)
 
 
 @component
@@ -17,6 +22,8 @@ class UrlCacheChecker:
         """
         self.document_store = document_store
         self.url_field = url_field
+        self._cache_hits = 0
+        self._cache_misses = 0
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -42,6 +49,18 @@ class UrlCacheChecker:
         data["init_parameters"]["document_store"] = docstore
         return default_from_dict(cls, data)
 
+    @property
+    def cache_stats(self) -> Dict[str, float]:
+        """
+        Hits and misses of the URLs looked up in the cache since this UrlCacheChecker was created.
+        """
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            "hits": self._cache_hits,
+            "misses": self._cache_misses,
+            "hit_rate": self._cache_hits / lookups if lookups else 0.0,
+        }
+
     @component.output_types(hits=List[Document], misses=List[str])
     def run(self, urls: List[str]):
         """
@@ -53,11 +72,21 @@ class UrlCacheChecker:
         found_documents = []
         missing_urls = []
 
+        # A single query for all URLs instead of one per URL, which matters for remote Document Stores
+        documents_by_url: Dict[str, List[Document]] = defaultdict(list)
+        if urls:
+            for document in self.document_store.filter_documents(filters={self.url_field: {"$in": urls}}):
+                # Resolve url_field like the filter does, so that it can be a meta field or a Document field
+                documents_by_url[_document_fields(document).get(self.url_field)].append(document)
+
         for url in urls:
-            filters = {self.url_field: url}
-            found = self.document_store.filter_documents(filters=filters)
+            found = documents_by_url.get(url)
             if found:
                 found_documents.extend(found)
             else:
                 missing_urls.append(url)
+        self._cache_hits += len(urls) - len(missing_urls)
+        self._cache_misses += len(missing_urls)
+        logger.debug("%s of %s URLs found in the cache", len(urls) - len(missing_urls), len(urls))
+        logger.debug("Cache hit rate: %.2f", self.cache_stats["hit_rate"])
         return {"hits": found_documents, "misses": missing_urls}
@@ -1,6 +1,9 @@
-from typing import List, Optional, Union, Dict
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple, Union
 
 from haystack.preview.lazy_imports import LazyImport
+from haystack.preview.utils import apply_inference_precision
 
 with LazyImport(message="Run 'pip install sentence-transformers>=2.2.0'") as sentence_transformers_import:
     from sentence_transformers import SentenceTransformer
@@ -9,22 +12,43 @@ with LazyImport(message="Run 'pip install sentence-transformers>=2.2.0'") as sen
 class _SentenceTransformersEmbeddingBackendFactory:
     """
     Factory class to create instances of Sentence Transformers embedding backends.
+
+    It's thread-safe: concurrent requests for the same backend, like in a parallel `Pipeline.warm_up()`, wait for it
+    to be created once, while different backends can be created at the same time.
     """
 
     _instances: Dict[str, "_SentenceTransformersEmbeddingBackend"] = {}
+    _lock = threading.Lock()
+    _creation_locks: Dict[str, threading.Lock] = {}
 
     @staticmethod
     def get_embedding_backend(
-        model_name_or_path: str, device: Optional[str] = None, use_auth_token: Union[bool, str, None] = None
+        model_name_or_path: str,
+        device: Optional[str] = None,
+        use_auth_token: Union[bool, str, None] = None,
+        inference_precision: str = "fp32",
     ):
-        embedding_backend_id = f"{model_name_or_path}{device}{use_auth_token}"
+        embedding_backend_id = f"{model_name_or_path}{device}{use_auth_token}{inference_precision}"
 
-        if embedding_backend_id in _SentenceTransformersEmbeddingBackendFactory._instances:
-            return _SentenceTransformersEmbeddingBackendFactory._instances[embedding_backend_id]
-        embedding_backend = _SentenceTransformersEmbeddingBackend(
-            model_name_or_path=model_name_or_path, device=device, use_auth_token=use_auth_token
-        )
-        _SentenceTransformersEmbeddingBackendFactory._instances[embedding_backend_id] = embedding_backend
+        factory = _SentenceTransformersEmbeddingBackendFactory
+        with factory._lock:
+            if embedding_backend_id in factory._instances:
+                return factory._instances[embedding_backend_id]
+            creation_lock = factory._creation_locks.setdefault(embedding_backend_id, threading.Lock())
+
+        with creation_lock:
+            # Another thread may have created the backend while this one was waiting for the lock
+            if embedding_backend_id in factory._instances:
+                return factory._instances[embedding_backend_id]
+            embedding_backend = _SentenceTransformersEmbeddingBackend(
+                model_name_or_path=model_name_or_path,
+                device=device,
+                use_auth_token=use_auth_token,
+                inference_precision=inference_precision,
+            )
+            with factory._lock:
+                factory._instances[embedding_backend_id] = embedding_backend
+                del factory._creation_locks[embedding_backend_id]
         return embedding_backend
 
 
@@ -34,13 +58,131 @@ class _SentenceTransformersEmbeddingBackend:
     """
 
     def __init__(
-        self, model_name_or_path: str, device: Optional[str] = None, use_auth_token: Union[bool, str, None] = None
+        self,
+        model_name_or_path: str,
+        device: Optional[str] = None,
+        use_auth_token: Union[bool, str, None] = None,
+        inference_precision: str = "fp32",
     ):
         sentence_transformers_import.check()
         self.model = SentenceTransformer(
             model_name_or_path=model_name_or_path, device=device, use_auth_token=use_auth_token
         )
+        self.model = apply_inference_precision(self.model, inference_precision)
+        self._dispatcher = _BatchingDispatcher(self.embed)
 
     def embed(self, data: List[str], **kwargs) -> List[List[float]]:
         embeddings = self.model.encode(data, **kwargs).tolist()
         return embeddings
+
+    def embed_batched(self, data: List[str], max_latency: float, max_batch_size: int, **kwargs) -> List[List[float]]:
+        """
+        Embeds the data together with the data of concurrent calls from other threads. The calls are merged into a
+        single call to the model, which uses it more efficiently than many small calls.
+
+        :param data: The texts to embed.
+        :param max_latency: How many seconds to wait for other calls before embedding.
+        :param max_batch_size: Embed right away once this many texts are waiting.
+        :param kwargs: Arguments for `SentenceTransformer.encode`. Only calls with the same arguments are merged.
+        :return: The embeddings of `data`.
+        """
+        return self._dispatcher.embed(data, max_latency=max_latency, max_batch_size=max_batch_size, **kwargs)
+
+    @property
+    def batching_metrics(self) -> Dict[str, float]:
+        """
+        Statistics about the calls of `embed_batched` and how they were merged.
+        """
+        return self._dispatcher.metrics
+
+
+class _EmbeddingRequest:
+    """
+    A call waiting to be embedded by the _BatchingDispatcher.
+    """
+
+    def __init__(self, data: List[str]):
+        self.data = data
+        self.done = threading.Event()
+        self.embeddings: List[List[float]] = []
+        self.error: Optional[Exception] = None
+
+
+class _BatchingDispatcher:
+    """
+    Merges concurrent embedding calls into batches.
+
+    There is no background thread: the first call that finds no batch waiting for its encode arguments becomes the
+    batch's leader. It waits until the latency budget is used up or enough texts have arrived, embeds the whole batch,
+    and hands each call its embeddings. Calls arriving meanwhile start the next batch.
+    """
+
+    def __init__(self, embed_function):
+        self._embed_function = embed_function
+        self._condition = threading.Condition()
+        self._batches: Dict[Tuple[Tuple[str, Any], ...], List[_EmbeddingRequest]] = {}
+        self._metrics = {"requests": 0, "batches": 0, "texts": 0, "max_batch_texts": 0, "wait_seconds": 0.0}
+
+    def embed(self, data: List[str], max_latency: float, max_batch_size: int, **kwargs) -> List[List[float]]:
+        key = tuple(sorted(kwargs.items()))
+        request = _EmbeddingRequest(data)
+        start = time.monotonic()
+        with self._condition:
+            batch = self._batches.setdefault(key, [])
+            batch.append(request)
+            is_leader = len(batch) == 1
+            if not is_leader and sum(len(r.data) for r in batch) >= max_batch_size:
+                self._condition.notify_all()
+
+            if is_leader:
+                deadline = start + max_latency
+                while sum(len(r.data) for r in batch) < max_batch_size:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    self._condition.wait(remaining)
+                # Calls arriving from now on start a new batch
+                del self._batches[key]
+                self._record(batch, wait_seconds=time.monotonic() - start)
+
+        if is_leader:
+            self._embed_batch(batch, kwargs)
+        else:
+            request.done.wait()
+
+        if request.error is not None:
+            raise request.error
+        return request.embeddings
+
+    def _embed_batch(self, batch: List[_EmbeddingRequest], kwargs: Dict[str, Any]):
+        try:
+            embeddings = self._embed_function([text for request in batch for text in request.data], **kwargs)
+            offset = 0
+            for request in batch:
+                request.embeddings = embeddings[offset : offset + len(request.data)]
+                offset += len(request.data)
+        except Exception as e:
+            for request in batch:
+                request.error = e
+        finally:
+            for request in batch:
+                request.done.set()
+
+    def _record(self, batch: List[_EmbeddingRequest], wait_seconds: float):
+        num_texts = sum(len(request.data) for request in batch)
+        self._metrics["requests"] += len(batch)
+        self._metrics["batches"] += 1
+        self._metrics["texts"] += num_texts
+        self._metrics["max_batch_texts"] = max(self._metrics["max_batch_texts"], num_texts)
+        self._metrics["wait_seconds"] += wait_seconds
+
+    @property
+    def metrics(self) -> Dict[str, float]:
+        """
+        The number of merged requests, batches, and texts, the largest batch, the total time the batch leaders
+        waited for other requests, and the mean number of requests per batch.
+        """
+        with self._condition:
+            metrics = dict(self._metrics)
+        metrics["mean_requests_per_batch"] = metrics["requests"] / metrics["batches"] if metrics["batches"] else 0.0
+        return metrics
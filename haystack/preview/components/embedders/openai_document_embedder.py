@@ -6,6 +6,7 @@ from tqdm import tqdm
 
 
 from haystack.preview import component, Document, default_to_dict
+from haystack.preview.utils.openai_requests import _OpenAIRequestRunnerFactory, estimate_tokens
 
 
 @component
@@ -41,6 +42,9 @@ class OpenAIDocumentEmbedder:
         progress_bar: bool = True,
         metadata_fields_to_embed: Optional[List[str]] = None,
         embedding_separator: str = "\n",
+        max_concurrent_requests: int = 4,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
     ):
         """
         Create a OpenAIDocumentEmbedder component.
@@ -57,6 +61,10 @@ class OpenAIDocumentEmbedder:
                              to keep the logs clean.
         :param metadata_fields_to_embed: List of meta fields that should be embedded along with the Document text.
         :param embedding_separator: Separator used to concatenate the meta fields to the Document text.
+        :param max_concurrent_requests: The maximum number of batches sent to OpenAI at the same time.
+        :param requests_per_minute: The maximum number of requests to send per minute, to stay within the rate limits
+            of your OpenAI account. `None` means no limit. Requests that are rate limited anyway are retried.
+        :param tokens_per_minute: The maximum number of tokens to send per minute. `None` means no limit.
         """
         # if the user does not provide the API key, check if it is set in the module client
         api_key = api_key or openai.api_key
@@ -77,6 +85,9 @@ class OpenAIDocumentEmbedder:
         self.progress_bar = progress_bar
         self.metadata_fields_to_embed = metadata_fields_to_embed or []
         self.embedding_separator = embedding_separator
+        self.max_concurrent_requests = max_concurrent_requests
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
 
         openai.api_key = api_key
         if organization is not None:
@@ -103,6 +114,9 @@ class OpenAIDocumentEmbedder:
             progress_bar=self.progress_bar,
             metadata_fields_to_embed=self.metadata_fields_to_embed,
             embedding_separator=self.embedding_separator,
+            max_concurrent_requests=self.max_concurrent_requests,
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
         )
 
     def _prepare_texts_to_embed(self, documents: List[Document]) -> List[str]:
@@ -129,16 +143,27 @@ class OpenAIDocumentEmbedder:
 
     def _embed_batch(self, texts_to_embed: List[str], batch_size: int) -> Tuple[List[List[float]], Dict[str, Any]]:
         """
-        Embed a list of texts in batches.
+        Embed a list of texts in batches. The batches are sent concurrently, within the configured rate limits.
         """
+        batches = [texts_to_embed[i : i + batch_size] for i in range(0, len(texts_to_embed), batch_size)]
+        runner = _OpenAIRequestRunnerFactory.get_request_runner(
+            max_concurrent_requests=self.max_concurrent_requests,
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
+        )
+        with tqdm(total=len(batches), disable=not self.progress_bar, desc="Calculating embeddings") as progress_bar:
+            responses = runner.run(
+                requests=[
+                    lambda batch=batch: openai.Embedding.acreate(model=self.model_name, input=batch)
+                    for batch in batches
+                ],
+                tokens=[sum(estimate_tokens(text) for text in batch) for batch in batches],
+                callback=lambda index, response: progress_bar.update(),
+            )
 
         all_embeddings = []
-        metadata = {}
-        for i in tqdm(
-            range(0, len(texts_to_embed), batch_size), disable=not self.progress_bar, desc="Calculating embeddings"
-        ):
-            batch = texts_to_embed[i : i + batch_size]
-            response = openai.Embedding.create(model=self.model_name, input=batch)
+        metadata: Dict[str, Any] = {}
+        for response in responses:
             embeddings = [el["embedding"] for el in response.data]
             all_embeddings.extend(embeddings)
 
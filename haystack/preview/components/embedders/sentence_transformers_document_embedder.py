@@ -4,6 +4,7 @@ from haystack.preview import component, Document, default_to_dict
 from haystack.preview.components.embedders.backends.sentence_transformers_backend import (
     _SentenceTransformersEmbeddingBackendFactory,
 )
+from haystack.preview.utils import validate_inference_precision
 
 
 @component
@@ -39,6 +40,7 @@ class SentenceTransformersDocumentEmbedder:
         normalize_embeddings: bool = False,
         metadata_fields_to_embed: Optional[List[str]] = None,
         embedding_separator: str = "\n",
+        inference_precision: str = "fp32",
     ):
         """
         Create a SentenceTransformersDocumentEmbedder component.
@@ -59,7 +61,11 @@ class SentenceTransformersDocumentEmbedder:
         :param normalize_embeddings: If set to true, returned vectors will have length 1.
         :param metadata_fields_to_embed: List of meta fields that should be embedded along with the Document content.
         :param embedding_separator: Separator used to concatenate the meta fields to the Document content.
+        :param inference_precision: The precision to run the model in. Use `"fp32"` (default) for full precision,
+            `"bf16"` to run it with bfloat16 autocast, or `"dynamic-int8"` to quantize its linear layers to int8
+            (CPU only). Reduced precision trades a little accuracy for faster inference on CPUs.
         """
+        validate_inference_precision(inference_precision)
 
         self.model_name_or_path = model_name_or_path
         # TODO: remove device parameter and use Haystack's device management once migrated
@@ -72,6 +78,7 @@ class SentenceTransformersDocumentEmbedder:
         self.normalize_embeddings = normalize_embeddings
         self.metadata_fields_to_embed = metadata_fields_to_embed or []
         self.embedding_separator = embedding_separator
+        self.inference_precision = inference_precision
 
     def _get_telemetry_data(self) -> Dict[str, Any]:
         """
@@ -95,6 +102,7 @@ class SentenceTransformersDocumentEmbedder:
             normalize_embeddings=self.normalize_embeddings,
             metadata_fields_to_embed=self.metadata_fields_to_embed,
             embedding_separator=self.embedding_separator,
+            inference_precision=self.inference_precision,
         )
 
     def warm_up(self):
@@ -103,7 +111,10 @@ class SentenceTransformersDocumentEmbedder:
         """
         if not hasattr(self, "embedding_backend"):
             self.embedding_backend = _SentenceTransformersEmbeddingBackendFactory.get_embedding_backend(
-                model_name_or_path=self.model_name_or_path, device=self.device, use_auth_token=self.token
+                model_name_or_path=self.model_name_or_path,
+                device=self.device,
+                use_auth_token=self.token,
+                inference_precision=self.inference_precision,
             )
 
     @component.output_types(documents=List[Document])
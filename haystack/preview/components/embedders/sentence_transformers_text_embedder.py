@@ -4,6 +4,7 @@ from haystack.preview import component, default_to_dict
 from haystack.preview.components.embedders.backends.sentence_transformers_backend import (
     _SentenceTransformersEmbeddingBackendFactory,
 )
+from haystack.preview.utils import validate_inference_precision
 
 
 @component
@@ -36,6 +37,8 @@ class SentenceTransformersTextEmbedder:
         batch_size: int = 32,
         progress_bar: bool = True,
         normalize_embeddings: bool = False,
+        batching_latency: Optional[float] = None,
+        inference_precision: str = "fp32",
     ):
         """
         Create a SentenceTransformersTextEmbedder component.
@@ -54,7 +57,15 @@ class SentenceTransformersTextEmbedder:
         :param batch_size: Number of strings to encode at once.
         :param progress_bar: If true, displays progress bar during embedding.
         :param normalize_embeddings: If set to true, returned vectors will have length 1.
+        :param batching_latency: If set, calls to `run` from concurrent threads, for example in a multi-threaded API
+            server, are merged into one call to the model. Each call waits up to this many seconds for others to join
+            it, or less if `batch_size` strings are waiting. All embedders with the same model share the batches.
+            Defaults to `None`, which embeds each string right away.
+        :param inference_precision: The precision to run the model in. Use `"fp32"` (default) for full precision,
+            `"bf16"` to run it with bfloat16 autocast, or `"dynamic-int8"` to quantize its linear layers to int8
+            (CPU only). Reduced precision trades a little accuracy for faster inference on CPUs.
         """
+        validate_inference_precision(inference_precision)
 
         self.model_name_or_path = model_name_or_path
         # TODO: remove device parameter and use Haystack's device management once migrated
@@ -65,6 +76,8 @@ class SentenceTransformersTextEmbedder:
         self.batch_size = batch_size
         self.progress_bar = progress_bar
         self.normalize_embeddings = normalize_embeddings
+        self.batching_latency = batching_latency
+        self.inference_precision = inference_precision
 
     def _get_telemetry_data(self) -> Dict[str, Any]:
         """
@@ -86,6 +99,8 @@ class SentenceTransformersTextEmbedder:
             batch_size=self.batch_size,
             progress_bar=self.progress_bar,
             normalize_embeddings=self.normalize_embeddings,
+            batching_latency=self.batching_latency,
+            inference_precision=self.inference_precision,
         )
 
     def warm_up(self):
@@ -94,7 +109,10 @@ class SentenceTransformersTextEmbedder:
         """
         if not hasattr(self, "embedding_backend"):
             self.embedding_backend = _SentenceTransformersEmbeddingBackendFactory.get_embedding_backend(
-                model_name_or_path=self.model_name_or_path, device=self.device, use_auth_token=self.token
+                model_name_or_path=self.model_name_or_path,
+                device=self.device,
+                use_auth_token=self.token,
+                inference_precision=self.inference_precision,
             )
 
     @component.output_types(embedding=List[float])
@@ -109,10 +127,34 @@ class SentenceTransformersTextEmbedder:
             raise RuntimeError("The embedding model has not been loaded. Please call warm_up() before running.")
 
         text_to_embed = self.prefix + text + self.suffix
-        embedding = self.embedding_backend.embed(
-            [text_to_embed],
+        encode_kwargs = {
+            "batch_size": self.batch_size,
+            "show_progress_bar": self.progress_bar,
+            "normalize_embeddings": self.normalize_embeddings,
+        }
+        if self.batching_latency is None:
+            embedding = self.embedding_backend.embed([text_to_embed], **encode_kwargs)[0]
+        else:
+            embedding = self.embedding_backend.embed_batched(
+                [text_to_embed], max_latency=self.batching_latency, max_batch_size=self.batch_size, **encode_kwargs
+            )[0]
+        return {"embedding": embedding}
+
+    def run_batch(self, text: List[str]):
+        """Embed a batch of strings with a single call to the embedding model."""
+        if not isinstance(text, list) or any(not isinstance(text_, str) for text_ in text):
+            raise TypeError(
+                "SentenceTransformersTextEmbedder expects a list of strings as input for run_batch()."
+                "In case you want to embed a list of Documents, please use the SentenceTransformersDocumentEmbedder."
+            )
+        if not hasattr(self, "embedding_backend"):
+            raise RuntimeError("The embedding model has not been loaded. Please call warm_up() before running.")
+
+        texts_to_embed = [self.prefix + text_ + self.suffix for text_ in text]
+        embeddings = self.embedding_backend.embed(
+            texts_to_embed,
             batch_size=self.batch_size,
             show_progress_bar=self.progress_bar,
             normalize_embeddings=self.normalize_embeddings,
-        )[0]
-        return {"embedding": embedding}
+        )
+        return {"embedding": embeddings}
@@ -1,10 +1,11 @@
 import logging
-from typing import List, Union
+from typing import Iterable, Iterator, List, Union
 from pathlib import Path
 
 from haystack.preview import Document, component
 from haystack.preview.dataclasses import ByteStream
 from haystack.preview.lazy_imports import LazyImport
+from haystack.preview.utils.parallel import isolated_map
 
 logger = logging.getLogger(__name__)
 
@@ -18,11 +19,15 @@ class HTMLToDocument:
     Converts an HTML file to a Document.
     """
 
-    def __init__(self):
+    def __init__(self, num_workers: int = 1):
         """
         Initializes the HTMLToDocument component.
+
+        :param num_workers: The number of processes to convert the files with. Defaults to 1, which converts the files
+            in the current process.
         """
         boilerpy3_import.check()
+        self.num_workers = num_workers
 
     @component.output_types(documents=List[Document])
     def run(self, sources: List[Union[str, Path, ByteStream]]):
@@ -32,35 +37,44 @@ class HTMLToDocument:
         :param sources: Paths to HTML files.
         :return: List of converted Documents.
         """
-        documents = []
-        extractor = extractors.ArticleExtractor(raise_on_failure=False)
-        for source in sources:
-            try:
-                file_content = self._extract_content(source)
-            except Exception as e:
-                logger.warning("Could not read %s. Skipping it. Error: %s", source, e)
-                continue
-            try:
-                text = extractor.get_content(file_content)
-            except Exception as conversion_e:  # Consider specifying the expected exception type(s) here
-                logger.warning("Failed to extract text from %s. Skipping it. Error: %s", source, conversion_e)
+        return {"documents": list(self.run_iter(sources=sources))}
+
+    def run_iter(self, sources: Iterable[Union[str, Path, ByteStream]]) -> Iterator[Document]:
+        """
+        Converts HTML files to Documents lazily, yielding each Document as soon as it's ready and in the order of the
+        sources. Use this instead of `run` to convert more files than fit into memory at once.
+
+        :param sources: Paths to HTML files.
+        :return: An iterator of the converted Documents.
+        """
+        for source, text, error in isolated_map(_convert_html, sources, num_workers=self.num_workers, chunk_size=32):
+            if error is not None:
+                logger.warning("Could not read %s. Skipping it. Error: %s", source, error)
                 continue
+            yield Document(content=text)
 
-            document = Document(content=text)
-            documents.append(document)
 
-        return {"documents": documents}
+def _convert_html(source: Union[str, Path, ByteStream]) -> str:
+    """
+    Extracts the text from an HTML data source.
 
-    def _extract_content(self, source: Union[str, Path, ByteStream]) -> str:
-        """
-        Extracts content from the given data source
-        :param source: The data source to extract content from.
-        :return: The extracted content.
-        """
-        if isinstance(source, (str, Path)):
-            with open(source) as text_file:
-                return text_file.read()
-        if isinstance(source, ByteStream):
-            return source.data.decode("utf-8")
+    :param source: The data source to extract the text from.
+    :return: The extracted text.
+    """
+    extractor = extractors.ArticleExtractor(raise_on_failure=False)
+    return extractor.get_content(_extract_content(source))
+
+
+def _extract_content(source: Union[str, Path, ByteStream]) -> str:
+    """
+    Extracts content from the given data source
+    :param source: The data source to extract content from.
+    :return: The extracted content.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source) as text_file:
+            return text_file.read()
+    if isinstance(source, ByteStream):
+        return source.data.decode("utf-8")
 
-        raise ValueError(f"Unsupported source type: {type(source)}")
+    raise ValueError(f"Unsupported source type: {type(source)}")
@@ -1,12 +1,15 @@
+import itertools
 import logging
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sized, Union
 
 from tqdm import tqdm
 
 from haystack.preview import Document, component
 from haystack.preview.dataclasses import ByteStream
 from haystack.preview.lazy_imports import LazyImport
+from haystack.preview.utils.parallel import isolated_map
 
 with LazyImport("Run 'pip install markdown-it-py mdit_plain'") as markdown_conversion_imports:
     from markdown_it import MarkdownIt
@@ -33,15 +36,18 @@ class MarkdownToDocument:
     ```
     """
 
-    def __init__(self, table_to_single_line: bool = False, progress_bar: bool = True):
+    def __init__(self, table_to_single_line: bool = False, progress_bar: bool = True, num_workers: int = 1):
         """
         :param table_to_single_line: Convert contents of the table into a single line. Defaults to False.
         :param progress_bar: Show a progress bar for the conversion. Defaults to True.
+        :param num_workers: The number of processes to convert the files with. Defaults to 1, which converts the files
+            in the current process.
         """
         markdown_conversion_imports.check()
 
         self.table_to_single_line = table_to_single_line
         self.progress_bar = progress_bar
+        self.num_workers = num_workers
 
     @component.output_types(documents=List[Document])
     def run(self, sources: List[Union[str, Path, ByteStream]], meta: Optional[List[Dict[str, Any]]] = None):
@@ -52,46 +58,70 @@ class MarkdownToDocument:
         :param meta: Optional list of metadata to attach to the Documents.
         The length of the list must match the number of paths. Defaults to `None`.
         """
-        parser = MarkdownIt(renderer_cls=RendererPlain)
-        if self.table_to_single_line:
-            parser.enable("table")
+        return {"documents": list(self.run_iter(sources=sources, meta=meta))}
 
-        documents = []
-        if meta is None:
-            meta = [{}] * len(sources)
+    def run_iter(
+        self, sources: Iterable[Union[str, Path, ByteStream]], meta: Optional[Iterable[Dict[str, Any]]] = None
+    ) -> Iterator[Document]:
+        """
+        Converts markdown data sources to Documents lazily, yielding each Document as soon as it's ready and in the
+        order of the sources. Use this instead of `run` to convert more files than fit into memory at once.
 
-        for source, metadata in tqdm(
-            zip(sources, meta),
-            total=len(sources),
+        :param sources: Markdown data sources (file paths or binary objects).
+        :param meta: Optional metadata to attach to the Documents, one entry per source. Defaults to `None`.
+        :return: An iterator of the converted Documents.
+        """
+        metas = meta if meta is not None else itertools.repeat(None)
+        results = isolated_map(
+            partial(_convert_markdown, table_to_single_line=self.table_to_single_line),
+            sources,
+            num_workers=self.num_workers,
+            chunk_size=32,
+        )
+        for (source, text, error), metadata in tqdm(
+            zip(results, metas),
+            total=len(sources) if isinstance(sources, Sized) else None,
             desc="Converting markdown files to Documents",
             disable=not self.progress_bar,
         ):
-            try:
-                file_content = self._extract_content(source)
-            except Exception as e:
-                logger.warning("Could not read %s. Skipping it. Error: %s", source, e)
-                continue
-            try:
-                text = parser.render(file_content)
-            except Exception as conversion_e:  # Consider specifying the expected exception type(s) here
-                logger.warning("Failed to extract text from %s. Skipping it. Error: %s", source, conversion_e)
+            if error is not None:
+                logger.warning("Could not read %s. Skipping it. Error: %s", source, error)
                 continue
+            yield Document(content=text, meta=metadata or {})
+
 
-            document = Document(content=text, meta=metadata)
-            documents.append(document)
+@lru_cache(maxsize=2)
+def _get_parser(table_to_single_line: bool) -> "MarkdownIt":
+    """
+    Creates the markdown parser once per process.
+    """
+    parser = MarkdownIt(renderer_cls=RendererPlain)
+    if table_to_single_line:
+        parser.enable("table")
+    return parser
 
-        return {"documents": documents}
 
-    def _extract_content(self, source: Union[str, Path, ByteStream]) -> str:
-        """
-        Extracts content from the given data source.
-        :param source: The data source to extract content from.
-        :return: The extracted content.
-        """
-        if isinstance(source, (str, Path)):
-            with open(source) as text_file:
-                return text_file.read()
-        if isinstance(source, ByteStream):
-            return source.data.decode("utf-8")
+def _convert_markdown(source: Union[str, Path, ByteStream], table_to_single_line: bool) -> str:
+    """
+    Renders a markdown data source as plain text.
+
+    :param source: The data source to convert.
+    :param table_to_single_line: Convert contents of the table into a single line.
+    :return: The plain text.
+    """
+    return _get_parser(table_to_single_line).render(_extract_content(source))
+
+
+def _extract_content(source: Union[str, Path, ByteStream]) -> str:
+    """
+    Extracts content from the given data source.
+    :param source: The data source to extract content from.
+    :return: The extracted content.
+    """
+    if isinstance(source, (str, Path)):
+        with open(source) as text_file:
+            return text_file.read()
+    if isinstance(source, ByteStream):
+        return source.data.decode("utf-8")
 
-        raise ValueError(f"Unsupported source type: {type(source)}")
+    raise ValueError(f"Unsupported source type: {type(source)}")
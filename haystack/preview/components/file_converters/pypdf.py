@@ -1,11 +1,13 @@
 import io
 import logging
-from typing import List, Union, Optional, Protocol
+from functools import partial
+from typing import Iterable, Iterator, List, Union, Optional, Protocol
 from pathlib import Path
 
 from haystack.preview.dataclasses import ByteStream
 from haystack.preview.lazy_imports import LazyImport
 from haystack.preview import Document, component
+from haystack.preview.utils.parallel import isolated_map
 
 with LazyImport("Run 'pip install pypdf'") as pypdf_import:
     from pypdf import PdfReader
@@ -30,7 +32,8 @@ class DefaultConverter:
 
     def convert(self, reader: PdfReader) -> Document:
         """Extract text from the PDF and return a Document object with the text content."""
-        text = "".join(page.extract_text() for page in reader.pages if page.extract_text())
+        texts = (page.extract_text() for page in reader.pages)
+        text = "".join(text for text in texts if text)
         return Document(content=text)
 
 
@@ -42,14 +45,17 @@ class PyPDFToDocument:
     A default text extraction converter is used if no custom converter is provided.
     """
 
-    def __init__(self, converter: Optional[PyPDFConverter] = None):
+    def __init__(self, converter: Optional[PyPDFConverter] = None, num_workers: int = 1):
         """
         Initializes the PyPDFToDocument component with an optional custom converter.
         :param converter: A converter instance that adheres to the PyPDFConverter protocol.
                           If None, the DefaultConverter is used.
+        :param num_workers: The number of processes to convert the files with. Defaults to 1, which converts the files
+                            in the current process. With more workers, the converter must be picklable.
         """
         pypdf_import.check()
         self.converter: PyPDFConverter = converter or DefaultConverter()
+        self.num_workers = num_workers
 
     @component.output_types(documents=List[Document])
     def run(self, sources: List[Union[str, Path, ByteStream]]):
@@ -59,29 +65,46 @@ class PyPDFToDocument:
         :param sources: A list of PDF data sources, which can be file paths or ByteStream objects.
         :return: A dictionary containing a list of Document objects under the 'documents' key.
         """
-        documents = []
-        for source in sources:
-            try:
-                pdf_reader = self._get_pdf_reader(source)
-                document = self.converter.convert(pdf_reader)
-            except Exception as e:
-                logger.warning("Could not read %s and convert it to Document, skipping. %s", source, e)
-                continue
-            documents.append(document)
-
-        return {"documents": documents}
+        return {"documents": list(self.run_iter(sources=sources))}
 
-    def _get_pdf_reader(self, source: Union[str, Path, ByteStream]) -> PdfReader:
+    def run_iter(self, sources: Iterable[Union[str, Path, ByteStream]]) -> Iterator[Document]:
         """
-        Creates a PdfReader object from a given source, which can be a file path or a ByteStream object.
+        Converts PDF sources into Document objects lazily, yielding each Document as soon as it's ready and in the
+        order of the sources. Use this instead of `run` to convert more files than fit into memory at once.
 
-        :param source: The source of the PDF data.
-        :return: A PdfReader instance initialized with the PDF data from the source.
-        :raises ValueError: If the source type is not supported.
+        :param sources: PDF data sources, which can be file paths or ByteStream objects.
+        :return: An iterator of the converted Documents.
         """
-        if isinstance(source, (str, Path)):
-            return PdfReader(str(source))
-        elif isinstance(source, ByteStream):
-            return PdfReader(io.BytesIO(source.data))
-        else:
-            raise ValueError(f"Unsupported source type: {type(source)}")
+        convert = partial(_convert_pdf, converter=self.converter)
+        for source, document, error in isolated_map(convert, sources, num_workers=self.num_workers):
+            if error is not None:
+                logger.warning("Could not read %s and convert it to Document, skipping. %s", source, error)
+                continue
+            yield document
+
+
+def _convert_pdf(source: Union[str, Path, ByteStream], converter: PyPDFConverter) -> Document:
+    """
+    Converts a PDF source into a Document with the given converter.
+
+    :param source: The source of the PDF data.
+    :param converter: The converter to turn the PdfReader into a Document.
+    :return: The converted Document.
+    """
+    return converter.convert(_get_pdf_reader(source))
+
+
+def _get_pdf_reader(source: Union[str, Path, ByteStream]) -> "PdfReader":
+    """
+    Creates a PdfReader object from a given source, which can be a file path or a ByteStream object.
+
+    :param source: The source of the PDF data.
+    :return: A PdfReader instance initialized with the PDF data from the source.
+    :raises ValueError: If the source type is not supported.
+    """
+    if isinstance(source, (str, Path)):
+        return PdfReader(str(source))
+    elif isinstance(source, ByteStream):
+        return PdfReader(io.BytesIO(source.data))
+    else:
+        raise ValueError(f"Unsupported source type: {type(source)}")
@@ -1,9 +1,11 @@
 import logging
+from functools import partial
 from pathlib import Path
-from typing import List, Union
+from typing import Iterable, Iterator, List, Optional, Union
 
 from haystack.preview.lazy_imports import LazyImport
 from haystack.preview import component, Document
+from haystack.preview.utils.parallel import isolated_map
 
 
 with LazyImport("Run 'pip install tika'") as tika_import:
@@ -20,14 +22,16 @@ class TikaDocumentConverter:
     requires a running Tika server.
     """
 
-    def __init__(self, tika_url: str = "http://localhost:9998/tika"):
+    def __init__(self, tika_url: str = "http://localhost:9998/tika", num_workers: int = 1):
         """
         Create a TikaDocumentConverter component.
 
         :param tika_url: URL of the Tika server. Default: `"http://localhost:9998/tika"`
+        :param num_workers: The number of processes that send files to the Tika server at the same time. Default: `1`
         """
         tika_import.check()
         self.tika_url = tika_url
+        self.num_workers = num_workers
 
     @component.output_types(documents=List[Document])
     def run(self, paths: List[Union[str, Path]]):
@@ -36,19 +40,34 @@ class TikaDocumentConverter:
 
         :param paths: A list of paths to the files to convert.
         """
+        return {"documents": list(self.run_iter(paths=paths))}
 
-        documents = []
-        for path in paths:
-            path = Path(path)
-            try:
-                parsed_file = tika_parser.from_file(path.as_posix(), self.tika_url)
-                extracted_text = parsed_file["content"]
-                if not extracted_text:
-                    logger.warning("Skipping file at '%s' as Tika was not able to extract any content.", str(path))
-                    continue
-                document = Document(content=extracted_text)
-                documents.append(document)
-            except Exception as e:
-                logger.error("Could not convert file at '%s' to Document. Error: %s", str(path), e)
-
-        return {"documents": documents}
+    def run_iter(self, paths: Iterable[Union[str, Path]]) -> Iterator[Document]:
+        """
+        Convert files to Documents lazily, yielding each Document as soon as it's ready and in the order of the paths.
+        Use this instead of `run` to convert more files than fit into memory at once.
+
+        :param paths: Paths to the files to convert.
+        :return: An iterator of the converted Documents.
+        """
+        extract = partial(_extract_text, tika_url=self.tika_url)
+        for path, extracted_text, error in isolated_map(extract, paths, num_workers=self.num_workers):
+            if error is not None:
+                logger.error("Could not convert file at '%s' to Document. Error: %s", str(path), error)
+                continue
+            if not extracted_text:
+                logger.warning("Skipping file at '%s' as Tika was not able to extract any content.", str(path))
+                continue
+            yield Document(content=extracted_text)
+
+
+def _extract_text(path: Union[str, Path], tika_url: str) -> Optional[str]:
+    """
+    Sends a file to the Tika server and returns the text extracted from it.
+
+    :param path: The path to the file.
+    :param tika_url: URL of the Tika server.
+    :return: The extracted text, or `None` if Tika couldn't extract any.
+    """
+    parsed_file = tika_parser.from_file(Path(path).as_posix(), tika_url)
+    return parsed_file["content"]
@@ -1,12 +1,15 @@
+import itertools
 import logging
+from functools import partial
 from pathlib import Path
-from typing import Optional, List, Union, Dict
+from typing import Optional, List, Union, Dict, Iterable, Iterator, Sized, Tuple
 
 from canals.errors import PipelineRuntimeError
 from tqdm import tqdm
 
 from haystack.preview.lazy_imports import LazyImport
 from haystack.preview import Document, component
+from haystack.preview.utils.parallel import isolated_map
 
 with LazyImport("Run 'pip install langdetect'") as langdetect_import:
     import langdetect
@@ -28,6 +31,7 @@ class TextFileToDocument:
         numeric_row_threshold: float = 0.4,
         valid_languages: Optional[List[str]] = None,
         progress_bar: bool = True,
+        num_workers: int = 1,
     ):
         """
         Create a TextFileToDocument component.
@@ -45,6 +49,8 @@ class TextFileToDocument:
             encoding errors. If the extracted text is not one of the valid languages, then there might be an encoding
             error resulting in garbled text. Default: `None`
         :param progress_bar: Whether to show a progress bar for the conversion process. Default: `True`
+        :param num_workers: The number of processes to convert the files with. `1` converts the files in the current
+            process. Default: `1`
         """
         langdetect_import.check()
 
@@ -53,6 +59,7 @@ class TextFileToDocument:
         self.numeric_row_threshold = numeric_row_threshold
         self.valid_languages = valid_languages or []
         self.progress_bar = progress_bar
+        self.num_workers = num_workers
 
     @component.output_types(documents=List[Document])
     def run(
@@ -85,6 +92,36 @@ class TextFileToDocument:
             error resulting in garbled text. Default: `None`
         :param progress_bar: Whether to show a progress bar for the conversion process. Default: `True`
         """
+        metas = TextFileToDocument._prepare_metadata(metadata, paths)
+        documents = self.run_iter(
+            paths=paths,
+            metadata=metas,
+            encoding=encoding,
+            remove_numeric_tables=remove_numeric_tables,
+            numeric_row_threshold=numeric_row_threshold,
+            valid_languages=valid_languages,
+            progress_bar=progress_bar,
+        )
+        return {"documents": list(documents)}
+
+    def run_iter(
+        self,
+        paths: Iterable[Union[str, Path]],
+        metadata: Optional[Union[Dict, Iterable[Dict]]] = None,
+        encoding: Optional[str] = None,
+        remove_numeric_tables: Optional[bool] = None,
+        numeric_row_threshold: Optional[float] = None,
+        valid_languages: Optional[List[str]] = None,
+        progress_bar: Optional[bool] = None,
+    ) -> Iterator[Document]:
+        """
+        Convert text files to Documents lazily, yielding each Document as soon as it's ready and in the order of the
+        paths. Use this instead of `run` to convert more files than fit into memory at once.
+
+        Takes the same parameters as `run`. If `metadata` is an iterable, it must yield one entry per path.
+
+        :return: An iterator of the converted Documents.
+        """
         if encoding is None:
             encoding = self.encoding
         if remove_numeric_tables is None:
@@ -96,21 +133,28 @@ class TextFileToDocument:
         if progress_bar is None:
             progress_bar = self.progress_bar
 
-        metas = TextFileToDocument._prepare_metadata(metadata, paths)
-
-        documents = []
-        for path, meta in tqdm(
-            zip(paths, metas), total=len(paths), desc="Converting text files", disable=not progress_bar
+        metas = itertools.repeat(metadata or {}) if metadata is None or isinstance(metadata, dict) else metadata
+        convert = partial(
+            _convert_text_file,
+            encoding=encoding,
+            remove_numeric_tables=remove_numeric_tables,
+            numeric_row_threshold=numeric_row_threshold,
+            valid_languages=valid_languages,
+        )
+        results = isolated_map(convert, paths, num_workers=self.num_workers, chunk_size=32)
+
+        for (path, result, error), meta in tqdm(
+            zip(results, metas),
+            total=len(paths) if isinstance(paths, Sized) else None,
+            desc="Converting text files",
+            disable=not progress_bar,
         ):
-            try:
-                text = self._read_and_clean_file(
-                    path=path, encoding=encoding, remove_numeric_tables=remove_numeric_tables
-                )
-            except Exception as e:
-                logger.warning("Could not read file %s. Skipping it. Error message: %s", path, e)
+            if error is not None:
+                logger.warning("Could not read file %s. Skipping it. Error message: %s", path, error)
                 continue
 
-            if valid_languages is not None and not TextFileToDocument._validate_language(text, valid_languages):
+            text, is_valid_language = result
+            if not is_valid_language:
                 logger.warning(
                     "Text from file %s is not in one of the valid languages: %s. "
                     "The file may have been decoded incorrectly.",
@@ -118,10 +162,7 @@ class TextFileToDocument:
                     valid_languages,
                 )
 
-            document = Document(content=text, meta=meta)
-            documents.append(document)
-
-        return {"documents": documents}
+            yield Document(content=text, meta={**meta, "file_path": meta.get("file_path", str(path))})
 
     @staticmethod
     def _prepare_metadata(metadata: Optional[Union[Dict, List[Dict]]], paths: List[Union[str, Path]]) -> List[Dict]:
@@ -155,14 +196,7 @@ class TextFileToDocument:
 
         :return: The text of the file cleaned from numeric tables if `remove_numeric_tables` is `True`.
         """
-        if not Path(path).exists():
-            raise PipelineRuntimeError(f"File at path {path} does not exist.")
-
-        with open(path, encoding=encoding) as file:
-            text = file.read()
-            pages = text.split("\f")
-            cleaned_pages = [self._clean_page(page, remove_numeric_tables) for page in pages]
-            return "\f".join(cleaned_pages)
+        return _read_and_clean_file(path, encoding, remove_numeric_tables, self.numeric_row_threshold)
 
     def _clean_page(self, page: str, remove_numeric_tables: bool) -> str:
         """
@@ -173,11 +207,7 @@ class TextFileToDocument:
 
         :return: The text from the page cleaned from numeric tables if `remove_numeric_tables` is `True`.
         """
-        cleaned_lines = page.splitlines()
-        if remove_numeric_tables:
-            cleaned_lines = [line for line in cleaned_lines if not self._is_numeric_row(line)]
-
-        return "\n".join(cleaned_lines)
+        return _clean_page(page, remove_numeric_tables, self.numeric_row_threshold)
 
     def _is_numeric_row(self, line: str) -> bool:
         """
@@ -186,9 +216,7 @@ class TextFileToDocument:
 
         :param line: The content of a line of a text file.
         """
-        words = line.split()
-        digits = [word for word in words if any(char.isdigit() for char in word)]
-        return len(digits) / len(words) > self.numeric_row_threshold and not line.strip().endswith(".")
+        return _is_numeric_row(line, self.numeric_row_threshold)
 
     @staticmethod
     def _validate_language(text: str, valid_languages: List[str]) -> bool:
@@ -207,3 +235,55 @@ class TextFileToDocument:
             lang = None
 
         return lang in valid_languages
+
+
+def _convert_text_file(
+    path: Union[str, Path],
+    encoding: str,
+    remove_numeric_tables: bool,
+    numeric_row_threshold: float,
+    valid_languages: List[str],
+) -> Tuple[str, bool]:
+    """
+    Read and clean a text file and check its language. This is a module-level function, so that it can run in a
+    separate process.
+
+    :return: The cleaned text of the file and whether it's in one of the valid languages.
+    """
+    text = _read_and_clean_file(path, encoding, remove_numeric_tables, numeric_row_threshold)
+    return text, TextFileToDocument._validate_language(text, valid_languages)
+
+
+def _read_and_clean_file(
+    path: Union[str, Path], encoding: str, remove_numeric_tables: bool, numeric_row_threshold: float
+) -> str:
+    """
+    Read the text file and clean each of its pages from numeric tables if `remove_numeric_tables` is `True`.
+    """
+    if not Path(path).exists():
+        raise PipelineRuntimeError(f"File at path {path} does not exist.")
+
+    with open(path, encoding=encoding) as file:
+        pages = file.read().split("\f")
+    return "\f".join(_clean_page(page, remove_numeric_tables, numeric_row_threshold) for page in pages)
+
+
+def _clean_page(page: str, remove_numeric_tables: bool, numeric_row_threshold: float) -> str:
+    """
+    Clean a page of text from numeric tables if `remove_numeric_tables` is `True`.
+    """
+    cleaned_lines = page.splitlines()
+    if remove_numeric_tables:
+        cleaned_lines = [line for line in cleaned_lines if not _is_numeric_row(line, numeric_row_threshold)]
+
+    return "\n".join(cleaned_lines)
+
+
+def _is_numeric_row(line: str, numeric_row_threshold: float) -> bool:
+    """
+    Check if a line is a numeric row, that is, if the ratio of words containing digits is above
+    `numeric_row_threshold` and the line doesn't end with a period.
+    """
+    words = line.split()
+    digits = [word for word in words if any(char.isdigit() for char in word)]
+    return len(digits) / len(words) > numeric_row_threshold and not line.strip().endswith(".")
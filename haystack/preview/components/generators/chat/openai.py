@@ -9,6 +9,7 @@ from openai.openai_object import OpenAIObject
 from haystack.preview import component, default_from_dict, default_to_dict
 from haystack.preview.components.generators.utils import serialize_callback_handler, deserialize_callback_handler
 from haystack.preview.dataclasses import StreamingChunk, ChatMessage
+from haystack.preview.utils.openai_requests import _OpenAIRequestRunnerFactory, estimate_chat_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -65,6 +66,9 @@ class GPTChatGenerator:
         model_name: str = "gpt-3.5-turbo",
         streaming_callback: Optional[Callable[[StreamingChunk], None]] = None,
         api_base_url: str = API_BASE_URL,
+        max_concurrent_requests: int = 4,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
         **generation_kwargs,
     ):
         """
@@ -77,6 +81,10 @@ class GPTChatGenerator:
         :param streaming_callback: A callback function that is called when a new token is received from the stream.
             The callback function accepts StreamingChunk as an argument.
         :param api_base_url: The OpenAI API Base url, defaults to `https://api.openai.com/v1`.
+        :param max_concurrent_requests: The maximum number of requests sent to OpenAI at the same time by `run_batch`.
+        :param requests_per_minute: The maximum number of requests `run_batch` sends per minute, to stay within the rate
+            limits of your OpenAI account. `None` means no limit. Requests that are rate limited anyway are retried.
+        :param tokens_per_minute: The maximum number of tokens `run_batch` sends per minute. `None` means no limit.
         :param generation_kwargs: Other parameters to use for the model. These parameters are all sent directly to
             the OpenAI endpoint. See OpenAI [documentation](https://platform.openai.com/docs/api-reference/chat) for
             more details.
@@ -112,6 +120,9 @@ class GPTChatGenerator:
         self.model_name = model_name
         self.generation_kwargs = generation_kwargs
         self.streaming_callback = streaming_callback
+        self.max_concurrent_requests = max_concurrent_requests
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
 
         self.api_base_url = api_base_url
         openai.api_base = api_base_url
@@ -133,6 +144,9 @@ class GPTChatGenerator:
             model_name=self.model_name,
             streaming_callback=callback_name,
             api_base_url=self.api_base_url,
+            max_concurrent_requests=self.max_concurrent_requests,
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
             **self.generation_kwargs,
         )
 
@@ -197,6 +211,50 @@ class GPTChatGenerator:
 
         return {"replies": completions}
 
+    def run_batch(self, messages: List[List[ChatMessage]], generation_kwargs: Optional[Dict[str, Any]] = None):
+        """
+        Generate responses for a batch of conversations. The conversations are sent to OpenAI concurrently, within the
+        rate limits set in the __init__ method, and rate limited requests are retried. With a `streaming_callback`,
+        the conversations are generated one after the other instead, so that the chunks of different responses are
+        not mixed up.
+
+        :param messages: The list of ChatMessage instances of each conversation.
+        :param generation_kwargs: Additional keyword arguments for text generation, used for all the conversations.
+        :return: The list of generated responses as ChatMessage instances for each conversation.
+        """
+        if self.streaming_callback:
+            return {
+                "replies": [
+                    self.run(messages=messages_, generation_kwargs=generation_kwargs)["replies"]
+                    for messages_ in messages
+                ]
+            }
+
+        generation_kwargs = {**self.generation_kwargs, **(generation_kwargs or {})}
+        openai_formatted_messages = [self._convert_to_openai_format(messages_) for messages_ in messages]
+        runner = _OpenAIRequestRunnerFactory.get_request_runner(
+            max_concurrent_requests=self.max_concurrent_requests,
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
+        )
+        responses = runner.run(
+            requests=[
+                lambda messages_=messages_: openai.ChatCompletion.acreate(
+                    model=self.model_name, messages=messages_, **generation_kwargs
+                )
+                for messages_ in openai_formatted_messages
+            ],
+            tokens=[estimate_chat_tokens(messages_, generation_kwargs) for messages_ in openai_formatted_messages],
+        )
+
+        replies: List[List[ChatMessage]] = []
+        for completion in responses:
+            completions = [self._build_message(completion, choice) for choice in completion.choices]
+            for message in completions:
+                self._check_finish_reason(message)
+            replies.append(completions)
+        return {"replies": replies}
+
     def _convert_to_openai_format(self, messages: List[ChatMessage]) -> List[Dict[str, Any]]:
         """
         Converts the list of ChatMessage to the list of messages in the format expected by the OpenAI API.
@@ -4,6 +4,7 @@ from copy import deepcopy
 
 from haystack.preview import component, default_to_dict
 from haystack.preview.lazy_imports import LazyImport
+from haystack.preview.utils import ModelKey, model_registry
 
 logger = logging.getLogger(__name__)
 
@@ -180,7 +181,19 @@ class HuggingFaceLocalGenerator:
 
     def warm_up(self):
         if self.pipeline is None:
-            self.pipeline = pipeline(**self.pipeline_kwargs)
+            if isinstance(self.pipeline_kwargs["model"], str):
+                # Generators with the same model and pipeline settings share the pipeline, so it's loaded only once
+                # per process
+                pipeline_kwargs = dict(self.pipeline_kwargs)
+                model = pipeline_kwargs.pop("model")
+                device = pipeline_kwargs.pop("device", None) or pipeline_kwargs.pop("device_map", None)
+                self.pipeline = model_registry.acquire(
+                    owner=self,
+                    key=ModelKey.from_kwargs("pipeline", model, device=device, **pipeline_kwargs),
+                    loader=lambda: pipeline(**self.pipeline_kwargs),
+                )
+            else:
+                self.pipeline = pipeline(**self.pipeline_kwargs)
 
         if self.stop_words and self.stopping_criteria_list is None:
             stop_words_criteria = StopWordsCriteria(
@@ -9,6 +9,7 @@ from openai.openai_object import OpenAIObject
 from haystack.preview import component, default_from_dict, default_to_dict
 from haystack.preview.components.generators.utils import serialize_callback_handler, deserialize_callback_handler
 from haystack.preview.dataclasses import StreamingChunk, ChatMessage
+from haystack.preview.utils.openai_requests import _OpenAIRequestRunnerFactory, estimate_chat_tokens
 
 logger = logging.getLogger(__name__)
 
@@ -58,6 +59,9 @@ class GPTGenerator:
         streaming_callback: Optional[Callable[[StreamingChunk], None]] = None,
         api_base_url: str = API_BASE_URL,
         system_prompt: Optional[str] = None,
+        max_concurrent_requests: int = 4,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
         **generation_kwargs,
     ):
         """
@@ -72,6 +76,10 @@ class GPTGenerator:
         :param api_base_url: The OpenAI API Base url, defaults to `https://api.openai.com/v1`.
         :param system_prompt: The system prompt to use for text generation. If not provided, the system prompt is
         omitted, and the default system prompt of the model is used.
+        :param max_concurrent_requests: The maximum number of requests sent to OpenAI at the same time by `run_batch`.
+        :param requests_per_minute: The maximum number of requests `run_batch` sends per minute, to stay within the rate
+            limits of your OpenAI account. `None` means no limit. Requests that are rate limited anyway are retried.
+        :param tokens_per_minute: The maximum number of tokens `run_batch` sends per minute. `None` means no limit.
         :param generation_kwargs: Other parameters to use for the model. These parameters are all sent directly to
             the OpenAI endpoint. See OpenAI [documentation](https://platform.openai.com/docs/api-reference/chat) for
             more details.
@@ -108,6 +116,9 @@ class GPTGenerator:
         self.generation_kwargs = generation_kwargs
         self.system_prompt = system_prompt
         self.streaming_callback = streaming_callback
+        self.max_concurrent_requests = max_concurrent_requests
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
 
         self.api_base_url = api_base_url
         openai.api_base = api_base_url
@@ -129,6 +140,9 @@ class GPTGenerator:
             model_name=self.model_name,
             streaming_callback=callback_name,
             api_base_url=self.api_base_url,
+            max_concurrent_requests=self.max_concurrent_requests,
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
             **self.generation_kwargs,
             system_prompt=self.system_prompt,
         )
@@ -159,17 +173,11 @@ class GPTGenerator:
         :return: A list of strings containing the generated responses and a list of dictionaries containing the metadata
         for each response.
         """
-        message = ChatMessage.from_user(prompt)
-        if self.system_prompt:
-            messages = [ChatMessage.from_system(self.system_prompt), message]
-        else:
-            messages = [message]
-
         # update generation kwargs by merging with the generation kwargs passed to the run method
         generation_kwargs = {**self.generation_kwargs, **(generation_kwargs or {})}
 
         # adapt ChatMessage(s) to the format expected by the OpenAI API
-        openai_formatted_messages = self._convert_to_openai_format(messages)
+        openai_formatted_messages = self._convert_to_openai_format(self._prompt_to_messages(prompt))
 
         completion = openai.ChatCompletion.create(
             model=self.model_name,
@@ -203,6 +211,61 @@ class GPTGenerator:
             "metadata": [message.metadata for message in completions],
         }
 
+    def run_batch(self, prompt: List[str], generation_kwargs: Optional[Dict[str, Any]] = None):
+        """
+        Generate responses for a batch of prompts. The prompts are sent to OpenAI concurrently, within the rate limits
+        set in the __init__ method, and rate limited requests are retried. With a `streaming_callback`, the prompts are
+        generated one after the other instead, so that the chunks of different responses are not mixed up.
+
+        :param prompt: The string prompts to use for text generation.
+        :param generation_kwargs: Additional keyword arguments for text generation, used for all the prompts.
+        :return: The list of generated responses and the list of their metadata for each prompt.
+        """
+        if self.streaming_callback:
+            results = [self.run(prompt=prompt_, generation_kwargs=generation_kwargs) for prompt_ in prompt]
+            return {
+                "replies": [result["replies"] for result in results],
+                "metadata": [result["metadata"] for result in results],
+            }
+
+        generation_kwargs = {**self.generation_kwargs, **(generation_kwargs or {})}
+        openai_formatted_messages = [
+            self._convert_to_openai_format(self._prompt_to_messages(prompt_)) for prompt_ in prompt
+        ]
+        runner = _OpenAIRequestRunnerFactory.get_request_runner(
+            max_concurrent_requests=self.max_concurrent_requests,
+            requests_per_minute=self.requests_per_minute,
+            tokens_per_minute=self.tokens_per_minute,
+        )
+        responses = runner.run(
+            requests=[
+                lambda messages=messages: openai.ChatCompletion.acreate(
+                    model=self.model_name, messages=messages, **generation_kwargs
+                )
+                for messages in openai_formatted_messages
+            ],
+            tokens=[estimate_chat_tokens(messages, generation_kwargs) for messages in openai_formatted_messages],
+        )
+
+        replies: List[List[str]] = []
+        metadata: List[List[Dict[str, Any]]] = []
+        for completion in responses:
+            completions = [self._build_message(completion, choice) for choice in completion.choices]
+            for message in completions:
+                self._check_finish_reason(message)
+            replies.append([message.content for message in completions])
+            metadata.append([message.metadata for message in completions])
+        return {"replies": replies, "metadata": metadata}
+
+    def _prompt_to_messages(self, prompt: str) -> List[ChatMessage]:
+        """
+        Builds the messages to send for a prompt, starting with the system prompt if there is one.
+        """
+        message = ChatMessage.from_user(prompt)
+        if self.system_prompt:
+            return [ChatMessage.from_system(self.system_prompt), message]
+        return [message]
+
     def _convert_to_openai_format(self, messages: List[ChatMessage]) -> List[Dict[str, Any]]:
         """
         Converts the list of ChatMessage to the list of messages in the format expected by the OpenAI API.
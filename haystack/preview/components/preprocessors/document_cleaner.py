@@ -1,14 +1,15 @@
 import logging
 import re
 from copy import deepcopy
-from functools import partial, reduce
-from itertools import chain
-from typing import Generator, List, Optional, Set
+from typing import Dict, Generator, List, Optional, Pattern, Set, Tuple
 
 from haystack.preview import Document, component
+from haystack.preview.utils.parallel import isolated_map
 
 logger = logging.getLogger(__name__)
 
+_EXTRA_WHITESPACES = re.compile(r"\s\s+")
+
 
 @component
 class DocumentCleaner:
@@ -38,6 +39,7 @@ class DocumentCleaner:
         remove_repeated_substrings: bool = False,
         remove_substrings: Optional[List[str]] = None,
         remove_regex: Optional[str] = None,
+        num_workers: int = 1,
     ):
         """
         :param remove_empty_lines: Whether to remove empty lines.
@@ -47,6 +49,8 @@ class DocumentCleaner:
             which is supported by TextFileToDocument and AzureOCRDocumentConverter.
         :param remove_substrings: List of substrings to remove from the text.
         :param remove_regex: Regex to match and replace substrings by "".
+        :param num_workers: The number of processes to clean the documents with. Defaults to 1, which cleans the
+            documents in the current process.
         """
 
         self.remove_empty_lines = remove_empty_lines
@@ -54,6 +58,7 @@ class DocumentCleaner:
         self.remove_repeated_substrings = remove_repeated_substrings
         self.remove_substrings = remove_substrings
         self.remove_regex = remove_regex
+        self.num_workers = num_workers
 
     @component.output_types(documents=List[Document])
     def run(self, documents: List[Document]):
@@ -64,6 +69,17 @@ class DocumentCleaner:
         if not isinstance(documents, list) or documents and not isinstance(documents[0], Document):
             raise TypeError("DocumentCleaner expects a List of Documents as input.")
 
+        # The cleaning steps are compiled once for the whole batch
+        cleaner = _TextCleaner(
+            remove_empty_lines=self.remove_empty_lines,
+            remove_extra_whitespaces=self.remove_extra_whitespaces,
+            remove_repeated_substrings=self.remove_repeated_substrings,
+            remove_substrings=self.remove_substrings,
+            remove_regex=self.remove_regex,
+        )
+        texts = (doc.content for doc in documents if doc.content is not None)
+        cleaned_texts = isolated_map(cleaner, texts, num_workers=self.num_workers, chunk_size=64)
+
         cleaned_docs = []
         for doc in documents:
             if doc.content is None:
@@ -73,157 +89,194 @@ class DocumentCleaner:
                 )
                 cleaned_docs.append(doc)
                 continue
-            text = doc.content
-
-            if self.remove_extra_whitespaces:
-                text = self._remove_extra_whitespaces(text)
-            if self.remove_empty_lines:
-                text = self._remove_empty_lines(text)
-            if self.remove_substrings:
-                text = self._remove_substrings(text, self.remove_substrings)
-            if self.remove_regex:
-                text = self._remove_regex(text, self.remove_regex)
-            if self.remove_repeated_substrings:
-                text = self._remove_repeated_substrings(text)
 
+            _, text, error = next(cleaned_texts)
+            if error is not None:
+                raise error
             cleaned_docs.append(Document(content=text, meta=deepcopy(doc.meta)))
 
         return {"documents": cleaned_docs}
 
-    def _remove_empty_lines(self, text: str) -> str:
-        """
-        Remove empty lines and lines that contain nothing but whitespaces from text.
-        :param text: Text to clean.
-        :param return: The text without empty lines.
-        """
-        lines = text.split("\n")
-        non_empty_lines = filter(lambda line: line.strip() != "", lines)
-        return "\n".join(non_empty_lines)
 
-    def _remove_extra_whitespaces(self, text: str) -> str:
-        """
-        Remove extra whitespaces from text.
-        :param text: Text to clean.
-        :param return: The text without extra whitespaces.
-        """
-        return re.sub(r"\s\s+", " ", text).strip()
+class _TextCleaner:
+    """
+    The cleaning steps of a DocumentCleaner, compiled once so that each text is cleaned in as few passes as possible.
+    Instances can be pickled to clean texts in other processes.
+    """
 
-    def _remove_regex(self, text: str, regex: str) -> str:
-        """
-        Remove substrings that match the specified regex from the text.
-        :param text: Text to clean.
-        :param regex: Regex to match and replace substrings by "".
-        :param return: The text without any substrings that match the regex.
-        """
-        return re.sub(regex, "", text).strip()
+    def __init__(
+        self,
+        remove_empty_lines: bool = True,
+        remove_extra_whitespaces: bool = True,
+        remove_repeated_substrings: bool = False,
+        remove_substrings: Optional[List[str]] = None,
+        remove_regex: Optional[str] = None,
+    ):
+        self.remove_extra_whitespaces = remove_extra_whitespaces
+        # Removing extra whitespaces collapses empty lines too, so they only need a separate pass without it
+        self.remove_empty_lines = remove_empty_lines and not remove_extra_whitespaces
+        self.remove_repeated_substrings = remove_repeated_substrings
+        # Removed one after the other in the given order, as removing one substring can create or break the
+        # occurrences of the next ones
+        self.substrings = [substring for substring in remove_substrings or [] if substring]
+        self.regex_pattern: Optional[Pattern] = re.compile(remove_regex) if remove_regex else None
 
-    def _remove_substrings(self, text: str, substrings: List[str]) -> str:
+    def __call__(self, text: str) -> str:
         """
-        Remove all specified substrings from the text.
+        Clean the text with the configured steps.
         :param text: Text to clean.
-        :param substrings: Substrings to remove.
-        :return: The text without the specified substrings.
+        :return: The cleaned text.
         """
-        for substring in substrings:
+        if self.remove_extra_whitespaces:
+            text = _EXTRA_WHITESPACES.sub(" ", text).strip()
+        if self.remove_empty_lines:
+            text = "\n".join(line for line in text.split("\n") if line.strip())
+        for substring in self.substrings:
             text = text.replace(substring, "")
+        if self.regex_pattern:
+            text = self.regex_pattern.sub("", text).strip()
+        if self.remove_repeated_substrings:
+            text = _find_and_remove_header_footer(
+                text, n_chars=300, n_first_pages_to_ignore=1, n_last_pages_to_ignore=1
+            )
         return text
 
-    def _remove_repeated_substrings(self, text: str) -> str:
-        """
-        Remove any substrings from the text that occur repeatedly on every page. For example headers or footers.
-        Pages in the text need to be separated by form feed character "\f".
-        :param text: Text to clean.
-        :return: The text without the repeated substrings.
-        """
-        return self._find_and_remove_header_footer(
-            text, n_chars=300, n_first_pages_to_ignore=1, n_last_pages_to_ignore=1
-        )
 
-    def _find_and_remove_header_footer(
-        self, text: str, n_chars: int, n_first_pages_to_ignore: int, n_last_pages_to_ignore: int
-    ) -> str:
-        """
-        Heuristic to find footers and headers across different pages by searching for the longest common string.
-        Pages in the text need to be separated by form feed character "\f".
-        For headers, we only search in the first n_chars characters (for footer: last n_chars).
-        Note: This heuristic uses exact matches and therefore works well for footers like "Copyright 2019 by XXX",
-         but won't detect "Page 3 of 4" or similar.
-
-        :param n_chars: The number of first/last characters where the header/footer shall be searched in.
-        :param n_first_pages_to_ignore: The number of first pages to ignore (e.g. TOCs often don't contain footer/header).
-        :param n_last_pages_to_ignore: The number of last pages to ignore.
-        :return: The text without the found headers and footers.
-        """
+def _find_and_remove_header_footer(
+    text: str, n_chars: int, n_first_pages_to_ignore: int, n_last_pages_to_ignore: int
+) -> str:
+    """
+    Heuristic to find footers and headers across different pages by searching for the longest common string.
+    Pages in the text need to be separated by form feed character "\f".
+    For headers, we only search in the first n_chars characters (for footer: last n_chars).
+    Note: This heuristic uses exact matches and therefore works well for footers like "Copyright 2019 by XXX",
+     but won't detect "Page 3 of 4" or similar.
+
+    :param n_chars: The number of first/last characters where the header/footer shall be searched in.
+    :param n_first_pages_to_ignore: The number of first pages to ignore (e.g. TOCs often don't contain footer/header).
+    :param n_last_pages_to_ignore: The number of last pages to ignore.
+    :return: The text without the found headers and footers.
+    """
 
-        pages = text.split("\f")
+    pages = text.split("\f")
 
-        # header
-        start_of_pages = [p[:n_chars] for p in pages[n_first_pages_to_ignore:-n_last_pages_to_ignore]]
-        found_header = self._find_longest_common_ngram(start_of_pages)
-        if found_header:
-            pages = [page.replace(found_header, "") for page in pages]
+    # header
+    start_of_pages = [p[:n_chars] for p in pages[n_first_pages_to_ignore:-n_last_pages_to_ignore]]
+    found_header = _find_longest_common_ngram(start_of_pages)
+    if found_header:
+        pages = [page.replace(found_header, "") for page in pages]
 
-        # footer
-        end_of_pages = [p[-n_chars:] for p in pages[n_first_pages_to_ignore:-n_last_pages_to_ignore]]
-        found_footer = self._find_longest_common_ngram(end_of_pages)
-        if found_footer:
-            pages = [page.replace(found_footer, "") for page in pages]
+    # footer
+    end_of_pages = [p[-n_chars:] for p in pages[n_first_pages_to_ignore:-n_last_pages_to_ignore]]
+    found_footer = _find_longest_common_ngram(end_of_pages)
+    if found_footer:
+        pages = [page.replace(found_footer, "") for page in pages]
 
-        logger.debug("Removed header '%s' and footer '%s' in document", found_header, found_footer)
-        text = "\f".join(pages)
-        return text
+    logger.debug("Removed header '%s' and footer '%s' in document", found_header, found_footer)
+    text = "\f".join(pages)
+    return text
 
-    def _ngram(self, seq: str, n: int) -> Generator[str, None, None]:
-        """
-        Return all ngrams of length n from a text sequence. Each ngram consists of n words split by whitespace.
-        :param seq: The sequence to generate ngrams from.
-        :param n: The length of the ngrams to generate.
-        :return: A Generator generating all ngrams of length n from the given sequence.
-        """
 
-        # In order to maintain the original whitespace, but still consider \n and \t for n-gram tokenization,
-        # we add a space here and remove it after creation of the ngrams again (see below)
-        seq = seq.replace("\n", " \n")
-        seq = seq.replace("\t", " \t")
+def _ngram(seq: str, n: int) -> Generator[str, None, None]:
+    """
+    Return all ngrams of length n from a text sequence. Each ngram consists of n words split by whitespace.
+    :param seq: The sequence to generate ngrams from.
+    :param n: The length of the ngrams to generate.
+    :return: A Generator generating all ngrams of length n from the given sequence.
+    """
 
-        words = seq.split(" ")
-        ngrams = (
-            " ".join(words[i : i + n]).replace(" \n", "\n").replace(" \t", "\t") for i in range(0, len(words) - n + 1)
-        )
+    # In order to maintain the original whitespace, but still consider \n and \t for n-gram tokenization,
+    # we add a space here and remove it after creation of the ngrams again (see below)
+    seq = seq.replace("\n", " \n")
+    seq = seq.replace("\t", " \t")
 
-        return ngrams
+    words = seq.split(" ")
+    ngrams = (
+        " ".join(words[i : i + n]).replace(" \n", "\n").replace(" \t", "\t") for i in range(0, len(words) - n + 1)
+    )
 
-    def _allngram(self, seq: str, min_ngram: int, max_ngram: int) -> Set[str]:
-        """
-        Generates all possible ngrams from a given sequence of text.
-        Considering all ngram lengths between the minimum and maximum length.
+    return ngrams
 
-        :param seq: The sequence to generate ngrams from.
-        :param min_ngram: The minimum length of ngram to consider.
-        :param max_ngram: The maximum length of ngram to consider.
-        :return: A set of all ngrams from the given sequence.
-        """
-        lengths = range(min_ngram, max_ngram) if max_ngram else range(min_ngram, len(seq))
-        ngrams = map(partial(self._ngram, seq), lengths)
-        res = set(chain.from_iterable(ngrams))
-        return res
 
-    def _find_longest_common_ngram(self, sequences: List[str], min_ngram: int = 3, max_ngram: int = 30) -> str:
-        """
-        Find the longest common ngram across a list of text sequences (e.g. start of pages).
-        Considering all ngram lengths between the minimum and maximum length. Helpful for finding footers, headers etc.
-        Empty sequences are ignored.
-
-        :param sequences: The list of strings that shall be searched for common n_grams.
-        :param max_ngram: The maximum length of ngram to consider.
-        :param min_ngram: The minimum length of ngram to consider.
-        :return: The longest ngram that all sequences have in common.
-        """
-        sequences = [s for s in sequences if s]  # filter empty sequences
-        if not sequences:
+def _allngram(seq: str, min_ngram: int, max_ngram: int) -> Dict[str, None]:
+    """
+    Generates all possible ngrams from a given sequence of text.
+    Considering all ngram lengths between the minimum and maximum length.
+
+    :param seq: The sequence to generate ngrams from.
+    :param min_ngram: The minimum length of ngram to consider.
+    :param max_ngram: The maximum length of ngram to consider.
+    :return: All ngrams from the given sequence, in order of their length and position, as keys of a dict.
+    """
+    lengths = range(min_ngram, max_ngram) if max_ngram else range(min_ngram, len(seq))
+    return {gram: None for n in lengths for gram in _ngram(seq, n)}
+
+
+def _word_boundaries(seq: str) -> Tuple[Set[int], Set[int]]:
+    """
+    The positions in `seq` where an ngram as generated by `_ngram` can start and end. Words are separated by spaces,
+    and "\n" and "\t" start a new word.
+    """
+    starts, ends = {0}, {len(seq)}
+    for i, char in enumerate(seq):
+        if char == " ":
+            ends.add(i)
+            starts.add(i + 1)
+        elif char in "\n\t":
+            starts.add(i)
+            ends.add(i)
+    return starts, ends
+
+
+def _is_ngram_of(candidate: str, seq: str, starts: Set[int], ends: Set[int], min_ngram: int, max_ngram: int) -> bool:
+    """
+    Checks whether `candidate` is one of the ngrams of `seq` with a length between `min_ngram` and `max_ngram`, that
+    is, whether it occurs in `seq` starting and ending at word boundaries.
+    """
+    num_words = 1 + candidate.count(" ") + sum(1 for char in candidate[1:] if char in "\n\t")
+    if num_words >= max_ngram:
+        return False
+    # A leading "\n" or "\t" at the start or after a space can also be the second word of an ngram that starts with an
+    # empty word
+    may_have_empty_word = candidate[0] in "\n\t" and min_ngram <= num_words + 1 < max_ngram
+    if num_words < min_ngram and not may_have_empty_word:
+        return False
+
+    start = seq.find(candidate)
+    while start != -1:
+        if start in starts and start + len(candidate) in ends:
+            if num_words >= min_ngram or start == 0 or seq[start - 1] == " ":
+                return True
+        start = seq.find(candidate, start + 1)
+    return False
+
+
+def _find_longest_common_ngram(sequences: List[str], min_ngram: int = 3, max_ngram: int = 30) -> str:
+    """
+    Find the longest common ngram across a list of text sequences (e.g. start of pages).
+    Considering all ngram lengths between the minimum and maximum length. Helpful for finding footers, headers etc.
+    Empty sequences are ignored.
+
+    Instead of generating all ngrams of every sequence, the ngrams of the shortest sequence are the candidates, and
+    they're looked up in the other sequences. The candidates that remain after the first few sequences are usually few.
+
+    :param sequences: The list of strings that shall be searched for common n_grams.
+    :param max_ngram: The maximum length of ngram to consider.
+    :param min_ngram: The minimum length of ngram to consider.
+    :return: The longest ngram that all sequences have in common.
+    """
+    sequences = [s for s in sequences if s]  # filter empty sequences
+    if not sequences:
+        return ""
+    shortest = min(range(len(sequences)), key=lambda i: len(sequences[i]))
+    candidates = list(_allngram(sequences[shortest], min_ngram=min_ngram, max_ngram=max_ngram))
+    for i, seq in enumerate(sequences):
+        if not candidates:
             return ""
-        seqs_ngrams = map(partial(self._allngram, min_ngram=min_ngram, max_ngram=max_ngram), sequences)
-        intersection = reduce(set.intersection, seqs_ngrams)
+        if i != shortest:
+            starts, ends = _word_boundaries(seq)
+            upper = max_ngram or len(seq)
+            candidates = [c for c in candidates if _is_ngram_of(c, seq, starts, ends, min_ngram, upper)]
 
-        longest = max(intersection, key=len, default="")
-        return longest if longest.strip() else ""
+    longest = max(candidates, key=len, default="")
+    return longest if longest.strip() else ""
@@ -1,9 +1,16 @@
+import re
+from collections import deque
 from copy import deepcopy
-from typing import List, Literal
+from typing import Iterator, List, Literal, Optional, Tuple
 
-from more_itertools import windowed
+from haystack.preview import component, ComponentError, Document
+from haystack.preview.lazy_imports import LazyImport
 
-from haystack.preview import component, Document
+with LazyImport("Run 'pip install transformers'") as transformers_import:
+    from transformers import AutoTokenizer
+
+
+_DELIMITERS = {"word": " ", "sentence": ".", "passage": "\n\n"}
 
 
 @component
@@ -11,27 +18,58 @@ class DocumentSplitter:
     """
     Splits a list of text documents into a list of text documents with shorter texts.
     This is useful for splitting documents with long texts that otherwise would not fit into the maximum text length of language models.
+
+    The splits are slices of the original text. Their position in it is stored in the metadata fields
+    "split_idx_start" and "split_idx_end", and their position among the splits of the same document in "split_id".
     """
 
     def __init__(
-        self, split_by: Literal["word", "sentence", "passage"] = "word", split_length: int = 200, split_overlap: int = 0
+        self,
+        split_by: Literal["word", "sentence", "passage", "token"] = "word",
+        split_length: int = 200,
+        split_overlap: int = 0,
+        tokenizer_name_or_path: Optional[str] = None,
     ):
         """
         :param split_by: The unit by which the document should be split. Choose from "word" for splitting by " ",
-        "sentence" for splitting by ".", or "passage" for splitting by "\n\n".
+        "sentence" for splitting by ".", "passage" for splitting by "\n\n", or "token" for splitting by the tokens of
+        the tokenizer given in `tokenizer_name_or_path`.
         :param split_length: The maximum number of units in each split.
         :param split_overlap: The number of units that each split should overlap.
+        :param tokenizer_name_or_path: The name or path of a Hugging Face fast tokenizer, required when splitting by
+        "token". This allows splitting documents to fit the input length of a specific model.
         """
 
         self.split_by = split_by
-        if split_by not in ["word", "sentence", "passage"]:
-            raise ValueError("split_by must be one of 'word', 'sentence' or 'passage'.")
+        if split_by not in ["word", "sentence", "passage", "token"]:
+            raise ValueError("split_by must be one of 'word', 'sentence', 'passage' or 'token'.")
         if split_length <= 0:
             raise ValueError("split_length must be greater than 0.")
         self.split_length = split_length
         if split_overlap < 0:
             raise ValueError("split_overlap must be greater than or equal to 0.")
+        if split_overlap >= split_length:
+            raise ValueError("split_overlap must be smaller than split_length.")
         self.split_overlap = split_overlap
+        if split_by == "token":
+            if tokenizer_name_or_path is None:
+                raise ValueError("tokenizer_name_or_path is required when splitting by 'token'.")
+            transformers_import.check()
+        self.tokenizer_name_or_path = tokenizer_name_or_path
+        self.tokenizer = None
+
+    def warm_up(self):
+        """
+        Load the tokenizer if the documents are split by token.
+        """
+        if self.split_by == "token" and self.tokenizer is None:
+            tokenizer = AutoTokenizer.from_pretrained(self.tokenizer_name_or_path)
+            if not tokenizer.is_fast:
+                raise ValueError(
+                    f"Splitting by 'token' requires a fast tokenizer, which is not available for "
+                    f"'{self.tokenizer_name_or_path}'."
+                )
+            self.tokenizer = tokenizer
 
     @component.output_types(documents=List[Document])
     def run(self, documents: List[Document]):
@@ -46,6 +84,8 @@ class DocumentSplitter:
 
         if not isinstance(documents, list) or (documents and not isinstance(documents[0], Document)):
             raise TypeError("DocumentSplitter expects a List of Documents as input.")
+        if self.split_by == "token" and self.tokenizer is None:
+            raise ComponentError("The component was not warmed up. Run 'warm_up()' before calling 'run()'.")
 
         split_docs = []
         for doc in documents:
@@ -53,39 +93,59 @@ class DocumentSplitter:
                 raise ValueError(
                     f"DocumentSplitter only works with text documents but document.content for document ID {doc.id} is None."
                 )
-            units = self._split_into_units(doc.content, self.split_by)
-            text_splits = self._concatenate_units(units, self.split_length, self.split_overlap)
+            # The splits share the copied metadata, only the fields of each split are added
             metadata = deepcopy(doc.meta)
             metadata["source_id"] = doc.id
-            split_docs += [Document(content=txt, meta=metadata) for txt in text_splits]
+            boundaries = self._unit_boundaries(doc.content)
+            for split_id, (start, end) in enumerate(
+                self._split_offsets(boundaries, self.split_length, self.split_overlap)
+            ):
+                split_meta = {**metadata, "split_id": split_id, "split_idx_start": start, "split_idx_end": end}
+                split_docs.append(Document(content=doc.content[start:end], meta=split_meta))
         return {"documents": split_docs}
 
-    def _split_into_units(self, text: str, split_by: Literal["word", "sentence", "passage"]) -> List[str]:
-        if split_by == "passage":
-            split_at = "\n\n"
-        elif split_by == "sentence":
-            split_at = "."
-        elif split_by == "word":
-            split_at = " "
-        else:
-            raise NotImplementedError(
-                "DocumentSplitter only supports 'passage', 'sentence' or 'word' split_by options."
+    def _unit_boundaries(self, text: str) -> Iterator[int]:
+        """
+        Yields the character offsets at which the units of the text start, followed by the length of the text.
+        Each unit extends until the next one starts, so that delimiters and whitespace stay part of the splits.
+        """
+        yield 0
+        if self.split_by == "token":
+            encoding = self.tokenizer(  # type: ignore[misc]
+                text, add_special_tokens=False, return_offsets_mapping=True, verbose=False
             )
-        units = text.split(split_at)
-        # Add the delimiter back to all units except the last one
-        for i in range(len(units) - 1):
-            units[i] += split_at
-        return units
+            # The first unit starts at the beginning of the text, including any whitespace before the first token
+            yield from (start for start, _ in encoding["offset_mapping"][1:])
+        else:
+            yield from (match.end() for match in re.finditer(re.escape(_DELIMITERS[self.split_by]), text))
+        yield len(text)
 
-    def _concatenate_units(self, elements: List[str], split_length: int, split_overlap: int) -> List[str]:
+    @staticmethod
+    def _split_offsets(boundaries: Iterator[int], split_length: int, split_overlap: int) -> Iterator[Tuple[int, int]]:
         """
-        Concatenates the elements into parts of split_length units.
+        Groups consecutive units into splits of split_length units that overlap by split_overlap units, and yields
+        the start and end offsets of the non-empty splits. Only the boundaries of one split are kept in memory.
+
+        :param boundaries: The offsets at which the units start, followed by the length of the text.
         """
-        text_splits = []
-        segments = windowed(elements, n=split_length, step=split_length - split_overlap)
-        for seg in segments:
-            current_units = [unit for unit in seg if unit is not None]
-            txt = "".join(current_units)
-            if len(txt) > 0:
-                text_splits.append(txt)
-        return text_splits
+        step = split_length - split_overlap
+        window = deque([next(boundaries)], maxlen=split_length + 1)
+        units_until_split = split_length
+        for boundary in boundaries:
+            window.append(boundary)
+            units_until_split -= 1
+            if not units_until_split:
+                units_until_split = step
+                if window[0] != window[-1]:
+                    yield window[0], window[-1]
+
+        if len(window) <= split_length:
+            # The text has fewer units than split_length
+            last_split = (window[0], window[-1])
+        elif units_until_split < step:
+            # The units after the last full split start a shorter split, which overlaps as usual with the previous one
+            last_split = (window[units_until_split], window[-1])
+        else:
+            return
+        if last_split[0] != last_split[1]:
+            yield last_split
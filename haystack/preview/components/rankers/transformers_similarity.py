@@ -4,6 +4,7 @@ from typing import List, Union, Dict, Any, Optional
 
 from haystack.preview import ComponentError, Document, component, default_to_dict
 from haystack.preview.lazy_imports import LazyImport
+from haystack.preview.utils import ModelKey, model_registry
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +41,7 @@ class TransformersSimilarityRanker:
         device: str = "cpu",
         token: Union[bool, str, None] = None,
         top_k: int = 10,
+        batch_size: int = 32,
     ):
         """
         Creates an instance of TransformersSimilarityRanker.
@@ -51,6 +53,7 @@ class TransformersSimilarityRanker:
             If this parameter is set to `True`, then the token generated when running
             `transformers-cli login` (stored in ~/.huggingface) will be used.
         :param top_k: The maximum number of documents to return per query.
+        :param batch_size: The number of query-document pairs to score at once.
         """
         torch_and_transformers_import.check()
 
@@ -58,6 +61,9 @@ class TransformersSimilarityRanker:
         if top_k <= 0:
             raise ValueError(f"top_k must be > 0, but got {top_k}")
         self.top_k = top_k
+        if batch_size <= 0:
+            raise ValueError(f"batch_size must be > 0, but got {batch_size}")
+        self.batch_size = batch_size
         self.device = device
         self.token = token
         self.model = None
@@ -74,10 +80,19 @@ class TransformersSimilarityRanker:
         Warm up the model and tokenizer used in scoring the documents.
         """
         if self.model_name_or_path and not self.model:
-            self.model = AutoModelForSequenceClassification.from_pretrained(self.model_name_or_path, token=self.token)
-            self.model = self.model.to(self.device)
-            self.model.eval()
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name_or_path, token=self.token)
+            # Rankers with the same model share it, so it's loaded only once per process
+            self.model, self.tokenizer = model_registry.acquire(
+                owner=self,
+                key=ModelKey.from_kwargs("sequence-classification", self.model_name_or_path, device=self.device),
+                loader=self._load_model_and_tokenizer,
+            )
+
+    def _load_model_and_tokenizer(self):
+        model = AutoModelForSequenceClassification.from_pretrained(self.model_name_or_path, token=self.token)
+        model = model.to(self.device)
+        model.eval()
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name_or_path, token=self.token)
+        return model, tokenizer
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -89,6 +104,7 @@ class TransformersSimilarityRanker:
             model_name_or_path=self.model_name_or_path,
             token=self.token if not isinstance(self.token, str) else None,  # don't serialize valid tokens
             top_k=self.top_k,
+            batch_size=self.batch_size,
         )
 
     @component.output_types(documents=List[Document])
@@ -116,19 +132,63 @@ class TransformersSimilarityRanker:
                 f"The component {self.__class__.__name__} not warmed up. Run 'warm_up()' before calling 'run()'."
             )
 
-        query_doc_pairs = [[query, doc.content] for doc in documents]
-        features = self.tokenizer(
-            query_doc_pairs, padding=True, truncation=True, return_tensors="pt"
-        ).to(  # type: ignore
-            self.device
-        )
-        with torch.inference_mode():
-            similarity_scores = self.model(**features).logits.squeeze()  # type: ignore
+        similarity_scores = self._compute_scores(queries=[query], documents=[documents])[0]
+        return {"documents": self._rank(documents=documents, similarity_scores=similarity_scores, top_k=top_k)}
+
+    def run_batch(self, query: List[str], documents: List[List[Document]], top_k: Optional[List[Optional[int]]] = None):
+        """
+        Ranks the documents of a batch of queries. The query-document pairs of all queries are scored together,
+        `batch_size` pairs at a time.
 
+        :param query: Query strings.
+        :param documents: The list of Documents of each query.
+        :param top_k: The maximum number of documents to return for each query.
+        :return: The Documents of each query sorted by (desc.) similarity with the query.
+        """
+        top_k = [self.top_k if k is None else k for k in top_k or [None] * len(query)]
+        if any(k <= 0 for k in top_k):
+            raise ValueError(f"top_k must be > 0, but got {top_k}")
+
+        if self.model_name_or_path and not self.model and any(documents):
+            raise ComponentError(
+                f"The component {self.__class__.__name__} not warmed up. Run 'warm_up()' before calling 'run()'."
+            )
+
+        similarity_scores = self._compute_scores(queries=query, documents=documents)
+        return {
+            "documents": [
+                self._rank(documents=docs, similarity_scores=scores, top_k=k)
+                for docs, scores, k in zip(documents, similarity_scores, top_k)
+            ]
+        }
+
+    def _compute_scores(self, queries: List[str], documents: List[List[Document]]) -> List["torch.Tensor"]:
+        """
+        Scores the query-document pairs of all queries in batches and returns the scores of each query's documents.
+        """
+        query_doc_pairs = [[query, doc.content] for query, docs in zip(queries, documents) for doc in docs]
+        if not query_doc_pairs:
+            return [torch.empty(0) for _ in queries]
+        batch_scores = []
+        for i in range(0, len(query_doc_pairs), self.batch_size):
+            features = self.tokenizer(
+                query_doc_pairs[i : i + self.batch_size], padding=True, truncation=True, return_tensors="pt"
+            ).to(  # type: ignore
+                self.device
+            )
+            with torch.inference_mode():
+                batch_scores.append(self.model(**features).logits.view(-1))  # type: ignore
+        similarity_scores = torch.cat(batch_scores)
+        return list(torch.split(similarity_scores, [len(docs) for docs in documents]))
+
+    def _rank(self, documents: List[Document], similarity_scores: "torch.Tensor", top_k: int) -> List[Document]:
+        """
+        Sorts the documents by their similarity scores and sets the scores on them.
+        """
         _, sorted_indices = torch.sort(similarity_scores, descending=True)
         ranked_docs = []
         for sorted_index_tensor in sorted_indices:
             i = sorted_index_tensor.item()
             documents[i].score = similarity_scores[i].item()
             ranked_docs.append(documents[i])
-        return {"documents": ranked_docs[:top_k]}
+        return ranked_docs[:top_k]
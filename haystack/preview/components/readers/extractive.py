@@ -1,11 +1,20 @@
+from collections import OrderedDict
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 import math
+import threading
 import warnings
 import os
 
 from haystack.preview import component, default_to_dict, ComponentError, Document, ExtractedAnswer
 from haystack.preview.lazy_imports import LazyImport
+from haystack.preview.utils import (
+    group_batch_items,
+    ModelKey,
+    model_registry,
+    apply_inference_precision,
+    validate_inference_precision,
+)
 
 with LazyImport(
     "Run 'pip install transformers[torch,sentencepiece]==4.34.1 sentence-transformers>=2.2.0'"
@@ -46,6 +55,8 @@ class ExtractiveReader:
         no_answer: bool = True,
         calibration_factor: float = 0.1,
         model_kwargs: Optional[Dict[str, Any]] = None,
+        tokenization_cache_size: int = 0,
+        inference_precision: str = "fp32",
     ) -> None:
         """
         Creates an ExtractiveReader
@@ -71,8 +82,15 @@ class ExtractiveReader:
         :param calibration_factor: Factor used for calibrating confidence scores
         :param model_kwargs: Additional keyword arguments passed to `AutoModelForQuestionAnswering.from_pretrained`
             when loading the model specified in `model_name_or_path`.
+        :param tokenization_cache_size: Number of tokenized documents to keep between runs, so that documents that
+            are passed again with other queries are not tokenized again. Only the query is tokenized then, and the
+            windows of the document are built from its cached tokens. 0 (the default) disables the cache.
+        :param inference_precision: The precision to run the model in. Use `"fp32"` (default) for full precision,
+            `"bf16"` to run it with bfloat16 autocast, or `"dynamic-int8"` to quantize its linear layers to int8
+            (CPU only). Reduced precision trades a little accuracy for faster inference on CPUs.
         """
         torch_and_transformers_import.check()
+        validate_inference_precision(inference_precision)
         self.model_name_or_path = str(model_name_or_path)
         self.model = None
         self.device = device
@@ -86,6 +104,11 @@ class ExtractiveReader:
         self.no_answer = no_answer
         self.calibration_factor = calibration_factor
         self.model_kwargs = model_kwargs or {}
+        self.tokenization_cache_size = tokenization_cache_size
+        self.inference_precision = inference_precision
+        self._tokenized_documents: "OrderedDict[str, Tuple[List[int], List[Tuple[int, int]]]]" = OrderedDict()
+        self._tokenized_documents_lock = threading.Lock()
+        self._special_tokens: Optional[Tuple[List[int], List[int], List[int]]] = None
 
     def _get_telemetry_data(self) -> Dict[str, Any]:
         """
@@ -111,6 +134,8 @@ class ExtractiveReader:
             no_answer=self.no_answer,
             calibration_factor=self.calibration_factor,
             model_kwargs=self.model_kwargs,
+            tokenization_cache_size=self.tokenization_cache_size,
+            inference_precision=self.inference_precision,
         )
 
     def warm_up(self):
@@ -126,10 +151,26 @@ class ExtractiveReader:
             else:
                 self.device = self.device or "cpu:0"
 
-            self.model = AutoModelForQuestionAnswering.from_pretrained(
-                self.model_name_or_path, token=self.token, **self.model_kwargs
-            ).to(self.device)
-            self.tokenizer = AutoTokenizer.from_pretrained(self.model_name_or_path, token=self.token)
+            # Readers with the same model share it, so it's loaded only once per process
+            self.model, self.tokenizer = model_registry.acquire(
+                owner=self,
+                key=ModelKey.from_kwargs(
+                    "question-answering",
+                    self.model_name_or_path,
+                    device=self.device,
+                    inference_precision=self.inference_precision,
+                    **self.model_kwargs,
+                ),
+                loader=self._load_model_and_tokenizer,
+            )
+
+    def _load_model_and_tokenizer(self) -> Tuple["AutoModelForQuestionAnswering", "AutoTokenizer"]:
+        model = AutoModelForQuestionAnswering.from_pretrained(
+            self.model_name_or_path, token=self.token, **self.model_kwargs
+        ).to(self.device)
+        model = apply_inference_precision(model, self.inference_precision)
+        tokenizer = AutoTokenizer.from_pretrained(self.model_name_or_path, token=self.token)
+        return model, tokenizer
 
     def _flatten_documents(
         self, queries: List[str], documents: List[List[Document]]
@@ -148,6 +189,11 @@ class ExtractiveReader:
         """
         Split and tokenise documents and preserve structures by returning mappings to query and document ids.
         """
+        if self.tokenization_cache_size > 0:
+            preprocessed = self._preprocess_with_cache(queries, documents, max_seq_length, query_ids, stride)
+            if preprocessed is not None:
+                return preprocessed
+
         texts = []
         document_ids = []
         for i, doc in enumerate(documents):
@@ -182,6 +228,131 @@ class ExtractiveReader:
 
         return input_ids, attention_mask, sequence_ids, encodings, query_ids, document_ids
 
+    def _preprocess_with_cache(
+        self, queries: List[str], documents: List[Document], max_seq_length: int, query_ids: List[int], stride: int
+    ) -> Optional[Tuple[torch.Tensor, torch.Tensor, torch.Tensor, List["_QueryDocumentWindow"], List[int], List[int]]]:
+        """
+        Does the same as `_preprocess`, but takes the tokens of the documents from the cache and only tokenizes the
+        queries. The windows are built the way the tokenizer would build them.
+
+        Returns `None` if the tokenizer would also truncate a query or fail to split a document, which is left to the
+        tokenizer.
+        """
+        document_ids = []
+        for i, doc in enumerate(documents):
+            if doc.content is None:
+                warnings.warn(
+                    f"Document with id {doc.id} was passed to ExtractiveReader, but does not contain any text. It will be ignored."
+                )
+                continue
+            document_ids.append(i)
+        if not document_ids:
+            return None
+
+        prefix, middle, suffix = self._get_special_tokens()
+        # The tokenizer only truncates the query and the document, never the special tokens
+        max_length = max_seq_length - len(prefix) - len(middle) - len(suffix)
+        unique_queries = list(dict.fromkeys(queries))
+        tokenized_queries = dict(
+            zip(unique_queries, self.tokenizer(unique_queries, add_special_tokens=False).input_ids)
+        )
+        tokenized_documents = self._tokenize_documents([documents[i].content for i in document_ids])  # type: ignore[misc]
+
+        # Each window is made of the query, a range of the document tokens, and its special tokens
+        windows = []
+        window_query_ids = []
+        window_document_ids = []
+        for document_id, (document_tokens, document_offsets) in zip(document_ids, tokenized_documents):
+            query_tokens = tokenized_queries[queries[document_id]]
+            query_length, document_length = _truncated_lengths(len(query_tokens), len(document_tokens), max_length)
+            if query_length < len(query_tokens) or (
+                document_length < len(document_tokens) and stride >= document_length
+            ):
+                return None
+            for start, end in _window_ranges(len(document_tokens), document_length, stride):
+                windows.append((query_tokens, document_tokens[start:end], document_offsets[start:end]))
+                window_query_ids.append(query_ids[document_id])
+                window_document_ids.append(document_id)
+
+        special_tokens_length = len(prefix) + len(middle) + len(suffix)
+        padded_length = max(len(query) + len(document) for query, document, _ in windows) + special_tokens_length
+        left_padding = self.tokenizer.padding_side == "left"
+        encodings = []
+        attention_mask_list = []
+        for query_tokens, document_tokens, document_offsets in windows:
+            ids = prefix + query_tokens + middle + document_tokens + suffix
+            sequence_ids: List[Optional[int]] = (
+                [None] * len(prefix)
+                + [0] * len(query_tokens)
+                + [None] * len(middle)
+                + [1] * len(document_tokens)
+                + [None] * len(suffix)
+            )
+            offsets: List[Optional[Tuple[int, int]]] = (
+                [None] * (len(prefix) + len(query_tokens) + len(middle)) + list(document_offsets) + [None] * len(suffix)
+            )
+            mask = [1] * len(ids)
+            padding = padded_length - len(ids)
+            if left_padding:
+                ids = [self.tokenizer.pad_token_id] * padding + ids
+                sequence_ids = [None] * padding + sequence_ids
+                offsets = [None] * padding + offsets
+                mask = [0] * padding + mask
+            else:
+                ids = ids + [self.tokenizer.pad_token_id] * padding
+                sequence_ids = sequence_ids + [None] * padding
+                offsets = offsets + [None] * padding
+                mask = mask + [0] * padding
+            encodings.append(_QueryDocumentWindow(ids, sequence_ids, offsets))
+            attention_mask_list.append(mask)
+
+        input_ids = torch.tensor([encoding.ids for encoding in encodings]).to(self.device)
+        attention_mask = torch.tensor(attention_mask_list).to(self.device)
+        sequence_ids_tensor = torch.tensor(
+            [[id_ if id_ is not None else -1 for id_ in encoding.sequence_ids] for encoding in encodings]
+        ).to(self.device)
+        return input_ids, attention_mask, sequence_ids_tensor, encodings, window_query_ids, window_document_ids
+
+    def _get_special_tokens(self) -> Tuple[List[int], List[int], List[int]]:
+        """
+        Returns the special tokens the tokenizer adds before the query, between the query and the document, and
+        after the document.
+        """
+        if self._special_tokens is None:
+            encoding = self.tokenizer("query", "document", truncation=False, padding=False).encodings[0]
+            sequence_ids = encoding.sequence_ids
+            first_query_token = sequence_ids.index(0)
+            first_document_token = sequence_ids.index(1)
+            last_query_token = len(sequence_ids) - 1 - sequence_ids[::-1].index(0)
+            last_document_token = len(sequence_ids) - 1 - sequence_ids[::-1].index(1)
+            self._special_tokens = (
+                encoding.ids[:first_query_token],
+                encoding.ids[last_query_token + 1 : first_document_token],
+                encoding.ids[last_document_token + 1 :],
+            )
+        return self._special_tokens
+
+    def _tokenize_documents(self, texts: List[str]) -> List[Tuple[List[int], List[Tuple[int, int]]]]:
+        """
+        Returns the tokens and their character offsets of each text, tokenizing only the texts that are not cached.
+        """
+        with self._tokenized_documents_lock:
+            cached = {text: self._tokenized_documents.get(text) for text in texts}
+        missing = [text for text, tokenized in cached.items() if tokenized is None]
+        if missing:
+            encodings = self.tokenizer(
+                missing, add_special_tokens=False, return_offsets_mapping=True, truncation=False, padding=False
+            )
+            cached.update(zip(missing, zip(encodings.input_ids, encodings.offset_mapping)))
+
+        with self._tokenized_documents_lock:
+            for text in cached:
+                self._tokenized_documents[text] = cached[text]  # type: ignore[assignment]
+                self._tokenized_documents.move_to_end(text)
+            while len(self._tokenized_documents) > self.tokenization_cache_size:
+                self._tokenized_documents.popitem(last=False)
+        return [cached[text] for text in texts]  # type: ignore[misc]
+
     def _postprocess(
         self,
         start: torch.Tensor,
@@ -253,7 +424,8 @@ class ExtractiveReader:
                 flat_answers_without_queries.append({"data": doc.content[start_:end_], "document": doc, "probability": probability.item(), "start": start_, "end": end_, "metadata": {}})  # type: ignore # doc.content cannot be None, because those documents are filtered when preprocessing. However, mypy doesn't know that.
         i = 0
         nested_answers = []
-        for query_id in range(query_ids[-1] + 1):
+        # Queries without any document to read still get a no answer
+        for query_id in range(len(queries)):
             current_answers = []
             while i < len(flat_answers_without_queries) and query_ids[i // answers_per_seq] == query_id:
                 answer = flat_answers_without_queries[i]
@@ -296,8 +468,76 @@ class ExtractiveReader:
         :param top_k: The maximum number of answers to return.
         :return: List of ExtractedAnswers sorted by (desc.) answer score.
         """
-        queries = [query]  # Temporary solution until we have decided what batching should look like in v2
-        nested_documents = [documents]
+        answers = self._answer_queries(
+            queries=[query],
+            nested_documents=[documents],
+            top_k=top_k,
+            confidence_threshold=confidence_threshold,
+            max_seq_length=max_seq_length,
+            stride=stride,
+            max_batch_size=max_batch_size,
+            answers_per_seq=answers_per_seq,
+            no_answer=no_answer,
+        )
+        return {"answers": answers[0]}
+
+    def run_batch(
+        self,
+        query: List[str],
+        documents: List[List[Document]],
+        top_k: Optional[List[Optional[int]]] = None,
+        confidence_threshold: Optional[List[Optional[float]]] = None,
+        max_seq_length: Optional[List[Optional[int]]] = None,
+        stride: Optional[List[Optional[int]]] = None,
+        max_batch_size: Optional[List[Optional[int]]] = None,
+        answers_per_seq: Optional[List[Optional[int]]] = None,
+        no_answer: Optional[List[Optional[bool]]] = None,
+    ):
+        """
+        Performs extractive QA on a batch of queries, each with its own documents. The query-document pairs of all
+        queries that share the same parameters go through the model together, in batches of `max_batch_size`.
+
+        :param query: Query strings.
+        :param documents: The list of Documents to search for an answer for each query.
+        :param top_k: The maximum number of answers to return for each query.
+        :return: The list of ExtractedAnswers of each query sorted by (desc.) answer score.
+        """
+        parameters = [
+            values or [None] * len(query)
+            for values in (
+                top_k,
+                confidence_threshold,
+                max_seq_length,
+                stride,
+                max_batch_size,
+                answers_per_seq,
+                no_answer,
+            )
+        ]
+        answers: List[List[ExtractedAnswer]] = [[] for _ in query]
+        for values, indices in group_batch_items(*parameters):
+            group_answers = self._answer_queries(
+                [query[i] for i in indices], [documents[i] for i in indices], *values  # type: ignore[arg-type]
+            )
+            for i, answers_ in zip(indices, group_answers):
+                answers[i] = answers_
+        return {"answers": answers}
+
+    def _answer_queries(
+        self,
+        queries: List[str],
+        nested_documents: List[List[Document]],
+        top_k: Optional[int] = None,
+        confidence_threshold: Optional[float] = None,
+        max_seq_length: Optional[int] = None,
+        stride: Optional[int] = None,
+        max_batch_size: Optional[int] = None,
+        answers_per_seq: Optional[int] = None,
+        no_answer: Optional[bool] = None,
+    ) -> List[List[ExtractedAnswer]]:
+        """
+        Performs extractive QA for several queries at once and returns the answers of each query.
+        """
         if self.model is None:
             raise ComponentError("The component was not warmed up. Run 'warm_up()' before calling 'run()'.")
 
@@ -310,6 +550,11 @@ class ExtractiveReader:
         no_answer = no_answer if no_answer is not None else self.no_answer
 
         flattened_queries, flattened_documents, query_ids = self._flatten_documents(queries, nested_documents)
+        if not flattened_documents:
+            # There's nothing to run the model on
+            return self._nest_answers(
+                [], [], torch.empty(0), [], queries, answers_per_seq, top_k, confidence_threshold, [], [], no_answer
+            )
         input_ids, attention_mask, sequence_ids, encodings, query_ids, document_ids = self._preprocess(
             flattened_queries, flattened_documents, max_seq_length, query_ids, stride
         )
@@ -342,7 +587,7 @@ class ExtractiveReader:
             start_logits, end_logits, sequence_ids, attention_mask, answers_per_seq, encodings
         )
 
-        answers = self._nest_answers(
+        return self._nest_answers(
             start,
             end,
             probabilities,
@@ -356,4 +601,49 @@ class ExtractiveReader:
             no_answer,
         )
 
-        return {"answers": answers[0]}  # same temporary batching fix as above
+
+def _truncated_lengths(first_length: int, second_length: int, max_length: int) -> Tuple[int, int]:
+    """
+    Returns the lengths a pair of sequences is truncated to so that it fits into `max_length`, with the
+    `longest_first` strategy of the tokenizers library.
+    """
+    if first_length + second_length <= max_length:
+        return first_length, second_length
+    shortest, longest = sorted((first_length, second_length))
+    longest = shortest if shortest > max_length else max(shortest, max_length - shortest)
+    if shortest + longest > max_length:
+        shortest = max_length // 2
+        longest = shortest + max_length % 2
+    return (shortest, longest) if first_length <= second_length else (longest, shortest)
+
+
+def _window_ranges(length: int, window_length: int, stride: int) -> List[Tuple[int, int]]:
+    """
+    Returns the ranges of the windows a sequence of `length` tokens is split into when it's truncated to
+    `window_length` tokens, each window overlapping with the previous one by `stride` tokens.
+    """
+    if length <= window_length:
+        return [(0, length)]
+    ranges = []
+    for start in range(0, length, window_length - stride):
+        ranges.append((start, min(start + window_length, length)))
+        if start + window_length >= length:
+            break
+    return ranges
+
+
+class _QueryDocumentWindow:
+    """
+    The padded tokens of a query and a window of a document, with the parts of the `tokenizers.Encoding` interface
+    the reader uses.
+    """
+
+    def __init__(
+        self, ids: List[int], sequence_ids: List[Optional[int]], offsets: List[Optional[Tuple[int, int]]]
+    ) -> None:
+        self.ids = ids
+        self.sequence_ids = sequence_ids
+        self._offsets = offsets
+
+    def token_to_chars(self, token_index: int) -> Optional[Tuple[int, int]]:
+        return self._offsets[token_index]
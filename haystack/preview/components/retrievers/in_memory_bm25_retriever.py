@@ -2,6 +2,7 @@ from typing import Dict, List, Any, Optional
 
 from haystack.preview import component, Document, default_to_dict, default_from_dict, DeserializationError
 from haystack.preview.document_stores import InMemoryDocumentStore, document_store
+from haystack.preview.utils import group_batch_items
 
 
 @component
@@ -104,3 +105,33 @@ class InMemoryBM25Retriever:
 
         docs = self.document_store.bm25_retrieval(query=query, filters=filters, top_k=top_k, scale_score=scale_score)
         return {"documents": docs}
+
+    def run_batch(
+        self,
+        query: List[str],
+        filters: Optional[List[Optional[Dict[str, Any]]]] = None,
+        top_k: Optional[List[Optional[int]]] = None,
+        scale_score: Optional[List[Optional[bool]]] = None,
+    ):
+        """
+        Run the InMemoryBM25Retriever on a batch of queries. The queries that share the same filters are scored
+        together, so the documents are filtered and tokenized only once for them.
+
+        :param query: The query strings for the Retriever.
+        :param filters: The filters of each query. `None` uses the filters given at initialization.
+        :param top_k: The maximum number of documents to return for each query.
+        :param scale_score: Whether to scale the BM25 scores of each query to a unit interval.
+        :return: The retrieved documents of each query.
+        """
+        filters = [self.filters if f is None else f for f in filters or [None] * len(query)]
+        top_k = [self.top_k if k is None else k for k in top_k or [None] * len(query)]
+        scale_score = [self.scale_score if s is None else s for s in scale_score or [None] * len(query)]
+
+        documents: List[List[Document]] = [[] for _ in query]
+        for (filters_, top_k_, scale_score_), indices in group_batch_items(filters, top_k, scale_score):
+            docs = self.document_store.bm25_retrieval_batch(
+                queries=[query[i] for i in indices], filters=filters_, top_k=top_k_, scale_score=scale_score_
+            )
+            for i, docs_ in zip(indices, docs):
+                documents[i] = docs_
+        return {"documents": documents}
@@ -2,6 +2,7 @@ from typing import Dict, List, Any, Optional
 
 from haystack.preview import component, Document, default_to_dict, default_from_dict, DeserializationError
 from haystack.preview.document_stores import InMemoryDocumentStore, document_store
+from haystack.preview.utils import group_batch_items
 
 
 @component
@@ -123,3 +124,43 @@ class InMemoryEmbeddingRetriever:
         )
 
         return {"documents": docs}
+
+    def run_batch(
+        self,
+        query_embedding: List[List[float]],
+        filters: Optional[List[Optional[Dict[str, Any]]]] = None,
+        top_k: Optional[List[Optional[int]]] = None,
+        scale_score: Optional[List[Optional[bool]]] = None,
+        return_embedding: Optional[List[Optional[bool]]] = None,
+    ):
+        """
+        Run the InMemoryEmbeddingRetriever on a batch of query embeddings. The similarities of the queries that
+        share the same filters are computed with a single matrix product.
+
+        :param query_embedding: Embeddings of the queries.
+        :param filters: The filters of each query. `None` uses the filters given at initialization.
+        :param top_k: The maximum number of documents to return for each query.
+        :param scale_score: Whether to scale the similarity scores of each query to a unit interval.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents for each query.
+        :return: The retrieved documents of each query.
+        """
+        batch_size = len(query_embedding)
+        filters = [self.filters if f is None else f for f in filters or [None] * batch_size]
+        top_k = [self.top_k if k is None else k for k in top_k or [None] * batch_size]
+        scale_score = [self.scale_score if s is None else s for s in scale_score or [None] * batch_size]
+        return_embedding = [self.return_embedding if r is None else r for r in return_embedding or [None] * batch_size]
+
+        documents: List[List[Document]] = [[] for _ in query_embedding]
+        for (filters_, top_k_, scale_score_, return_embedding_), indices in group_batch_items(
+            filters, top_k, scale_score, return_embedding
+        ):
+            docs = self.document_store.embedding_retrieval_batch(
+                query_embeddings=[query_embedding[i] for i in indices],
+                filters=filters_,
+                top_k=top_k_,
+                scale_score=scale_score_,
+                return_embedding=return_embedding_,
+            )
+            for i, docs_ in zip(indices, docs):
+                documents[i] = docs_
+        return {"documents": documents}
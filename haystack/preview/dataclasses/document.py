@@ -1,7 +1,12 @@
 import io
+import copy
+import array
+import base64
 import hashlib
 import logging
-from dataclasses import asdict, dataclass, field, fields
+import importlib.util
+from dataclasses import dataclass, field, fields
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Type, cast
 
 import numpy
@@ -12,6 +17,58 @@ from haystack.preview.dataclasses.byte_stream import ByteStream
 logger = logging.getLogger(__name__)
 
 
+@lru_cache(maxsize=None)
+def _parquet_available() -> bool:
+    """
+    Checks whether pyarrow is installed, so that DataFrames can be serialized as Parquet.
+    """
+    return importlib.util.find_spec("pyarrow") is not None
+
+
+class Embedding(array.array):
+    """
+    Compact float32 buffer holding the embedding of a Document.
+
+    It can be indexed, iterated and measured like a list and compares equal to lists and NumPy arrays holding the
+    same values in float32 precision. Being a buffer, it can be turned into a NumPy array without copying it with
+    `numpy.frombuffer(embedding, dtype=numpy.float32)`.
+    """
+
+    def __new__(cls, values: Any = ()):
+        if isinstance(values, numpy.ndarray):
+            values = numpy.ascontiguousarray(values, dtype=numpy.float32).ravel().tobytes()
+        return super().__new__(cls, "f", values)
+
+    def __reduce_ex__(self, protocol):
+        return self.__class__, (self.tobytes(),)
+
+    def __copy__(self):
+        return self.__class__(self.tobytes())
+
+    def __deepcopy__(self, memo):
+        return self.__copy__()
+
+    def __eq__(self, other):
+        if isinstance(other, array.array) and other.typecode == "f":
+            return super().__eq__(other)
+        try:
+            other = numpy.asarray(other, dtype=numpy.float32)
+        except (TypeError, ValueError):
+            return NotImplemented
+        return other.shape == (len(self),) and bool(
+            numpy.array_equal(numpy.frombuffer(self, dtype=numpy.float32), other)
+        )
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    def __repr__(self):
+        return repr(self.tolist())
+
+    __str__ = __repr__
+
+
 class _BackwardCompatible(type):
     """
     Metaclass that handles Document backward compatibility.
@@ -32,10 +89,6 @@ class _BackwardCompatible(type):
         if "content_type" in kwargs:
             del kwargs["content_type"]
 
-        # Embedding were stored as NumPy arrays in 1.x, so we convert it to the new type
-        if isinstance(embedding := kwargs.get("embedding"), numpy.ndarray):
-            kwargs["embedding"] = embedding.tolist()
-
         # id_hash_keys is not used anymore
         if "id_hash_keys" in kwargs:
             del kwargs["id_hash_keys"]
@@ -68,7 +121,8 @@ class Document(metaclass=_BackwardCompatible):
     :param blob: Binary data associated with the document, if the document has any binary data associated with it.
     :param meta: Additional custom metadata for the document. Must be JSON-serializable.
     :param score: Score of the document. Used for ranking, usually assigned by retrievers.
-    :param embedding: Vector representation of the document.
+    :param embedding: Vector representation of the document. It's stored as a compact float32 `Embedding` buffer
+                      that can be used like a list of floats.
     """
 
     id: str = field(default="")
@@ -100,12 +154,24 @@ class Document(metaclass=_BackwardCompatible):
             return self.id == other.id
         return False
 
+    def __setattr__(self, name, value):
+        """
+        Stores embeddings as compact float32 buffers.
+        While a Document without explicit id is initialized, the conversion is left to `__post_init__`, so that the
+        id is generated from the original values.
+        """
+        if name == "embedding" and value is not None and not isinstance(value, Embedding) and self.__dict__.get("id"):
+            value = Embedding(value)
+        super().__setattr__(name, value)
+
     def __post_init__(self):
         """
         Generate the ID based on the init parameters.
         """
         # Generate an id only if not explicitly set
         self.id = self.id or self._create_id()
+        if self.embedding is not None and not isinstance(self.embedding, Embedding):
+            self.embedding = Embedding(self.embedding)
 
     def _create_id(self):
         """
@@ -116,39 +182,92 @@ class Document(metaclass=_BackwardCompatible):
         blob = self.blob.data if self.blob is not None else None
         mime_type = self.blob.mime_type if self.blob is not None else None
         meta = self.meta or {}
-        embedding = self.embedding if self.embedding is not None else None
+        # Embeddings were stored as NumPy arrays in 1.x, the id is still generated from their list representation
+        embedding = self.embedding.tolist() if isinstance(self.embedding, numpy.ndarray) else self.embedding
         data = f"{text}{dataframe}{blob}{mime_type}{meta}{embedding}"
         return hashlib.sha256(data.encode("utf-8")).hexdigest()
 
-    def to_dict(self, flatten=True) -> Dict[str, Any]:
+    def copy_with(self, **changes) -> "Document":
+        """
+        Creates a shallow copy of the Document with some of its fields changed, for example
+        `document.copy_with(score=0.8, embedding=None)`. `meta` is copied, so that changing the copy's metadata doesn't
+        change the original Document. The other fields are shared with the original Document and the id is kept as
+        it is.
+
+        :param changes: The fields to change and their new values.
+        """
+        unknown_fields = changes.keys() - {f.name for f in fields(self)}
+        if unknown_fields:
+            raise ValueError(f"Document has no fields {sorted(unknown_fields)}.")
+        document = copy.copy(self)
+        document.meta = dict(self.meta)
+        for name, value in changes.items():
+            setattr(document, name, value)
+        return document
+
+    def to_dict(self, flatten=True, binary=False) -> Dict[str, Any]:
         """
         Converts Document into a dictionary.
-        `dataframe` and `blob` fields are converted to JSON-serializable types.
+        `dataframe`, `blob` and `embedding` fields are converted to JSON-serializable types: the `dataframe` to JSON,
+        the `blob` data to a base64 string and the `embedding` to a list of floats. The other values aren't copied, so
+        they're shared with the Document.
 
         :param flatten: Whether to flatten `meta` field or not. Defaults to `True` to be backward-compatible with Haystack 1.x.
+        :param binary: Whether to keep the `blob` data as raw bytes, the `embedding` as a compact `Embedding` and to
+                       convert the `dataframe` to Parquet bytes instead of JSON. Parquet is only used if pyarrow is
+                       installed and the DataFrame can be stored as Parquet, otherwise the DataFrame is still converted
+                       to JSON. The result isn't JSON-serializable, but it can be pickled or converted back with
+                       `from_dict()`.
         """
-        data = asdict(self)
-        if (dataframe := data.get("dataframe")) is not None:
-            data["dataframe"] = dataframe.to_json()
-        if (blob := data.get("blob")) is not None:
-            data["blob"] = {"data": list(blob["data"]), "mime_type": blob["mime_type"]}
+        data = {f.name: getattr(self, f.name) for f in fields(self)}
+        if (embedding := data["embedding"]) is not None and not binary:
+            data["embedding"] = embedding.tolist()
+        if (dataframe := data["dataframe"]) is not None:
+            data["dataframe"] = self._dataframe_to_parquet(dataframe) if binary else None
+            if data["dataframe"] is None:
+                data["dataframe"] = dataframe.to_json()
+        if (blob := data["blob"]) is not None:
+            data["blob"] = {
+                "data": blob.data if binary else base64.b64encode(blob.data).decode("ascii"),
+                "mime_type": blob.mime_type,
+            }
 
+        meta = data.pop("meta")
         if flatten:
-            meta = data.pop("meta")
             return {**data, **meta}
+        return {**data, "meta": dict(meta)}
 
-        return data
+    @staticmethod
+    def _dataframe_to_parquet(dataframe: pandas.DataFrame) -> Optional[bytes]:
+        """
+        Converts the DataFrame to Parquet bytes. Returns `None` if this isn't possible.
+        """
+        if not _parquet_available():
+            return None
+        try:
+            return dataframe.to_parquet()
+        except (ImportError, ValueError) as e:
+            logger.debug("Can't convert the DataFrame to Parquet, falling back to JSON. Error: %s", e)
+            return None
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Document":
         """
         Creates a new Document object from a dictionary.
-        `dataframe` and `blob` fields are converted to their original types.
+        `dataframe` and `blob` fields are converted to their original types. The `dataframe` can be JSON or Parquet
+        bytes and the `blob` data a base64 string, raw bytes, or a list of integers as created by earlier versions.
         """
+        data = dict(data)
         if (dataframe := data.get("dataframe")) is not None:
-            data["dataframe"] = pandas.read_json(io.StringIO(dataframe))
+            if isinstance(dataframe, (bytes, bytearray, memoryview)):
+                data["dataframe"] = pandas.read_parquet(io.BytesIO(dataframe))
+            else:
+                data["dataframe"] = pandas.read_json(io.StringIO(dataframe))
         if blob := data.get("blob"):
-            data["blob"] = ByteStream(data=bytes(blob["data"]), mime_type=blob["mime_type"])
+            blob_data = blob["data"]
+            if isinstance(blob_data, str):
+                blob_data = base64.b64decode(blob_data)
+            data["blob"] = ByteStream(data=bytes(blob_data), mime_type=blob["mime_type"])
         return cls(**data)
 
     @property
@@ -215,7 +215,22 @@ class InMemoryDocumentStore:
         :param scale_score: Whether to scale the scores of the retrieved documents. Default is True.
         :return: A list of the top_k documents most relevant to the query.
         """
-        if not query:
+        return self.bm25_retrieval_batch(queries=[query], filters=filters, top_k=top_k, scale_score=scale_score)[0]
+
+    def bm25_retrieval_batch(
+        self, queries: List[str], filters: Optional[Dict[str, Any]] = None, top_k: int = 10, scale_score: bool = True
+    ) -> List[List[Document]]:
+        """
+        Retrieves documents that are most relevant to each of the queries using BM25 algorithm.
+        The documents are filtered and tokenized only once for all queries.
+
+        :param queries: The query strings.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents to retrieve for each query. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved documents. Default is True.
+        :return: A list with the top_k documents most relevant to each query.
+        """
+        if any(not query for query in queries):
             raise ValueError("Query should be a non-empty string")
 
         content_type_filter = {"$or": {"content": {"$not": None}, "dataframe": {"$not": None}}}
@@ -251,28 +266,24 @@ class InMemoryDocumentStore:
         ]
         if len(tokenized_corpus) == 0:
             logger.info("No documents found for BM25 retrieval. Returning empty list.")
-            return []
+            return [[] for _ in queries]
 
         # initialize BM25
         bm25_scorer = self.bm25_algorithm(tokenized_corpus, **self.bm25_parameters)
-        # tokenize query
-        tokenized_query = self.tokenizer(query.lower())
-        # get scores for the query against the corpus
-        docs_scores = bm25_scorer.get_scores(tokenized_query)
-        if scale_score:
-            docs_scores = [expit(float(score / BM25_SCALING_FACTOR)) for score in docs_scores]
-        # get the last top_k indexes and reverse them
-        top_docs_positions = np.argsort(docs_scores)[-top_k:][::-1]
-
-        # Create documents with the BM25 score to return them
-        return_documents = []
-        for i in top_docs_positions:
-            doc = all_documents[i]
-            doc_fields = doc.to_dict()
-            doc_fields["score"] = docs_scores[i]
-            return_document = Document.from_dict(doc_fields)
-            return_documents.append(return_document)
-        return return_documents
+        results = []
+        for query in queries:
+            # tokenize query
+            tokenized_query = self.tokenizer(query.lower())
+            # get scores for the query against the corpus
+            docs_scores = bm25_scorer.get_scores(tokenized_query)
+            if scale_score:
+                docs_scores = [expit(float(score / BM25_SCALING_FACTOR)) for score in docs_scores]
+            # get the last top_k indexes and reverse them
+            top_docs_positions = np.argsort(docs_scores)[-top_k:][::-1]
+
+            # Create documents with the BM25 score to return them
+            results.append([all_documents[i].copy_with(score=docs_scores[i]) for i in top_docs_positions])
+        return results
 
     def embedding_retrieval(
         self,
@@ -292,8 +303,36 @@ class InMemoryDocumentStore:
         :param return_embedding: Whether to return the embedding of the retrieved Documents. Default is False.
         :return: A list of the top_k documents most relevant to the query.
         """
-        if len(query_embedding) == 0 or not isinstance(query_embedding[0], float):
-            raise ValueError("query_embedding should be a non-empty list of floats.")
+        return self.embedding_retrieval_batch(
+            query_embeddings=[query_embedding],
+            filters=filters,
+            top_k=top_k,
+            scale_score=scale_score,
+            return_embedding=return_embedding,
+        )[0]
+
+    def embedding_retrieval_batch(
+        self,
+        query_embeddings: List[List[float]],
+        filters: Optional[Dict[str, Any]] = None,
+        top_k: int = 10,
+        scale_score: bool = True,
+        return_embedding: bool = False,
+    ) -> List[List[Document]]:
+        """
+        Retrieves documents that are most similar to each of the query embeddings using a vector similarity metric.
+        The similarities of all queries are computed with a single matrix product.
+
+        :param query_embeddings: Embeddings of the queries.
+        :param filters: A dictionary with filters to narrow down the search space.
+        :param top_k: The number of top documents to retrieve for each query. Default is 10.
+        :param scale_score: Whether to scale the scores of the retrieved Documents. Default is True.
+        :param return_embedding: Whether to return the embedding of the retrieved Documents. Default is False.
+        :return: A list with the top_k documents most relevant to each query.
+        """
+        for query_embedding in query_embeddings:
+            if len(query_embedding) == 0 or not isinstance(query_embedding[0], float):
+                raise ValueError("query_embedding should be a non-empty list of floats.")
 
         filters = filters or {}
         all_documents = self.filter_documents(filters=filters)
@@ -304,27 +343,28 @@ class InMemoryDocumentStore:
                 "No Documents found with embeddings. Returning empty list. "
                 "To generate embeddings, use a DocumentEmbedder."
             )
-            return []
+            return [[] for _ in query_embeddings]
         elif len(documents_with_embeddings) < len(all_documents):
             logger.info(
                 "Skipping some Documents that don't have an embedding. "
                 "To generate embeddings, use a DocumentEmbedder."
             )
 
-        scores = self._compute_query_embedding_similarity_scores(
-            embedding=query_embedding, documents=documents_with_embeddings, scale_score=scale_score
+        scores = self._compute_query_embeddings_similarity_scores(
+            embeddings=query_embeddings, documents=documents_with_embeddings, scale_score=scale_score
         )
 
-        # create Documents with the similarity score for the top k results
-        top_documents = []
-        for doc, score in sorted(zip(documents_with_embeddings, scores), key=lambda x: x[1], reverse=True)[:top_k]:
-            doc_fields = doc.to_dict()
-            doc_fields["score"] = score
-            if return_embedding is False:
-                doc_fields["embedding"] = None
-            top_documents.append(Document(**doc_fields))
+        # create Documents with the similarity score for the top k results of each query
+        results = []
+        for query_scores in scores:
+            top_documents = []
+            for doc, score in sorted(zip(documents_with_embeddings, query_scores), key=lambda x: x[1], reverse=True)[
+                :top_k
+            ]:
+                top_documents.append(doc.copy_with(score=score, embedding=doc.embedding if return_embedding else None))
+            results.append(top_documents)
 
-        return top_documents
+        return results
 
     def _compute_query_embedding_similarity_scores(
         self, embedding: List[float], documents: List[Document], scale_score: bool = True
@@ -337,10 +377,22 @@ class InMemoryDocumentStore:
         :param scale_score: Whether to scale the scores of the Documents. Default is True.
         :return: A list of scores.
         """
+        return self._compute_query_embeddings_similarity_scores(
+            embeddings=[embedding], documents=documents, scale_score=scale_score
+        )[0]
 
-        query_embedding = np.array(embedding)
-        if query_embedding.ndim == 1:
-            query_embedding = np.expand_dims(a=query_embedding, axis=0)
+    def _compute_query_embeddings_similarity_scores(
+        self, embeddings: List[List[float]], documents: List[Document], scale_score: bool = True
+    ) -> List[List[float]]:
+        """
+        Computes the similarity scores between the embeddings of several queries and the embeddings of the documents.
+
+        :param embeddings: Embeddings of the queries.
+        :param documents: A list of Documents.
+        :param scale_score: Whether to scale the scores of the Documents. Default is True.
+        :return: A list with the scores of the Documents for each query.
+        """
+        query_embedding = np.array(embeddings, dtype=np.float64)
 
         try:
             document_embeddings = np.array([doc.embedding for doc in documents])
@@ -360,7 +412,7 @@ class InMemoryDocumentStore:
             document_embeddings /= np.linalg.norm(x=document_embeddings, axis=1, keepdims=True)
 
         try:
-            scores = np.dot(a=query_embedding, b=document_embeddings.T)[0].tolist()
+            scores = np.dot(a=query_embedding, b=document_embeddings.T)
         except ValueError as e:
             if "shapes" in str(e) and "not aligned" in str(e):
                 raise DocumentStoreError(
@@ -371,8 +423,8 @@ class InMemoryDocumentStore:
 
         if scale_score:
             if self.embedding_similarity_function == "dot_product":
-                scores = [expit(float(score / DOT_PRODUCT_SCALING_FACTOR)) for score in scores]
+                scores = expit(scores / DOT_PRODUCT_SCALING_FACTOR)
             elif self.embedding_similarity_function == "cosine":
-                scores = [(score + 1) / 2 for score in scores]
+                scores = (scores + 1) / 2
 
-        return scores
+        return scores.tolist()
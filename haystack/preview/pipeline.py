@@ -1,8 +1,17 @@
-from typing import Any, Dict, Optional, Union, TextIO
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union, TextIO
+from collections import OrderedDict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
 from pathlib import Path
+import bisect
 import datetime
 import logging
+import time
+import weakref
+
 import canals
+import networkx
+from canals.errors import PipelineRuntimeError
+from canals.pipeline.validation import validate_pipeline_input
 
 from haystack.preview.telemetry import pipeline_running
 from haystack.preview.marshal import Marshaller, YamlMarshaller
@@ -31,21 +40,314 @@ class Pipeline(canals.Pipeline):
         """
         self._telemetry_runs = 0
         self._last_telemetry_sent: Optional[datetime.datetime] = None
+        # Tracked by name and identity, as components don't have to be hashable
+        self._warmed_up: Dict[str, "weakref.ref[Any]"] = {}
+        self.warm_up_report: Dict[str, float] = {}
         super().__init__(metadata=metadata, max_loops_allowed=max_loops_allowed, debug_path=debug_path)
 
-    def run(self, data: Dict[str, Any], debug: bool = False) -> Dict[str, Any]:
+    def warm_up(self, max_workers: Optional[int] = None):
+        """
+        Warms up the components, for example loading their models. Components are warmed up in parallel threads, so
+        that loading several models takes about as long as loading the slowest of them. Components that were already
+        warmed up by this Pipeline are skipped.
+
+        How many seconds each component took to warm up is stored in `warm_up_report`.
+
+        :params max_workers: how many components can warm up at the same time. Defaults to all of them, up to 8.
+        """
+        to_warm_up = [
+            (name, self.graph.nodes[name]["instance"])
+            for name in self.graph.nodes
+            if hasattr(self.graph.nodes[name]["instance"], "warm_up")
+            and not self._is_warmed_up(name, self.graph.nodes[name]["instance"])
+        ]
+        if not to_warm_up:
+            return
+
+        def warm_up_component(name: str, instance: Any) -> float:
+            logger.info("Warming up component %s...", name)
+            start = time.perf_counter()
+            instance.warm_up()
+            return time.perf_counter() - start
+
+        max_workers = min(max_workers or 8, len(to_warm_up))
+        if max_workers == 1:
+            durations = [warm_up_component(name, instance) for name, instance in to_warm_up]
+        else:
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="warm_up") as executor:
+                futures = [executor.submit(warm_up_component, name, instance) for name, instance in to_warm_up]
+                # Results are collected in order, so the first failing component is always the same
+                durations = [future.result() for future in futures]
+
+        for (name, instance), duration in zip(to_warm_up, durations):
+            self._warmed_up[name] = weakref.ref(instance)
+            self.warm_up_report[name] = duration
+        logger.info(
+            "Warm-up times: %s",
+            ", ".join(
+                f"{name} {duration:.2f}s"
+                for name, duration in sorted(self.warm_up_report.items(), key=lambda item: -item[1])
+            ),
+        )
+
+    def _is_warmed_up(self, name: str, instance: Any) -> bool:
+        # The instance is compared too, in case the component was replaced by another one with the same name
+        warmed_up = self._warmed_up.get(name)
+        return warmed_up is not None and warmed_up() is instance
+
+    def run(self, data: Dict[str, Any], debug: bool = False, max_concurrency: int = 1) -> Dict[str, Any]:
         """
         Runs the pipeline.
 
         :params data: the inputs to give to the input components of the Pipeline.
         :params debug: whether to collect and return debug information.
+        :params max_concurrency: how many components can run at the same time. With a value greater than 1, each
+            component starts on a thread pool as soon as its inputs are ready, so independent branches, like two
+            retrievers feeding a joiner, take as long as the slowest of them. Variadic inputs, like the documents of a
+            joiner, receive their values in the topological order of the components that sent them, whichever
+            finished first. Pipelines with loops and debug runs are always executed sequentially.
 
         :returns: A dictionary with the outputs of the output components of the Pipeline.
 
         :raises PipelineRuntimeError: if the any of the components fail or return unexpected output.
         """
         pipeline_running(self)
-        return super().run(data=data, debug=debug)
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}.")
+        if max_concurrency == 1 or debug or not networkx.is_directed_acyclic_graph(self.graph):
+            return super().run(data=data, debug=debug)
+        return self._run_concurrently(data=data, max_concurrency=max_concurrency)
+
+    def _run_concurrently(self, data: Dict[str, Any], max_concurrency: int) -> Dict[str, Any]:
+        """
+        Runs the pipeline on a thread pool, starting each component as soon as its inputs are ready instead of waiting
+        for the other running components to finish. A component is only considered once none of its upstream
+        components is running, so that it has received their outputs when it's decided whether it runs, waits, or is
+        skipped, as in the sequential `run()`. Variadic inputs receive their values in the topological order of the
+        components that sent them, not in the order they finished.
+        """
+        data = validate_pipeline_input(self.graph, input_values=data)
+
+        logger.info("Pipeline execution started.")
+        inputs_buffer = self._prepare_inputs_buffer(data)
+        pipeline_output: Dict[str, Dict[str, Any]] = {}
+        self._clear_visits_count()
+        self.warm_up()
+        self.debug = {}
+
+        insertion_order = {name: index for index, name in enumerate(self.graph.nodes)}
+        topological_order = {
+            name: index
+            for index, name in enumerate(networkx.lexicographical_topological_sort(self.graph, key=insertion_order.get))
+        }
+        ancestors = {name: networkx.ancestors(self.graph, name) for name in self.graph.nodes}
+        # The topological order of the senders of the values of each variadic input, in the same order as the values
+        variadic_senders: Dict[Tuple[str, str], List[int]] = {}
+        running: Dict[Future, str] = {}
+
+        with ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix="pipeline") as executor:
+            try:
+                while inputs_buffer or running:
+                    logger.debug("> Queue: %s", {k: list(v.keys()) for k, v in inputs_buffer.items()})
+                    running_names = set(running.values())
+                    ready = self._collect_ready_components(
+                        inputs_buffer,
+                        is_blocked=lambda name: not ancestors[name].isdisjoint(running_names),
+                        can_wait=bool(running),
+                    )
+                    for name, inputs in ready:
+                        running[executor.submit(self._run_component, name=name, inputs=inputs)] = name
+                    if not running:
+                        continue
+
+                    done, _ = wait(running, return_when=FIRST_COMPLETED)
+                    # Components that finished together are routed in topological order, so the first failing
+                    # component is always the same
+                    for future in sorted(done, key=lambda future: topological_order[running[future]]):
+                        component_name = running.pop(future)
+                        output = future.result()
+                        if not self.graph.out_edges(component_name):
+                            pipeline_output[component_name] = output
+                        else:
+                            inputs_buffer = self._route_output_in_order(
+                                node_results=output,
+                                node_name=component_name,
+                                inputs_buffer=inputs_buffer,
+                                topological_order=topological_order,
+                                variadic_senders=variadic_senders,
+                            )
+            except BaseException:
+                for future in running:
+                    future.cancel()
+                raise
+
+        logger.info("Pipeline executed successfully.")
+        return pipeline_output
+
+    def _collect_ready_components(
+        self, inputs_buffer: OrderedDict, is_blocked: Callable[[str], bool], can_wait: bool
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Pops all components that are ready to run from the inputs buffer, in FIFO order.
+        Blocked components, whose upstream components are still running, are left in the buffer without being
+        considered. Waiting components are put back at the end of the buffer and skipped ones are handled as in `run()`.
+
+        :params is_blocked: whether a component must not be considered yet.
+        :params can_wait: whether running components can still send inputs to the waiting ones.
+        """
+        ready: List[Tuple[str, Dict[str, Any]]] = []
+        queued = len(inputs_buffer)
+        waiting = 0
+        for _ in range(queued):
+            component_name, inputs = inputs_buffer.popitem(last=False)  # FIFO
+            if is_blocked(component_name):
+                inputs_buffer[component_name] = inputs
+                continue
+            self._check_max_loops(component_name)
+
+            action = self._calculate_action(name=component_name, inputs=inputs, inputs_buffer=inputs_buffer)
+            if action == "wait":
+                inputs_buffer[component_name] = inputs
+                waiting += 1
+            elif action == "skip":
+                self.graph.nodes[component_name]["visits"] += 1
+                inputs_buffer = self._skip_downstream_unvisited_nodes(
+                    component_name=component_name, inputs_buffer=inputs_buffer
+                )
+            elif action == "run":
+                ready.append((component_name, inputs))
+
+        if queued and waiting == queued and not can_wait:
+            raise PipelineRuntimeError(
+                f"{list(inputs_buffer.keys())} are stuck waiting for input, but there are no other components to run."
+            )
+        return ready
+
+    def _route_output_in_order(
+        self,
+        node_name: str,
+        node_results: Dict[str, Any],
+        inputs_buffer: OrderedDict,
+        topological_order: Dict[str, int],
+        variadic_senders: Dict[Tuple[str, str], List[int]],
+    ) -> OrderedDict:
+        """
+        Routes the outputs of the component like `_route_output()`, then moves the values it appended to variadic
+        inputs to their place in the topological order of the senders.
+        """
+        inputs_buffer = self._route_output(node_results=node_results, node_name=node_name, inputs_buffer=inputs_buffer)
+        appended: Dict[Tuple[str, str], int] = {}
+        for _, target_node, edge_data in self.graph.out_edges(node_name, data=True):
+            to_socket = edge_data["to_socket"]
+            if to_socket.is_variadic and node_results.get(edge_data["from_socket"].name) is not None:
+                appended[(target_node, to_socket.name)] = appended.get((target_node, to_socket.name), 0) + 1
+
+        for (target_node, socket_name), count in appended.items():
+            values = inputs_buffer[target_node][socket_name]
+            # Values that were there before any component sent one are pipeline inputs, they stay first
+            senders = variadic_senders.setdefault((target_node, socket_name), [-1] * (len(values) - count))
+            position = bisect.bisect_right(senders, topological_order[node_name])
+            senders[position:position] = [topological_order[node_name]] * count
+            new_values = values[-count:]
+            del values[-count:]
+            values[position:position] = new_values
+        return inputs_buffer
+
+    def run_batch(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Runs the pipeline on a batch of inputs.
+
+        Components that implement a `run_batch()` method receive all the batch items they have to process at once.
+        `run_batch()` takes the same parameters as `run()`, each as a list with one value per batch item (`None` for
+        the optional inputs an item didn't receive), and returns a dictionary with the same outputs as `run()`, each
+        as a list with one value per batch item. The other components are run once per batch item.
+
+        Components are run in topological order, in the order they were added to the pipeline when there's a choice.
+        Pipelines with loops are run with `run()` for each batch item.
+
+        :params data: the inputs of each batch item, in the same format as the inputs of `run()`.
+
+        :returns: A list with a dictionary with the outputs of the output components for each batch item.
+
+        :raises PipelineRuntimeError: if the any of the components fail or return unexpected output.
+        """
+        pipeline_running(self)
+        if not networkx.is_directed_acyclic_graph(self.graph):
+            return [super().run(data=item_data) for item_data in data]
+
+        data = [validate_pipeline_input(self.graph, input_values=item_data) for item_data in data]
+        logger.info("Pipeline batch execution started.")
+        # The inputs of each component for each batch item. A component is present if it was reached for that item.
+        inputs_buffers = [self._prepare_inputs_buffer(item_data) for item_data in data]
+        pipeline_outputs: List[Dict[str, Dict[str, Any]]] = [{} for _ in data]
+        self._clear_visits_count()
+        self.warm_up()
+
+        insertion_order = {name: index for index, name in enumerate(self.graph.nodes)}
+        for component_name in networkx.lexicographical_topological_sort(self.graph, key=insertion_order.get):
+            mandatory_sockets = {
+                socket.name
+                for socket in self.graph.nodes[component_name]["input_sockets"].values()
+                if not socket.is_optional
+            }
+            ready_items = []
+            for index, inputs_buffer in enumerate(inputs_buffers):
+                if component_name not in inputs_buffer:
+                    continue
+                if mandatory_sockets.issubset(inputs_buffer[component_name]):
+                    ready_items.append(index)
+                else:
+                    # The component is on a skipped branch for this item, so the components downstream are too
+                    self._route_output(node_name=component_name, node_results={}, inputs_buffer=inputs_buffer)
+            if not ready_items:
+                continue
+
+            outputs = self._run_component_batch(
+                name=component_name, inputs=[inputs_buffers[index].pop(component_name) for index in ready_items]
+            )
+            for index, output in zip(ready_items, outputs):
+                if not self.graph.out_edges(component_name):
+                    pipeline_outputs[index][component_name] = output
+                else:
+                    self._route_output(
+                        node_results=output, node_name=component_name, inputs_buffer=inputs_buffers[index]
+                    )
+
+        logger.info("Pipeline batch executed successfully.")
+        return pipeline_outputs
+
+    def _run_component_batch(self, name: str, inputs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Runs the component on the inputs of several batch items, with a single call to its `run_batch()` method if it
+        has one, and returns the outputs of each item.
+        """
+        instance = self.graph.nodes[name]["instance"]
+        if not hasattr(instance, "run_batch"):
+            return [self._run_component(name=name, inputs=item_inputs) for item_inputs in inputs]
+
+        self.graph.nodes[name]["visits"] += 1
+        socket_names = [
+            socket for socket in self.graph.nodes[name]["input_sockets"] if any(socket in i for i in inputs)
+        ]
+        batched_inputs = {socket: [item_inputs.get(socket) for item_inputs in inputs] for socket in socket_names}
+        try:
+            logger.info("* Running %s on a batch of %s items", name, len(inputs))
+            batched_outputs = instance.run_batch(**batched_inputs)
+        except Exception as e:
+            raise PipelineRuntimeError(
+                f"{name} raised '{e.__class__.__name__}: {e}' \nInputs: {batched_inputs}\n\n"
+                "See the stacktrace above for more information."
+            ) from e
+
+        if not isinstance(batched_outputs, dict) or any(
+            not isinstance(values, list) or len(values) != len(inputs) for values in batched_outputs.values()
+        ):
+            raise PipelineRuntimeError(
+                f"Component '{name}' returned an unexpected value from run_batch(). "
+                f"Components must return a dictionary with a list of {len(inputs)} values for each output."
+            )
+
+        return [{output: values[i] for output, values in batched_outputs.items()} for i in range(len(inputs))]
 
     def dumps(self, marshaller: Marshaller = DEFAULT_MARSHALLER) -> str:
         """
@@ -1,3 +1,8 @@
 from haystack.preview.utils.expit import expit
 from haystack.preview.utils.requests_utils import request_with_retry
 from haystack.preview.utils.filters import document_matches_filter
+from haystack.preview.utils.batching import group_batch_items
+from haystack.preview.utils.parallel import isolated_map
+from haystack.preview.utils.openai_requests import OpenAIRequestRunner
+from haystack.preview.utils.model_registry import ModelKey, ModelRegistry, model_registry
+from haystack.inference_precision import apply_inference_precision, validate_inference_precision
@@ -0,0 +1,21 @@
+from typing import Any, List, Tuple
+
+
+def group_batch_items(*parameters: List[Any]) -> List[Tuple[Tuple[Any, ...], List[int]]]:
+    """
+    Groups the items of a batch that share the same parameter values, so that each group can be processed at once.
+    The values are compared with `==`, so they don't need to be hashable, like filter dictionaries.
+
+    :param parameters: Lists with one value per batch item for each parameter.
+    :return: A list of groups in order of first appearance, each with the shared parameter values and the indices of
+        the batch items that use them.
+    """
+    groups: List[Tuple[Tuple[Any, ...], List[int]]] = []
+    for index, values in enumerate(zip(*parameters)):
+        for group_values, indices in groups:
+            if group_values == values:
+                indices.append(index)
+                break
+        else:
+            groups.append((values, [index]))
+    return groups
@@ -1,4 +1,5 @@
 from typing import List, Any, Union, Dict
+from dataclasses import fields
 from datetime import datetime
 
 import numpy as np
@@ -54,6 +55,14 @@ def or_operation(conditions: List[Any], document: Document, _current_key: str):
     )
 
 
+def _document_fields(document: Document) -> Dict[str, Any]:
+    """
+    Returns the fields of the Document with a flattened `meta`, like `Document.to_dict()` but without converting the
+    values, as the comparisons handle DataFrames themselves.
+    """
+    return {**{f.name: getattr(document, f.name) for f in fields(document) if f.name != "meta"}, **document.meta}
+
+
 def _safe_eq(first: Any, second: Any) -> bool:
     """
     Compares objects for equality, even np.ndarrays and pandas DataFrames.
@@ -258,7 +267,7 @@ def document_matches_filter(conditions: Union[Dict, List], document: Document, _
                     "Filters can't start with an operator like $eq and $in. You have to specify the field name first. "
                     "See the examples in the documentation."
                 )
-            return OPERATORS[field_key](fields=document.to_dict(), field_name=_current_key, value=field_value)
+            return OPERATORS[field_key](fields=_document_fields(document), field_name=_current_key, value=field_value)
 
         # Otherwise fall back to the defaults
         conditions = _list_conditions(field_value)
@@ -271,11 +280,11 @@ def document_matches_filter(conditions: Union[Dict, List], document: Document, _
             return and_operation(conditions=_list_conditions(conditions), document=document, _current_key=_current_key)
         else:
             # The default operator for a {key: [value1, value2]} filter is $in
-            return in_operation(fields=document.to_dict(), field_name=_current_key, value=conditions)
+            return in_operation(fields=_document_fields(document), field_name=_current_key, value=conditions)
 
     if _current_key:
         # The default operator for a {key: value} filter is $eq
-        return eq_operation(fields=document.to_dict(), field_name=_current_key, value=conditions)
+        return eq_operation(fields=_document_fields(document), field_name=_current_key, value=conditions)
 
     raise FilterError("Filters must be dictionaries or lists. See the examples in the documentation.")
 
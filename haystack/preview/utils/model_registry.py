@@ -0,0 +1,147 @@
+import logging
+import threading
+import time
+import weakref
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Loading options that don't change the loaded weights, so components that only differ in them share a model
+_IGNORED_OPTIONS = {"token", "use_auth_token"}
+
+
+@dataclass(frozen=True)
+class ModelKey:
+    """
+    Identifies a loaded model in the ModelRegistry. Models are only shared between components if all the fields match.
+
+    :param kind: What is loaded, for example `"question-answering"` or `"whisper"`. Different kinds of models loaded
+        from the same checkpoint are not interchangeable.
+    :param model: The name or path of the model.
+    :param device: The device the model is loaded on.
+    :param dtype: The data type of the weights.
+    :param revision: The revision of the model.
+    :param options: The other loading options, as a string.
+    """
+
+    kind: str
+    model: str
+    device: Optional[str] = None
+    dtype: Optional[str] = None
+    revision: Optional[str] = None
+    options: str = ""
+
+    @classmethod
+    def from_kwargs(cls, kind: str, model: Any, device: Any = None, **kwargs) -> "ModelKey":
+        """
+        Builds the key of a model from the keyword arguments it's loaded with. `torch_dtype` and `revision` are taken
+        from them, and the other arguments, except the authentication token, become the options.
+        """
+        options = {name: value for name, value in kwargs.items() if name not in _IGNORED_OPTIONS}
+        dtype = options.pop("torch_dtype", None)
+        revision = options.pop("revision", None)
+        return cls(
+            kind=kind,
+            model=str(model),
+            device=str(device) if device is not None else None,
+            dtype=str(dtype) if dtype is not None else None,
+            revision=revision,
+            options=repr(sorted(options.items())) if options else "",
+        )
+
+
+class _RegistryEntry:
+    def __init__(self):
+        self.model: Any = None
+        self.loaded = False
+        self.ref_count = 0
+        self.load_seconds = 0.0
+        self.lock = threading.Lock()
+
+
+class ModelRegistry:
+    """
+    Process-wide cache of loaded models, so that components using the same model share its weights instead of loading
+    their own copy.
+
+    Each model is loaded once by the first component that asks for it. The registry counts the components that hold
+    it and drops the model once all of them are garbage collected. Different models can be loaded by several threads
+    at the same time, while concurrent requests for the same model wait for it to be loaded once.
+
+    Components must not modify the models they get from the registry, as they're shared.
+    """
+
+    def __init__(self):
+        self._entries: Dict[ModelKey, _RegistryEntry] = {}
+        self._lock = threading.Lock()
+
+    def acquire(self, owner: Any, key: ModelKey, loader: Callable[[], T]) -> T:
+        """
+        Returns the model for `key`, loading it with `loader` if no other component holds it.
+
+        :param owner: The component the model is for. The model is released when `owner` is garbage collected.
+        :param key: The key of the model.
+        :param loader: A function loading the model, called only if the model isn't loaded yet.
+        :return: The shared model.
+        """
+        with self._lock:
+            entry = self._entries.setdefault(key, _RegistryEntry())
+            entry.ref_count += 1
+
+        try:
+            with entry.lock:
+                if not entry.loaded:
+                    start = time.perf_counter()
+                    entry.model = loader()
+                    entry.load_seconds = time.perf_counter() - start
+                    entry.loaded = True
+                    logger.debug("Loaded model %s in %.2f seconds.", key, entry.load_seconds)
+                else:
+                    logger.debug("Reusing the already loaded model %s.", key)
+        except Exception:
+            self.release(key)
+            raise
+
+        weakref.finalize(owner, self.release, key)
+        return entry.model
+
+    def release(self, key: ModelKey):
+        """
+        Releases a reference to the model for `key`. The model is dropped from the registry once nothing holds it.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            entry.ref_count -= 1
+            if entry.ref_count <= 0:
+                del self._entries[key]
+
+    def ref_count(self, key: ModelKey) -> int:
+        """
+        Returns the number of components holding the model for `key`.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry.ref_count if entry is not None else 0
+
+    def report(self) -> List[Dict[str, Any]]:
+        """
+        Lists the loaded models, with how long they took to load and how many components hold them, slowest first.
+        """
+        with self._lock:
+            entries = [(key, entry) for key, entry in self._entries.items() if entry.loaded]
+        return sorted(
+            [
+                {"model": key, "load_seconds": entry.load_seconds, "ref_count": entry.ref_count}
+                for key, entry in entries
+            ],
+            key=lambda row: row["load_seconds"],
+            reverse=True,
+        )
+
+
+model_registry = ModelRegistry()
@@ -0,0 +1,250 @@
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence, Tuple
+
+import aiohttp
+import openai
+
+logger = logging.getLogger(__name__)
+
+
+# Errors after which the same request may succeed if it's sent again later
+RETRYABLE_ERRORS = (
+    openai.error.RateLimitError,
+    openai.error.ServiceUnavailableError,
+    openai.error.APIConnectionError,
+    openai.error.Timeout,
+    openai.error.TryAgain,
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Roughly estimates the number of tokens of a text for rate limiting, without loading a tokenizer. English text
+    averages about four characters per token.
+    """
+    return len(text) // 4 + 1
+
+
+def estimate_chat_tokens(messages: List[Dict[str, Any]], generation_kwargs: Dict[str, Any]) -> int:
+    """
+    Roughly estimates the number of tokens a chat completion request counts against the rate limit: the tokens of
+    the messages plus the maximum number of tokens to generate for each of the `n` completions.
+    """
+    prompt_tokens = sum(estimate_tokens(str(message.get("content") or "")) for message in messages)
+    return prompt_tokens + generation_kwargs.get("max_tokens", 0) * generation_kwargs.get("n", 1)
+
+
+class RateLimiter:
+    """
+    Limits how much of a resource, like requests or tokens, is used per minute. It works as a token bucket that holds
+    at most one minute worth of the limit and refills continuously.
+
+    Must only be used from within a single event loop.
+    """
+
+    def __init__(self, limit_per_minute: int):
+        if limit_per_minute < 1:
+            raise ValueError(f"The limit per minute must be at least 1, got {limit_per_minute}.")
+        self.limit_per_minute = limit_per_minute
+        self._available = float(limit_per_minute)
+        self._last_refill = time.monotonic()
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def acquire(self, amount: int = 1):
+        """
+        Waits until `amount` can be used without exceeding the limit. Callers are served in order, so that a large
+        amount isn't starved by many small ones. Amounts larger than the limit are capped to it, as they could never
+        be acquired otherwise.
+        """
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        amount = min(amount, self.limit_per_minute)
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                refill = (now - self._last_refill) * self.limit_per_minute / 60
+                self._available = min(self._available + refill, self.limit_per_minute)
+                self._last_refill = now
+                if self._available >= amount:
+                    self._available -= amount
+                    return
+                await asyncio.sleep((amount - self._available) * 60 / self.limit_per_minute)
+
+
+class OpenAIRequestRunner:
+    """
+    Sends requests to the OpenAI API concurrently while respecting the rate limits of the account.
+
+    The requests run on an event loop in a background thread, which is shared by all the calls of `run`, also from
+    different threads. At most `max_concurrent_requests` requests are in flight at any time, and the number of requests
+    and tokens sent per minute is limited. Requests that fail with a rate limit or a transient error are retried with
+    an exponential backoff.
+
+    Usage example:
+    ```python
+    import openai
+    from haystack.preview.utils import OpenAIRequestRunner
+
+    runner = OpenAIRequestRunner(max_concurrent_requests=8, requests_per_minute=3000)
+    responses = runner.run(
+        [lambda text=text: openai.Embedding.acreate(model="text-embedding-ada-002", input=text) for text in texts]
+    )
+    ```
+    """
+
+    def __init__(
+        self,
+        max_concurrent_requests: int = 4,
+        requests_per_minute: Optional[int] = None,
+        tokens_per_minute: Optional[int] = None,
+        max_retries: int = 5,
+        initial_backoff: float = 1.0,
+        max_backoff: float = 60.0,
+    ):
+        """
+        :param max_concurrent_requests: The maximum number of requests in flight at the same time.
+        :param requests_per_minute: The maximum number of requests to send per minute. `None` means no limit.
+        :param tokens_per_minute: The maximum number of tokens to send per minute. `None` means no limit.
+        :param max_retries: How many times a request is retried after a rate limit or a transient error.
+        :param initial_backoff: Seconds to wait before the first retry. The wait doubles with every retry, unless the
+            API tells how long to wait.
+        :param max_backoff: The maximum number of seconds to wait before a retry.
+        """
+        if max_concurrent_requests < 1:
+            raise ValueError(f"max_concurrent_requests must be at least 1, got {max_concurrent_requests}.")
+        self.max_concurrent_requests = max_concurrent_requests
+        self.max_retries = max_retries
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self._request_limiter = RateLimiter(requests_per_minute) if requests_per_minute else None
+        self._token_limiter = RateLimiter(tokens_per_minute) if tokens_per_minute else None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._lock = threading.Lock()
+
+    def run(
+        self,
+        requests: Sequence[Callable[[], Awaitable[Any]]],
+        tokens: Optional[Sequence[int]] = None,
+        callback: Optional[Callable[[int, Any], None]] = None,
+    ) -> List[Any]:
+        """
+        Sends the requests and blocks until all of them are done.
+
+        :param requests: Functions that create the coroutine of each request, like
+            `lambda: openai.Embedding.acreate(...)`. They're called again for every retry.
+        :param tokens: The estimated number of tokens of each request, for the tokens per minute limit.
+        :param callback: Called with the index and the response of each request as soon as it's done.
+        :return: The responses in the order of `requests`. If a request fails for good, its error is raised and the
+            remaining requests are cancelled.
+        """
+        if not requests:
+            return []
+        with self._lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(target=self._loop.run_forever, name="OpenAIRequestRunner", daemon=True).start()
+        coroutine = self._run(requests, tokens or [0] * len(requests), callback)
+        return asyncio.run_coroutine_threadsafe(coroutine, self._loop).result()
+
+    async def _run(
+        self,
+        requests: Sequence[Callable[[], Awaitable[Any]]],
+        tokens: Sequence[int],
+        callback: Optional[Callable[[int, Any], None]],
+    ) -> List[Any]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrent_requests)
+        responses: List[Any] = [None] * len(requests)
+        # The workers take the next request from a shared iterator, so that no more coroutines than workers exist
+        # at a time, no matter how many requests there are
+        indices = iter(range(len(requests)))
+
+        async def worker():
+            for index in indices:
+                responses[index] = await self._send(requests[index], tokens[index])
+                if callback is not None:
+                    callback(index, responses[index])
+
+        # A single session for all the requests of this call, so that connections are reused
+        async with aiohttp.ClientSession() as session:
+            openai.aiosession.set(session)
+            workers = [asyncio.ensure_future(worker()) for _ in range(min(self.max_concurrent_requests, len(requests)))]
+            try:
+                await asyncio.gather(*workers)
+            finally:
+                for task in workers:
+                    task.cancel()
+        return responses
+
+    async def _send(self, request: Callable[[], Awaitable[Any]], tokens: int) -> Any:
+        """
+        Sends a single request within the limits, retrying it after rate limit and transient errors.
+        """
+        attempt = 0
+        while True:
+            if self._request_limiter is not None:
+                await self._request_limiter.acquire()
+            if self._token_limiter is not None:
+                await self._token_limiter.acquire(tokens)
+            async with self._semaphore:  # type: ignore[union-attr]
+                try:
+                    return await request()
+                except Exception as e:
+                    if not _is_retryable(e) or attempt == self.max_retries:
+                        raise
+                    delay = self._backoff(e, attempt)
+                    logger.debug("OpenAI request failed with '%s', retrying in %.1f seconds.", e, delay)
+            attempt += 1
+            await asyncio.sleep(delay)
+
+    def _backoff(self, error: Exception, attempt: int) -> float:
+        """
+        Returns how many seconds to wait before retrying a failed request. The Retry-After header sent with a rate
+        limit error takes precedence over the exponential backoff.
+        """
+        headers = getattr(error, "headers", None) or {}
+        retry_after = headers.get("retry-after") or headers.get("Retry-After")
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.max_backoff)
+            except ValueError:
+                pass
+        delay = min(self.initial_backoff * 2**attempt, self.max_backoff)
+        # Jitter, so that the requests that failed together are not retried together
+        return delay * random.uniform(0.5, 1.0)
+
+
+def _is_retryable(error: Exception) -> bool:
+    if isinstance(error, RETRYABLE_ERRORS):
+        return True
+    # Server side errors are often transient too
+    return isinstance(error, openai.error.APIError) and (getattr(error, "http_status", None) or 0) >= 500
+
+
+class _OpenAIRequestRunnerFactory:
+    """
+    Factory class to share OpenAIRequestRunner instances, so that all the components using the same limits share the
+    same budget of requests and tokens.
+    """
+
+    _instances: Dict[Tuple[int, Optional[int], Optional[int]], OpenAIRequestRunner] = {}
+    _lock = threading.Lock()
+
+    @staticmethod
+    def get_request_runner(
+        max_concurrent_requests: int, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None
+    ) -> OpenAIRequestRunner:
+        runner_id = (max_concurrent_requests, requests_per_minute, tokens_per_minute)
+        with _OpenAIRequestRunnerFactory._lock:
+            if runner_id not in _OpenAIRequestRunnerFactory._instances:
+                _OpenAIRequestRunnerFactory._instances[runner_id] = OpenAIRequestRunner(
+                    max_concurrent_requests=max_concurrent_requests,
+                    requests_per_minute=requests_per_minute,
+                    tokens_per_minute=tokens_per_minute,
+                )
+            return _OpenAIRequestRunnerFactory._instances[runner_id]
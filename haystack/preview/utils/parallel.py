@@ -0,0 +1,85 @@
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from itertools import islice
+from typing import Any, Callable, Deque, Iterable, Iterator, List, Optional, Tuple
+
+
+def isolated_map(
+    function: Callable[[Any], Any],
+    items: Iterable[Any],
+    num_workers: int = 1,
+    chunk_size: int = 1,
+    max_pending: Optional[int] = None,
+) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """
+    Applies `function` to each item and yields the results lazily, in the order of `items`. An exception raised for
+    one item is yielded together with it instead of being raised, so a single broken item doesn't stop the others.
+
+    With more than one worker, the items are processed in a pool of processes, sent to it in chunks of `chunk_size`
+    items. Only `max_pending` chunks are submitted to the pool at any time, so that neither the items nor the results
+    of a large input are all held in memory at once. In that case, `function`, the items, and the results must be
+    picklable.
+
+    :param function: The function to apply to each item.
+    :param items: The items to process. They are consumed lazily.
+    :param num_workers: The number of processes to use. With `1`, the items are processed in the current process.
+    :param chunk_size: The number of items to send to a worker process at once. Larger chunks reduce the overhead of
+        passing many small items between processes.
+    :param max_pending: The maximum number of chunks submitted to the pool and not yet yielded. Defaults to twice the
+        number of workers.
+    :return: An iterator of `(item, result, error)` tuples. Either `result` or `error` is `None`.
+    """
+    if num_workers < 1:
+        raise ValueError(f"num_workers must be at least 1, got {num_workers}.")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be at least 1, got {chunk_size}.")
+
+    if num_workers == 1:
+        for item in items:
+            yield (item, *_apply(function, item))
+        return
+
+    max_pending = max(max_pending or 2 * num_workers, 1)
+    pending: Deque[Tuple[List[Any], Future]] = deque()
+    executor = ProcessPoolExecutor(max_workers=num_workers)
+    iterator = iter(items)
+    try:
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                break
+            pending.append((chunk, executor.submit(_apply_to_chunk, function, chunk)))
+            if len(pending) >= max_pending:
+                yield from _pop_results(pending)
+        while pending:
+            yield from _pop_results(pending)
+    finally:
+        # Nothing more is consumed if the caller stops iterating early, so don't process the remaining chunks
+        for _, future in pending:
+            future.cancel()
+        executor.shutdown(wait=True)
+
+
+def _apply(function: Callable[[Any], Any], item: Any) -> Tuple[Any, Optional[Exception]]:
+    try:
+        return function(item), None
+    except Exception as e:
+        return None, e
+
+
+def _apply_to_chunk(function: Callable[[Any], Any], chunk: List[Any]) -> List[Tuple[Any, Optional[Exception]]]:
+    return [_apply(function, item) for item in chunk]
+
+
+def _pop_results(pending: Deque[Tuple[List[Any], Future]]) -> Iterator[Tuple[Any, Any, Optional[Exception]]]:
+    """
+    Waits for the oldest pending chunk and yields its items with their results or errors.
+    """
+    chunk, future = pending.popleft()
+    try:
+        results = future.result()
+    except Exception as e:
+        # The whole chunk failed, for example because an item or result could not be pickled
+        results = [(None, e)] * len(chunk)
+    for item, (result, error) in zip(chunk, results):
+        yield item, result, error
@@ -1,27 +1,72 @@
-from haystack.utils.reflection import args_to_kwargs
-from haystack.utils.requests_utils import request_with_retry
-from haystack.utils.preprocessing import convert_files_to_docs, tika_convert_files_to_docs
-from haystack.utils.import_utils import fetch_archive_from_http
-from haystack.utils.cleaning import clean_wiki_text
-from haystack.utils.doc_store import launch_es, launch_opensearch, launch_weaviate, stop_opensearch, stop_service
-from haystack.utils.deepsetcloud import DeepsetCloud, DeepsetCloudError, DeepsetCloudExperiments
-from haystack.utils.export_utils import (
-    print_answers,
-    print_documents,
-    print_questions,
-    export_answers_to_csv,
-    convert_labels_to_squad,
-)
-from haystack.utils.squad_data import SquadData
-from haystack.utils.context_matching import calculate_context_similarity, match_context, match_contexts
-from haystack.utils.experiment_tracking import (
-    Tracker,
-    NoTrackingHead,
-    BaseTrackingHead,
-    MLflowTrackingHead,
-    StdoutTrackingHead,
-)
-from haystack.utils.early_stopping import EarlyStopping
-from haystack.utils.labels import aggregate_labels
-from haystack.utils.batching import get_batches_from_generator
-from haystack.utils.getting_started import build_pipeline, add_example_data
+# The utils are imported when they're first accessed, so that importing one of them doesn't import torch
+from typing import TYPE_CHECKING
+
+from haystack.lazy_imports import lazy_attributes
+
+
+_LAZY_ATTRIBUTES = {
+    "haystack.utils.reflection": ["args_to_kwargs"],
+    "haystack.utils.requests_utils": ["request_with_retry"],
+    "haystack.utils.preprocessing": ["convert_files_to_docs", "tika_convert_files_to_docs"],
+    "haystack.utils.import_utils": ["fetch_archive_from_http"],
+    "haystack.utils.cleaning": ["clean_wiki_text"],
+    "haystack.utils.doc_store": [
+        "launch_es",
+        "launch_opensearch",
+        "launch_weaviate",
+        "stop_opensearch",
+        "stop_service",
+    ],
+    "haystack.utils.deepsetcloud": ["DeepsetCloud", "DeepsetCloudError", "DeepsetCloudExperiments"],
+    "haystack.utils.export_utils": [
+        "print_answers",
+        "print_documents",
+        "print_questions",
+        "export_answers_to_csv",
+        "convert_labels_to_squad",
+    ],
+    "haystack.utils.squad_data": ["SquadData"],
+    "haystack.utils.context_matching": ["calculate_context_similarity", "match_context", "match_contexts"],
+    "haystack.utils.experiment_tracking": [
+        "Tracker",
+        "NoTrackingHead",
+        "BaseTrackingHead",
+        "MLflowTrackingHead",
+        "StdoutTrackingHead",
+    ],
+    "haystack.utils.early_stopping": ["EarlyStopping"],
+    "haystack.utils.labels": ["aggregate_labels"],
+    "haystack.utils.batching": ["get_batches_from_generator"],
+    "haystack.utils.getting_started": ["build_pipeline", "add_example_data"],
+}
+
+__getattr__, __dir__, __all__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
+
+if TYPE_CHECKING:
+    from haystack.utils.reflection import args_to_kwargs
+    from haystack.utils.requests_utils import request_with_retry
+    from haystack.utils.preprocessing import convert_files_to_docs, tika_convert_files_to_docs
+    from haystack.utils.import_utils import fetch_archive_from_http
+    from haystack.utils.cleaning import clean_wiki_text
+    from haystack.utils.doc_store import launch_es, launch_opensearch, launch_weaviate, stop_opensearch, stop_service
+    from haystack.utils.deepsetcloud import DeepsetCloud, DeepsetCloudError, DeepsetCloudExperiments
+    from haystack.utils.export_utils import (
+        print_answers,
+        print_documents,
+        print_questions,
+        export_answers_to_csv,
+        convert_labels_to_squad,
+    )
+    from haystack.utils.squad_data import SquadData
+    from haystack.utils.context_matching import calculate_context_similarity, match_context, match_contexts
+    from haystack.utils.experiment_tracking import (
+        Tracker,
+        NoTrackingHead,
+        BaseTrackingHead,
+        MLflowTrackingHead,
+        StdoutTrackingHead,
+    )
+    from haystack.utils.early_stopping import EarlyStopping
+    from haystack.utils.labels import aggregate_labels
+    from haystack.utils.batching import get_batches_from_generator
+    from haystack.utils.getting_started import build_pipeline, add_example_data
@@ -1,5 +1,13 @@
+from typing import Any, Callable, List, Optional, Sequence, TypeVar
+
 from itertools import islice
 
+from tqdm import tqdm
+
+
+T = TypeVar("T")
+R = TypeVar("R")
+
 
 def get_batches_from_generator(iterable, n):
     """
@@ -10,3 +18,89 @@ def get_batches_from_generator(iterable, n):
     while x:
         yield x
         x = tuple(islice(it, n))
+
+
+def schedule_batches(
+    lengths: Sequence[int], batch_size: Optional[int] = None, max_tokens_per_batch: Optional[int] = None
+) -> List[List[int]]:
+    """
+    Groups items into batches of items with a similar length, so that little compute is spent on padding.
+
+    The items are sorted by length, longest first, so that a batch that doesn't fit into memory fails right away.
+    A batch holds at most `batch_size` items, and at most as many items as fit into `max_tokens_per_batch` tokens once
+    they're padded to the longest item of the batch. An item longer than `max_tokens_per_batch` gets a batch of its own.
+
+    :param lengths: The length of each item, usually its number of tokens.
+    :param batch_size: The maximum number of items per batch. If `None`, the number of items isn't limited.
+    :param max_tokens_per_batch: The maximum number of tokens per padded batch. If `None`, it isn't limited.
+    :return: The indices of the items in each batch.
+    """
+    if batch_size is not None and batch_size < 1:
+        raise ValueError(f"batch_size must be at least 1, got {batch_size}.")
+    if max_tokens_per_batch is not None and max_tokens_per_batch < 1:
+        raise ValueError(f"max_tokens_per_batch must be at least 1, got {max_tokens_per_batch}.")
+
+    batches: List[List[int]] = []
+    batch: List[int] = []
+    for index in sorted(range(len(lengths)), key=lambda i: lengths[i], reverse=True):
+        if batch:
+            # The first item of a batch is its longest one
+            padded_tokens = max(lengths[batch[0]], 1) * (len(batch) + 1)
+            if (batch_size is not None and len(batch) >= batch_size) or (
+                max_tokens_per_batch is not None and padded_tokens > max_tokens_per_batch
+            ):
+                batches.append(batch)
+                batch = []
+        batch.append(index)
+    if batch:
+        batches.append(batch)
+    return batches
+
+
+def run_in_batches(
+    items: Sequence[T],
+    predict: Callable[[List[T]], Sequence[R]],
+    lengths: Sequence[int],
+    batch_size: Optional[int] = None,
+    max_tokens_per_batch: Optional[int] = None,
+    progress_bar: bool = False,
+    desc: Optional[str] = None,
+) -> List[R]:
+    """
+    Runs `predict` on the batches `schedule_batches()` groups `items` into, and returns the predictions in the order
+    of `items`.
+
+    :param items: The items to predict, for example the texts to classify.
+    :param predict: Called with the items of each batch. Must return one prediction per item, in the same order.
+    :param lengths: The length of each item, usually its number of tokens, see `count_tokens()`.
+    :param batch_size: The maximum number of items per batch. If `None`, the number of items isn't limited.
+    :param max_tokens_per_batch: The maximum number of tokens per padded batch. If `None`, it isn't limited.
+    :param progress_bar: Whether to show a progress bar.
+    :param desc: The description of the progress bar.
+    """
+    predictions: List[Any] = [None] * len(items)
+    with tqdm(total=len(items), disable=not progress_bar, desc=desc) as pbar:
+        for batch in schedule_batches(lengths, batch_size=batch_size, max_tokens_per_batch=max_tokens_per_batch):
+            batch_predictions = predict([items[index] for index in batch])
+            if len(batch_predictions) != len(batch):
+                raise ValueError(f"Expected {len(batch)} predictions for the batch, got {len(batch_predictions)}.")
+            for index, prediction in zip(batch, batch_predictions):
+                predictions[index] = prediction
+            pbar.update(len(batch))
+    return predictions
+
+
+def count_tokens(tokenizer: Any, texts: Sequence[Any], max_length: Optional[int] = None) -> List[int]:
+    """
+    Counts the tokens a Hugging Face tokenizer turns each text into, including the special tokens. The counts are
+    capped at `max_length`, or at the maximum length of the model if it's not given, like truncation would.
+
+    :param tokenizer: A Hugging Face tokenizer.
+    :param texts: The texts, or pairs of texts, to count the tokens of.
+    :param max_length: The length the texts are truncated to.
+    """
+    if not texts:
+        return []
+    max_length = max_length or getattr(tokenizer, "model_max_length", None)
+    input_ids = tokenizer(list(texts), verbose=False)["input_ids"]
+    return [min(len(ids), max_length) if max_length else len(ids) for ids in input_ids]
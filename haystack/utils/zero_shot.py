@@ -0,0 +1,187 @@
+from typing import Any, Dict, List, Optional, Sequence
+
+import inspect
+import logging
+
+import numpy as np
+import torch
+
+from haystack.utils.batching import run_in_batches
+
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_HYPOTHESIS_TEMPLATE = "This example is {}."
+
+
+class ZeroShotClassifier:
+    """
+    Runs the model of a Hugging Face zero-shot classification pipeline, scoring each text against each candidate label
+    like the pipeline does, with less overhead:
+
+    - The hypotheses built from the candidate labels are tokenized once and reused for all texts.
+    - Each text is tokenized once, not once per label.
+    - All (text, hypothesis) pairs are run together, in batches of pairs with a similar length, instead of one pair
+      per forward pass.
+    """
+
+    def __init__(self, hf_pipeline: Any, hypothesis_template: str = DEFAULT_HYPOTHESIS_TEMPLATE):
+        """
+        :param hf_pipeline: A Hugging Face `ZeroShotClassificationPipeline`. Its model, tokenizer, and device are used.
+        :param hypothesis_template: The template used to turn each label into a hypothesis.
+        """
+        if hypothesis_template.format("label") == hypothesis_template:
+            raise ValueError(
+                f"The hypothesis_template '{hypothesis_template}' must contain '{{}}' where the label should go."
+            )
+        self.model = hf_pipeline.model
+        self.tokenizer = hf_pipeline.tokenizer
+        self.device = hf_pipeline.device
+        self.entailment_id: int = hf_pipeline.entailment_id
+        self.hypothesis_template = hypothesis_template
+        if self.tokenizer.pad_token is None:
+            self.tokenizer.pad_token = self.tokenizer.eos_token
+        self._hypotheses: Dict[str, List[int]] = {}
+        self._pairs_from_ids: Optional[bool] = None
+        self._use_cache = "use_cache" in inspect.signature(self.model.forward).parameters
+
+    def __call__(
+        self,
+        texts: Sequence[str],
+        labels: Sequence[str],
+        batch_size: Optional[int] = None,
+        max_tokens_per_batch: Optional[int] = None,
+        progress_bar: bool = False,
+        desc: Optional[str] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Classifies each text into one of the candidate labels.
+
+        :param texts: The texts to classify.
+        :param labels: The candidate labels.
+        :param batch_size: The maximum number of (text, hypothesis) pairs per forward pass.
+        :param max_tokens_per_batch: The maximum number of tokens per padded batch of pairs.
+        :param progress_bar: Whether to show a progress bar over the pairs.
+        :param desc: The description of the progress bar.
+        :return: One dictionary per text, in the format of the Hugging Face pipeline: the `"sequence"`, the
+                 `"labels"` sorted by score, and their `"scores"`.
+        """
+        if not labels:
+            raise ValueError("You must provide at least one candidate label.")
+        if not texts:
+            return []
+
+        pairs = self._encode_pairs(texts, labels)
+        logits = run_in_batches(
+            pairs,
+            self._forward,
+            lengths=[len(pair["input_ids"]) for pair in pairs],
+            batch_size=batch_size,
+            max_tokens_per_batch=max_tokens_per_batch,
+            progress_bar=progress_bar,
+            desc=desc,
+        )
+        # Pairs are ordered by text first, then by label
+        logits_per_text = np.stack(logits).reshape(len(texts), len(labels), -1)
+
+        if len(labels) == 1:
+            contradiction_id = -1 if self.entailment_id == 0 else 0
+            entail_contradiction_logits = logits_per_text[..., [contradiction_id, self.entailment_id]]
+            scores = _softmax(entail_contradiction_logits)[..., 1]
+        else:
+            scores = _softmax(logits_per_text[..., self.entailment_id])
+
+        predictions = []
+        for text, text_scores in zip(texts, scores):
+            top_indices = list(reversed(text_scores.argsort()))
+            predictions.append(
+                {
+                    "sequence": text,
+                    "labels": [labels[index] for index in top_indices],
+                    "scores": text_scores[top_indices].tolist(),
+                }
+            )
+        return predictions
+
+    def encode_hypotheses(self, labels: Sequence[str]) -> List[List[int]]:
+        """
+        Returns the token IDs, without special tokens, of the hypotheses for `labels`. They're tokenized once per label.
+        """
+        missing = [label for label in labels if label not in self._hypotheses]
+        if missing:
+            hypotheses = [self.hypothesis_template.format(label) for label in missing]
+            encoded = self.tokenizer(hypotheses, add_special_tokens=False, verbose=False)["input_ids"]
+            self._hypotheses.update(zip(missing, encoded))
+        return [self._hypotheses[label] for label in labels]
+
+    def _encode_pairs(self, texts: Sequence[str], labels: Sequence[str]) -> List[Dict[str, List[int]]]:
+        if not self._can_build_pairs_from_ids():
+            # The tokenizer doesn't add its special tokens to pairs of IDs as it does to pairs of texts
+            hypotheses = [self.hypothesis_template.format(label) for label in labels]
+            text_pairs = [[text, hypothesis] for text in texts for hypothesis in hypotheses]
+            encodings = self.tokenizer(text_pairs, truncation="only_first", verbose=False)
+            return [
+                {name: encodings[name][index] for name in self.tokenizer.model_input_names if name in encodings}
+                for index in range(len(text_pairs))
+            ]
+
+        hypotheses = self.encode_hypotheses(labels)
+        premises = self.tokenizer(list(texts), add_special_tokens=False, verbose=False)["input_ids"]
+        max_length = self.tokenizer.model_max_length - self.tokenizer.num_special_tokens_to_add(pair=True)
+        pairs = []
+        for premise in premises:
+            for hypothesis in hypotheses:
+                # Like in the Hugging Face pipeline, only the text is truncated, and only if that's enough
+                if len(hypothesis) < max_length < len(premise) + len(hypothesis):
+                    pairs.append(self._build_pair(premise[: max_length - len(hypothesis)], hypothesis))
+                else:
+                    pairs.append(self._build_pair(premise, hypothesis))
+        return pairs
+
+    def _build_pair(self, premise: List[int], hypothesis: List[int]) -> Dict[str, List[int]]:
+        input_ids = self.tokenizer.build_inputs_with_special_tokens(premise, hypothesis)
+        pair = {"input_ids": input_ids, "attention_mask": [1] * len(input_ids)}
+        if "token_type_ids" in self.tokenizer.model_input_names:
+            pair["token_type_ids"] = self.tokenizer.create_token_type_ids_from_sequences(premise, hypothesis)
+        return pair
+
+    def _can_build_pairs_from_ids(self) -> bool:
+        """
+        Checks once whether pairs built from token IDs match the pairs the tokenizer encodes from texts.
+        """
+        if self._pairs_from_ids is None:
+            premise, hypothesis = "This is a premise.", self.hypothesis_template.format("label")
+            expected = self.tokenizer(premise, hypothesis, verbose=False)
+            premise_ids, hypothesis_ids = self.tokenizer(
+                [premise, hypothesis], add_special_tokens=False, verbose=False
+            )["input_ids"]
+            built = self._build_pair(premise_ids, hypothesis_ids)
+            self._pairs_from_ids = all(
+                list(expected[name]) == values for name, values in built.items() if name in expected
+            )
+            if not self._pairs_from_ids:
+                logger.debug(
+                    "%s can't build pairs from token IDs, tokenizing the pairs.", type(self.tokenizer).__name__
+                )
+        return self._pairs_from_ids
+
+    def _forward(self, pairs: List[Dict[str, List[int]]]) -> List[np.ndarray]:
+        max_length = max(len(pair["input_ids"]) for pair in pairs)
+        pad_values = {"input_ids": self.tokenizer.pad_token_id, "attention_mask": 0, "token_type_ids": 0}
+        inputs = {}
+        for name in pairs[0]:
+            padded = []
+            for pair in pairs:
+                padding = [pad_values.get(name, 0)] * (max_length - len(pair[name]))
+                padded.append(padding + pair[name] if self.tokenizer.padding_side == "left" else pair[name] + padding)
+            inputs[name] = torch.tensor(padded, device=self.device)
+        if self._use_cache:
+            inputs["use_cache"] = False
+        with torch.inference_mode():
+            logits = self.model(**inputs).logits
+        return list(logits.float().cpu().numpy())
+
+
+def _softmax(logits: np.ndarray) -> np.ndarray:
+    exp = np.exp(logits)
+    return exp / exp.sum(-1, keepdims=True)
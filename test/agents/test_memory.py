@@ -1,3 +1,7 @@
+from collections import OrderedDict
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
 import pytest
 from typing import Dict, Any
 from haystack.agents.memory import NoMemory, ConversationMemory
@@ -43,3 +47,55 @@ def test_conversation_memory_window_size():
     conv_mem.clear()
     assert conv_mem.load() == ""
     assert conv_mem.load(window_size=1) == ""
+
+
+@pytest.mark.unit
+def test_conversation_memory_max_tokens():
+    conv_mem = ConversationMemory(max_tokens=8)
+    conv_mem.save({"input": "Hello", "output": "Hi there"})
+    # "Human: Hello\nAI: Hi there\n" has 5 words
+    assert conv_mem.load() == "Human: Hello\nAI: Hi there\n"
+
+    conv_mem.save({"input": "How are you?", "output": "I'm doing well, thanks."})
+    # The first snippet doesn't fit next to the 9 words of the second one, and neither does the second one alone
+    assert conv_mem.load() == ""
+
+    conv_mem.max_tokens = 14
+    assert conv_mem.load() == "Human: Hello\nAI: Hi there\nHuman: How are you?\nAI: I'm doing well, thanks.\n"
+    assert conv_mem.load(window_size=1) == "Human: How are you?\nAI: I'm doing well, thanks.\n"
+
+    conv_mem.save({"input": "Bye", "output": "Bye"})
+    assert conv_mem.load() == "Human: How are you?\nAI: I'm doing well, thanks.\nHuman: Bye\nAI: Bye\n"
+
+    conv_mem.clear()
+    assert conv_mem.load() == ""
+
+
+@pytest.mark.unit
+def test_conversation_memory_max_tokens_uses_prompt_model_tokenizer():
+    prompt_node = MagicMock()
+    # A tokenizer like tiktoken's, counting each character as a token
+    prompt_node.prompt_model.model_invocation_layer._tokenizer = SimpleNamespace(encode=list)
+    conv_mem = ConversationMemory(max_tokens=30, prompt_node=prompt_node)
+
+    conv_mem.save({"input": "Hello", "output": "Hi there"})
+    conv_mem.save({"input": "Bye", "output": "Bye"})
+
+    # Each character is a token: the second snippet has 21 tokens, both together 47
+    assert conv_mem.load() == "Human: Bye\nAI: Bye\n"
+
+
+@pytest.mark.unit
+def test_conversation_memory_load_does_not_render_snippets_again():
+    conv_mem = ConversationMemory()
+    with patch.object(ConversationMemory, "render_snippet", wraps=ConversationMemory.render_snippet) as render:
+        for i in range(5):
+            conv_mem.save({"input": f"Question {i}", "output": f"Answer {i}"})
+            conv_mem.load()
+            conv_mem.load(window_size=2)
+    assert render.call_count == 5
+    assert conv_mem.load(window_size=1) == "Human: Question 4\nAI: Answer 4\n"
+
+    # Snippets added to the list directly are rendered when loading
+    conv_mem.list.append(OrderedDict(Human="Question 5", AI="Answer 5"))
+    assert conv_mem.load(window_size=1) == "Human: Question 5\nAI: Answer 5\n"
@@ -1,3 +1,4 @@
+import threading
 from unittest.mock import MagicMock
 from haystack.nodes import PromptNode, PromptTemplate
 import pytest
@@ -142,3 +143,72 @@ def test_conversation_summary_memory_with_template(mocked_prompt_node):
 
     summary_mem.clear()
     assert summary_mem.load() == ""
+
+
+@pytest.mark.unit
+def test_conversation_summary_memory_in_background(mocked_prompt_node):
+    summary_ready = threading.Event()
+
+    def prompt(template, chat_transcript):
+        summary_ready.wait(timeout=10)
+        return [f"Summary of {chat_transcript.count('Human:')} snippets."]
+
+    mocked_prompt_node.prompt.side_effect = prompt
+    summary_mem = ConversationSummaryMemory(mocked_prompt_node, summary_frequency=2, summarize_in_background=True)
+
+    data1: Dict[str, Any] = {"input": "Hello", "output": "Hi there"}
+    data2: Dict[str, Any] = {"input": "How are you?", "output": "I'm doing well, thanks."}
+    summary_mem.save(data1)
+    summary_mem.save(data2)
+
+    # save() doesn't wait for the summary, the snippets are loaded until it's ready
+    assert summary_mem.load() == "\nHuman: Hello\nAI: Hi there\nHuman: How are you?\nAI: I'm doing well, thanks.\n"
+    assert summary_mem.unsummarized_snippets() == 2
+    assert not summary_mem.wait_for_summaries(timeout=0.01)
+
+    summary_ready.set()
+    assert summary_mem.wait_for_summaries(timeout=10)
+    assert summary_mem.load() == "Summary of 2 snippets."
+    assert not summary_mem.has_unsummarized_snippets()
+
+    data3: Dict[str, Any] = {"input": "What's the weather like?", "output": "It's sunny outside."}
+    summary_mem.save(data3)
+    assert summary_mem.load() == "Summary of 2 snippets.\nHuman: What's the weather like?\nAI: It's sunny outside.\n"
+
+
+@pytest.mark.unit
+def test_conversation_summary_memory_in_background_retries_failed_snippets(mocked_prompt_node):
+    mocked_prompt_node.prompt.side_effect = [Exception("LLM unavailable"), ["This is a summary."]]
+    summary_mem = ConversationSummaryMemory(mocked_prompt_node, summary_frequency=1, summarize_in_background=True)
+
+    summary_mem.save({"input": "Hello", "output": "Hi there"})
+    assert summary_mem.wait_for_summaries(timeout=10)
+    assert summary_mem.load() == "\nHuman: Hello\nAI: Hi there\n"
+
+    summary_mem.save({"input": "How are you?", "output": "I'm doing well, thanks."})
+    assert summary_mem.wait_for_summaries(timeout=10)
+    assert summary_mem.load() == "This is a summary."
+    # The second summary covers the snippet of the failed one
+    transcript = mocked_prompt_node.prompt.call_args.kwargs["chat_transcript"]
+    assert transcript == "Human: Hello\nAI: Hi there\nHuman: How are you?\nAI: I'm doing well, thanks.\n"
+
+
+@pytest.mark.unit
+def test_conversation_summary_memory_clear_discards_pending_summaries(mocked_prompt_node):
+    summary_started, summary_ready = threading.Event(), threading.Event()
+
+    def prompt(template, chat_transcript):
+        summary_started.set()
+        summary_ready.wait(timeout=10)
+        return ["This is a summary."]
+
+    mocked_prompt_node.prompt.side_effect = prompt
+    summary_mem = ConversationSummaryMemory(mocked_prompt_node, summary_frequency=1, summarize_in_background=True)
+    summary_mem.save({"input": "Hello", "output": "Hi there"})
+    pending = list(summary_mem._pending_summaries)
+    assert summary_started.wait(timeout=10)
+
+    summary_mem.clear()
+    summary_ready.set()
+    pending[0].result(timeout=10)
+    assert summary_mem.load() == ""
@@ -0,0 +1,97 @@
+"""
+Measures zero-shot classification of texts of varied lengths with the Hugging Face pipeline, which runs one forward
+pass per (text, label) pair, and with `ZeroShotClassifier`, which tokenizes each hypothesis once and runs the pairs in
+batches of pairs with a similar length. Without `--model`, a small randomly initialized BERT model is used, so the
+numbers show the orchestration overhead rather than realistic model costs.
+
+Usage: python batched_inference.py --texts 200 --labels 5 --batch-size 16 --max-tokens-per-batch 2048
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict, List, Optional
+import argparse
+import json
+import random
+
+import torch
+from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast, pipeline
+
+from haystack.utils.zero_shot import ZeroShotClassifier
+
+
+WORDS = "the a is this example about sports politics weather team won game election vote rain today news".split()
+
+
+def build_random_pipeline(directory: str):
+    vocab_file = Path(directory) / "vocab.txt"
+    vocab_file.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "."] + WORDS))
+    tokenizer = BertTokenizerFast(str(vocab_file), model_max_length=512)
+    labels = ["contradiction", "neutral", "entailment"]
+    config = BertConfig(
+        vocab_size=len(WORDS) + 6,
+        hidden_size=128,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=256,
+        label2id={label: i for i, label in enumerate(labels)},
+        id2label=dict(enumerate(labels)),
+    )
+    model = BertForSequenceClassification(config).eval()
+    return pipeline("zero-shot-classification", model=model, tokenizer=tokenizer, device="cpu")
+
+
+def benchmark_zero_shot(
+    texts: int, labels: int, batch_size: int, max_tokens_per_batch: Optional[int], model: Optional[str]
+) -> List[Dict]:
+    rng = random.Random(0)
+    inputs = [" ".join(rng.choices(WORDS, k=rng.randint(3, 200))) for _ in range(texts)]
+    candidate_labels = WORDS[:labels]
+
+    with TemporaryDirectory() as directory:
+        hf_pipeline = pipeline("zero-shot-classification", model=model) if model else build_random_pipeline(directory)
+        classifier = ZeroShotClassifier(hf_pipeline)
+        benchmarks = {
+            "hf_pipeline": lambda: hf_pipeline(inputs, candidate_labels=candidate_labels),
+            "hf_pipeline_batched": lambda: hf_pipeline(
+                inputs, candidate_labels=candidate_labels, batch_size=batch_size
+            ),
+            "zero_shot_classifier": lambda: classifier(
+                inputs, candidate_labels, batch_size=batch_size, max_tokens_per_batch=max_tokens_per_batch
+            ),
+        }
+        results = []
+        with torch.inference_mode():
+            for name, function in benchmarks.items():
+                start = perf_counter()
+                function()
+                seconds = perf_counter() - start
+                results.append(
+                    {
+                        "benchmark": name,
+                        "texts": texts,
+                        "labels": labels,
+                        "seconds": round(seconds, 3),
+                        "texts_per_second": round(texts / seconds, 1),
+                    }
+                )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--texts", type=int, default=200, help="Number of texts to classify.")
+    parser.add_argument("--labels", type=int, default=5, help="Number of candidate labels.")
+    parser.add_argument("--batch-size", type=int, default=16, help="Number of pairs per forward pass.")
+    parser.add_argument("--max-tokens-per-batch", type=int, default=None, help="Token budget per padded batch.")
+    parser.add_argument("--model", default=None, help="NLI model to use instead of a small random model.")
+    args = parser.parse_args()
+
+    for result in benchmark_zero_shot(
+        texts=args.texts,
+        labels=args.labels,
+        batch_size=args.batch_size,
+        max_tokens_per_batch=args.max_tokens_per_batch,
+        model=args.model,
+    ):
+        print(json.dumps(result))
@@ -0,0 +1,70 @@
+"""
+Measures the time an agent spends in its memory per step over a long conversation: saving a snippet and loading the
+conversation history, as `ConversationalAgent` does at every step. `ConversationMemory` is measured with and without a
+token budget, and `ConversationSummaryMemory` with a stand-in PromptNode that takes `--llm-latency` seconds per summary,
+summarizing synchronously in `save()` and in the background.
+
+Usage: python conversation_memory.py --turns 2000 --llm-latency 0.05
+"""
+from time import perf_counter, sleep
+from typing import Dict, List
+from unittest.mock import MagicMock
+import argparse
+import json
+
+from haystack.agents.memory import ConversationMemory, ConversationSummaryMemory
+from haystack.nodes import PromptNode, PromptTemplate
+
+
+def slow_prompt_node(llm_latency: float) -> PromptNode:
+    prompt_node = MagicMock(spec=PromptNode)
+    prompt_node.default_prompt_template = PromptTemplate("Summarize the conversation: {chat_transcript}")
+
+    def prompt(template, chat_transcript):
+        sleep(llm_latency)
+        return [f"A summary of {len(chat_transcript)} characters. "]
+
+    prompt_node.prompt.side_effect = prompt
+    return prompt_node
+
+
+def benchmark_memory(turns: int, llm_latency: float) -> List[Dict]:
+    memories = {
+        "conversation_memory": lambda: ConversationMemory(),
+        "conversation_memory_max_tokens": lambda: ConversationMemory(max_tokens=1000),
+        "summary_memory": lambda: ConversationSummaryMemory(slow_prompt_node(llm_latency)),
+        "summary_memory_in_background": lambda: ConversationSummaryMemory(
+            slow_prompt_node(llm_latency), summarize_in_background=True
+        ),
+    }
+    results = []
+    for name, create_memory in memories.items():
+        memory = create_memory()
+        step_seconds = []
+        for turn in range(turns):
+            start = perf_counter()
+            memory.save({"input": f"Question number {turn} of the user?", "output": f"Answer number {turn}."})
+            memory.load()
+            step_seconds.append(perf_counter() - start)
+        results.append(
+            {
+                "benchmark": name,
+                "turns": turns,
+                "mean_step_us": round(1e6 * sum(step_seconds) / turns, 1),
+                "last_100_steps_mean_us": round(1e6 * sum(step_seconds[-100:]) / len(step_seconds[-100:]), 1),
+                "max_step_us": round(1e6 * max(step_seconds), 1),
+            }
+        )
+        if isinstance(memory, ConversationSummaryMemory):
+            memory.wait_for_summaries()
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--turns", type=int, default=2000, help="Number of conversation turns.")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Seconds the LLM takes per summary.")
+    args = parser.parse_args()
+
+    for result in benchmark_memory(turns=args.turns, llm_latency=args.llm_latency):
+        print(json.dumps(result))
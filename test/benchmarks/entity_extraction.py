@@ -0,0 +1,114 @@
+"""
+Measures the documents per second of `EntityExtractor.extract_batch()` on CPU, with the postprocessing that builds a
+dictionary per token and with the vectorized postprocessing, and with all documents in one window and in windows of
+`--documents-per-window` documents. Without `--model`, a small randomly initialized BERT model is used, so the numbers
+show the tokenization and postprocessing overhead rather than realistic model costs. Its classifier is biased towards
+the "O" label so that, like with a trained model, most tokens aren't part of an entity.
+
+Usage: python entity_extraction.py --documents 500 --words 300 --batch-size 16 --documents-per-window 64
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict, List, Optional
+import argparse
+import json
+import random
+
+import torch
+from transformers import BertConfig, BertForTokenClassification, BertTokenizerFast
+
+from haystack.nodes.extractor import EntityExtractor
+
+
+WORDS = "carla jon snow lives in berlin paris and winterfell my name is the brother sister city river".split()
+LABELS = ["O", "B-PER", "I-PER", "B-LOC", "I-LOC", "B-ORG", "I-ORG", "B-MISC", "I-MISC"]
+
+
+def build_random_model(directory: str):
+    vocab = ["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "."] + WORDS + ["##s", "##er", "##in"]
+    vocab_file = Path(directory) / "vocab.txt"
+    vocab_file.write_text("\n".join(vocab))
+    BertTokenizerFast(str(vocab_file), model_max_length=128).save_pretrained(directory)
+    config = BertConfig(
+        vocab_size=len(vocab),
+        hidden_size=64,
+        num_hidden_layers=2,
+        num_attention_heads=2,
+        intermediate_size=128,
+        label2id={label: i for i, label in enumerate(LABELS)},
+        id2label=dict(enumerate(LABELS)),
+    )
+    torch.manual_seed(0)
+    model = BertForTokenClassification(config)
+    with torch.no_grad():
+        model.classifier.bias[0] = 3.0
+    model.save_pretrained(directory)
+
+
+def benchmark_entity_extraction(
+    documents: int,
+    words: int,
+    batch_size: int,
+    documents_per_window: int,
+    aggregation_strategy: Optional[str],
+    model: Optional[str],
+) -> List[Dict]:
+    rng = random.Random(0)
+    texts = [" ".join(rng.choices(WORDS + ["berliner", "cities"], k=rng.randint(1, words))) for _ in range(documents)]
+
+    with TemporaryDirectory() as directory:
+        if model is None:
+            build_random_model(directory)
+        extractor = EntityExtractor(
+            model_name_or_path=model or directory,
+            use_gpu=False,
+            progress_bar=False,
+            aggregation_strategy=aggregation_strategy,  # type: ignore
+        )
+        vectorized_strategies = extractor.entity_postprocessor.VECTORIZED_AGGREGATION_STRATEGIES
+        extractor.extract_batch(texts[:batch_size], batch_size=batch_size)
+
+        results = []
+        for vectorized in [False, True]:
+            extractor.entity_postprocessor.VECTORIZED_AGGREGATION_STRATEGIES = (
+                vectorized_strategies if vectorized else ()
+            )
+            for window in [documents, documents_per_window]:
+                extractor.documents_per_window = window
+                start = perf_counter()
+                extractor.extract_batch(texts, batch_size=batch_size)
+                seconds = perf_counter() - start
+                results.append(
+                    {
+                        "benchmark": "extract_batch",
+                        "aggregation_strategy": aggregation_strategy,
+                        "vectorized_postprocessing": vectorized,
+                        "documents_per_window": window,
+                        "documents": documents,
+                        "seconds": round(seconds, 3),
+                        "documents_per_second": round(documents / seconds, 1),
+                    }
+                )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--documents", type=int, default=500, help="Number of documents to extract entities from.")
+    parser.add_argument("--words", type=int, default=300, help="Maximum number of words per document.")
+    parser.add_argument("--batch-size", type=int, default=16, help="Number of text splits per forward pass.")
+    parser.add_argument("--documents-per-window", type=int, default=64, help="Number of documents per window.")
+    parser.add_argument("--aggregation-strategy", default="first", help="The aggregation strategy to use.")
+    parser.add_argument("--model", default=None, help="NER model to use instead of a small random model.")
+    args = parser.parse_args()
+
+    for result in benchmark_entity_extraction(
+        documents=args.documents,
+        words=args.words,
+        batch_size=args.batch_size,
+        documents_per_window=args.documents_per_window,
+        aggregation_strategy=None if args.aggregation_strategy == "none" else args.aggregation_strategy,
+        model=args.model,
+    ):
+        print(json.dumps(result))
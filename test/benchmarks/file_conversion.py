@@ -0,0 +1,71 @@
+"""
+Measures the throughput of the preview file converters with different numbers of worker processes.
+
+Usage: python file_conversion.py --files 2000 --workers 1 2 4
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict, List
+import argparse
+import json
+
+from haystack.preview.components.file_converters import HTMLToDocument, MarkdownToDocument, TextFileToDocument
+
+
+def write_sample_files(directory: Path, num_files: int) -> Dict[str, List[Path]]:
+    """
+    Writes `num_files` text, markdown, and HTML files with a few kilobytes of content each.
+    """
+    paragraph = "Haystack is an end-to-end framework for building applications powered by LLMs. " * 20
+    contents = {
+        "txt": "\n\n".join([paragraph] * 5),
+        "md": "\n\n".join(f"## Section {i}\n\n{paragraph}" for i in range(5)),
+        "html": "<html><body><article>"
+        + "".join(f"<h2>Section {i}</h2><p>{paragraph}</p>" for i in range(5))
+        + "</article></body></html>",
+    }
+    paths: Dict[str, List[Path]] = {extension: [] for extension in contents}
+    for extension, content in contents.items():
+        for i in range(num_files):
+            path = directory / f"file_{i}.{extension}"
+            path.write_text(content)
+            paths[extension].append(path)
+    return paths
+
+
+def benchmark_file_conversion(num_files: int, workers: List[int]) -> List[Dict]:
+    results = []
+    with TemporaryDirectory() as directory:
+        paths = write_sample_files(Path(directory), num_files)
+        for num_workers in workers:
+            converters = {
+                "txt": TextFileToDocument(progress_bar=False, num_workers=num_workers),
+                "md": MarkdownToDocument(progress_bar=False, num_workers=num_workers),
+                "html": HTMLToDocument(num_workers=num_workers),
+            }
+            for extension, converter in converters.items():
+                start = perf_counter()
+                # Streaming keeps memory bounded, only the number of documents is kept
+                num_docs = sum(1 for _ in converter.run_iter(paths[extension]))
+                seconds = perf_counter() - start
+                results.append(
+                    {
+                        "converter": type(converter).__name__,
+                        "num_workers": num_workers,
+                        "documents": num_docs,
+                        "seconds": round(seconds, 3),
+                        "files_per_second": round(num_files / seconds, 1),
+                    }
+                )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--files", type=int, default=1000, help="Number of files to convert per file type.")
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4], help="Numbers of workers to compare.")
+    args = parser.parse_args()
+
+    for result in benchmark_file_conversion(num_files=args.files, workers=args.workers):
+        print(json.dumps(result))
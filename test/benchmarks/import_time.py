@@ -0,0 +1,78 @@
+"""
+Measures how long importing Haystack takes with `python -X importtime`, and which dependencies take the longest.
+Exits with an error if an import takes longer than `--max-seconds`, so it can guard against import time regressions.
+
+Usage: python import_time.py --imports "import haystack" "from haystack.nodes import PreProcessor" --max-seconds 1
+"""
+from typing import Dict, List, Optional, Tuple
+import argparse
+import json
+import subprocess
+import sys
+
+
+def import_times(code: str) -> List[Tuple[str, int, int]]:
+    """
+    Runs `code` in a new interpreter with `-X importtime` and returns the name, import depth, and cumulative
+    microseconds of each imported module.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    times = []
+    # Each line is "import time: <self us> | <cumulative us> | <module name indented by its import depth>"
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times.append((name.strip(), len(name) - len(name.lstrip()), int(cumulative)))
+    return times
+
+
+def measure_import(code: str, top: int) -> Dict:
+    """
+    Returns the time `code` spends importing modules and the packages that took the longest. Modules the interpreter
+    imports on startup are not counted.
+    """
+    startup_modules = {name for name, _, _ in import_times("pass")}
+    total = 0
+    packages: Dict[str, int] = {}
+    for name, depth, cumulative in import_times(code):
+        if name in startup_modules:
+            continue
+        if depth == 1:
+            total += cumulative
+        if "." not in name:
+            packages[name] = max(packages.get(name, 0), cumulative)
+    slowest = sorted(packages.items(), key=lambda item: item[1], reverse=True)
+    return {
+        "import": code,
+        "seconds": round(total / 1e6, 3),
+        "slowest_packages": {package: round(micros / 1e6, 3) for package, micros in slowest[:top]},
+    }
+
+
+def benchmark_import_time(imports: List[str], top: int, max_seconds: Optional[float]) -> int:
+    exit_code = 0
+    for code in imports:
+        result = measure_import(code, top=top)
+        print(json.dumps(result))
+        if max_seconds is not None and result["seconds"] > max_seconds:
+            print(f"'{code}' took {result['seconds']} seconds, more than {max_seconds} seconds.", file=sys.stderr)
+            exit_code = 1
+    return exit_code
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--imports",
+        nargs="+",
+        default=["import haystack", "from haystack.nodes.base import BaseComponent", "from haystack import Pipeline"],
+        help="Import statements to measure, each in a new interpreter.",
+    )
+    parser.add_argument("--top", type=int, default=5, help="Number of slowest packages to show per import.")
+    parser.add_argument("--max-seconds", type=float, default=None, help="Fail if an import takes longer than this.")
+    args = parser.parse_args()
+
+    sys.exit(benchmark_import_time(imports=args.imports, top=args.top, max_seconds=args.max_seconds))
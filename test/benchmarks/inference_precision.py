@@ -0,0 +1,76 @@
+"""
+Compares the latency and the accuracy of the inference precisions on a small randomly initialized BERT model.
+The accuracy is measured as the cosine similarity between the outputs of each precision and the fp32 outputs.
+
+Usage: python inference_precision.py --batch-size 16 --seq-len 128 --runs 10
+"""
+from time import perf_counter
+from typing import Dict, List
+import argparse
+import copy
+import json
+
+import torch
+from transformers import BertConfig, BertModel
+
+from haystack.inference_precision import INFERENCE_PRECISIONS, apply_inference_precision
+
+
+def create_model(hidden_size: int, num_layers: int) -> "BertModel":
+    torch.manual_seed(0)
+    config = BertConfig(
+        vocab_size=1000,
+        hidden_size=hidden_size,
+        num_hidden_layers=num_layers,
+        num_attention_heads=4,
+        intermediate_size=hidden_size * 4,
+    )
+    return BertModel(config).eval()
+
+
+def benchmark_inference_precision(
+    batch_size: int, seq_len: int, runs: int, hidden_size: int, num_layers: int
+) -> List[Dict]:
+    model = create_model(hidden_size=hidden_size, num_layers=num_layers)
+    input_ids = torch.randint(0, 1000, (batch_size, seq_len))
+    with torch.inference_mode():
+        reference = model(input_ids=input_ids).last_hidden_state
+
+    results = []
+    for inference_precision in INFERENCE_PRECISIONS:
+        prepared = apply_inference_precision(copy.deepcopy(model), inference_precision)
+        with torch.inference_mode():
+            outputs = prepared(input_ids=input_ids).last_hidden_state
+            start = perf_counter()
+            for _ in range(runs):
+                prepared(input_ids=input_ids)
+            seconds = (perf_counter() - start) / runs
+        similarity = torch.nn.functional.cosine_similarity(outputs.flatten(0, 1), reference.flatten(0, 1), dim=-1)
+        results.append(
+            {
+                "inference_precision": inference_precision,
+                "seconds_per_batch": round(seconds, 4),
+                "mean_cosine_similarity": round(similarity.mean().item(), 6),
+                "min_cosine_similarity": round(similarity.min().item(), 6),
+            }
+        )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--batch-size", type=int, default=16, help="Number of sequences per batch.")
+    parser.add_argument("--seq-len", type=int, default=128, help="Number of tokens per sequence.")
+    parser.add_argument("--runs", type=int, default=10, help="Number of timed forward passes per precision.")
+    parser.add_argument("--hidden-size", type=int, default=256, help="Hidden size of the model.")
+    parser.add_argument("--num-layers", type=int, default=4, help="Number of layers of the model.")
+    args = parser.parse_args()
+
+    for result in benchmark_inference_precision(
+        batch_size=args.batch_size,
+        seq_len=args.seq_len,
+        runs=args.runs,
+        hidden_size=args.hidden_size,
+        num_layers=args.num_layers,
+    ):
+        print(json.dumps(result))
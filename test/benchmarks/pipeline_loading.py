@@ -0,0 +1,97 @@
+"""
+Measures the wall time of `Pipeline.load_from_yaml()` and of the JSON schema validation it runs, with and without
+the cached compiled JSON schema. The pipeline only uses nodes that are quick to create.
+
+Usage: python pipeline_loading.py --loads 20
+"""
+from pathlib import Path
+from tempfile import TemporaryDirectory
+from time import perf_counter
+from typing import Dict, List
+import argparse
+import json
+
+import yaml
+
+from haystack import Pipeline
+from haystack.nodes import _json_schema
+from haystack.pipelines.config import get_compiled_schema, validate_schema
+
+
+PIPELINE_YAML = """
+version: ignore
+components:
+  - name: FileTypeClassifier
+    type: FileTypeClassifier
+  - name: TextConverter
+    type: TextConverter
+    params:
+      remove_numeric_tables: true
+  - name: RouteDocuments
+    type: RouteDocuments
+    params:
+      split_by: content_type
+  - name: JoinDocuments
+    type: JoinDocuments
+    params:
+      join_mode: concatenate
+pipelines:
+  - name: indexing
+    nodes:
+      - name: FileTypeClassifier
+        inputs: [File]
+      - name: TextConverter
+        inputs: [FileTypeClassifier.output_1]
+      - name: RouteDocuments
+        inputs: [TextConverter]
+      - name: JoinDocuments
+        inputs: [RouteDocuments.output_1, RouteDocuments.output_2]
+"""
+
+
+def clear_caches():
+    get_compiled_schema.cache_clear()
+    _json_schema._NODE_CLASS_SCHEMAS.clear()
+
+
+def benchmark_pipeline_loading(loads: int) -> List[Dict]:
+    results = []
+    with TemporaryDirectory() as directory:
+        path = Path(directory) / "pipeline.yml"
+        path.write_text(PIPELINE_YAML)
+        # Generates the schema file if it doesn't exist yet, so that it's not measured
+        Pipeline.load_from_yaml(path)
+        config = yaml.safe_load(PIPELINE_YAML)
+
+        benchmarks = {
+            "load_from_yaml": lambda: Pipeline.load_from_yaml(path),
+            "validate_schema": lambda: validate_schema(config),
+        }
+        for name, function in benchmarks.items():
+            for cached in [False, True]:
+                seconds = []
+                for _ in range(loads):
+                    if not cached:
+                        clear_caches()
+                    start = perf_counter()
+                    function()
+                    seconds.append(perf_counter() - start)
+                results.append(
+                    {
+                        "benchmark": name,
+                        "cached_schema": cached,
+                        "runs": loads,
+                        "mean_ms": round(1000 * sum(seconds) / loads, 2),
+                        "max_ms": round(1000 * max(seconds), 2),
+                    }
+                )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--loads", type=int, default=20, help="Number of times the pipeline is loaded.")
+    args = parser.parse_args()
+
+    for result in benchmark_pipeline_loading(loads=args.loads):
+        print(json.dumps(result))
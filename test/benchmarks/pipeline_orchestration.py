@@ -0,0 +1,84 @@
+"""
+Measures the orchestration overhead of `Pipeline.run()` and `Pipeline.run_batch()`: the time spent routing the inputs
+between nodes that return immediately. The pipeline has a chain of nodes, a decision node with two branches, and a
+node joining the branches. For comparison, the runs are also measured with the execution plan compiled again on every
+run, as if the graph changed before each run.
+
+Usage: python pipeline_orchestration.py --runs 1000 --nodes 20
+"""
+from time import perf_counter
+from typing import Dict, List
+import argparse
+import json
+
+from haystack import Pipeline
+from haystack.nodes.base import BaseComponent
+
+
+class PassThrough(BaseComponent):
+    outgoing_edges = 1
+
+    def run(self, query=None, inputs=None, top_k=None):  # type: ignore
+        return {"query": query}, "output_1"
+
+    def run_batch(self, queries=None, inputs=None, top_k=None):  # type: ignore
+        return {"queries": queries}, "output_1"
+
+
+class Decision(PassThrough):
+    outgoing_edges = 2
+
+    def run(self, query=None, inputs=None, top_k=None):  # type: ignore
+        return {"query": query}, "output_1" if len(query) % 2 else "output_2"
+
+
+def build_pipeline(nodes: int) -> Pipeline:
+    pipeline = Pipeline()
+    previous = "Query"
+    for i in range(nodes):
+        pipeline.add_node(component=PassThrough(), name=f"Node{i}", inputs=[previous])
+        previous = f"Node{i}"
+    pipeline.add_node(component=Decision(), name="Decision", inputs=[previous])
+    pipeline.add_node(component=PassThrough(), name="Branch1", inputs=["Decision.output_1"])
+    pipeline.add_node(component=PassThrough(), name="Branch2", inputs=["Decision.output_2"])
+    pipeline.add_node(component=PassThrough(), name="Join", inputs=["Branch1", "Branch2"])
+    return pipeline
+
+
+def benchmark_orchestration(runs: int, nodes: int) -> List[Dict]:
+    pipeline = build_pipeline(nodes)
+    benchmarks = {
+        "run": lambda: pipeline.run(query="query", params={"top_k": 3}),
+        "run_batch": lambda: pipeline.run_batch(queries=["query 1", "query 2"], params={"top_k": 3}),
+    }
+    results = []
+    for name, function in benchmarks.items():
+        for compiled in [True, False]:
+            function()
+            start = perf_counter()
+            for _ in range(runs):
+                if not compiled:
+                    pipeline._invalidate_execution_plan()
+                function()
+            seconds = perf_counter() - start
+            results.append(
+                {
+                    "benchmark": name,
+                    "compiled_plan": compiled,
+                    "nodes": len(pipeline.graph.nodes),
+                    "runs": runs,
+                    "mean_us": round(1e6 * seconds / runs, 1),
+                    "runs_per_second": round(runs / seconds),
+                }
+            )
+    return results
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=1000, help="Number of times the pipeline is run.")
+    parser.add_argument("--nodes", type=int, default=20, help="Number of nodes in the chain before the branches.")
+    args = parser.parse_args()
+
+    for result in benchmark_orchestration(runs=args.runs, nodes=args.nodes):
+        print(json.dumps(result))
@@ -0,0 +1,108 @@
+import pickle
+from pathlib import Path
+
+import pytest
+import torch
+from torch.utils.data import TensorDataset
+
+from haystack.modeling.data_handler.data_silo import DataSilo
+from haystack.modeling.data_handler.dataset import MemmapTensorDataset, convert_features_to_dataset, write_dataset_shard
+
+
+class FakeTokenizer:
+    pad_token_id = 0
+    model_max_length = 4
+
+
+class FakeProcessor:
+    """
+    Minimal picklable stand-in for a Processor, so that it can be sent to the workers of the multiprocessing.Pool.
+    """
+
+    def __init__(self):
+        self.tasks = {"text_classification": {}}
+        self.train_filename = "train.json"
+        self.dev_filename = None
+        self.test_filename = None
+        self.dev_split = 0.0
+        self.data_dir = Path("data")
+        self.max_seq_len = 4
+        self.tokenizer = FakeTokenizer()
+        self.calls = 0
+
+    def dataset_from_dicts(self, dicts, indices=None):
+        self.calls += 1
+        features = [{"input_ids": d["ids"], "label_ids": [d["label"]]} for d in dicts]
+        dataset, tensor_names = convert_features_to_dataset(features)
+        return dataset, tensor_names, set()
+
+    def log_problematic(self, problematic_sample_ids):
+        pass
+
+
+@pytest.fixture
+def train_dicts():
+    return [{"ids": [i + 1, i + 2, 0, 0], "label": i % 2} for i in range(10)]
+
+
+@pytest.mark.unit
+def test_write_dataset_shard(tmp_path):
+    dataset = TensorDataset(torch.arange(12).reshape(6, 2), torch.arange(6))
+    shard = write_dataset_shard(dataset, ["input_ids", "label_ids"], tmp_path / "shard")
+
+    assert isinstance(shard, MemmapTensorDataset)
+    assert len(shard) == 6
+    assert all(torch.equal(a, b) for a, b in zip(shard[2], dataset[2]))
+    assert all(torch.equal(a, b) for a, b in zip(shard[1:4], dataset[1:4]))
+
+    unpickled = pickle.loads(pickle.dumps(shard))
+    assert all(torch.equal(a, b) for a, b in zip(unpickled[:], dataset[:]))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_processes", [1, 2])
+def test_get_dataset(train_dicts, max_processes):
+    silo = DataSilo(
+        processor=FakeProcessor(),
+        batch_size=2,
+        automatic_loading=False,
+        max_multiprocessing_chunksize=3,
+        max_processes=max_processes,
+    )
+    dataset, tensor_names = silo._get_dataset(filename=None, dicts=train_dicts)
+
+    assert tensor_names == ["input_ids", "label_ids"]
+    assert [sample[0].tolist() for sample in dataset] == [d["ids"] for d in train_dicts]
+
+
+@pytest.mark.unit
+def test_data_silo_cache_is_memory_mapped(tmp_path, train_dicts):
+    silo = DataSilo(
+        processor=FakeProcessor(),
+        batch_size=2,
+        automatic_loading=False,
+        max_multiprocessing_chunksize=3,
+        max_processes=1,
+        caching=True,
+        cache_path=tmp_path,
+    )
+    silo._load_data(train_dicts=train_dicts)
+    assert all(isinstance(shard, MemmapTensorDataset) for shard in silo.data["train"].datasets)
+
+    processor = FakeProcessor()
+    cached_silo = DataSilo(processor=processor, batch_size=2, caching=True, cache_path=tmp_path)
+
+    assert processor.calls == 0
+    assert cached_silo.tensor_names == ["input_ids", "label_ids"]
+    assert cached_silo.data["dev"] is None
+    assert len(cached_silo.data["train"].datasets) == 4
+    assert [sample[0].tolist() for sample in cached_silo.data["train"]] == [d["ids"] for d in train_dicts]
+
+
+@pytest.mark.unit
+def test_data_silo_ignores_incomplete_cache(tmp_path, train_dicts):
+    silo = DataSilo(processor=FakeProcessor(), batch_size=2, automatic_loading=False, caching=True, cache_path=tmp_path)
+    silo._load_data(train_dicts=train_dicts)
+    (tmp_path / silo._get_checksum() / "tensor_names.json").unlink()
+
+    assert not DataSilo._is_cache_complete(tmp_path / silo._get_checksum())
@@ -1,11 +1,20 @@
+import pickle
+
 import pytest
 from unittest.mock import MagicMock
 from unittest import mock
 from pathlib import Path
 
+from tokenizers import Tokenizer, models, pre_tokenizers
+from transformers import PreTrainedTokenizerFast
+
 import haystack
 from haystack.errors import ModelingError
-from haystack.modeling.model.feature_extraction import FeatureExtractor
+from haystack.modeling.model.feature_extraction import (
+    DocumentTokenizationCache,
+    FeatureExtractor,
+    tokenize_batch_question_answering,
+)
 
 
 class MockedAutoTokenizer:
@@ -108,6 +117,57 @@ def test_get_tokenizer_keep_accents():
         )
 
 
+@pytest.fixture()
+def word_level_tokenizer():
+    words = "who lives in berlin paris my name is carla and i live in".split()
+    vocab = {"[UNK]": 0, "[PAD]": 1, **{word: i + 2 for i, word in enumerate(dict.fromkeys(words))}}
+    tokenizer = Tokenizer(models.WordLevel(vocab=vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    return PreTrainedTokenizerFast(tokenizer_object=tokenizer, unk_token="[UNK]", pad_token="[PAD]")
+
+
+def qa_pre_baskets(questions, contexts):
+    return [
+        {"context": context, "qas": [{"question": question, "id": i, "answers": []}]}
+        for i, (question, context) in enumerate(zip(questions, contexts))
+    ]
+
+
+@pytest.mark.unit
+def test_tokenize_batch_question_answering_with_cache(word_level_tokenizer):
+    contexts = ["my name is carla and i live in berlin", "who lives in paris"]
+    cache = DocumentTokenizationCache(max_size=10)
+
+    first = qa_pre_baskets(["who lives in berlin", "who lives in paris"], contexts)
+    uncached = tokenize_batch_question_answering(first, word_level_tokenizer, indices=[0, 1])
+    cached = tokenize_batch_question_answering(first, word_level_tokenizer, indices=[0, 1], cache=cache)
+    for uncached_basket, cached_basket in zip(uncached, cached):
+        for key in ["document_tokens", "document_start_of_word", "question_tokens", "question_offsets"]:
+            assert list(uncached_basket.raw[key]) == list(cached_basket.raw[key])
+        assert list(uncached_basket.raw["document_offsets"]) == list(cached_basket.raw["document_offsets"])
+    assert len(cache) == 2
+
+    # A new query about the same documents reuses their tokens
+    second = qa_pre_baskets(["my name", "my name"], contexts)
+    baskets = tokenize_batch_question_answering(second, word_level_tokenizer, indices=[2, 3], cache=cache)
+    assert baskets[0].raw["document_tokens"] is cached[0].raw["document_tokens"]
+    assert baskets[0].raw["question_tokens"] == word_level_tokenizer("my name", add_special_tokens=False)["input_ids"]
+    assert len(cache) == 2
+
+
+@pytest.mark.unit
+def test_document_tokenization_cache_evicts_least_recently_used():
+    cache = DocumentTokenizationCache(max_size=2)
+    cache.put("a", {"document_tokens": [1]})
+    cache.put("b", {"document_tokens": [2]})
+    cache.get("a")
+    cache.put("c", {"document_tokens": [3]})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"document_tokens": [1]}
+    assert len(pickle.loads(pickle.dumps(cache))) == 0
+
+
 FEATURE_EXTRACTORS_TO_TEST = ["bert-base-cased"]
 
 
@@ -0,0 +1,53 @@
+from unittest.mock import MagicMock
+
+import pytest
+import torch
+from torch.utils.data import TensorDataset
+
+from haystack.modeling.data_handler.samples import Sample, SampleBasket
+from haystack.modeling.infer import Inferencer
+
+
+class MockedProcessor:
+    tasks = {}
+
+    def __init__(self):
+        self.calls = []
+
+    def dataset_from_dicts(self, dicts, indices=None, return_baskets=False):
+        self.calls.append(indices)
+        values = torch.tensor([[d["value"]] for d in dicts])
+        baskets = [
+            SampleBasket(id_internal=str(i), raw=d, samples=[Sample(id=str(i), clear_text=d)])
+            for i, d in zip(indices, dicts)
+        ]
+        return TensorDataset(values), ["value"], {indices[0]} if dicts[0]["value"] < 0 else set(), baskets
+
+
+@pytest.fixture
+def inferencer():
+    model = MagicMock()
+    model.prediction_heads = []
+    model.forward.side_effect = lambda value: value * 2
+    model.formatted_preds.side_effect = lambda logits, samples, padding_mask: logits.flatten().tolist()
+    return Inferencer(model=model, processor=MockedProcessor(), task_type=None, batch_size=2, disable_tqdm=True)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("preprocessing_chunk_size", [None, 1, 3, 10])
+def test_inference_from_dicts_in_chunks(inferencer, preprocessing_chunk_size):
+    inferencer.preprocessing_chunk_size = preprocessing_chunk_size
+    dicts = [{"value": value} for value in [-1, 1, 2, 3, -4, 5, 6]]
+
+    predictions = inferencer.inference_from_dicts(dicts)
+
+    assert predictions == [-2, 2, 4, 6, -8, 10, 12]
+    # The dicts keep their indices in all the inputs, not only in their chunk
+    chunk_size = preprocessing_chunk_size or len(dicts)
+    assert inferencer.processor.calls == [
+        list(range(start, min(start + chunk_size, len(dicts)))) for start in range(0, len(dicts), chunk_size)
+    ]
+    # The mocked processor reports the first dict of a chunk if its value is negative
+    expected_problematic_ids = {0, 4} if chunk_size == 1 else {0}
+    assert inferencer.problematic_sample_ids == expected_problematic_ids
+    assert set(inferencer.last_inference_timings) >= {"preprocessing", "model", "postprocessing"}
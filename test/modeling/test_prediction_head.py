@@ -1,5 +1,8 @@
 import logging
 
+import pytest
+import torch
+
 from haystack.modeling.model.adaptive_model import AdaptiveModel
 from haystack.modeling.model.language_model import get_language_model
 from haystack.modeling.model.prediction_head import QuestionAnsweringHead
@@ -28,3 +31,62 @@ def test_prediction_head_load_save(tmp_path, caplog=None):
     model.save(tmp_path)
     model_loaded = AdaptiveModel.load(tmp_path, device="cpu")
     assert model_loaded is not None
+
+
+def _top_candidates_per_sample(head, logits, span_mask, max_answer_length):
+    # The candidates of each sample, taken from all its candidates sorted by score
+    start_logits, end_logits = (x.squeeze(-1) for x in logits.split(1, dim=-1))
+    start_end_matrix = head._get_start_end_matrix(start_logits, end_logits, span_mask, max_answer_length)
+    batch_size, max_seq_len, _ = start_end_matrix.shape
+    sorted_indices = start_end_matrix.view(batch_size, -1).sort(descending=True)[1].unsqueeze(2)
+    sorted_candidates = torch.cat((sorted_indices // max_seq_len, sorted_indices % max_seq_len), dim=2).numpy()
+    start_matrix = start_logits.unsqueeze(2).expand(-1, -1, max_seq_len)
+    end_matrix = end_logits.unsqueeze(1).expand(-1, max_seq_len, -1)
+    return [
+        head.get_top_candidates(
+            sorted_candidates[i], start_end_matrix[i].numpy(), i, start_matrix=start_matrix[i], end_matrix=end_matrix[i]
+        )
+        for i in range(batch_size)
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("duplicate_filtering", [-1, 0, 2])
+def test_qa_head_logits_to_preds_matches_per_sample_candidates(duplicate_filtering):
+    torch.manual_seed(0)
+    head = QuestionAnsweringHead(n_best=3, n_best_per_sample=4, duplicate_filtering=duplicate_filtering)
+    batch_size, max_seq_len = 5, 40
+    logits = torch.randn(batch_size, max_seq_len, 2)
+    span_mask = torch.ones(batch_size, max_seq_len, dtype=torch.long)
+    # question tokens and padding are never part of an answer
+    span_mask[:, 1:8] = 0
+    span_mask[1, 30:] = 0
+
+    preds = head.logits_to_preds(logits, span_mask, start_of_word=None, seq_2_start_t=None, max_answer_length=10)
+
+    expected = _top_candidates_per_sample(head, logits, span_mask, max_answer_length=10)
+    assert len(preds) == batch_size
+    for sample_preds, expected_sample_preds in zip(preds, expected):
+        assert [
+            (p.offset_answer_start, p.offset_answer_end, p.score, p.confidence, p.answer_type, p.passage_id)
+            for p in sample_preds
+        ] == [
+            (p.offset_answer_start, p.offset_answer_end, p.score, p.confidence, p.answer_type, p.passage_id)
+            for p in expected_sample_preds
+        ]
+
+
+@pytest.mark.unit
+def test_qa_head_logits_to_preds_with_few_candidates():
+    head = QuestionAnsweringHead(n_best=5, duplicate_filtering=3)
+    logits = torch.randn(2, 6, 2)
+    span_mask = torch.tensor([[1, 0, 0, 1, 1, 0], [1, 0, 0, 0, 0, 1]])
+
+    preds = head.logits_to_preds(logits, span_mask, start_of_word=None, seq_2_start_t=None, max_answer_length=100)
+
+    expected = _top_candidates_per_sample(head, logits, span_mask, max_answer_length=100)
+    for sample_preds, expected_sample_preds in zip(preds, expected):
+        assert len(sample_preds) == len(expected_sample_preds)
+        assert sample_preds[0].offset_answer_start == expected_sample_preds[0].offset_answer_start
+        assert sample_preds[0].offset_answer_end == expected_sample_preds[0].offset_answer_end
+        assert sample_preds[-1].answer_type == "no_answer"
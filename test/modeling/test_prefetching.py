@@ -0,0 +1,93 @@
+import threading
+import time
+
+import pytest
+
+from haystack.modeling.data_handler.prefetching import StageTimings, prefetch_chunks
+
+
+@pytest.mark.unit
+def test_prefetch_chunks_keeps_order_and_indices():
+    items = [f"item {i}" for i in range(10)]
+
+    chunks = list(prefetch_chunks(items, lambda chunk, indices: (chunk, indices), chunk_size=4))
+
+    assert chunks == [(items[0:4], [0, 1, 2, 3]), (items[4:8], [4, 5, 6, 7]), (items[8:10], [8, 9])]
+
+
+@pytest.mark.unit
+def test_prefetch_chunks_without_chunk_size_featurizes_all_items_in_the_calling_thread():
+    threads = []
+
+    def featurize(chunk, indices):
+        threads.append(threading.current_thread())
+        return indices
+
+    assert list(prefetch_chunks(["a", "b", "c"], featurize)) == [[0, 1, 2]]
+    assert threads == [threading.current_thread()]
+
+
+@pytest.mark.unit
+def test_prefetch_chunks_featurizes_while_the_caller_works():
+    timings = StageTimings()
+
+    def featurize(chunk, indices):
+        time.sleep(0.05)
+        return indices
+
+    start = time.perf_counter()
+    for _ in prefetch_chunks(list(range(8)), featurize, chunk_size=2, timings=timings):
+        # The model would run on the chunk here
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - start
+
+    # Sequentially, featurizing and working on 4 chunks would take 0.4 seconds
+    assert elapsed < 0.35
+    assert timings.to_dict()["preprocessing"] >= 0.2
+    assert timings.to_dict()["waiting_for_preprocessing"] < 0.2
+
+
+@pytest.mark.unit
+def test_prefetch_chunks_bounds_the_prefetched_chunks():
+    featurized = []
+
+    def featurize(chunk, indices):
+        featurized.append(indices)
+        return indices
+
+    chunks = prefetch_chunks(list(range(10)), featurize, chunk_size=1, max_prefetched_chunks=2)
+    assert next(chunks) == [0]
+    time.sleep(0.2)
+    # The first chunk was consumed, two wait in the queue, and one is featurized but can't be queued yet
+    assert len(featurized) == 4
+    chunks.close()
+
+
+@pytest.mark.unit
+def test_prefetch_chunks_raises_featurization_errors():
+    def featurize(chunk, indices):
+        if indices[0] == 2:
+            raise ValueError("Broken chunk")
+        return indices
+
+    chunks = prefetch_chunks(list(range(4)), featurize, chunk_size=2)
+    assert next(chunks) == [0, 1]
+    with pytest.raises(ValueError, match="Broken chunk"):
+        next(chunks)
+
+
+@pytest.mark.unit
+def test_prefetch_chunks_stops_featurizing_when_closed():
+    featurized = []
+
+    def featurize(chunk, indices):
+        featurized.append(indices)
+        return indices
+
+    chunks = prefetch_chunks(list(range(100)), featurize, chunk_size=1)
+    next(chunks)
+    chunks.close()
+    count = len(featurized)
+    time.sleep(0.2)
+
+    assert len(featurized) == count < 100
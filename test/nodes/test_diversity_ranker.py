@@ -1,6 +1,9 @@
 from typing import List
+from unittest.mock import patch
 
+import numpy as np
 import pytest
+import torch
 
 from haystack import Document
 from haystack.nodes.ranker.diversity import DiversityRanker
@@ -265,3 +268,103 @@ def test_diversity_ranker_with_top_k_edge():
     documents = [Document(content="doc1"), Document(content="doc2"), Document(content="doc3")]
     result = ranker.predict(query=query, documents=documents)
     assert len(result) == 3
+
+
+class MockSentenceTransformer:
+    """
+    Deterministic stand-in for a SentenceTransformer that hashes the texts into random embeddings.
+    """
+
+    def __init__(self, *args, **kwargs):
+        self.device = torch.device("cpu")
+        self.encoded_texts: List[str] = []
+
+    def get_sentence_embedding_dimension(self):
+        return 8
+
+    def encode(self, texts, convert_to_tensor=True):
+        self.encoded_texts.extend(texts)
+        return torch.stack([self.embed(text) for text in texts])
+
+    @staticmethod
+    def embed(text):
+        generator = torch.Generator().manual_seed(sum(ord(c) * (i + 1) for i, c in enumerate(text)))
+        return torch.randn(8, generator=generator)
+
+
+@pytest.fixture
+def mock_sentence_transformer():
+    with patch("haystack.nodes.ranker.diversity.SentenceTransformer", MockSentenceTransformer):
+        yield
+
+
+def _reference_greedy_order(query_embedding, doc_embeddings, similarity):
+    """Straightforward implementation of the greedy diversity order to check the batched one against"""
+    if similarity == "dot_product":
+        doc_embeddings = doc_embeddings / torch.norm(doc_embeddings, p=2, dim=-1).unsqueeze(-1)
+        query_embedding = query_embedding / torch.norm(query_embedding, p=2, dim=-1)
+    n = len(doc_embeddings)
+    selected = [int(torch.argmax(doc_embeddings @ query_embedding))]
+    selected_sum = doc_embeddings[selected[0]] / n
+    while len(selected) < n:
+        similarities = doc_embeddings @ selected_sum
+        similarities[selected] = torch.inf
+        selected.append(int(torch.argmin(similarities)))
+        selected_sum += doc_embeddings[selected[-1]] / n
+    return selected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("similarity", ["dot_product", "cosine"])
+def test_greedy_diversity_order_matches_reference(mock_sentence_transformer, similarity):
+    ranker = DiversityRanker(similarity=similarity, use_gpu=False)  # type: ignore
+    documents = [Document(content=f"document {i}") for i in range(12)]
+    expected = _reference_greedy_order(
+        MockSentenceTransformer.embed("query"),
+        torch.stack([MockSentenceTransformer.embed(doc.content) for doc in documents]),
+        similarity,
+    )
+
+    assert ranker.greedy_diversity_order(query="query", documents=documents) == [documents[i] for i in expected]
+    # Stopping early selects the same documents as cutting off the full order
+    assert ranker.predict(query="query", documents=documents, top_k=4) == [documents[i] for i in expected[:4]]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("top_k", [None, 3])
+def test_predict_batch_matches_predict(mock_sentence_transformer, top_k):
+    ranker = DiversityRanker(use_gpu=False)
+    queries = ["first query", "second query", "third query"]
+    documents = [[Document(content=f"doc {q} {i}") for i in range(n)] for q, n in enumerate([5, 1, 9])]
+
+    results = ranker.predict_batch(queries=queries, documents=documents, top_k=top_k)
+
+    assert results == [ranker.predict(query=q, documents=docs, top_k=top_k) for q, docs in zip(queries, documents)]
+    assert [len(docs) for docs in results] == [min(n, top_k or n) for n in [5, 1, 9]]
+
+
+@pytest.mark.unit
+def test_predict_batch_encodes_all_queries_at_once(mock_sentence_transformer):
+    ranker = DiversityRanker(use_gpu=False)
+    documents = [[Document(content=f"doc {q} {i}") for i in range(3)] for q in range(2)]
+    with patch.object(ranker.model, "encode", wraps=ranker.model.encode) as encode:
+        ranker.predict_batch(queries=["query 1", "query 2"], documents=documents)
+    assert encode.call_count == 2
+
+
+@pytest.mark.unit
+def test_predict_reuses_document_embeddings(mock_sentence_transformer):
+    documents = [Document(content=f"document {i}") for i in range(6)]
+    for doc in documents[:4]:
+        doc.embedding = MockSentenceTransformer.embed(doc.content).numpy()
+    # An embedding of another dimension can't be reused
+    documents[4].embedding = np.ones(3, dtype=np.float32)
+    embeddings_before = [None if doc.embedding is None else doc.embedding.copy() for doc in documents]
+
+    ranker = DiversityRanker(use_gpu=False, use_document_embeddings=True)
+    result = ranker.predict(query="query", documents=documents)
+
+    assert ranker.model.encoded_texts == ["document 4", "document 5", "query"]
+    assert result == DiversityRanker(use_gpu=False).predict(query="query", documents=documents)
+    for doc, embedding in zip(documents, embeddings_before):
+        assert (doc.embedding is None and embedding is None) or np.array_equal(doc.embedding, embedding)
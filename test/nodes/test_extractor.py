@@ -1,4 +1,8 @@
+from unittest.mock import patch
+
 import pytest
+import torch
+from transformers import BertConfig, BertForTokenClassification, BertTokenizerFast
 
 from haystack.nodes import TextConverter
 from haystack.nodes.retriever.sparse import BM25Retriever
@@ -19,6 +23,43 @@ def ner_node():
     return EntityExtractor(model_name_or_path="elastic/distilbert-base-cased-finetuned-conll03-english")
 
 
+TINY_NER_WORDS = "carla jon snow lives in berlin paris and my name is the".split()
+
+
+@pytest.fixture
+def tiny_ner_model(tmp_path):
+    """A randomly initialized BERT token classification model with a small vocabulary that has subword tokens."""
+    vocab_file = tmp_path / "vocab.txt"
+    vocab_file.write_text(
+        "\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "."] + TINY_NER_WORDS + ["##a", "##er"])
+    )
+    BertTokenizerFast(str(vocab_file), model_max_length=12).save_pretrained(tmp_path)
+    labels = ["O", "B-PER", "I-PER", "B-LOC", "I-LOC"]
+    config = BertConfig(
+        vocab_size=len(TINY_NER_WORDS) + 8,
+        hidden_size=16,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        intermediate_size=32,
+        initializer_range=1.0,
+        label2id={label: i for i, label in enumerate(labels)},
+        id2label=dict(enumerate(labels)),
+    )
+    torch.manual_seed(0)
+    BertForTokenClassification(config).save_pretrained(tmp_path)
+    return str(tmp_path)
+
+
+@pytest.fixture
+def tiny_ner_texts():
+    return [
+        "carla lives in berlin and jon snow lives in paris",
+        "my name is carlaa . i live in berliner and xyz is unknown",
+        "jon",
+        "the name of the snow and the berlin and the paris is carla and jon " * 3,
+    ]
+
+
 @pytest.mark.integration
 @pytest.mark.parametrize("document_store_with_docs", ["memory"], indirect=True)
 def test_extractor(document_store_with_docs, tiny_reader, ner_node):
@@ -233,3 +274,75 @@ def test_extract_method_simple_aggregation():
         {"entity_group": "PER", "word": "De", "start": 30, "end": 32},
         {"entity_group": "LOC", "word": "##bra", "start": 32, "end": 35},
     ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("aggregation_strategy", [None, "simple", "first", "max"])
+@pytest.mark.parametrize("pre_split_text", [False, True])
+def test_extract_vectorized_aggregation_matches_per_token_aggregation(
+    tiny_ner_model, tiny_ner_texts, aggregation_strategy, pre_split_text
+):
+    ner = EntityExtractor(
+        model_name_or_path=tiny_ner_model,
+        use_gpu=False,
+        progress_bar=False,
+        aggregation_strategy=aggregation_strategy,
+        pre_split_text=pre_split_text,
+        ignore_labels=[],
+    )
+    vectorized = ner.extract(tiny_ner_texts)
+
+    with patch.object(ner.entity_postprocessor, "VECTORIZED_AGGREGATION_STRATEGIES", ()):
+        per_token = ner.extract(tiny_ner_texts)
+
+    assert len(vectorized) == len(per_token) == len(tiny_ner_texts)
+    for vectorized_entities, per_token_entities in zip(vectorized, per_token):
+        assert len(vectorized_entities) > 0
+        for vectorized_entity, per_token_entity in zip(vectorized_entities, per_token_entities):
+            assert vectorized_entity.pop("score") == pytest.approx(per_token_entity.pop("score"))
+        assert vectorized_entities == per_token_entities
+
+
+@pytest.mark.unit
+def test_extract_vectorized_aggregation_ignores_labels(tiny_ner_model, tiny_ner_texts):
+    ner = EntityExtractor(model_name_or_path=tiny_ner_model, use_gpu=False, progress_bar=False)
+    all_entities = ner.extract(tiny_ner_texts[0])
+
+    ner.ignore_labels = ["O", "PER"]
+    entities = ner.extract(tiny_ner_texts[0])
+
+    assert entities == [entity for entity in all_entities if entity["entity_group"] != "PER"]
+
+
+@pytest.mark.unit
+def test_extract_stream_processes_windows_of_documents(tiny_ner_model, tiny_ner_texts):
+    ner = EntityExtractor(model_name_or_path=tiny_ner_model, use_gpu=False, progress_bar=False)
+    expected = ner.extract(tiny_ner_texts, batch_size=4)
+
+    with patch.object(ner, "preprocess", wraps=ner.preprocess) as preprocess:
+        stream = ner.extract_stream((text for text in tiny_ner_texts), batch_size=4, documents_per_window=3)
+        first_entities = next(stream)
+        assert [len(call.args[0]) for call in preprocess.call_args_list] == [3]
+        entities = [first_entities] + list(stream)
+
+    assert [len(call.args[0]) for call in preprocess.call_args_list] == [3, 1]
+    assert entities == expected
+
+
+@pytest.mark.unit
+def test_extract_batch_uses_documents_per_window(tiny_ner_model, tiny_ner_texts):
+    ner = EntityExtractor(model_name_or_path=tiny_ner_model, use_gpu=False, progress_bar=False)
+    expected = ner.extract_batch([tiny_ner_texts[:3], tiny_ner_texts[3:]])
+
+    ner.documents_per_window = 1
+    with patch.object(ner, "preprocess", wraps=ner.preprocess) as preprocess:
+        entities = ner.extract_batch([tiny_ner_texts[:3], tiny_ner_texts[3:]])
+
+    assert preprocess.call_count == len(tiny_ner_texts)
+    assert entities == expected
+
+
+@pytest.mark.unit
+def test_extractor_invalid_documents_per_window(tiny_ner_model):
+    with pytest.raises(ValueError, match="documents_per_window"):
+        EntityExtractor(model_name_or_path=tiny_ner_model, use_gpu=False, documents_per_window=0)
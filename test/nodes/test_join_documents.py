@@ -1,3 +1,6 @@
+import random
+from math import inf
+
 import pytest
 
 
@@ -113,3 +116,65 @@ def test_joindocuments_concatenate_duplicate_docs_null_score():
     result, _ = join_docs.run(inputs)
     assert len(result["documents"]) == 3
     assert result["documents"] == expected_outputs["documents"]
+
+
+def _reference_join(results, join_mode, weights=None, top_k_join=None):
+    """Straightforward dict-based implementation of the join modes to check the vectorized one against"""
+    document_map = {doc.id: doc for result in results for doc in result}
+    scores_map = {}
+    for input_id, result in enumerate(results):
+        for rank, doc in enumerate(result):
+            if join_mode == "concatenate":
+                best = scores_map.get(doc.id)
+                if doc.id not in scores_map or (doc.score is not None and (best is None or doc.score > best)):
+                    scores_map[doc.id] = doc.score
+            elif join_mode == "merge":
+                weight = weights[input_id] if weights else 1 / len(results)
+                scores_map[doc.id] = scores_map.get(doc.id, 0) + (doc.score or 0) * weight
+            else:
+                scores_map[doc.id] = scores_map.get(doc.id, 0) + 1 / (61 + rank)
+    ranked = sorted(scores_map.items(), key=lambda d: d[1] if d[1] is not None else -inf, reverse=True)
+    return [(document_map[id].content, score) for id, score in ranked[:top_k_join]]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("join_mode", ["concatenate", "merge", "reciprocal_rank_fusion"])
+@pytest.mark.parametrize("top_k_join", [None, 1, 7, 100])
+def test_joindocuments_matches_reference(join_mode, top_k_join):
+    def make_batch():
+        rng = random.Random(42)
+        batch = []
+        for _ in range(4):
+            results = []
+            for _ in range(3):
+                ids = rng.sample(range(30), 20)
+                # scores are rounded to provoke ties between documents
+                scores = [rng.choice([None, round(rng.random(), 1)]) for _ in ids]
+                results.append([Document(content=f"doc {i}", score=score) for i, score in zip(ids, scores)])
+            batch.append(results)
+        return batch
+
+    weights = [3.0, 1.0, 1.0] if join_mode == "merge" else None
+    batch = make_batch()
+    join_docs = JoinDocuments(join_mode=join_mode, weights=weights, top_k_join=top_k_join)
+    normalized_weights = [w / sum(weights) for w in weights] if weights else None
+    expected = [_reference_join(results, join_mode, normalized_weights, top_k_join) for results in batch]
+
+    result, _ = join_docs.run_batch(inputs=[{"documents": [results[i] for results in batch]} for i in range(3)])
+    for docs, expected_docs in zip(result["documents"], expected):
+        assert [doc.content for doc in docs] == [content for content, _ in expected_docs]
+        assert [doc.score for doc in docs] == pytest.approx([score for _, score in expected_docs])
+
+    # JoinDocuments sets the joined scores on the documents, so the single query run needs fresh ones
+    result, _ = join_docs.run(inputs=[{"documents": docs} for docs in make_batch()[0]])
+    assert [doc.content for doc in result["documents"]] == [content for content, _ in expected[0]]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("join_mode", ["concatenate", "merge", "reciprocal_rank_fusion"])
+def test_joindocuments_without_inputs(join_mode):
+    join_docs = JoinDocuments(join_mode=join_mode)
+
+    assert join_docs._join([[]]) == [[]]
+    assert join_docs._join([[], [[]]]) == [[], []]
+    assert join_docs._join([]) == []
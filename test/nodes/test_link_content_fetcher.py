@@ -1,6 +1,9 @@
 from typing import Optional
 from unittest.mock import Mock, patch
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 import logging
+import threading
+import time
 import pytest
 import requests
 from requests import Response
@@ -20,6 +23,45 @@ def mocked_requests():
         yield mock_requests
 
 
+def raw_text_handler(response) -> Optional[str]:
+    return response.text
+
+
+@pytest.fixture
+def local_http_stub():
+    """
+    A local HTTP server that answers /<name>?delay=<seconds> with an HTML page containing <name> after the delay.
+    It counts the requests per path and tracks the maximum number of requests it was serving at the same time.
+    """
+    stats = {"requests": {}, "in_flight": 0, "max_in_flight": 0}
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            path, _, query = self.path.partition("?")
+            with lock:
+                stats["requests"][path] = stats["requests"].get(path, 0) + 1
+                stats["in_flight"] += 1
+                stats["max_in_flight"] = max(stats["max_in_flight"], stats["in_flight"])
+            time.sleep(float(query.split("=")[1]) if query.startswith("delay=") else 0)
+            with lock:
+                stats["in_flight"] -= 1
+            body = f"<html><body><p>Content of {path[1:]}</p></body></html>".encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "text/html")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_address[1]}", stats
+    server.shutdown()
+
+
 @pytest.fixture
 def mocked_article_extractor():
     with patch("boilerpy3.extractors.ArticleExtractor.get_content", return_value="Sample content from webpage"):
@@ -403,6 +445,106 @@ def test_valid_requests_dont_switch_agent(mocked_requests):
     )
 
 
+@pytest.mark.unit
+def test_fetch_batch(local_http_stub, mocked_article_extractor):
+    base_url, _ = local_http_stub
+    urls = [f"{base_url}/page{i}" for i in range(5)]
+    r = LinkContentFetcher()
+
+    results = r.fetch_batch(urls=urls, doc_kwargs=[{"snippet_text": f"snippet {i}"} for i in range(5)])
+
+    assert len(results) == 5
+    assert [docs[0].meta["url"] for docs in results] == urls
+    assert all(docs[0].content == "Sample content from webpage" for docs in results)
+
+
+@pytest.mark.unit
+def test_fetch_batch_limits_connections_per_host(local_http_stub):
+    base_url, stats = local_http_stub
+    r = LinkContentFetcher(max_connections_per_host=2)
+
+    r.fetch_batch(urls=[f"{base_url}/page{i}?delay=0.1" for i in range(6)])
+
+    assert sum(stats["requests"].values()) == 6
+    assert stats["max_in_flight"] == 2
+
+
+@pytest.mark.unit
+def test_fetch_batch_returns_what_finished_within_total_timeout(local_http_stub):
+    base_url, _ = local_http_stub
+    r = LinkContentFetcher(total_timeout=0.5, content_handlers={"text/html": raw_text_handler})
+
+    start = time.perf_counter()
+    results = r.fetch_batch(
+        urls=[f"{base_url}/fast", f"{base_url}/slow?delay=3"],
+        doc_kwargs=[{"snippet_text": "fast snippet"}, {"snippet_text": "slow snippet"}],
+    )
+
+    assert time.perf_counter() - start < 2
+    assert "Content of fast" in results[0][0].content
+    # the slow page falls back to the snippet text
+    assert results[1][0].content == "slow snippet"
+
+
+@pytest.mark.unit
+def test_fetch_batch_invalid_url():
+    r = LinkContentFetcher()
+    with pytest.raises(requests.exceptions.InvalidURL):
+        r.fetch_batch(urls=["http://example.com", "invalid-url"])
+
+
+@pytest.mark.unit
+def test_run_batch_fetches_duplicate_urls_once(local_http_stub):
+    base_url, stats = local_http_stub
+    r = LinkContentFetcher(content_handlers={"text/html": raw_text_handler})
+
+    results, _ = r.run_batch(queries=[f"{base_url}/a", f"{base_url}/b", f"{base_url}/a"])
+
+    assert len(results["documents"]) == 3
+    assert stats["requests"] == {"/a": 1, "/b": 1}
+    assert results["documents"][0][0].content == results["documents"][2][0].content
+
+
+def failing_handler(response) -> Optional[str]:
+    if "broken" in response.text:
+        raise ValueError("Can't extract the content")
+    return response.text
+
+
+@pytest.mark.unit
+def test_fetch_batch_skip_failed_urls(local_http_stub):
+    base_url, _ = local_http_stub
+    r = LinkContentFetcher(raise_on_failure=True, content_handlers={"text/html": failing_handler})
+    urls = [f"{base_url}/good", f"{base_url}/broken", f"{base_url}/other"]
+
+    with pytest.raises(ValueError):
+        r.fetch_batch(urls=urls)
+
+    results = r.fetch_batch(urls=urls, skip_failed_urls=True)
+    assert "Content of good" in results[0][0].content
+    assert results[1] == []
+    assert "Content of other" in results[2][0].content
+
+
+@pytest.mark.unit
+def test_close_stops_the_event_loop_and_closes_the_client(local_http_stub):
+    base_url, _ = local_http_stub
+    r = LinkContentFetcher(content_handlers={"text/html": raw_text_handler})
+    r.fetch_batch(urls=[f"{base_url}/a"])
+    thread, client = r._engine._thread, r._engine._client
+    assert thread.is_alive()
+
+    r.close()
+
+    assert not thread.is_alive()
+    assert client.is_closed
+    assert r._engine._client is None
+    # the engine starts again when it's used after closing
+    assert "Content of b" in r.fetch_batch(urls=[f"{base_url}/b"])[0][0].content
+    r.close()
+    r.close()
+
+
 @pytest.mark.integration
 def test_call_with_valid_url_on_live_web():
     """
@@ -502,8 +502,10 @@ def test_farmreader_predict_preprocessor_batching(mocked_qa_inferencer, docs):
     reader = FARMReader(model_name_or_path="mocked_model", preprocessing_batch_size=2)
     reader.predict(query="sample query", documents=docs)
 
-    # We expect 3 calls to the QAInferencer (5 docs / 2 batch_size)
-    assert reader.inferencer.inference_from_objects.call_count == 3
+    # The QAInferencer gets all 5 docs at once and preprocesses them in batches of 2
+    assert reader.inferencer.inference_from_objects.call_count == 1
+    assert len(reader.inferencer.inference_from_objects.call_args.kwargs["objects"]) == 5
+    assert mocked_qa_inferencer.load.call_args.kwargs["preprocessing_chunk_size"] == 2
 
 
 @pytest.mark.unit
@@ -512,5 +514,7 @@ def test_farmreader_predict_batch_preprocessor_batching(mocked_qa_inferencer, do
     reader = FARMReader(model_name_or_path="mocked_model", preprocessing_batch_size=2)
     reader.predict_batch(queries=["sample query 1", "sample_query_2"], documents=docs)
 
-    # We expect 5 calls to the QAInferencer (2 queries * 5 docs / 2 batch_size)
-    assert reader.inferencer.inference_from_objects.call_count == 5
+    # The QAInferencer gets all 10 query-doc pairs at once and preprocesses them in batches of 2
+    assert reader.inferencer.inference_from_objects.call_count == 1
+    assert len(reader.inferencer.inference_from_objects.call_args.kwargs["objects"]) == 10
+    assert mocked_qa_inferencer.load.call_args.kwargs["preprocessing_chunk_size"] == 2
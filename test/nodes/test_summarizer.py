@@ -1,7 +1,6 @@
 import pytest
 
 import haystack
-from haystack.utils.torch_utils import ListDataset
 from haystack.schema import Document
 from haystack.nodes import TransformersSummarizer
 
@@ -13,18 +12,22 @@ SUMMARIZED_DOCS = [
 ]
 
 
+class MockTokenizer:
+    model_max_length = 512
+
+    def __call__(self, texts, *a, **k):
+        return {"input_ids": [text.split() for text in texts]}
+
+
 class MockHFPipeline:
     def __init__(self, *a, **k):
-        pass
+        self.tokenizer = MockTokenizer()
+        self.batches = []
 
     def __call__(self, docs, *a, **k):
-        summaries = [{"summary_text": summary} for summary in EXPECTED_SUMMARIES]
-        if isinstance(docs, ListDataset):
-            return [summaries for _ in docs]
-        return summaries
-
-    def tokenizer(self, *a, **k):
-        return {"input_ids": []}
+        self.batches.append(docs)
+        summaries = {doc.content: summary for doc, summary in zip(DOCS, EXPECTED_SUMMARIES)}
+        return [{"summary_text": summaries.get(doc, "Long summary")} for doc in docs]
 
 
 @pytest.fixture
@@ -83,3 +86,14 @@ def test_summarization_batch_multiple_doc_lists(summarizer):
     assert len(summarized_docs[0]) == len(DOCS)
     for expected_summary, summary in zip(EXPECTED_SUMMARIES, summarized_docs[0]):
         assert expected_summary == summary.meta["summary"]
+
+
+@pytest.mark.unit
+def test_summarization_batch_multiple_doc_lists_in_one_stream_of_batches(mock_models):
+    summarizer = TransformersSummarizer(model_name_or_path="irrelevant/anyway", use_gpu=False, batch_size=3)
+    long_doc = Document(content="First test doc " * 10)
+
+    summarizer.predict_batch(documents=[[DOCS[0], long_doc], [DOCS[1]], [DOCS[0]]])
+
+    # The longest document comes first, and the batches hold documents of all lists
+    assert summarizer.summarizer.batches == [[long_doc.content, DOCS[0].content, DOCS[1].content], [DOCS[0].content]]
@@ -9,19 +9,23 @@ ORIGINAL_TEXT = "TEST QUERY"
 TRANSLATION = "MOCK TRANSLATION"
 
 
+class MockEncoding(dict):
+    def to(self, *a, **k):
+        return {"input_ids": self["input_ids"]}
+
+
 class MockTokenizer:
+    model_max_length = 512
+
     @classmethod
     def from_pretrained(cls, *a, **k):
         return cls()
 
-    def __call__(self, *a, **k):
-        return self
+    def __call__(self, text, *a, **k):
+        return MockEncoding(input_ids=[t.split() for t in text])
 
-    def to(self, *a, **k):
-        return {}
-
-    def batch_decode(self, *a, **k):
-        return [TRANSLATION]
+    def batch_decode(self, generated_output, *a, **k):
+        return [TRANSLATION] * len(generated_output)
 
 
 class MockModel:
@@ -29,8 +33,12 @@ class MockModel:
     def from_pretrained(cls, *a, **k):
         return cls()
 
-    def generate(self, *a, **k):
-        return None
+    def __init__(self):
+        self.batches = []
+
+    def generate(self, input_ids, *a, **k):
+        self.batches.append(input_ids)
+        return input_ids
 
     def to(self, *a, **k):
         return None
@@ -113,3 +121,22 @@ def test_translator_with_dict_without_text_key(en_to_de_translator):
 def test_translator_with_dict_with_non_string_value(en_to_de_translator):
     with pytest.raises(AttributeError):
         en_to_de_translator.translate(documents=[{"text": 123}])
+
+
+@pytest.mark.unit
+def test_translator_batch_with_queries(mock_models):
+    translator = TransformersTranslator(model_name_or_path="irrelevant/anyway", batch_size=2)
+    translations = translator.translate_batch(queries=["a", "b c", "d"])
+    assert translations == [TRANSLATION] * 3
+    assert translator.model.batches == [[["b", "c"], ["a"]], [["d"]]]
+
+
+@pytest.mark.unit
+def test_translator_batch_with_multiple_document_lists_in_one_stream_of_batches(mock_models):
+    translator = TransformersTranslator(model_name_or_path="irrelevant/anyway", batch_size=2)
+    documents = [[Document(content="a b"), Document(content="c")], [Document(content="d e f")]]
+
+    translations = translator.translate_batch(documents=documents)
+
+    assert [[doc.content for doc in docs] for docs in translations] == [[TRANSLATION] * 2, [TRANSLATION]]
+    assert translator.model.batches == [[["d", "e", "f"], ["a", "b"]], [["c"]]]
@@ -1,23 +1,25 @@
 import os
-from unittest.mock import patch, Mock
+from datetime import datetime
+from unittest.mock import patch, Mock, PropertyMock
 from test.conftest import MockDocumentStore
+import httpx
 import pytest
 
 from haystack import Document, Pipeline
+from haystack.document_stores import InMemoryDocumentStore
 from haystack.nodes import WebRetriever, PromptNode
-from haystack.nodes.retriever.link_content import html_content_handler
+from haystack.nodes.retriever.link_content import html_content_handler, _AsyncFetchEngine
 from haystack.nodes.retriever.web import SearchResult
 from test.nodes.conftest import example_serperdev_response
 
 
 @pytest.fixture
 def mocked_requests():
-    with patch("haystack.nodes.retriever.link_content.requests") as mock_requests:
-        mock_response = Mock()
-        mock_requests.get.return_value = mock_response
-        mock_response.status_code = 200
-        mock_response.text = "Sample content from webpage"
-        yield mock_requests
+    transport = httpx.MockTransport(lambda request: httpx.Response(200, text="Sample content from webpage"))
+    with patch.object(
+        _AsyncFetchEngine, "client", new_callable=PropertyMock, return_value=httpx.AsyncClient(transport=transport)
+    ) as mock_client:
+        yield mock_client
 
 
 @pytest.fixture
@@ -179,10 +181,17 @@ def test_retrieve_batch(mock_web_search):
     """
     queries = ["query1", "query2"]
     wr = WebRetriever(api_key="fake_key", mode="preprocessed_documents")
-    web_docs = [Document("doc1"), Document("doc2"), Document("doc3")]
-    with patch("haystack.nodes.retriever.web.WebRetriever._scrape_links", return_value=web_docs):
+    web_docs = [
+        Document(f"doc{i}", meta={"url": result["link"]})
+        for i, result in enumerate(example_serperdev_response["organic"])
+    ][:3]
+    with patch("haystack.nodes.retriever.web.WebRetriever._scrape_links", return_value=web_docs) as mock_scrape:
         result = wr.retrieve_batch(queries)
 
+    # both queries return the same links, so they are only fetched once
+    mock_scrape.assert_called_once()
+    assert len(mock_scrape.call_args[0][0]) == len(example_serperdev_response["organic"])
+
     assert len(result) == len(queries)
 
     # check that the result is a list of lists of Documents
@@ -194,6 +203,100 @@ def test_retrieve_batch(mock_web_search):
     assert len([doc for docs in result for doc in docs]) == len(web_docs) * len(queries)
 
 
+@pytest.mark.unit
+def test_retrieve_batch_ranks_shared_links_per_query():
+    wr = WebRetriever(api_key="fake_key", mode="raw_documents", top_k=1)
+    search_results = {
+        "query1": [
+            Document("a", meta={"link": "https://a.com", "score": 0.9, "position": "1"}),
+            Document("b", meta={"link": "https://b.com", "score": 0.1, "position": "2"}),
+        ],
+        "query2": [
+            Document("b", meta={"link": "https://b.com", "score": 0.8, "position": "1"}),
+            Document("a", meta={"link": "https://a.com", "score": 0.2, "position": "2"}),
+        ],
+    }
+    web_docs = [
+        Document("content a", meta={"url": "https://a.com", "search.score": 0.9, "search.position": "1"}),
+        Document("content b", meta={"url": "https://b.com", "search.score": 0.1, "search.position": "2"}),
+    ]
+    with patch.object(
+        wr.web_search, "run", side_effect=lambda query, top_k: ({"documents": search_results[query]}, "output_1")
+    ), patch.object(wr, "_scrape_links", return_value=web_docs):
+        result = wr.retrieve_batch(["query1", "query2"])
+
+    assert [[doc.content for doc in docs] for docs in result] == [["content a"], ["content b"]]
+    assert result[1][0].meta["search.score"] == 0.8
+    assert result[1][0].meta["search.position"] == "1"
+    # the fetched documents are copied per query, not changed
+    assert web_docs[1].meta["search.score"] == 0.1
+
+
+@pytest.mark.unit
+def test_retrieve_batch_returns_the_same_documents_as_retrieve():
+    wr = WebRetriever(api_key="fake_key", mode="raw_documents")
+    search_results = [
+        Document("a", meta={"link": "https://a.com", "score": 0.5, "position": "1"}),
+        Document("b", meta={"link": "https://b.com", "score": 0.4, "position": "2"}),
+        Document("c", meta={"link": "https://c.com", "score": 0.9, "position": "3"}),
+        Document("d", meta={"link": "https://d.com", "score": 1.0, "position": "4"}),
+    ]
+
+    def search(query, top_k):
+        return {"documents": search_results[:top_k]}, "output_1"
+
+    def scrape_links(links):
+        docs = [
+            Document(
+                f"content {link.url}",
+                meta={"url": link.url, "search.score": link.score, "search.position": link.position},
+            )
+            for link in links
+        ]
+        return sorted(docs, key=lambda doc: doc.meta["search.score"], reverse=True)
+
+    def cache_document_store():
+        store = InMemoryDocumentStore()
+        cached_doc = Document(
+            "cached b", meta={"url": "https://b.com", "timestamp": int(datetime.utcnow().timestamp())}
+        )
+        store.write_documents([cached_doc])
+        return store
+
+    with patch.object(wr.web_search, "run", side_effect=search) as mock_search, patch.object(
+        wr, "_scrape_links", side_effect=scrape_links
+    ):
+        batch_result = wr.retrieve_batch(["query"], top_p=3, cache_document_store=cache_document_store())
+        result = wr.retrieve("query", top_p=3, cache_document_store=cache_document_store())
+
+    assert batch_result == [result]
+    assert [doc.content for doc in result] == ["cached b", "content https://c.com", "content https://a.com"]
+    assert [call.kwargs["top_k"] for call in mock_search.call_args_list] == [3, 3]
+
+
+@pytest.mark.unit
+def test_scrape_links_skips_only_failed_links(mocked_article_extractor, mocked_link_content_fetcher_handler_type):
+    def respond(request):
+        if request.url.host == "broken.com":
+            return httpx.Response(500)
+        return httpx.Response(200, text="Sample content from webpage")
+
+    transport = httpx.MockTransport(respond)
+    wr = WebRetriever(api_key="fake_key", mode="raw_documents")
+    wr.link_content_fetcher.raise_on_failure = True
+    wr.link_content_fetcher.retry_attempts = 1
+    links = [
+        SearchResult("https://broken.com", "Some text", 0.9, "1"),
+        SearchResult("https://works.com", "Some text", 0.5, "2"),
+    ]
+    with patch.object(
+        _AsyncFetchEngine, "client", new_callable=PropertyMock, return_value=httpx.AsyncClient(transport=transport)
+    ):
+        result = wr._scrape_links(links)
+
+    assert [doc.meta["url"] for doc in result] == ["https://works.com"]
+
+
 @pytest.mark.unit
 def test_retrieve_uses_cache(mock_web_search):
     """
@@ -236,6 +339,50 @@ def test_retrieve_saves_to_cache(mock_web_search):
     mock_save_cache.assert_called()
 
 
+@pytest.mark.unit
+def test_check_cache_looks_up_all_links_at_once():
+    """
+    Test that the retriever's _check_cache method queries the cache store once for all links and skips expired documents
+    """
+    now = int(datetime.utcnow().timestamp())
+    document_store = InMemoryDocumentStore()
+    document_store.write_documents(
+        [
+            Document("fresh", meta={"url": "https://a.com", "timestamp": now}),
+            Document("expired", meta={"url": "https://b.com", "timestamp": now - 7200}),
+        ]
+    )
+    wr = WebRetriever(api_key="fake_key", mode="raw_documents", cache_document_store=document_store)
+    links = [
+        SearchResult("https://a.com", "Some text", 0.5, "1"),
+        SearchResult("https://b.com", "Some text", 0.4, "2"),
+        SearchResult("https://c.com", "Some text", 0.3, "3"),
+    ]
+
+    with patch.object(document_store, "get_all_documents", wraps=document_store.get_all_documents) as mock_get_all:
+        cached_links, cached_docs = wr._check_cache(links, cache_time=3600)
+
+    mock_get_all.assert_called_once()
+    assert cached_links == [links[0]]
+    assert [doc.content for doc in cached_docs] == ["fresh"]
+    assert wr.cache_stats == {"hits": 1, "misses": 2, "hit_rate": 1 / 3}
+
+
+@pytest.mark.unit
+def test_save_to_cache_deletes_expired_documents_once_per_interval():
+    """
+    Test that the retriever's _save_to_cache method doesn't delete expired documents on every write
+    """
+    document_store = MockDocumentStore()
+    wr = WebRetriever(api_key="fake_key", cache_document_store=document_store, cache_cleanup_interval=3600)
+
+    with patch.object(document_store, "delete_documents") as mock_delete:
+        wr._save_to_cache([Document("doc1")], cache_time=60)
+        wr._save_to_cache([Document("doc2")], cache_time=60)
+
+    mock_delete.assert_called_once()
+
+
 @pytest.mark.integration
 @pytest.mark.skipif(
     not os.environ.get("SERPERDEV_API_KEY", None),
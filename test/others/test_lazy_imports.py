@@ -0,0 +1,90 @@
+import subprocess
+import sys
+from typing import Set
+
+import pytest
+
+import haystack
+import haystack.nodes
+from haystack.errors import PipelineSchemaError
+from haystack.nodes.base import BaseComponent
+
+
+# Dependencies that `import haystack` must not import, as they take seconds to import
+HEAVY_MODULES = {"torch", "transformers", "pandas", "networkx", "posthog", "yaml"}
+
+
+def imported_modules(code: str) -> Set[str]:
+    """
+    Runs `code` in a new interpreter and returns the names of all the modules it imported.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code], capture_output=True, text=True, check=True
+    )
+    return {line.split("|")[-1].strip() for line in result.stderr.splitlines() if line.startswith("import time:")}
+
+
+@pytest.mark.unit
+def test_import_haystack_does_not_import_heavy_dependencies():
+    assert HEAVY_MODULES & imported_modules("import haystack") == set()
+
+
+@pytest.mark.unit
+def test_import_base_component_does_not_import_torch():
+    assert {"torch", "transformers"} & imported_modules("from haystack.nodes.base import BaseComponent") == set()
+
+
+@pytest.mark.unit
+def test_lazy_attributes_are_the_original_objects():
+    from haystack.nodes.file_converter.txt import TextConverter
+    from haystack.schema import Document
+
+    assert haystack.Document is Document
+    assert haystack.nodes.TextConverter is TextConverter
+    assert "TextConverter" in dir(haystack.nodes)
+
+
+@pytest.mark.unit
+def test_lazy_submodules_are_imported_on_access():
+    from haystack.nodes import file_converter
+
+    assert haystack.nodes.file_converter is file_converter
+
+
+@pytest.mark.unit
+def test_unknown_lazy_attribute_raises_attribute_error():
+    with pytest.raises(AttributeError, match="module 'haystack.nodes' has no attribute 'NotANode'"):
+        haystack.nodes.NotANode  # pylint: disable=pointless-statement
+
+
+@pytest.mark.unit
+def test_get_subclass_imports_lazy_components():
+    code = (
+        "from haystack.nodes.base import BaseComponent\n"
+        "assert 'TextConverter' not in BaseComponent._subclasses\n"
+        "assert BaseComponent.get_subclass('TextConverter').__name__ == 'TextConverter'\n"
+        "assert BaseComponent.get_subclass('InMemoryDocumentStore').__name__ == 'InMemoryDocumentStore'\n"
+        # Not exported by haystack.nodes, only registered when importing all nodes
+        "assert BaseComponent.get_subclass('BaseQueryClassifier').__name__ == 'BaseQueryClassifier'\n"
+    )
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+@pytest.mark.unit
+def test_get_subclass_unknown_component():
+    with pytest.raises(PipelineSchemaError, match="'NotANode' not found"):
+        BaseComponent.get_subclass("NotANode")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "package", ["haystack", "haystack.nodes", "haystack.document_stores", "haystack.pipelines", "haystack.utils"]
+)
+def test_star_import_imports_lazy_attributes(package):
+    namespace: dict = {}
+    exec(f"from {package} import *", namespace)  # pylint: disable=exec-used
+
+    module = sys.modules[package]
+    assert module.__all__
+    assert set(module.__all__) <= set(dir(module))
+    assert all(namespace[name] is getattr(module, name) for name in module.__all__)
@@ -2118,6 +2118,88 @@ def test_update_config_hash():
         assert test_pipeline.config_hash == "a30d3273de0d70e63e8cd91d915255b3"
 
 
+@pytest.mark.unit
+def test_config_hash_is_updated_when_needed_after_adding_nodes():
+    pipeline = Pipeline()
+    with mock.patch.object(Pipeline, "update_config_hash", autospec=True) as update_config_hash:
+        pipeline.add_node(name="A", component=MockNode(), inputs=["Query"])
+        pipeline.add_node(name="B", component=MockNode(), inputs=["A"])
+        update_config_hash.assert_not_called()
+
+    config_hash = pipeline.config_hash
+    assert config_hash is not None
+    pipeline.add_node(name="C", component=MockNode(), inputs=["B"])
+    assert pipeline.config_hash not in (None, config_hash)
+
+
+@pytest.mark.unit
+def test_execution_plan():
+    class Classifier(RootNode):
+        outgoing_edges = 2
+
+        def run(self):
+            return {}, "output_1"
+
+    pipeline = Pipeline()
+    pipeline.add_node(name="Classifier", component=Classifier(), inputs=["Query"])
+    pipeline.add_node(name="A", component=MockNode(), inputs=["Classifier.output_1"])
+    pipeline.add_node(name="B", component=MockNode(), inputs=["Classifier.output_2"])
+    pipeline.add_node(name="C", component=MockNode(), inputs=["Classifier.output_1"])
+    pipeline.add_node(name="Join", component=JoinDocuments(), inputs=["A", "B", "C"])
+
+    plan = pipeline._get_execution_plan()
+
+    assert plan.root_node == "Query"
+    assert plan.order.index("Classifier") < plan.order.index("B") < plan.order.index("Join")
+    assert plan.ancestors["Query"] == frozenset()
+    assert plan.ancestors["A"] == {"Query", "Classifier"}
+    assert plan.ancestors["Join"] == {"Query", "Classifier", "A", "B", "C"}
+    assert plan.next_nodes("Classifier", "output_1") == ("A", "C")
+    assert plan.next_nodes("Classifier", "output_2") == ("B",)
+    assert plan.next_nodes("Classifier", "output_3") == ()
+    assert plan.next_nodes("Classifier", "output_all") == ("A", "B", "C")
+    assert plan.next_nodes("Join", "output_1") == ()
+    assert pipeline.get_next_nodes("Classifier", "output_1") == ["A", "C"]
+
+
+@pytest.mark.unit
+def test_execution_plan_is_compiled_again_after_changing_nodes():
+    class A(RootNode):
+        def run(self):
+            return {}, "output_1"
+
+    pipeline = Pipeline()
+    pipeline.add_node(name="A", component=A(), inputs=["Query"])
+    plan = pipeline._get_execution_plan()
+    pipeline.run(query="test")
+    pipeline.run(query="test")
+    assert pipeline._get_execution_plan() is plan
+
+    pipeline.add_node(name="B", component=MockNode(), inputs=["A"])
+    plan_with_b = pipeline._get_execution_plan()
+    assert plan_with_b is not plan
+    assert plan_with_b.next_nodes("A", "output_1") == ("B",)
+
+    pipeline.set_node("B", MockNode())
+    assert pipeline._get_execution_plan() is not plan_with_b
+
+
+@pytest.mark.unit
+def test_validate_node_names_in_params_inspects_the_nodes_once():
+    pipeline = Pipeline()
+    pipeline.add_node(name="A", component=MockNode(), inputs=["Query"])
+
+    with mock.patch.object(
+        Pipeline, "_get_run_node_signature", autospec=True, return_value=["top_k"]
+    ) as get_run_node_signature:
+        pipeline._validate_node_names_in_params(params={"top_k": 3, "A": {}})
+        pipeline._validate_node_names_in_params(params={"top_k": 5})
+        with pytest.raises(ValueError, match="No node\\(s\\) or global parameter\\(s\\) named wrong"):
+            pipeline._validate_node_names_in_params(params={"wrong": 5})
+
+    assert get_run_node_signature.call_count == 2  # once for the root node and once for A
+
+
 @pytest.mark.unit
 def test_load_from_config_w_param_that_equals_component_name():
     config = {
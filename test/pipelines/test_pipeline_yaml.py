@@ -1,5 +1,6 @@
 from abc import abstractmethod
 import logging
+import os
 from numpy import mat
 import pytest
 import json
@@ -15,6 +16,7 @@ from haystack.nodes import _json_schema
 from haystack.nodes import FileTypeClassifier
 from haystack.errors import HaystackError, PipelineConfigError, PipelineSchemaError, DocumentStoreError
 from haystack.nodes.base import BaseComponent
+from haystack.pipelines.config import get_compiled_schema
 
 from ..conftest import MockNode, MockDocumentStore, MockReader, MockRetriever
 from .. import conftest
@@ -371,6 +373,72 @@ def test_load_yaml_custom_component(tmp_path):
     assert pipeline.get_node("custom_node").param == 1
 
 
+@pytest.mark.unit
+def test_load_yaml_custom_component_redefined_with_same_name(tmp_path):
+    config = """
+            version: ignore
+            components:
+            - name: custom_node
+              type: CustomNode
+              params:
+                param: some text
+            pipelines:
+            - name: my_pipeline
+              nodes:
+              - name: custom_node
+                inputs:
+                - Query
+        """
+    with open(tmp_path / "tmp_config.yml", "w") as tmp_file:
+        tmp_file.write(config)
+
+    class CustomNode(MockNode):
+        def __init__(self, param: int):
+            super().__init__()
+            self.param = param
+
+    with pytest.raises(PipelineSchemaError, match="Node of type CustomNode found, but it failed validation"):
+        Pipeline.load_from_yaml(path=tmp_path / "tmp_config.yml")
+
+    class CustomNode(MockNode):  # pylint: disable=function-redefined
+        def __init__(self, param: str):
+            super().__init__()
+            self.param = param
+
+    pipeline = Pipeline.load_from_yaml(path=tmp_path / "tmp_config.yml")
+    assert pipeline.get_node("custom_node").param == "some text"
+
+
+@pytest.mark.unit
+def test_load_yaml_reuses_compiled_schema(tmp_path):
+    with open(tmp_path / "tmp_config.yml", "w") as tmp_file:
+        tmp_file.write(
+            """
+            version: ignore
+            components:
+            - name: retriever
+              type: MockRetriever
+            pipelines:
+            - name: my_pipeline
+              nodes:
+              - name: retriever
+                inputs:
+                - Query
+        """
+        )
+    compiled_schema = get_compiled_schema(_json_schema.get_schema_key())
+
+    Pipeline.load_from_yaml(path=tmp_path / "tmp_config.yml")
+    Pipeline.load_from_yaml(path=tmp_path / "tmp_config.yml")
+    assert get_compiled_schema(_json_schema.get_schema_key()) is compiled_schema
+
+    # Regenerating the schema file invalidates the compiled schema
+    schema_file_path = tmp_path / "haystack-pipeline-main.schema.json"
+    stat = schema_file_path.stat()
+    os.utime(schema_file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get_compiled_schema(_json_schema.get_schema_key()) is not compiled_schema
+
+
 @pytest.mark.unit
 def test_load_yaml_custom_component_with_null_values(tmp_path):
     class CustomNode(MockNode):
@@ -897,6 +965,47 @@ def test_load_yaml_no_pipelines(tmp_path):
         assert "pipeline" in str(e)
 
 
+@pytest.mark.unit
+def test_load_yaml_component_without_name(tmp_path):
+    with open(tmp_path / "tmp_config.yml", "w") as tmp_file:
+        tmp_file.write(
+            """
+            version: ignore
+            components:
+            - type: MockDocumentStore
+            pipelines:
+            - name: my_pipeline
+              nodes:
+              - name: docstore
+                inputs:
+                - Query
+        """
+        )
+    with pytest.raises(PipelineSchemaError, match="Node of type MockDocumentStore found, but it failed validation"):
+        Pipeline.load_from_yaml(path=tmp_path / "tmp_config.yml")
+
+
+@pytest.mark.unit
+def test_load_yaml_component_with_non_string_name(tmp_path):
+    with open(tmp_path / "tmp_config.yml", "w") as tmp_file:
+        tmp_file.write(
+            """
+            version: ignore
+            components:
+            - name: 1
+              type: MockDocumentStore
+            pipelines:
+            - name: my_pipeline
+              nodes:
+              - name: docstore
+                inputs:
+                - Query
+        """
+        )
+    with pytest.raises(PipelineSchemaError, match="Node of type MockDocumentStore found, but it failed validation"):
+        Pipeline.load_from_yaml(path=tmp_path / "tmp_config.yml")
+
+
 @pytest.mark.unit
 def test_load_yaml_invalid_pipeline_name(tmp_path):
     with open(tmp_path / "tmp_config.yml", "w") as tmp_file:
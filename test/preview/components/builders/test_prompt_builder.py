@@ -27,6 +27,34 @@ def test_run():
     assert res == {"prompt": "This is a test"}
 
 
+@pytest.mark.unit
+def test_run_batch():
+    builder = PromptBuilder(template="This is a {{ variable }}")
+    res = builder.run_batch(variable=["test", "batch"])
+    assert res == {"prompt": ["This is a test", "This is a batch"]}
+
+
+@pytest.mark.unit
+def test_run_batch_without_input():
+    builder = PromptBuilder(template="This is a {{ variable }}")
+    assert builder.run_batch() == {"prompt": []}
+    assert builder.run_batch(messages=[], variable=[]) == {"prompt": []}
+    assert builder.run_batch(messages=None, variable=None) == {"prompt": []}
+
+
+@pytest.mark.unit
+def test_run_batch_with_messages():
+    builder = PromptBuilder(template_variables=["location"])
+    messages = [ChatMessage.from_user("What's the weather like in {{ location }}?")]
+    res = builder.run_batch(messages=[messages, messages], location=["Berlin", "Rome"])
+    assert res == {
+        "prompt": [
+            [ChatMessage.from_user("What's the weather like in Berlin?")],
+            [ChatMessage.from_user("What's the weather like in Rome?")],
+        ]
+    }
+
+
 @pytest.mark.unit
 def test_run_without_input():
     builder = PromptBuilder(template="This is a template without input")
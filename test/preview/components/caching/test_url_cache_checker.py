@@ -1,3 +1,5 @@
+from unittest.mock import patch
+
 import pytest
 
 from haystack.preview import Document, DeserializationError
@@ -81,3 +83,42 @@ class TestUrlCacheChecker:
         checker = UrlCacheChecker(docstore)
         results = checker.run(urls=["https://example.com/1", "https://example.com/5"])
         assert results == {"hits": [documents[0], documents[2]], "misses": ["https://example.com/5"]}
+
+    @pytest.mark.unit
+    def test_run_queries_the_store_once(self):
+        docstore = InMemoryDocumentStore()
+        documents = [
+            Document(content="doc1", meta={"url": "https://example.com/1"}),
+            Document(content="doc2", meta={"url": "https://example.com/2"}),
+        ]
+        docstore.write_documents(documents)
+        checker = UrlCacheChecker(docstore)
+        with patch.object(docstore, "filter_documents", wraps=docstore.filter_documents) as mock_filter_documents:
+            results = checker.run(urls=["https://example.com/2", "https://example.com/5", "https://example.com/1"])
+        mock_filter_documents.assert_called_once()
+        assert results == {"hits": [documents[1], documents[0]], "misses": ["https://example.com/5"]}
+
+    @pytest.mark.unit
+    def test_run_with_document_field_as_url_field(self):
+        docstore = InMemoryDocumentStore()
+        documents = [
+            Document(content="https://example.com/1", meta={"url": "https://example.com/2"}),
+            Document(content="https://example.com/2"),
+        ]
+        docstore.write_documents(documents)
+        checker = UrlCacheChecker(docstore, url_field="content")
+        results = checker.run(urls=["https://example.com/1", "https://example.com/5"])
+        assert results == {"hits": [documents[0]], "misses": ["https://example.com/5"]}
+
+    @pytest.mark.unit
+    def test_cache_stats(self):
+        docstore = InMemoryDocumentStore()
+        docstore.write_documents([Document(content="doc1", meta={"url": "https://example.com/1"})])
+        checker = UrlCacheChecker(docstore)
+        assert checker.cache_stats == {"hits": 0, "misses": 0, "hit_rate": 0.0}
+
+        checker.run(urls=["https://example.com/1", "https://example.com/2"])
+        checker.run(urls=["https://example.com/1", "https://example.com/3"])
+        checker.run(urls=["https://example.com/1"])
+
+        assert checker.cache_stats == {"hits": 3, "misses": 2, "hit_rate": 0.6}
@@ -1,3 +1,4 @@
+import asyncio
 from unittest.mock import patch
 from typing import List, cast
 
@@ -8,6 +9,7 @@ from openai.util import convert_to_openai_object
 from openai.openai_object import OpenAIObject
 
 from haystack.preview import Document
+from haystack.preview.dataclasses.document import Embedding
 from haystack.preview.components.embedders.openai_document_embedder import OpenAIDocumentEmbedder
 
 
@@ -24,6 +26,10 @@ def mock_openai_response(input: List[str], model: str = "text-embedding-ada-002"
     return cast(OpenAIObject, convert_to_openai_object(dict_response))
 
 
+async def mock_openai_async_response(input: List[str], model: str = "text-embedding-ada-002", **kwargs):
+    return mock_openai_response(input=input, model=model, **kwargs)
+
+
 class TestOpenAIDocumentEmbedder:
     @pytest.mark.unit
     def test_init_default(self, monkeypatch):
@@ -89,6 +95,9 @@ class TestOpenAIDocumentEmbedder:
                 "progress_bar": True,
                 "metadata_fields_to_embed": [],
                 "embedding_separator": "\n",
+                "max_concurrent_requests": 4,
+                "requests_per_minute": None,
+                "tokens_per_minute": None,
             },
         }
 
@@ -104,6 +113,9 @@ class TestOpenAIDocumentEmbedder:
             progress_bar=False,
             metadata_fields_to_embed=["test_field"],
             embedding_separator=" | ",
+            max_concurrent_requests=8,
+            requests_per_minute=3000,
+            tokens_per_minute=1000000,
         )
         data = component.to_dict()
         assert data == {
@@ -117,6 +129,9 @@ class TestOpenAIDocumentEmbedder:
                 "progress_bar": False,
                 "metadata_fields_to_embed": ["test_field"],
                 "embedding_separator": " | ",
+                "max_concurrent_requests": 8,
+                "requests_per_minute": 3000,
+                "tokens_per_minute": 1000000,
             },
         }
 
@@ -164,12 +179,12 @@ class TestOpenAIDocumentEmbedder:
         with patch(
             "haystack.preview.components.embedders.openai_document_embedder.openai.Embedding"
         ) as openai_embedding_patch:
-            openai_embedding_patch.create.side_effect = mock_openai_response
+            openai_embedding_patch.acreate.side_effect = mock_openai_async_response
             embedder = OpenAIDocumentEmbedder(api_key="fake-api-key", model_name="model")
 
             embeddings, metadata = embedder._embed_batch(texts_to_embed=texts, batch_size=2)
 
-            assert openai_embedding_patch.create.call_count == 3
+            assert openai_embedding_patch.acreate.call_count == 3
 
         assert isinstance(embeddings, list)
         assert len(embeddings) == len(texts)
@@ -178,9 +193,32 @@ class TestOpenAIDocumentEmbedder:
             assert len(embedding) == 1536
             assert all(isinstance(x, float) for x in embedding)
 
-        # openai.Embedding.create is called 3 times
+        # openai.Embedding.acreate is called 3 times
         assert metadata == {"model": "model", "usage": {"prompt_tokens": 3 * 4, "total_tokens": 3 * 4}}
 
+    @pytest.mark.unit
+    def test_embed_batch_concurrently_preserves_order(self):
+        texts = [f"text {i}" for i in range(10)]
+
+        async def mock_openai_slow_response(input: List[str], model: str, **kwargs):
+            # the first batches take longest, so they finish last
+            await asyncio.sleep(0.01 * (10 - int(input[0].split()[1])))
+            response = mock_openai_response(input=input, model=model)
+            for i, text in enumerate(input):
+                response.data[i]["embedding"] = [float(text.split()[1])]
+            return response
+
+        with patch(
+            "haystack.preview.components.embedders.openai_document_embedder.openai.Embedding"
+        ) as openai_embedding_patch:
+            openai_embedding_patch.acreate.side_effect = mock_openai_slow_response
+            embedder = OpenAIDocumentEmbedder(api_key="fake-api-key", model_name="model", max_concurrent_requests=3)
+
+            embeddings, metadata = embedder._embed_batch(texts_to_embed=texts, batch_size=2)
+
+        assert embeddings == [[float(i)] for i in range(10)]
+        assert metadata["usage"] == {"prompt_tokens": 5 * 4, "total_tokens": 5 * 4}
+
     @pytest.mark.unit
     def test_run(self):
         docs = [
@@ -192,7 +230,7 @@ class TestOpenAIDocumentEmbedder:
         with patch(
             "haystack.preview.components.embedders.openai_document_embedder.openai.Embedding"
         ) as openai_embedding_patch:
-            openai_embedding_patch.create.side_effect = mock_openai_response
+            openai_embedding_patch.acreate.side_effect = mock_openai_async_response
             embedder = OpenAIDocumentEmbedder(
                 api_key="fake-api-key",
                 model_name=model,
@@ -204,7 +242,7 @@ class TestOpenAIDocumentEmbedder:
 
             result = embedder.run(documents=docs)
 
-            openai_embedding_patch.create.assert_called_once_with(
+            openai_embedding_patch.acreate.assert_called_once_with(
                 model=model,
                 input=[
                     "prefix Cuisine | I love cheese suffix",
@@ -218,7 +256,7 @@ class TestOpenAIDocumentEmbedder:
         assert len(documents_with_embeddings) == len(docs)
         for doc in documents_with_embeddings:
             assert isinstance(doc, Document)
-            assert isinstance(doc.embedding, list)
+            assert isinstance(doc.embedding, Embedding)
             assert len(doc.embedding) == 1536
             assert all(isinstance(x, float) for x in doc.embedding)
         assert metadata == {"model": model, "usage": {"prompt_tokens": 4, "total_tokens": 4}}
@@ -234,7 +272,7 @@ class TestOpenAIDocumentEmbedder:
         with patch(
             "haystack.preview.components.embedders.openai_document_embedder.openai.Embedding"
         ) as openai_embedding_patch:
-            openai_embedding_patch.create.side_effect = mock_openai_response
+            openai_embedding_patch.acreate.side_effect = mock_openai_async_response
             embedder = OpenAIDocumentEmbedder(
                 api_key="fake-api-key",
                 model_name=model,
@@ -247,7 +285,7 @@ class TestOpenAIDocumentEmbedder:
 
             result = embedder.run(documents=docs)
 
-            assert openai_embedding_patch.create.call_count == 2
+            assert openai_embedding_patch.acreate.call_count == 2
 
         documents_with_embeddings = result["documents"]
         metadata = result["metadata"]
@@ -256,11 +294,11 @@ class TestOpenAIDocumentEmbedder:
         assert len(documents_with_embeddings) == len(docs)
         for doc in documents_with_embeddings:
             assert isinstance(doc, Document)
-            assert isinstance(doc.embedding, list)
+            assert isinstance(doc.embedding, Embedding)
             assert len(doc.embedding) == 1536
             assert all(isinstance(x, float) for x in doc.embedding)
 
-        # openai.Embedding.create is called 2 times
+        # openai.Embedding.acreate is called 2 times
         assert metadata == {"model": model, "usage": {"prompt_tokens": 2 * 4, "total_tokens": 2 * 4}}
 
     @pytest.mark.unit
@@ -3,6 +3,7 @@ import pytest
 import numpy as np
 
 from haystack.preview import Document
+from haystack.preview.dataclasses.document import Embedding
 from haystack.preview.components.embedders.sentence_transformers_document_embedder import (
     SentenceTransformersDocumentEmbedder,
 )
@@ -64,6 +65,7 @@ class TestSentenceTransformersDocumentEmbedder:
                 "progress_bar": True,
                 "normalize_embeddings": False,
                 "embedding_separator": "\n",
+                "inference_precision": "fp32",
                 "metadata_fields_to_embed": [],
             },
         }
@@ -81,6 +83,7 @@ class TestSentenceTransformersDocumentEmbedder:
             normalize_embeddings=True,
             metadata_fields_to_embed=["meta_field"],
             embedding_separator=" - ",
+            inference_precision="dynamic-int8",
         )
         data = component.to_dict()
 
@@ -96,6 +99,7 @@ class TestSentenceTransformersDocumentEmbedder:
                 "progress_bar": False,
                 "normalize_embeddings": True,
                 "embedding_separator": " - ",
+                "inference_precision": "dynamic-int8",
                 "metadata_fields_to_embed": ["meta_field"],
             },
         }
@@ -109,7 +113,7 @@ class TestSentenceTransformersDocumentEmbedder:
         mocked_factory.get_embedding_backend.assert_not_called()
         embedder.warm_up()
         mocked_factory.get_embedding_backend.assert_called_once_with(
-            model_name_or_path="model", device="cpu", use_auth_token=None
+            model_name_or_path="model", device="cpu", use_auth_token=None, inference_precision="fp32"
         )
 
     @pytest.mark.unit
@@ -137,7 +141,7 @@ class TestSentenceTransformersDocumentEmbedder:
         assert len(result["documents"]) == len(documents)
         for doc in result["documents"]:
             assert isinstance(doc, Document)
-            assert isinstance(doc.embedding, list)
+            assert isinstance(doc.embedding, Embedding)
             assert isinstance(doc.embedding[0], float)
 
     @pytest.mark.unit
@@ -1,4 +1,8 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import patch
+
+import numpy as np
 import pytest
 from haystack.preview.components.embedders.backends.sentence_transformers_backend import (
     _SentenceTransformersEmbeddingBackendFactory,
@@ -20,6 +24,23 @@ def test_factory_behavior(mock_sentence_transformer):
     assert another_embedding_backend is not embedding_backend
 
 
+@pytest.mark.unit
+@patch("haystack.preview.components.embedders.backends.sentence_transformers_backend.SentenceTransformer")
+def test_factory_creates_the_backend_once_for_concurrent_calls(mock_sentence_transformer):
+    mock_sentence_transformer.side_effect = lambda **kwargs: time.sleep(0.1)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        backends = list(
+            executor.map(
+                lambda _: _SentenceTransformersEmbeddingBackendFactory.get_embedding_backend("concurrent_model"),
+                range(4),
+            )
+        )
+
+    assert all(backend is backends[0] for backend in backends)
+    mock_sentence_transformer.assert_called_once()
+
+
 @pytest.mark.unit
 @patch("haystack.preview.components.embedders.backends.sentence_transformers_backend.SentenceTransformer")
 def test_model_initialization(mock_sentence_transformer):
@@ -40,3 +61,64 @@ def test_embedding_function_with_kwargs(mock_sentence_transformer):
     embedding_backend.embed(data=data, normalize_embeddings=True)
 
     embedding_backend.model.encode.assert_called_once_with(data, normalize_embeddings=True)
+
+
+@pytest.mark.unit
+@patch("haystack.preview.components.embedders.backends.sentence_transformers_backend.SentenceTransformer")
+def test_embed_batched_merges_concurrent_calls(mock_sentence_transformer):
+    embedding_backend = _SentenceTransformersEmbeddingBackendFactory.get_embedding_backend(
+        model_name_or_path="batching"
+    )
+    embedding_backend.model.encode.side_effect = lambda data, **kwargs: np.array([[float(text)] for text in data])
+
+    def embed(i):
+        return embedding_backend.embed_batched([str(i), str(i + 0.5)], max_latency=1.0, max_batch_size=16, batch_size=4)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(embed, range(8)))
+
+    # The batch is complete once 16 texts are waiting, so the latency budget isn't used up
+    assert embedding_backend.model.encode.call_count == 1
+    assert embedding_backend.model.encode.call_args.kwargs == {"batch_size": 4}
+    assert results == [[[float(i)], [i + 0.5]] for i in range(8)]
+    metrics = embedding_backend.batching_metrics
+    assert metrics["requests"] == 8
+    assert metrics["batches"] == 1
+    assert metrics["texts"] == 16
+    assert metrics["max_batch_texts"] == 16
+    assert metrics["mean_requests_per_batch"] == 8
+
+
+@pytest.mark.unit
+@patch("haystack.preview.components.embedders.backends.sentence_transformers_backend.SentenceTransformer")
+def test_embed_batched_separates_encode_arguments(mock_sentence_transformer):
+    embedding_backend = _SentenceTransformersEmbeddingBackendFactory.get_embedding_backend(model_name_or_path="args")
+    embedding_backend.model.encode.side_effect = lambda data, **kwargs: np.zeros((len(data), 2))
+
+    def embed(normalize):
+        return embedding_backend.embed_batched(
+            ["text"], max_latency=1.0, max_batch_size=2, normalize_embeddings=normalize
+        )
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(embed, [True, False, True, False]))
+
+    assert results == [[[0.0, 0.0]]] * 4
+    assert sorted(call.kwargs["normalize_embeddings"] for call in embedding_backend.model.encode.call_args_list) == [
+        False,
+        True,
+    ]
+
+
+@pytest.mark.unit
+@patch("haystack.preview.components.embedders.backends.sentence_transformers_backend.SentenceTransformer")
+def test_embed_batched_raises_error_in_every_call(mock_sentence_transformer):
+    embedding_backend = _SentenceTransformersEmbeddingBackendFactory.get_embedding_backend(model_name_or_path="error")
+    embedding_backend.model.encode.side_effect = RuntimeError("encoding failed")
+
+    def embed(i):
+        with pytest.raises(RuntimeError, match="encoding failed"):
+            embedding_backend.embed_batched([str(i)], max_latency=0.05, max_batch_size=4)
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(embed, range(4)))
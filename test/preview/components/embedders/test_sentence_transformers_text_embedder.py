@@ -55,6 +55,8 @@ class TestSentenceTransformersTextEmbedder:
                 "batch_size": 32,
                 "progress_bar": True,
                 "normalize_embeddings": False,
+                "batching_latency": None,
+                "inference_precision": "fp32",
             },
         }
 
@@ -69,6 +71,8 @@ class TestSentenceTransformersTextEmbedder:
             batch_size=64,
             progress_bar=False,
             normalize_embeddings=True,
+            batching_latency=0.01,
+            inference_precision="bf16",
         )
         data = component.to_dict()
         assert data == {
@@ -82,6 +86,8 @@ class TestSentenceTransformersTextEmbedder:
                 "batch_size": 64,
                 "progress_bar": False,
                 "normalize_embeddings": True,
+                "batching_latency": 0.01,
+                "inference_precision": "bf16",
             },
         }
 
@@ -100,6 +106,8 @@ class TestSentenceTransformersTextEmbedder:
                 "batch_size": 32,
                 "progress_bar": True,
                 "normalize_embeddings": False,
+                "batching_latency": None,
+                "inference_precision": "fp32",
             },
         }
 
@@ -112,7 +120,7 @@ class TestSentenceTransformersTextEmbedder:
         mocked_factory.get_embedding_backend.assert_not_called()
         embedder.warm_up()
         mocked_factory.get_embedding_backend.assert_called_once_with(
-            model_name_or_path="model", device="cpu", use_auth_token=None
+            model_name_or_path="model", device="cpu", use_auth_token=None, inference_precision="fp32"
         )
 
     @pytest.mark.unit
@@ -140,6 +148,48 @@ class TestSentenceTransformersTextEmbedder:
         assert isinstance(embedding, list)
         assert all(isinstance(el, float) for el in embedding)
 
+    @pytest.mark.unit
+    def test_run_with_batching_latency(self):
+        embedder = SentenceTransformersTextEmbedder(model_name_or_path="model", batching_latency=0.01, batch_size=8)
+        embedder.embedding_backend = MagicMock()
+        embedder.embedding_backend.embed_batched = MagicMock(return_value=[[0.1, 0.2]])
+
+        result = embedder.run(text="a nice text to embed")
+
+        assert result["embedding"] == [0.1, 0.2]
+        embedder.embedding_backend.embed.assert_not_called()
+        embedder.embedding_backend.embed_batched.assert_called_once_with(
+            ["a nice text to embed"],
+            max_latency=0.01,
+            max_batch_size=8,
+            batch_size=8,
+            show_progress_bar=True,
+            normalize_embeddings=False,
+        )
+
+    @pytest.mark.unit
+    def test_run_batch(self):
+        embedder = SentenceTransformersTextEmbedder(model_name_or_path="model", prefix="prefix ")
+        embedder.embedding_backend = MagicMock()
+        embedder.embedding_backend.embed = MagicMock(
+            side_effect=lambda x, **kwargs: np.random.rand(len(x), 16).tolist()
+        )
+
+        result = embedder.run_batch(text=["first text", "second text"])
+
+        embedder.embedding_backend.embed.assert_called_once()
+        assert embedder.embedding_backend.embed.call_args[0][0] == ["prefix first text", "prefix second text"]
+        assert len(result["embedding"]) == 2
+        assert all(len(embedding) == 16 for embedding in result["embedding"])
+
+    @pytest.mark.unit
+    def test_run_batch_wrong_input_format(self):
+        embedder = SentenceTransformersTextEmbedder(model_name_or_path="model")
+        embedder.embedding_backend = MagicMock()
+
+        with pytest.raises(TypeError, match="expects a list of strings"):
+            embedder.run_batch(text="a text")
+
     @pytest.mark.unit
     def test_run_wrong_input_format(self):
         embedder = SentenceTransformersTextEmbedder(model_name_or_path="model")
@@ -61,3 +61,14 @@ class TestHTMLToDocument:
         assert len(docs) == 2
         for doc in docs:
             assert "Haystack" in doc.content
+
+    @pytest.mark.unit
+    def test_run_iter(self, preview_samples_path):
+        """
+        Test if the component converts the sources lazily and isolates the errors of each file.
+        """
+        sources = iter(["non_existing_file.html", preview_samples_path / "html" / "what_is_haystack.html"])
+        converter = HTMLToDocument(num_workers=2)
+        docs = converter.run_iter(sources=sources)
+        assert "Haystack" in next(docs).content
+        assert next(docs, None) is None
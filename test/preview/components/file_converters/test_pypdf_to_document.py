@@ -1,9 +1,11 @@
 import logging
+from unittest.mock import MagicMock
+
 import pytest
 from pypdf import PdfReader
 
 from haystack.preview import Document
-from haystack.preview.components.file_converters.pypdf import PyPDFToDocument
+from haystack.preview.components.file_converters.pypdf import DefaultConverter, PyPDFToDocument
 from haystack.preview.dataclasses import ByteStream
 
 
@@ -64,3 +66,24 @@ class TestPyPDFToDocument:
         assert len(docs) == 1
         assert "ReAct" not in docs[0].content
         assert "I don't care about converting given pdfs, I always return this" in docs[0].content
+
+    @pytest.mark.unit
+    def test_default_converter_extracts_each_page_once(self):
+        pages = [MagicMock(), MagicMock(), MagicMock()]
+        for page, text in zip(pages, ["first page. ", "", "last page."]):
+            page.extract_text.return_value = text
+        reader = MagicMock(pages=pages)
+
+        document = DefaultConverter().convert(reader)
+
+        assert document.content == "first page. last page."
+        for page in pages:
+            page.extract_text.assert_called_once()
+
+    @pytest.mark.unit
+    def test_run_iter_with_multiple_workers(self, preview_samples_path):
+        paths = ["non_existing_file.pdf", preview_samples_path / "pdf" / "react_paper.pdf"]
+        converter = PyPDFToDocument(num_workers=2)
+        docs = list(converter.run_iter(sources=paths))
+        assert len(docs) == 1
+        assert "ReAct" in docs[0].content
@@ -26,6 +26,32 @@ class TestTextfileToDocument:  # pylint: disable=R0904
         assert docs[0].meta["file_path"] == str(paths[0])
         assert docs[1].meta["file_path"] == str(paths[1])
 
+    @pytest.mark.unit
+    def test_run_with_multiple_workers(self, preview_samples_path):
+        paths = [
+            preview_samples_path / "txt" / "doc_1.txt",
+            "non_existing_file.txt",
+            preview_samples_path / "txt" / "doc_2.txt",
+        ]
+        converter = TextFileToDocument(num_workers=2)
+        docs = converter.run(paths=paths)["documents"]
+        assert [doc.content for doc in docs] == [
+            "Some text for testing.\nTwo lines in here.",
+            "This is a test line.\n123 456 789\n987 654 321.",
+        ]
+        assert [doc.meta["file_path"] for doc in docs] == [str(paths[0]), str(paths[2])]
+
+    @pytest.mark.unit
+    def test_run_iter(self, preview_samples_path):
+        paths = (preview_samples_path / "txt" / name for name in ["doc_1.txt", "doc_2.txt"])
+        converter = TextFileToDocument()
+        documents = converter.run_iter(paths=paths, metadata={"name": "test"}, remove_numeric_tables=True)
+        doc = next(documents)
+        assert doc.content == "Some text for testing.\nTwo lines in here."
+        assert doc.meta == {"name": "test", "file_path": str(preview_samples_path / "txt" / "doc_1.txt")}
+        assert next(documents).content == "This is a test line.\n987 654 321."
+        assert next(documents, None) is None
+
     @pytest.mark.unit
     def test_run_warning_for_invalid_language(self, preview_samples_path, caplog):
         file_path = preview_samples_path / "txt" / "doc_1.txt"
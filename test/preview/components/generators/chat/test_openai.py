@@ -1,7 +1,9 @@
 import os
+from typing import Any, Dict, List
 from unittest.mock import patch, Mock
 
 import openai
+from openai.util import convert_to_openai_object
 import pytest
 
 from haystack.preview.components.generators.chat import GPTChatGenerator
@@ -57,6 +59,25 @@ def streaming_chunk(content: str):
     return mock_response
 
 
+async def mock_async_chat_completion(model: str, messages: List[Dict[str, Any]], **kwargs):
+    """
+    Mock the asynchronous OpenAI API completion response, echoing the last message
+    """
+    return convert_to_openai_object(
+        {
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": f"Echo: {messages[-1]['content']}"},
+                }
+            ],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        }
+    )
+
+
 @pytest.fixture
 def chat_messages():
     return [
@@ -110,6 +131,9 @@ class TestGPTChatGenerator:
                 "model_name": "gpt-3.5-turbo",
                 "streaming_callback": None,
                 "api_base_url": "https://api.openai.com/v1",
+                "max_concurrent_requests": 4,
+                "requests_per_minute": None,
+                "tokens_per_minute": None,
             },
         }
 
@@ -131,6 +155,9 @@ class TestGPTChatGenerator:
                 "max_tokens": 10,
                 "some_test_param": "test-params",
                 "api_base_url": "test-base-url",
+                "max_concurrent_requests": 4,
+                "requests_per_minute": None,
+                "tokens_per_minute": None,
                 "streaming_callback": "haystack.preview.components.generators.utils.default_streaming_callback",
             },
         }
@@ -153,6 +180,9 @@ class TestGPTChatGenerator:
                 "max_tokens": 10,
                 "some_test_param": "test-params",
                 "api_base_url": "test-base-url",
+                "max_concurrent_requests": 4,
+                "requests_per_minute": None,
+                "tokens_per_minute": None,
                 "streaming_callback": "chat.test_openai.<lambda>",
             },
         }
@@ -167,6 +197,9 @@ class TestGPTChatGenerator:
                 "max_tokens": 10,
                 "some_test_param": "test-params",
                 "api_base_url": "test-base-url",
+                "max_concurrent_requests": 4,
+                "requests_per_minute": None,
+                "tokens_per_minute": None,
                 "streaming_callback": "haystack.preview.components.generators.utils.default_streaming_callback",
             },
         }
@@ -187,6 +220,9 @@ class TestGPTChatGenerator:
                 "max_tokens": 10,
                 "some_test_param": "test-params",
                 "api_base_url": "test-base-url",
+                "max_concurrent_requests": 4,
+                "requests_per_minute": None,
+                "tokens_per_minute": None,
                 "streaming_callback": "haystack.preview.components.generators.utils.default_streaming_callback",
             },
         }
@@ -222,6 +258,20 @@ class TestGPTChatGenerator:
         assert len(response["replies"]) == 1
         assert [isinstance(reply, ChatMessage) for reply in response["replies"]]
 
+    @pytest.mark.unit
+    def test_run_batch(self, chat_messages):
+        conversations = [chat_messages, [ChatMessage.from_user("What's the capital of Germany")]]
+        with patch("openai.ChatCompletion.acreate", side_effect=mock_async_chat_completion) as mock_acreate:
+            component = GPTChatGenerator(api_key="test-api-key", temperature=0.5)
+            response = component.run_batch(messages=conversations)
+
+        assert mock_acreate.call_count == 2
+        _, kwargs = mock_acreate.call_args
+        assert kwargs["temperature"] == 0.5
+        assert len(response["replies"]) == 2
+        assert [reply.content for reply in response["replies"][0]] == ["Echo: What's the capital of France"]
+        assert [reply.content for reply in response["replies"][1]] == ["Echo: What's the capital of Germany"]
+
     @pytest.mark.unit
     def test_run_streaming(self, chat_messages, mock_chat_completion):
         streaming_call_count = 0
@@ -1,8 +1,9 @@
 import os
-from typing import List
+from typing import Any, Dict, List
 from unittest.mock import patch, Mock
 
 import openai
+from openai.util import convert_to_openai_object
 import pytest
 
 from haystack.preview.components.generators import GPTGenerator
@@ -58,6 +59,25 @@ def streaming_chunk(content: str):
     return mock_response
 
 
+async def mock_async_chat_completion(model: str, messages: List[Dict[str, Any]], **kwargs):
+    """
+    Mock the asynchronous OpenAI API completion response, echoing the last message
+    """
+    return convert_to_openai_object(
+        {
+            "model": model,
+            "choices": [
+                {
+                    "index": 0,
+                    "finish_reason": "stop",
+                    "message": {"role": "assistant", "content": f"Echo: {messages[-1]['content']}"},
+                }
+            ],
+            "usage": {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15},
+        }
+    )
+
+
 class TestGPTGenerator:
     @pytest.mark.unit
     def test_init_default(self):
@@ -104,6 +124,9 @@ class TestGPTGenerator:
                 "streaming_callback": None,
                 "system_prompt": None,
                 "api_base_url": "https://api.openai.com/v1",
+                "max_concurrent_requests": 4,
+                "requests_per_minute": None,
+                "tokens_per_minute": None,
             },
         }
 
@@ -126,6 +149,9 @@ class TestGPTGenerator:
                 "some_test_param": "test-params",
                 "system_prompt": None,
                 "api_base_url": "test-base-url",
+                "max_concurrent_requests": 4,
+                "requests_per_minute": None,
+                "tokens_per_minute": None,
                 "streaming_callback": "haystack.preview.components.generators.utils.default_streaming_callback",
             },
         }
@@ -149,6 +175,9 @@ class TestGPTGenerator:
                 "some_test_param": "test-params",
                 "system_prompt": None,
                 "api_base_url": "test-base-url",
+                "max_concurrent_requests": 4,
+                "requests_per_minute": None,
+                "tokens_per_minute": None,
                 "streaming_callback": "test_openai.<lambda>",
             },
         }
@@ -163,6 +192,9 @@ class TestGPTGenerator:
                 "max_tokens": 10,
                 "some_test_param": "test-params",
                 "api_base_url": "test-base-url",
+                "max_concurrent_requests": 4,
+                "requests_per_minute": None,
+                "tokens_per_minute": None,
                 "system_prompt": None,
                 "streaming_callback": "haystack.preview.components.generators.utils.default_streaming_callback",
             },
@@ -184,6 +216,9 @@ class TestGPTGenerator:
                 "max_tokens": 10,
                 "some_test_param": "test-params",
                 "api_base_url": "test-base-url",
+                "max_concurrent_requests": 4,
+                "requests_per_minute": None,
+                "tokens_per_minute": None,
                 "streaming_callback": "haystack.preview.components.generators.utils.default_streaming_callback",
             },
         }
@@ -219,6 +254,22 @@ class TestGPTGenerator:
         assert len(response["replies"]) == 1
         assert [isinstance(reply, str) for reply in response["replies"]]
 
+    @pytest.mark.unit
+    def test_run_batch(self):
+        with patch("openai.ChatCompletion.acreate", side_effect=mock_async_chat_completion) as mock_acreate:
+            component = GPTGenerator(
+                api_key="test-api-key", system_prompt="Be brief.", max_tokens=10, max_concurrent_requests=2
+            )
+            response = component.run_batch(prompt=[f"Question {i}" for i in range(5)])
+
+        assert mock_acreate.call_count == 5
+        _, kwargs = mock_acreate.call_args
+        assert kwargs["max_tokens"] == 10
+        assert kwargs["messages"][0] == {"role": "system", "content": "Be brief."}
+        assert response["replies"] == [[f"Echo: Question {i}"] for i in range(5)]
+        assert all(len(metadata) == 1 for metadata in response["metadata"])
+        assert response["metadata"][0][0]["usage"] == {"prompt_tokens": 10, "completion_tokens": 5, "total_tokens": 15}
+
     @pytest.mark.unit
     def test_run_streaming(self, mock_chat_completion):
         streaming_call_count = 0
@@ -4,6 +4,7 @@ import pytest
 
 from haystack.preview import Document
 from haystack.preview.components.preprocessors import DocumentCleaner
+from haystack.preview.components.preprocessors.document_cleaner import _allngram, _find_longest_common_ngram
 
 
 class TestDocumentCleaner:
@@ -81,6 +82,17 @@ class TestDocumentCleaner:
         assert len(result["documents"]) == 1
         assert result["documents"][0].content == " is a text with some ."
 
+    @pytest.mark.unit
+    def test_remove_overlapping_substrings(self):
+        cleaner = DocumentCleaner(remove_substrings=["ab", "abc", "c.d", "", "b"])
+        result = cleaner.run(documents=[Document(content="abcd c.d abab c*d bb")])
+        # The substrings are removed one after the other in the given order
+        assert result["documents"][0].content == "cd   c*d "
+
+        cleaner = DocumentCleaner(remove_substrings=["ba", "o b"], remove_extra_whitespaces=False)
+        result = cleaner.run(documents=[Document(content="foo baz")])
+        assert result["documents"][0].content == "foo z"
+
     @pytest.mark.unit
     def test_remove_regex(self):
         cleaner = DocumentCleaner(remove_regex=r"\s\s+")
@@ -137,3 +149,30 @@ class TestDocumentCleaner:
         for doc, cleaned_doc in zip(documents, result["documents"]):
             assert doc.meta == cleaned_doc.meta
             assert cleaned_doc.content == "Text."
+
+    @pytest.mark.unit
+    def test_run_with_multiple_workers(self):
+        cleaner = DocumentCleaner(remove_substrings=["secret"], num_workers=2)
+        documents = [Document(content=f"Text  number {i}, secret.\n\n") for i in range(100)]
+        documents.insert(10, Document())
+        result = cleaner.run(documents=documents)
+        assert len(result["documents"]) == 101
+        assert result["documents"][10].content is None
+        assert result["documents"][11].content == "Text number 10, ."
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "sequences",
+        [
+            ["This is a header.\nPage 1", "This is a header.\nPage 2", "Header: This is a header.\n"],
+            ["a b c d", "b c d e", "x b c d"],
+            ["\nc d e", " \nc d e", "x\nc d e"],
+            ["a b c", "ab c d"],
+            ["", "a b c d", "a b c d"],
+        ],
+    )
+    def test_find_longest_common_ngram(self, sequences):
+        all_ngrams = [_allngram(seq, min_ngram=3, max_ngram=30) for seq in sequences if seq]
+        common = set(all_ngrams[0]).intersection(*all_ngrams[1:])
+        expected = max(common, key=len, default="")
+        assert _find_longest_common_ngram(sequences) == (expected if expected.strip() else "")
@@ -1,9 +1,23 @@
+from unittest.mock import patch
+
 import pytest
+from tokenizers import Tokenizer
+from tokenizers.models import WordLevel
+from tokenizers.pre_tokenizers import WhitespaceSplit
+from transformers import PreTrainedTokenizerFast
 
-from haystack.preview import Document
+from haystack.preview import ComponentError, Document
 from haystack.preview.components.preprocessors import DocumentSplitter
 
 
+@pytest.fixture
+def whitespace_tokenizer():
+    vocab = {"[UNK]": 0, "This": 1, "is": 2, "a": 3, "text.": 4}
+    tokenizer = Tokenizer(WordLevel(vocab=vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = WhitespaceSplit()
+    return PreTrainedTokenizerFast(tokenizer_object=tokenizer, unk_token="[UNK]")
+
+
 class TestDocumentSplitter:
     @pytest.mark.unit
     def test_non_text_document(self):
@@ -27,7 +41,7 @@ class TestDocumentSplitter:
 
     @pytest.mark.unit
     def test_unsupported_split_by(self):
-        with pytest.raises(ValueError, match="split_by must be one of 'word', 'sentence' or 'passage'."):
+        with pytest.raises(ValueError, match="split_by must be one of 'word', 'sentence', 'passage' or 'token'."):
             DocumentSplitter(split_by="unsupported")
 
     @pytest.mark.unit
@@ -40,6 +54,56 @@ class TestDocumentSplitter:
         with pytest.raises(ValueError, match="split_overlap must be greater than or equal to 0."):
             DocumentSplitter(split_overlap=-1)
 
+    @pytest.mark.unit
+    def test_overlap_not_smaller_than_split_length(self):
+        with pytest.raises(ValueError, match="split_overlap must be smaller than split_length."):
+            DocumentSplitter(split_length=2, split_overlap=2)
+
+    @pytest.mark.unit
+    def test_split_by_token_without_tokenizer(self):
+        with pytest.raises(ValueError, match="tokenizer_name_or_path is required when splitting by 'token'."):
+            DocumentSplitter(split_by="token")
+
+    @pytest.mark.unit
+    def test_split_by_token_not_warmed_up(self):
+        splitter = DocumentSplitter(split_by="token", tokenizer_name_or_path="some-model")
+        with pytest.raises(ComponentError, match="The component was not warmed up."):
+            splitter.run(documents=[Document(content="This is a text.")])
+
+    @pytest.mark.unit
+    def test_split_by_token(self, whitespace_tokenizer):
+        splitter = DocumentSplitter(
+            split_by="token", split_length=3, split_overlap=1, tokenizer_name_or_path="some-model"
+        )
+        with patch(
+            "haystack.preview.components.preprocessors.document_splitter.AutoTokenizer.from_pretrained",
+            return_value=whitespace_tokenizer,
+        ) as from_pretrained:
+            splitter.warm_up()
+            from_pretrained.assert_called_once_with("some-model")
+
+        result = splitter.run(documents=[Document(content="  This is  a text. This is a\ntext.")])
+        assert [doc.content for doc in result["documents"]] == [
+            "  This is  a ",
+            "a text. This ",
+            "This is a\n",
+            "a\ntext.",
+        ]
+
+    @pytest.mark.unit
+    def test_split_offsets_stored_in_metadata(self):
+        splitter = DocumentSplitter(split_by="word", split_length=3, split_overlap=1)
+        doc = Document(content="This is a text with some words.", meta={"nested": {"key": "value"}})
+        result = splitter.run(documents=[doc])
+        assert [doc.content for doc in result["documents"]] == ["This is a ", "a text with ", "with some words."]
+        for split_id, split_doc in enumerate(result["documents"]):
+            assert split_doc.meta["split_id"] == split_id
+            start, end = split_doc.meta["split_idx_start"], split_doc.meta["split_idx_end"]
+            assert doc.content[start:end] == split_doc.content
+        # The splits share the metadata copied from their source document
+        assert result["documents"][0].meta["nested"] is result["documents"][1].meta["nested"]
+        assert result["documents"][0].meta["nested"] is not doc.meta["nested"]
+
     @pytest.mark.unit
     def test_split_by_word(self):
         splitter = DocumentSplitter(split_by="word", split_length=10)
@@ -1,4 +1,7 @@
+from unittest.mock import MagicMock
+
 import pytest
+import torch
 
 from haystack.preview import Document, ComponentError
 from haystack.preview.components.rankers.transformers_similarity import TransformersSimilarityRanker
@@ -14,6 +17,7 @@ class TestSimilarityRanker:
             "init_parameters": {
                 "device": "cpu",
                 "top_k": 10,
+                "batch_size": 32,
                 "token": None,
                 "model_name_or_path": "cross-encoder/ms-marco-MiniLM-L-6-v2",
             },
@@ -22,7 +26,7 @@ class TestSimilarityRanker:
     @pytest.mark.unit
     def test_to_dict_with_custom_init_parameters(self):
         component = TransformersSimilarityRanker(
-            model_name_or_path="my_model", device="cuda", token="my_token", top_k=5
+            model_name_or_path="my_model", device="cuda", token="my_token", top_k=5, batch_size=8
         )
         data = component.to_dict()
         assert data == {
@@ -32,9 +36,56 @@ class TestSimilarityRanker:
                 "model_name_or_path": "my_model",
                 "token": None,  # we don't serialize valid tokens,
                 "top_k": 5,
+                "batch_size": 8,
             },
         }
 
+    @pytest.mark.unit
+    def test_run_batch(self):
+        ranker = TransformersSimilarityRanker(top_k=2)
+        # The mocked model scores each query-document pair by the length of the document content
+        ranker.tokenizer = MagicMock(
+            side_effect=lambda pairs, **kwargs: MagicMock(to=lambda device: {"lengths": [len(p[1]) for p in pairs]})
+        )
+        ranker.model = MagicMock(side_effect=lambda lengths: MagicMock(logits=torch.tensor(lengths).float()[:, None]))
+        queries = ["first query", "second query", "third query"]
+        documents = [
+            [Document(content="a"), Document(content="abc"), Document(content="ab")],
+            [],
+            [Document(content="abcd"), Document(content="a")],
+        ]
+
+        result = ranker.run_batch(query=queries, documents=documents, top_k=[None, None, 1])
+
+        ranker.model.assert_called_once()
+        assert [[doc.content for doc in docs] for docs in result["documents"]] == [["abc", "ab"], [], ["abcd"]]
+        assert [doc.score for doc in result["documents"][0]] == [3.0, 2.0]
+        assert result["documents"][0] == ranker.run(query=queries[0], documents=documents[0])["documents"]
+
+    @pytest.mark.unit
+    def test_run_batch_scores_pairs_in_batches(self):
+        ranker = TransformersSimilarityRanker(top_k=2, batch_size=2)
+        ranker.tokenizer = MagicMock(
+            side_effect=lambda pairs, **kwargs: MagicMock(to=lambda device: {"lengths": [len(p[1]) for p in pairs]})
+        )
+        ranker.model = MagicMock(side_effect=lambda lengths: MagicMock(logits=torch.tensor(lengths).float()[:, None]))
+        queries = ["first query", "second query"]
+        documents = [
+            [Document(content="a"), Document(content="abc"), Document(content="ab")],
+            [Document(content="abcd"), Document(content="a")],
+        ]
+
+        result = ranker.run_batch(query=queries, documents=documents)
+
+        assert [len(call.args[0]) for call in ranker.tokenizer.call_args_list] == [2, 2, 1]
+        assert [[doc.content for doc in docs] for docs in result["documents"]] == [["abc", "ab"], ["abcd", "a"]]
+        assert [doc.score for doc in result["documents"][1]] == [4.0, 1.0]
+
+    @pytest.mark.unit
+    def test_init_fails_with_invalid_batch_size(self):
+        with pytest.raises(ValueError, match="batch_size must be > 0"):
+            TransformersSimilarityRanker(batch_size=0)
+
     @pytest.mark.integration
     @pytest.mark.parametrize(
         "query,docs_before_texts,expected_first_text",
@@ -4,7 +4,8 @@ from unittest.mock import patch, Mock
 import pytest
 
 import torch
-from transformers import pipeline
+from tokenizers import Tokenizer, models, pre_tokenizers, processors
+from transformers import PreTrainedTokenizerFast, pipeline
 
 from haystack.preview.components.readers import ExtractiveReader
 from haystack.preview import Document
@@ -107,6 +108,8 @@ def test_to_dict():
             "no_answer": True,
             "calibration_factor": 0.1,
             "model_kwargs": {"torch_dtype": "auto"},
+            "tokenization_cache_size": 0,
+            "inference_precision": "fp32",
         },
     }
 
@@ -131,6 +134,8 @@ def test_to_dict_empty_model_kwargs():
             "no_answer": True,
             "calibration_factor": 0.1,
             "model_kwargs": {},
+            "tokenization_cache_size": 0,
+            "inference_precision": "fp32",
         },
     }
 
@@ -154,6 +159,37 @@ def test_output(mock_reader: ExtractiveReader):
     assert answers[-1].probability == pytest.approx(no_answer_prob)
 
 
+@pytest.mark.unit
+def test_run_batch(mock_reader: ExtractiveReader):
+    answers = mock_reader.run_batch(query=example_queries, documents=example_documents, top_k=[3, 1])["answers"]
+
+    assert answers[0] == mock_reader.run(example_queries[0], example_documents[0], top_k=3)["answers"]
+    assert answers[1] == mock_reader.run(example_queries[1], example_documents[1], top_k=1)["answers"]
+
+
+@pytest.mark.unit
+def test_run_batch_without_documents(mock_reader: ExtractiveReader):
+    answers = mock_reader.run_batch(
+        query=[example_queries[0], example_queries[1], "Third query?"], documents=[[], example_documents[0], []]
+    )["answers"]
+
+    assert answers[1] == mock_reader.run(example_queries[1], example_documents[0])["answers"]
+    # Like `run`, queries without documents get a no answer
+    assert answers[0] == mock_reader.run(example_queries[0], [])["answers"]
+    assert answers[2] == mock_reader.run("Third query?", [])["answers"]
+    assert [(answer.data, answer.probability) for answer in answers[0]] == [(None, 1.0)]
+
+
+@pytest.mark.unit
+def test_run_batch_without_any_documents(mock_reader: ExtractiveReader):
+    answers = mock_reader.run_batch(query=example_queries, documents=[[], []], no_answer=[True, False])["answers"]
+
+    assert [[(answer.query, answer.data, answer.probability) for answer in answers_] for answers_ in answers] == [
+        [(example_queries[0], None, 1.0)],
+        [],
+    ]
+
+
 @pytest.mark.unit
 def test_flatten_documents(mock_reader: ExtractiveReader):
     queries, docs, query_ids = mock_reader._flatten_documents(example_queries, example_documents)
@@ -189,6 +225,56 @@ def test_preprocess_splitting(mock_reader: ExtractiveReader):
     assert doc_ids == [0, 1, 2, 3, 3]
 
 
+@pytest.fixture
+def word_level_tokenizer():
+    words = "who is the chancellor of germany head department angela merkel was olaf scholz jerry".split()
+    vocab = {"[UNK]": 0, "[PAD]": 1, "[CLS]": 2, "[SEP]": 3, **{word: i + 4 for i, word in enumerate(words)}}
+    tokenizer = Tokenizer(models.WordLevel(vocab=vocab, unk_token="[UNK]"))
+    tokenizer.pre_tokenizer = pre_tokenizers.Whitespace()
+    tokenizer.post_processor = processors.TemplateProcessing(
+        single="[CLS] $A [SEP]", pair="[CLS] $A [SEP] [SEP] $B:1 [SEP]:1", special_tokens=[("[CLS]", 2), ("[SEP]", 3)]
+    )
+    return PreTrainedTokenizerFast(
+        tokenizer_object=tokenizer, unk_token="[UNK]", pad_token="[PAD]", cls_token="[CLS]", sep_token="[SEP]"
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("max_seq_length, stride, padding_side", [(384, 0, "right"), (16, 3, "right"), (12, 2, "left")])
+def test_preprocess_with_tokenization_cache(word_level_tokenizer, max_seq_length, stride, padding_side):
+    word_level_tokenizer.padding_side = padding_side
+    documents = example_documents[0] + [Document(content="Angela Merkel was the chancellor of Germany. " * 3)]
+    queries = [example_queries[0]] * 2 + [example_queries[1]] * 2
+
+    reader = ExtractiveReader(device="cpu:0")
+    reader.tokenizer = word_level_tokenizer
+    cached_reader = ExtractiveReader(device="cpu:0", tokenization_cache_size=2)
+    cached_reader.tokenizer = word_level_tokenizer
+
+    expected = reader._preprocess(queries, documents, max_seq_length, [0, 0, 1, 1], stride)
+    for _ in range(2):
+        preprocessed = cached_reader._preprocess(queries, documents, max_seq_length, [0, 0, 1, 1], stride)
+        for expected_tensor, tensor in zip(expected[:3], preprocessed[:3]):
+            assert torch.equal(expected_tensor, tensor)
+        assert preprocessed[4:] == expected[4:]
+        for expected_encoding, encoding in zip(expected[3], preprocessed[3]):
+            document_tokens = [i for i, id_ in enumerate(expected_encoding.sequence_ids) if id_ == 1]
+            assert [encoding.token_to_chars(i) for i in document_tokens] == [
+                expected_encoding.token_to_chars(i) for i in document_tokens
+            ]
+    assert len(cached_reader._tokenized_documents) == 2
+
+
+@pytest.mark.unit
+def test_preprocess_with_tokenization_cache_falls_back_if_query_is_truncated(word_level_tokenizer):
+    reader = ExtractiveReader(device="cpu:0", tokenization_cache_size=2)
+    reader.tokenizer = word_level_tokenizer
+
+    assert reader._preprocess_with_cache(example_queries[:1], example_documents[0][:1], 8, [0], 0) is None
+    input_ids, *_ = reader._preprocess(example_queries[:1], example_documents[0][:1], 8, [0], 0)
+    assert input_ids.shape[1] == 8
+
+
 @pytest.mark.unit
 def test_postprocess(mock_reader: ExtractiveReader):
     start = torch.zeros((2, 8))
@@ -269,6 +355,22 @@ def test_warm_up_use_hf_token(mocked_automodel, mocked_autotokenizer):
     mocked_autotokenizer.assert_called_once_with("deepset/roberta-base-squad2", token="fake-token")
 
 
+@pytest.mark.unit
+@patch("haystack.preview.components.readers.extractive.AutoTokenizer.from_pretrained")
+@patch("haystack.preview.components.readers.extractive.AutoModelForQuestionAnswering.from_pretrained")
+def test_warm_up_shares_model(mocked_automodel, mocked_autotokenizer):
+    mocked_automodel.side_effect = lambda *args, **kwargs: Mock()
+    readers = [ExtractiveReader("shared-model", device="cpu:0") for _ in range(2)]
+    other_device_reader = ExtractiveReader("shared-model", device="cuda:0")
+    for reader in readers + [other_device_reader]:
+        reader.warm_up()
+
+    assert mocked_automodel.call_count == 2
+    assert readers[0].model is readers[1].model
+    assert readers[0].tokenizer is readers[1].tokenizer
+    assert other_device_reader.model is not readers[0].model
+
+
 @pytest.mark.integration
 def test_t5():
     reader = ExtractiveReader("TARUNBHATT/flan-t5-small-finetuned-squad")
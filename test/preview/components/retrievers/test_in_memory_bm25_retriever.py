@@ -1,4 +1,5 @@
 from typing import Dict, Any
+from unittest.mock import patch
 
 import pytest
 
@@ -130,6 +131,32 @@ class TestMemoryBM25Retriever:
         assert len(result["documents"]) == top_k
         assert result["documents"][0].content == "PHP is a popular programming language"
 
+    @pytest.mark.unit
+    def test_run_batch(self, mock_docs):
+        ds = InMemoryDocumentStore()
+        ds.write_documents(mock_docs)
+        retriever = InMemoryBM25Retriever(ds, top_k=3)
+        queries = ["Java", "Python", "Ruby"]
+        top_k = [None, 1, None]
+
+        result = retriever.run_batch(query=queries, top_k=top_k)
+
+        for docs, query, top_k_ in zip(result["documents"], queries, top_k):
+            expected = retriever.run(query=query, top_k=top_k_)["documents"]
+            assert [(doc.id, doc.score) for doc in docs] == [(doc.id, doc.score) for doc in expected]
+        assert [len(docs) for docs in result["documents"]] == [3, 1, 3]
+
+    @pytest.mark.unit
+    def test_run_batch_tokenizes_documents_once(self, mock_docs):
+        ds = InMemoryDocumentStore()
+        ds.write_documents(mock_docs)
+        retriever = InMemoryBM25Retriever(ds)
+
+        with patch.object(ds, "filter_documents", wraps=ds.filter_documents) as filter_documents:
+            retriever.run_batch(query=["Java", "Python", "Ruby"])
+
+        filter_documents.assert_called_once()
+
     @pytest.mark.unit
     def test_invalid_run_wrong_store_type(self):
         SomeOtherDocumentStore = document_store_class("SomeOtherDocumentStore")
@@ -131,6 +131,28 @@ class TestMemoryEmbeddingRetriever:
         assert len(result["documents"]) == top_k
         assert np.array_equal(result["documents"][0].embedding, [1.0, 1.0, 1.0, 1.0])
 
+    @pytest.mark.unit
+    def test_run_batch(self):
+        ds = InMemoryDocumentStore(embedding_similarity_function="cosine")
+        ds.write_documents(
+            [
+                Document(content="my document", embedding=[0.1, 0.2, 0.3, 0.4], meta={"lang": "en"}),
+                Document(content="another document", embedding=[1.0, 1.0, 1.0, 1.0], meta={"lang": "de"}),
+                Document(content="third document", embedding=[0.5, 0.7, 0.5, 0.7], meta={"lang": "en"}),
+            ]
+        )
+        retriever = InMemoryEmbeddingRetriever(ds, top_k=3)
+        query_embeddings = [[0.1, 0.1, 0.1, 0.1], [0.4, 0.3, 0.2, 0.1], [0.1, 0.1, 0.1, 0.1]]
+        filters = [None, None, {"lang": "en"}]
+        top_k = [None, 2, None]
+
+        result = retriever.run_batch(query_embedding=query_embeddings, filters=filters, top_k=top_k)
+
+        for docs, query_embedding, filters_, top_k_ in zip(result["documents"], query_embeddings, filters, top_k):
+            expected = retriever.run(query_embedding=query_embedding, filters=filters_, top_k=top_k_)["documents"]
+            assert [(doc.id, doc.score) for doc in docs] == [(doc.id, doc.score) for doc in expected]
+        assert [len(docs) for docs in result["documents"]] == [3, 2, 2]
+
     @pytest.mark.unit
     def test_invalid_run_wrong_store_type(self):
         SomeOtherDocumentStore = document_store_class("SomeOtherDocumentStore")
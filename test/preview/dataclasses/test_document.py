@@ -1,10 +1,15 @@
+import copy
+import json
+import pickle
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
 import pytest
 
 from haystack.preview import Document
 from haystack.preview.dataclasses.byte_stream import ByteStream
+from haystack.preview.dataclasses.document import Embedding
 
 
 @pytest.mark.unit
@@ -197,7 +202,7 @@ def test_to_dict_with_custom_parameters():
         "id": doc.id,
         "content": "test text",
         "dataframe": pd.DataFrame([10, 20, 30]).to_json(),
-        "blob": {"data": list(b"some bytes"), "mime_type": "application/pdf"},
+        "blob": {"data": "c29tZSBieXRlcw==", "mime_type": "application/pdf"},
         "some": "values",
         "test": 10,
         "score": 0.99,
@@ -220,7 +225,7 @@ def test_to_dict_with_custom_parameters_without_flattening():
         "id": doc.id,
         "content": "test text",
         "dataframe": pd.DataFrame([10, 20, 30]).to_json(),
-        "blob": {"data": list(b"some bytes"), "mime_type": "application/pdf"},
+        "blob": {"data": "c29tZSBieXRlcw==", "mime_type": "application/pdf"},
         "meta": {"some": "values", "test": 10},
         "score": 0.99,
         "embedding": [10, 10],
@@ -341,3 +346,101 @@ def test_content_type():
 
     with pytest.raises(ValueError):
         _ = Document(content="text", dataframe=pd.DataFrame([0])).content_type
+
+
+@pytest.mark.unit
+def test_embedding_is_stored_compactly():
+    doc = Document(content="test text", embedding=[0.1, 0.2, 0.3])
+
+    assert isinstance(doc.embedding, Embedding)
+    assert doc.embedding.itemsize == 4
+    assert len(doc.embedding) == 3
+    assert doc.embedding[1] == pytest.approx(0.2)
+    assert list(doc.embedding) == pytest.approx([0.1, 0.2, 0.3])
+    # The id is still generated from the original values
+    assert doc.id == Document(content="test text", embedding=[0.1, 0.2, 0.3], id="").id
+
+    doc.embedding = np.array([1.0, 2.0])
+    assert isinstance(doc.embedding, Embedding)
+    assert doc.embedding == [1.0, 2.0]
+
+
+@pytest.mark.unit
+def test_embedding_equality():
+    embedding = Embedding([0.1, 0.2, 0.3])
+
+    assert embedding == [0.1, 0.2, 0.3]
+    assert [0.1, 0.2, 0.3] == embedding
+    assert embedding == np.array([0.1, 0.2, 0.3])
+    assert embedding == Embedding(np.array([0.1, 0.2, 0.3], dtype=np.float32))
+    assert embedding != [0.1, 0.2]
+    assert embedding != [[0.1], [0.2], [0.3]]
+    assert embedding != "0.1, 0.2, 0.3"
+    assert embedding != None
+
+
+@pytest.mark.unit
+def test_embedding_survives_copies_and_serialization():
+    doc = Document(content="test text", embedding=[0.1, 0.2, 0.3])
+
+    data = doc.to_dict()
+    assert type(data["embedding"]) is list
+    assert data["embedding"] == pytest.approx([0.1, 0.2, 0.3])
+    assert json.loads(json.dumps(data))["embedding"] == data["embedding"]
+
+    new_doc = Document.from_dict(data)
+    assert isinstance(new_doc.embedding, Embedding)
+    assert new_doc.embedding == doc.embedding
+
+    data = doc.to_dict(binary=True)
+    assert data["embedding"] is doc.embedding
+    assert Document.from_dict(data).embedding == doc.embedding
+
+    assert pickle.loads(pickle.dumps(doc)).embedding == doc.embedding
+    assert isinstance(copy.deepcopy(doc).embedding, Embedding)
+
+
+@pytest.mark.unit
+def test_to_dict_binary():
+    doc = Document(dataframe=pd.DataFrame([10, 20, 30]), blob=ByteStream(b"some bytes", mime_type="application/pdf"))
+
+    data = doc.to_dict(binary=True)
+
+    assert data["blob"] == {"data": b"some bytes", "mime_type": "application/pdf"}
+    new_doc = Document.from_dict(data)
+    assert new_doc.blob == doc.blob
+    assert new_doc.dataframe.equals(doc.dataframe)
+
+
+@pytest.mark.unit
+def test_from_dict_does_not_change_the_input():
+    data = Document(dataframe=pd.DataFrame([0]), blob=ByteStream(b"some bytes")).to_dict()
+    original_data = dict(data)
+
+    Document.from_dict(data)
+
+    assert data == original_data
+
+
+@pytest.mark.unit
+def test_copy_with():
+    doc = Document(content="test text", meta={"some": "values"}, score=0.1, embedding=[0.1, 0.2])
+
+    new_doc = doc.copy_with(score=0.9, embedding=None)
+
+    assert new_doc.id == doc.id
+    assert new_doc.content == "test text"
+    assert new_doc.meta == {"some": "values"}
+    new_doc.meta["some"] = "other values"
+    assert doc.meta == {"some": "values"}
+    assert new_doc.score == 0.9
+    assert new_doc.embedding is None
+    assert doc.score == 0.1
+    assert doc.embedding == [0.1, 0.2]
+    assert isinstance(doc.copy_with(embedding=[1.0, 2.0]).embedding, Embedding)
+
+
+@pytest.mark.unit
+def test_copy_with_unknown_field():
+    with pytest.raises(ValueError, match="no fields"):
+        Document(content="test text").copy_with(scores=0.9)
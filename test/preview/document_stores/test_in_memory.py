@@ -257,6 +257,18 @@ class TestMemoryDocumentStore(DocumentStoreBaseTests):  # pylint: disable=R0904
         assert len(results) == 1
         assert results[0].content == "Haystack supports multiple languages"
 
+    @pytest.mark.unit
+    def test_retrieval_results_do_not_share_meta_with_the_store(self):
+        docstore = InMemoryDocumentStore()
+        docstore.write_documents([Document(content="Hello world", meta={"page": 1}, embedding=[0.1, 0.2])])
+
+        bm25_result = docstore.bm25_retrieval(query="Hello", top_k=1)[0]
+        embedding_result = docstore.embedding_retrieval(query_embedding=[0.1, 0.2], top_k=1)[0]
+        bm25_result.meta["page"] = 2
+        embedding_result.meta["page"] = 3
+
+        assert docstore.filter_documents()[0].meta == {"page": 1}
+
     @pytest.mark.unit
     def test_embedding_retrieval_invalid_query(self):
         docstore = InMemoryDocumentStore()
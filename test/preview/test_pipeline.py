@@ -1,6 +1,9 @@
-from typing import Optional
+import time
+from typing import List, Optional
 
 import pytest
+from canals.component.types import Variadic
+from canals.errors import PipelineRuntimeError
 
 from haystack.preview import Pipeline, component
 
@@ -60,3 +63,215 @@ def test_pipeline_load(test_files_path):
         assert pipeline.max_loops_allowed == 99
         assert isinstance(pipeline.get_component("Comp1"), TestComponent)
         assert isinstance(pipeline.get_component("Comp2"), TestComponent)
+
+
+@component
+class SlowComponent:
+    def __init__(self, delay: float = 0.2, suffix: str = "!"):
+        self.delay = delay
+        self.suffix = suffix
+
+    @component.output_types(value=str)
+    def run(self, value: str):
+        time.sleep(self.delay)
+        return {"value": f"{value}{self.suffix}"}
+
+
+@component
+class Concatenate:
+    @component.output_types(value=str)
+    def run(self, values: Variadic[str]):
+        return {"value": " ".join(values)}
+
+
+@component
+class FailingComponent:
+    @component.output_types(value=str)
+    def run(self, value: str):
+        raise ValueError("Something went wrong")
+
+
+def _branching_pipeline(branches: int) -> Pipeline:
+    pipeline = Pipeline()
+    pipeline.add_component("first", SlowComponent(delay=0.0))
+    pipeline.add_component("joiner", Concatenate())
+    for i in range(branches):
+        pipeline.add_component(f"branch_{i}", SlowComponent(delay=0.2 * (branches - i), suffix=str(i)))
+        pipeline.connect("first.value", f"branch_{i}.value")
+        pipeline.connect(f"branch_{i}.value", "joiner.values")
+    return pipeline
+
+
+@pytest.mark.unit
+def test_pipeline_run_concurrently_matches_sequential_run():
+    pipeline = _branching_pipeline(branches=3)
+
+    start = time.perf_counter()
+    result = pipeline.run({"first": {"value": "a"}}, max_concurrency=4)
+    concurrent_duration = time.perf_counter() - start
+
+    assert result == pipeline.run({"first": {"value": "a"}})
+    assert result == {"joiner": {"value": "a!0 a!1 a!2"}}
+    # The branches sleep 0.6, 0.4 and 0.2 seconds, running them one after the other would take 1.2 seconds.
+    # The joiner still receives their outputs in the same order, even though the last branch finishes first.
+    assert concurrent_duration < 1.0
+
+
+@pytest.mark.unit
+def test_pipeline_run_concurrently_starts_components_as_soon_as_their_inputs_are_ready():
+    pipeline = Pipeline()
+    pipeline.add_component("first", SlowComponent(delay=0.0))
+    pipeline.add_component("slow", SlowComponent(delay=0.6, suffix="s"))
+    pipeline.add_component("fast", SlowComponent(delay=0.0, suffix="f"))
+    pipeline.add_component("after_fast", SlowComponent(delay=0.4, suffix="a"))
+    pipeline.add_component("joiner", Concatenate())
+    pipeline.connect("first.value", "slow.value")
+    pipeline.connect("first.value", "fast.value")
+    pipeline.connect("fast.value", "after_fast.value")
+    pipeline.connect("slow.value", "joiner.values")
+    pipeline.connect("after_fast.value", "joiner.values")
+
+    start = time.perf_counter()
+    result = pipeline.run({"first": {"value": "a"}}, max_concurrency=4)
+    concurrent_duration = time.perf_counter() - start
+
+    # The joiner waits for both of its upstream branches
+    assert result == {"joiner": {"value": "a!s a!fa"}}
+    # "after_fast" starts while "slow" is still running. Waiting for "slow" to finish first would take 1 second.
+    assert concurrent_duration < 0.9
+
+
+@pytest.mark.unit
+def test_pipeline_run_concurrently_raises_component_errors():
+    pipeline = _branching_pipeline(branches=2)
+    pipeline.add_component("failing", FailingComponent())
+    pipeline.connect("first.value", "failing.value")
+
+    with pytest.raises(PipelineRuntimeError, match="failing raised 'ValueError: Something went wrong'"):
+        pipeline.run({"first": {"value": "a"}}, max_concurrency=4)
+
+
+@component
+class SlowWarmUpComponent:
+    def __init__(self, delay: float = 0.2):
+        self.delay = delay
+        self.warm_up_calls = 0
+
+    def warm_up(self):
+        time.sleep(self.delay)
+        self.warm_up_calls += 1
+
+    @component.output_types(value=str)
+    def run(self, value: str):
+        return {"value": value}
+
+
+@pytest.mark.unit
+def test_pipeline_warm_up_in_parallel_once():
+    pipeline = Pipeline()
+    for i in range(3):
+        pipeline.add_component(f"comp_{i}", SlowWarmUpComponent(delay=0.3))
+    pipeline.connect("comp_0.value", "comp_1.value")
+    pipeline.connect("comp_1.value", "comp_2.value")
+
+    start = time.perf_counter()
+    pipeline.warm_up()
+    duration = time.perf_counter() - start
+
+    # Warming up the components one after the other would take 0.9 seconds
+    assert duration < 0.8
+    assert set(pipeline.warm_up_report) == {"comp_0", "comp_1", "comp_2"}
+    assert all(seconds >= 0.3 for seconds in pipeline.warm_up_report.values())
+
+    assert pipeline.run({"comp_0": {"value": "a"}}) == {"comp_2": {"value": "a"}}
+    assert [pipeline.get_component(f"comp_{i}").warm_up_calls for i in range(3)] == [1, 1, 1]
+
+
+@component
+class UnhashableWarmUpComponent(SlowWarmUpComponent):
+    def __eq__(self, other):
+        return isinstance(other, UnhashableWarmUpComponent)
+
+
+@pytest.mark.unit
+def test_pipeline_warm_up_unhashable_components_once():
+    pipeline = Pipeline()
+    pipeline.add_component("first", UnhashableWarmUpComponent(delay=0))
+    pipeline.add_component("second", UnhashableWarmUpComponent(delay=0))
+    pipeline.connect("first.value", "second.value")
+
+    pipeline.warm_up()
+    pipeline.warm_up()
+
+    assert pipeline.get_component("first").warm_up_calls == 1
+    assert pipeline.get_component("second").warm_up_calls == 1
+
+
+@pytest.mark.unit
+def test_pipeline_run_with_invalid_max_concurrency():
+    with pytest.raises(ValueError, match="max_concurrency"):
+        _branching_pipeline(branches=2).run({"first": {"value": "a"}}, max_concurrency=0)
+
+
+@component
+class BatchUppercase:
+    def __init__(self):
+        self.batch_calls = 0
+
+    @component.output_types(value=str)
+    def run(self, value: str, suffix: Optional[str] = None):
+        return {"value": value.upper() + (suffix or "")}
+
+    def run_batch(self, value: List[str], suffix: Optional[List[Optional[str]]] = None):
+        self.batch_calls += 1
+        suffix = suffix or [None] * len(value)
+        return {"value": [v.upper() + (s or "") for v, s in zip(value, suffix)]}
+
+
+@component
+class EvenLengthRouter:
+    @component.output_types(even=str, odd=str)
+    def run(self, value: str):
+        if len(value) % 2 == 0:
+            return {"even": value, "odd": None}
+        return {"even": None, "odd": value}
+
+
+@pytest.mark.unit
+def test_pipeline_run_batch():
+    pipeline = Pipeline()
+    pipeline.add_component("router", EvenLengthRouter())
+    pipeline.add_component("uppercase", BatchUppercase())
+    pipeline.add_component("append", TestComponent())
+    pipeline.connect("router.even", "uppercase.value")
+    pipeline.connect("router.odd", "append.input_")
+    data = [
+        {"router": {"value": "ab"}},
+        {"router": {"value": "abc"}, "uppercase": {"suffix": "?"}},
+        {"router": {"value": "abcd"}, "uppercase": {"suffix": "!"}},
+    ]
+
+    results = pipeline.run_batch(data)
+
+    assert results == [pipeline.run(item_data) for item_data in data]
+    assert results == [{"uppercase": {"value": "AB"}}, {"append": {"value": "abc"}}, {"uppercase": {"value": "ABCD!"}}]
+    # Both items that reached the batch-capable component were processed with a single call
+    assert pipeline.get_component("uppercase").batch_calls == 1
+
+
+@pytest.mark.unit
+def test_pipeline_run_batch_raises_on_invalid_batch_outputs():
+    @component
+    class InvalidBatchComponent:
+        @component.output_types(value=str)
+        def run(self, value: str):
+            return {"value": value}
+
+        def run_batch(self, value: List[str]):
+            return {"value": value[:1]}
+
+    pipeline = Pipeline()
+    pipeline.add_component("invalid", InvalidBatchComponent())
+
+    with pytest.raises(PipelineRuntimeError, match="run_batch"):
+        pipeline.run_batch([{"invalid": {"value": "a"}}, {"invalid": {"value": "b"}}])
@@ -0,0 +1,16 @@
+import pytest
+
+from haystack.preview.utils import group_batch_items
+
+
+@pytest.mark.unit
+def test_group_batch_items():
+    filters = [{"lang": "en"}, None, {"lang": "en"}, None]
+    top_k = [10, 10, 10, 5]
+
+    assert group_batch_items(filters, top_k) == [(({"lang": "en"}, 10), [0, 2]), ((None, 10), [1]), ((None, 5), [3])]
+
+
+@pytest.mark.unit
+def test_group_batch_items_empty_batch():
+    assert group_batch_items([], []) == []
@@ -0,0 +1,49 @@
+import pytest
+import torch
+
+from haystack.preview.utils import apply_inference_precision, validate_inference_precision
+
+
+class TinyModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.linear = torch.nn.Linear(16, 4)
+
+    def forward(self, inputs):
+        return {"logits": self.linear(inputs), "hidden": [inputs.sum(dim=-1)]}
+
+
+@pytest.mark.unit
+def test_apply_inference_precision_dynamic_int8():
+    torch.manual_seed(0)
+    model = TinyModel().eval()
+    inputs = torch.randn(3, 16)
+    expected = model(inputs)["logits"]
+
+    model = apply_inference_precision(model, "dynamic-int8")
+
+    assert isinstance(model.linear, torch.ao.nn.quantized.dynamic.Linear)
+    assert torch.allclose(model(inputs)["logits"], expected, atol=0.05)
+
+
+@pytest.mark.unit
+def test_apply_inference_precision_bf16():
+    torch.manual_seed(0)
+    model = TinyModel().eval()
+    inputs = torch.randn(3, 16)
+    expected = model(inputs)["logits"]
+
+    model = apply_inference_precision(model, "bf16")
+    outputs = model(inputs)
+
+    assert outputs["logits"].dtype == torch.float32
+    assert outputs["hidden"][0].dtype == torch.float32
+    assert model.forward.__name__ == "forward"
+    assert torch.allclose(outputs["logits"], expected, atol=0.05)
+
+
+@pytest.mark.unit
+def test_validate_inference_precision():
+    validate_inference_precision("fp32")
+    with pytest.raises(ValueError, match="Use one of fp32, bf16, dynamic-int8"):
+        validate_inference_precision("fp16")
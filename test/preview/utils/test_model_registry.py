@@ -0,0 +1,98 @@
+import gc
+import threading
+import time
+
+import pytest
+
+from haystack.preview.utils import ModelKey, ModelRegistry
+
+
+class Owner:
+    pass
+
+
+@pytest.mark.unit
+def test_model_key_from_kwargs():
+    key = ModelKey.from_kwargs(
+        "question-answering", "model", device="cpu", torch_dtype="float16", revision="v1", token="secret", a=1
+    )
+
+    assert key == ModelKey(
+        kind="question-answering", model="model", device="cpu", dtype="float16", revision="v1", options="[('a', 1)]"
+    )
+    assert key == ModelKey.from_kwargs(
+        "question-answering", "model", device="cpu", torch_dtype="float16", revision="v1", a=1
+    )
+    assert key != ModelKey.from_kwargs("question-answering", "model", device="cpu", revision="v1", a=1)
+
+
+@pytest.mark.unit
+def test_acquire_loads_once_and_releases_with_owners():
+    registry = ModelRegistry()
+    key = ModelKey(kind="test", model="model")
+    loads = []
+
+    def loader():
+        loads.append(1)
+        return object()
+
+    owners = [Owner(), Owner()]
+    models = [registry.acquire(owner, key, loader) for owner in owners]
+
+    assert len(loads) == 1
+    assert models[0] is models[1]
+    assert registry.ref_count(key) == 2
+    assert [row["model"] for row in registry.report()] == [key]
+
+    del owners[0]
+    gc.collect()
+    assert registry.ref_count(key) == 1
+
+    owners.clear()
+    gc.collect()
+    assert registry.ref_count(key) == 0
+    assert registry.report() == []
+
+    registry.acquire(Owner(), key, loader)
+    assert len(loads) == 2
+
+
+@pytest.mark.unit
+def test_acquire_loads_different_models_in_parallel():
+    registry = ModelRegistry()
+    owners = [Owner() for _ in range(4)]
+
+    def loader():
+        time.sleep(0.3)
+        return object()
+
+    models = {}
+
+    def acquire(index):
+        models[index] = registry.acquire(owners[index], ModelKey(kind="test", model=str(index % 2)), loader)
+
+    start = time.perf_counter()
+    threads = [threading.Thread(target=acquire, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Two different models loaded at the same time, each of them only once
+    assert time.perf_counter() - start < 0.55
+    assert models[0] is models[2] and models[1] is models[3]
+    assert models[0] is not models[1]
+
+
+@pytest.mark.unit
+def test_acquire_releases_failed_loads():
+    registry = ModelRegistry()
+    key = ModelKey(kind="test", model="model")
+
+    def loader():
+        raise OSError("Model not found")
+
+    with pytest.raises(OSError, match="Model not found"):
+        registry.acquire(Owner(), key, loader)
+
+    assert registry.ref_count(key) == 0
@@ -0,0 +1,171 @@
+import asyncio
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import openai
+import pytest
+
+from haystack.preview.utils import OpenAIRequestRunner
+from haystack.preview.utils.openai_requests import RateLimiter
+
+
+class FakeOpenAIServer:
+    """
+    A local OpenAI compatible embeddings endpoint. It answers the first `rate_limited_requests` requests with a 429
+    error and embeds each input text as `[len(text)]`.
+    """
+
+    def __init__(self, rate_limited_requests: int = 0, delay: float = 0.0):
+        self.rate_limited_requests = rate_limited_requests
+        self.delay = delay
+        self.requests = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        self.url = f"http://127.0.0.1:{self._server.server_port}/v1"
+
+    def _handler(self):
+        fake_server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+                with fake_server._lock:
+                    fake_server.requests += 1
+                    rate_limited = fake_server.requests <= fake_server.rate_limited_requests
+                    fake_server.in_flight += 1
+                    fake_server.max_in_flight = max(fake_server.max_in_flight, fake_server.in_flight)
+                time.sleep(fake_server.delay)
+                with fake_server._lock:
+                    fake_server.in_flight -= 1
+
+                if rate_limited:
+                    self._respond(429, {"error": {"message": "Rate limit reached", "type": "requests"}}, "0")
+                elif body["model"] == "unknown-model":
+                    self._respond(404, {"error": {"message": "The model does not exist", "type": "invalid_request"}})
+                else:
+                    data = [
+                        {"object": "embedding", "index": i, "embedding": [len(text)]}
+                        for i, text in enumerate(body["input"])
+                    ]
+                    usage = {"prompt_tokens": len(data), "total_tokens": len(data)}
+                    self._respond(200, {"object": "list", "data": data, "model": body["model"], "usage": usage})
+
+            def _respond(self, status, payload, retry_after=None):
+                content = json.dumps(payload).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(content)))
+                if retry_after is not None:
+                    self.send_header("Retry-After", retry_after)
+                self.end_headers()
+                self.wfile.write(content)
+
+            def log_message(self, *args):
+                pass
+
+        return Handler
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *args):
+        self._server.shutdown()
+        self._server.server_close()
+
+
+@pytest.fixture
+def fake_openai(monkeypatch):
+    def start(**kwargs):
+        server = FakeOpenAIServer(**kwargs)
+        monkeypatch.setattr(openai, "api_base", server.url)
+        monkeypatch.setattr(openai, "api_key", "fake-api-key")
+        return server
+
+    return start
+
+
+def embedding_requests(texts):
+    return [lambda text=text: openai.Embedding.acreate(model="model", input=[text]) for text in texts]
+
+
+@pytest.mark.unit
+def test_run_preserves_order_and_limits_concurrency(fake_openai):
+    texts = ["a" * i for i in range(1, 13)]
+    runner = OpenAIRequestRunner(max_concurrent_requests=3)
+
+    with fake_openai(delay=0.05) as server:
+        done = []
+        responses = runner.run(embedding_requests(texts), callback=lambda index, response: done.append(index))
+
+    assert [response.data[0]["embedding"] for response in responses] == [[len(text)] for text in texts]
+    assert sorted(done) == list(range(12))
+    assert server.max_in_flight == 3
+
+
+@pytest.mark.unit
+def test_run_retries_rate_limited_requests(fake_openai):
+    runner = OpenAIRequestRunner(max_concurrent_requests=2, initial_backoff=0.01)
+
+    with fake_openai(rate_limited_requests=3) as server:
+        responses = runner.run(embedding_requests(["a", "bb", "ccc"]))
+
+    assert [response.data[0]["embedding"] for response in responses] == [[1], [2], [3]]
+    assert server.requests == 6
+
+
+@pytest.mark.unit
+def test_run_raises_after_max_retries(fake_openai):
+    runner = OpenAIRequestRunner(max_retries=2, initial_backoff=0.01)
+
+    with fake_openai(rate_limited_requests=100) as server:
+        with pytest.raises(openai.error.RateLimitError):
+            runner.run(embedding_requests(["a"]))
+
+    assert server.requests == 3
+
+
+@pytest.mark.unit
+def test_run_does_not_retry_invalid_requests(fake_openai):
+    runner = OpenAIRequestRunner(initial_backoff=0.01)
+
+    with fake_openai() as server:
+        with pytest.raises(openai.error.InvalidRequestError):
+            runner.run([lambda: openai.Embedding.acreate(model="unknown-model", input=["a"])])
+
+    assert server.requests == 1
+
+
+@pytest.mark.unit
+def test_run_limits_requests_per_minute(fake_openai):
+    # empty the bucket, which then refills with 10 requests per second
+    runner = OpenAIRequestRunner(max_concurrent_requests=8, requests_per_minute=600)
+    runner._request_limiter._available = 0
+
+    with fake_openai():
+        start = time.monotonic()
+        runner.run(embedding_requests(["a"] * 5))
+        elapsed = time.monotonic() - start
+
+    assert 0.4 < elapsed < 2.0
+
+
+@pytest.mark.unit
+def test_rate_limiter_caps_amounts_above_the_limit():
+    limiter = RateLimiter(limit_per_minute=100)
+
+    async def acquire():
+        await asyncio.wait_for(limiter.acquire(1000), timeout=1.0)
+
+    asyncio.run(acquire())
+    assert limiter._available < 1
+
+
+@pytest.mark.unit
+def test_rate_limiter_rejects_invalid_limits():
+    with pytest.raises(ValueError, match="at least 1"):
+        RateLimiter(limit_per_minute=0)
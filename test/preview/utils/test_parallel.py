@@ -0,0 +1,44 @@
+import pytest
+
+from haystack.preview.utils import isolated_map
+
+
+def reciprocal(value):
+    return 1 / value
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("num_workers, chunk_size", [(1, 1), (2, 1), (2, 3)])
+def test_isolated_map(num_workers, chunk_size):
+    results = list(isolated_map(reciprocal, [1, 2, 0, 4], num_workers=num_workers, chunk_size=chunk_size))
+
+    assert [(item, result) for item, result, _ in results] == [(1, 1.0), (2, 0.5), (0, None), (4, 0.25)]
+    assert [type(error) for _, _, error in results] == [type(None), type(None), ZeroDivisionError, type(None)]
+
+
+@pytest.mark.unit
+def test_isolated_map_consumes_items_lazily():
+    consumed = []
+
+    def items():
+        for item in range(100):
+            consumed.append(item)
+            yield item + 1
+
+    results = isolated_map(reciprocal, items(), num_workers=2, max_pending=3)
+    assert next(results) == (1, 1.0, None)
+    assert len(consumed) == 3
+    results.close()
+
+
+@pytest.mark.unit
+def test_isolated_map_invalid_num_workers():
+    with pytest.raises(ValueError, match="num_workers must be at least 1"):
+        list(isolated_map(reciprocal, [1], num_workers=0))
+
+
+@pytest.mark.unit
+def test_isolated_map_unpicklable_function():
+    results = list(isolated_map(lambda value: value, [1, 2], num_workers=2))
+    assert [item for item, _, _ in results] == [1, 2]
+    assert all(result is None and error is not None for _, result, error in results)
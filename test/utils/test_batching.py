@@ -0,0 +1,69 @@
+import pytest
+
+from haystack.utils.batching import count_tokens, run_in_batches, schedule_batches
+
+
+class WordTokenizer:
+    model_max_length = 4
+
+    def __call__(self, texts, **kwargs):
+        return {"input_ids": [["[CLS]"] + text.split() for text in texts]}
+
+
+@pytest.mark.unit
+def test_schedule_batches_groups_items_of_similar_length_longest_first():
+    assert schedule_batches([1, 5, 2, 5, 3], batch_size=2) == [[1, 3], [4, 2], [0]]
+
+
+@pytest.mark.unit
+def test_schedule_batches_without_limits_returns_a_single_batch():
+    assert schedule_batches([1, 5, 2]) == [[1, 2, 0]]
+    assert schedule_batches([]) == []
+
+
+@pytest.mark.unit
+def test_schedule_batches_respects_the_token_budget():
+    # 10 tokens fit two items of length 5, or five items of length 2 or less once padded
+    assert schedule_batches([5, 2, 5, 2, 2, 2, 1, 1], max_tokens_per_batch=10) == [[0, 2], [1, 3, 4, 5, 6], [7]]
+
+
+@pytest.mark.unit
+def test_schedule_batches_gives_items_over_the_token_budget_a_batch_of_their_own():
+    assert schedule_batches([20, 3, 15], batch_size=8, max_tokens_per_batch=10) == [[0], [2], [1]]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("kwargs", [{"batch_size": 0}, {"max_tokens_per_batch": 0}])
+def test_schedule_batches_rejects_invalid_limits(kwargs):
+    with pytest.raises(ValueError):
+        schedule_batches([1, 2], **kwargs)
+
+
+@pytest.mark.unit
+def test_run_in_batches_returns_predictions_in_the_order_of_the_items():
+    batches = []
+
+    def predict(batch):
+        batches.append(batch)
+        return [item.upper() for item in batch]
+
+    items = ["a", "bbb", "cc", "dddd"]
+    predictions = run_in_batches(items, predict, lengths=[len(item) for item in items], batch_size=3)
+
+    assert predictions == ["A", "BBB", "CC", "DDDD"]
+    assert batches == [["dddd", "bbb", "cc"], ["a"]]
+
+
+@pytest.mark.unit
+def test_run_in_batches_checks_the_number_of_predictions():
+    with pytest.raises(ValueError, match="Expected 2 predictions"):
+        run_in_batches(["a", "b"], lambda batch: ["A"], lengths=[1, 1])
+
+
+@pytest.mark.unit
+def test_count_tokens_caps_counts_at_the_max_length():
+    texts = ["one", "one two three four five"]
+
+    assert count_tokens(WordTokenizer(), texts) == [2, 4]
+    assert count_tokens(WordTokenizer(), texts, max_length=3) == [2, 3]
+    assert count_tokens(WordTokenizer(), []) == []
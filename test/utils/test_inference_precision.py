@@ -0,0 +1,114 @@
+import copy
+import io
+import pickle
+import subprocess
+import sys
+
+import pytest
+import torch
+from transformers import BertConfig, BertModel
+
+from haystack.inference_precision import apply_inference_precision
+
+
+@pytest.fixture
+def tiny_bert():
+    torch.manual_seed(0)
+    config = BertConfig(
+        vocab_size=100, hidden_size=32, num_hidden_layers=2, num_attention_heads=2, intermediate_size=64
+    )
+    return BertModel(config).eval()
+
+
+@pytest.fixture
+def input_ids():
+    return torch.randint(0, 100, (2, 8), generator=torch.Generator().manual_seed(0))
+
+
+@pytest.mark.unit
+def test_apply_inference_precision_fp32_returns_model_unchanged(tiny_bert):
+    forward = tiny_bert.forward
+
+    assert apply_inference_precision(tiny_bert, "fp32") is tiny_bert
+    assert tiny_bert.forward == forward
+
+
+@pytest.mark.unit
+def test_apply_inference_precision_dynamic_int8(tiny_bert, input_ids):
+    with torch.inference_mode():
+        expected = tiny_bert(input_ids=input_ids).last_hidden_state
+
+    model = apply_inference_precision(tiny_bert, "dynamic-int8")
+    with torch.inference_mode():
+        outputs = model(input_ids=input_ids).last_hidden_state
+
+    assert isinstance(model.encoder.layer[0].attention.self.query, torch.ao.nn.quantized.dynamic.Linear)
+    similarity = torch.nn.functional.cosine_similarity(outputs, expected, dim=-1)
+    assert similarity.min() > 0.99
+
+
+@pytest.mark.unit
+def test_apply_inference_precision_bf16(tiny_bert, input_ids):
+    with torch.inference_mode():
+        expected = tiny_bert(input_ids=input_ids).last_hidden_state
+
+    model = apply_inference_precision(tiny_bert, "bf16")
+    with torch.inference_mode():
+        outputs = model(input_ids=input_ids)
+
+    # The outputs keep their type and are cast back to float32
+    assert outputs.__class__.__name__ == "BaseModelOutputWithPoolingAndCrossAttentions"
+    assert outputs.last_hidden_state.dtype == torch.float32
+    assert outputs.pooler_output.dtype == torch.float32
+    similarity = torch.nn.functional.cosine_similarity(outputs.last_hidden_state, expected, dim=-1)
+    assert similarity.min() > 0.99
+
+
+@pytest.mark.unit
+def test_apply_inference_precision_invalid_value(tiny_bert):
+    with pytest.raises(ValueError, match="Invalid inference_precision 'int4'"):
+        apply_inference_precision(tiny_bert, "int4")
+
+
+class RecordingModel(torch.nn.Module):
+    def __init__(self):
+        super().__init__()
+        self.linear = torch.nn.Linear(4, 2)
+
+    def forward(self, inputs):
+        outputs = self.linear(inputs)
+        self.last_dtype = outputs.dtype
+        return outputs
+
+
+@pytest.mark.unit
+def test_apply_inference_precision_bf16_applies_to_model_copies():
+    model = apply_inference_precision(RecordingModel(), "bf16")
+    # torch.nn.DataParallel creates its replicas like this
+    replica = model._replicate_for_data_parallel()
+
+    assert isinstance(model, RecordingModel)
+    assert "forward" not in model.__dict__
+    assert replica(torch.randn(3, 4)).dtype == torch.float32
+    assert replica.last_dtype == torch.bfloat16
+    assert apply_inference_precision(model, "bf16").__class__ is model.__class__
+
+
+@pytest.mark.unit
+def test_apply_inference_precision_bf16_model_can_be_pickled():
+    model = apply_inference_precision(RecordingModel(), "bf16")
+    inputs = torch.randn(3, 4)
+
+    torch.save(model, io.BytesIO())
+    copies = [pickle.loads(pickle.dumps(model)), copy.deepcopy(model)]
+
+    for model_copy in copies:
+        assert model_copy.__class__ is model.__class__
+        assert torch.equal(model_copy(inputs), model(inputs))
+        assert model_copy.last_dtype == torch.bfloat16
+
+
+@pytest.mark.unit
+def test_inference_precision_does_not_import_haystack_utils():
+    code = "import sys, haystack.inference_precision; assert 'haystack.utils' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
@@ -0,0 +1,84 @@
+from unittest.mock import patch
+
+import pytest
+import torch
+from transformers import BertConfig, BertForSequenceClassification, BertTokenizerFast, pipeline
+
+from haystack.utils.zero_shot import ZeroShotClassifier
+
+
+WORDS = "the a is this example about sports politics weather team won game election vote rain today".split()
+TEXTS = [
+    "the team won the game today",
+    "rain",
+    "the election vote is about politics and the team won the game about the weather today",
+]
+
+
+@pytest.fixture
+def zero_shot_pipeline(tmp_path):
+    vocab_file = tmp_path / "vocab.txt"
+    vocab_file.write_text("\n".join(["[PAD]", "[UNK]", "[CLS]", "[SEP]", "[MASK]", "."] + WORDS))
+    # The short maximum length makes the longest text get truncated
+    tokenizer = BertTokenizerFast(str(vocab_file), model_max_length=16)
+    labels = ["contradiction", "neutral", "entailment"]
+    config = BertConfig(
+        vocab_size=len(WORDS) + 6,
+        hidden_size=16,
+        num_hidden_layers=1,
+        num_attention_heads=2,
+        intermediate_size=32,
+        initializer_range=1.0,
+        label2id={label: i for i, label in enumerate(labels)},
+        id2label=dict(enumerate(labels)),
+    )
+    torch.manual_seed(0)
+    model = BertForSequenceClassification(config).eval()
+    return pipeline("zero-shot-classification", model=model, tokenizer=tokenizer, device="cpu")
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("labels", [["sports", "weather", "politics"], ["sports"]])
+def test_zero_shot_classifier_matches_the_hugging_face_pipeline(zero_shot_pipeline, labels):
+    expected = zero_shot_pipeline(TEXTS, candidate_labels=labels)
+
+    predictions = ZeroShotClassifier(zero_shot_pipeline)(TEXTS, labels, batch_size=2, max_tokens_per_batch=40)
+
+    for prediction, expected_prediction in zip(predictions, expected):
+        assert prediction["sequence"] == expected_prediction["sequence"]
+        assert dict(zip(prediction["labels"], prediction["scores"])) == pytest.approx(
+            dict(zip(expected_prediction["labels"], expected_prediction["scores"])), abs=1e-5
+        )
+
+
+@pytest.mark.unit
+def test_zero_shot_classifier_tokenizes_the_pairs_if_it_cant_build_them(zero_shot_pipeline):
+    labels = ["sports", "weather"]
+    classifier = ZeroShotClassifier(zero_shot_pipeline)
+    expected = classifier(TEXTS, labels)
+
+    classifier._pairs_from_ids = False
+    predictions = classifier(TEXTS, labels)
+
+    for prediction, expected_prediction in zip(predictions, expected):
+        assert prediction["scores"] == pytest.approx(expected_prediction["scores"], abs=1e-5)
+
+
+@pytest.mark.unit
+def test_zero_shot_classifier_encodes_each_hypothesis_once(zero_shot_pipeline):
+    classifier = ZeroShotClassifier(zero_shot_pipeline)
+    classifier(TEXTS, ["sports", "weather"])
+
+    with patch.object(classifier, "tokenizer", wraps=classifier.tokenizer) as tokenizer:
+        hypotheses = classifier.encode_hypotheses(["weather", "sports"])
+        tokenizer.assert_not_called()
+
+    assert (
+        hypotheses[0] == zero_shot_pipeline.tokenizer("This example is weather.", add_special_tokens=False)["input_ids"]
+    )
+
+
+@pytest.mark.unit
+def test_zero_shot_classifier_rejects_templates_without_placeholder(zero_shot_pipeline):
+    with pytest.raises(ValueError, match="must contain"):
+        ZeroShotClassifier(zero_shot_pipeline, hypothesis_template="This example is about something.")